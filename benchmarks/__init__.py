@@ -0,0 +1,6 @@
+"""Performance benchmarks for ai-asst-mgr.
+
+The suites in this package use pytest-benchmark and are deliberately kept out of
+the default ``testpaths`` so the unit test run stays fast. See
+``benchmarks/README.md`` for how to run them and compare results.
+"""
@@ -0,0 +1,81 @@
+"""Shared fixtures for the benchmark suites.
+
+Dataset size is controlled by ``--bench-scale`` (or ``AI_ASST_MGR_BENCH_SCALE``)
+and accepts the named scales from :data:`benchmarks.datagen.SCALES` or a plain
+session count. Generated datasets are cached per session in a temporary
+directory, so each size is built once per run.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from benchmarks.datagen import (
+    DEFAULT_SEED,
+    parse_scale,
+    populate_database,
+    write_config_tree,
+    write_gemini_tree,
+    write_history_jsonl,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+ENV_BENCH_SCALE = "AI_ASST_MGR_BENCH_SCALE"
+DEFAULT_BENCH_SCALE = "10k"
+
+# File-based inputs are re-imported on every round, so they are sized as a
+# fraction of the database scale to keep a single round in the seconds range.
+_HISTORY_FRACTION = 100
+_GEMINI_FRACTION = 1_000
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register benchmark command-line options."""
+    parser.addoption(
+        "--bench-scale",
+        default=os.environ.get(ENV_BENCH_SCALE, DEFAULT_BENCH_SCALE),
+        help="Synthetic dataset size: 10k, 100k, 1m, 10m or a session count",
+    )
+
+
+@pytest.fixture(scope="session")
+def bench_scale(request: pytest.FixtureRequest) -> int:
+    """Number of sessions in the synthetic database."""
+    return parse_scale(str(request.config.getoption("--bench-scale")))
+
+
+@pytest.fixture(scope="session")
+def bench_db_path(bench_scale: int, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A sessions database populated with ``bench_scale`` sessions."""
+    db_path = tmp_path_factory.mktemp("bench-db") / "sessions.db"
+    populate_database(db_path, sessions=bench_scale, seed=DEFAULT_SEED)
+    return db_path
+
+
+@pytest.fixture(scope="session")
+def history_file(bench_scale: int, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A Claude history.jsonl scaled to the benchmark size."""
+    path = tmp_path_factory.mktemp("bench-history") / "history.jsonl"
+    write_history_jsonl(path, sessions=max(bench_scale // _HISTORY_FRACTION, 10))
+    return path
+
+
+@pytest.fixture(scope="session")
+def gemini_tree(bench_scale: int, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A Gemini session tree scaled to the benchmark size."""
+    base_dir = tmp_path_factory.mktemp("bench-gemini")
+    write_gemini_tree(base_dir, sessions=max(bench_scale // _GEMINI_FRACTION, 10))
+    return base_dir
+
+
+@pytest.fixture(scope="session")
+def config_tree(bench_scale: int, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A vendor configuration directory for backup/restore benchmarks."""
+    root = tmp_path_factory.mktemp("bench-config") / ".claude"
+    write_config_tree(root, files=max(bench_scale // 20, 50))
+    return root
@@ -0,0 +1,647 @@
+"""Deterministic synthetic data generator for benchmarks.
+
+Produces realistic-looking fixtures at configurable scale so performance work
+can be measured against something larger than a developer's own history:
+
+- A fully populated sessions database (sessions, events, GitHub commits),
+  bulk-loaded with ``executemany`` in one transaction (millions of rows
+  load in minutes rather than the hours per-row inserts would take).
+- A Claude ``history.jsonl`` file in the format read by ``database.sync``.
+- A Gemini ``<project>/chats/session-*.json`` tree as read by
+  ``database.sync_gemini``.
+- A vendor configuration directory for backup/restore benchmarks.
+
+Every generator takes a ``seed`` and an ``anchor`` datetime; the same pair
+always produces byte-identical output.
+
+Example:
+    python -m benchmarks.datagen db /tmp/bench.db --scale 1m
+    python -m benchmarks.datagen history /tmp/history.jsonl --sessions 50000
+    python -m benchmarks.datagen gemini /tmp/gemini-tmp --sessions 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ai_asst_mgr.database.schema import SchemaManager
+from ai_asst_mgr.operations.github_parser import GitHubCommit
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+DEFAULT_SEED = 1337
+DEFAULT_DAYS = 90
+DEFAULT_EVENTS_PER_SESSION = 10
+DEFAULT_BATCH_SIZE = 50_000
+
+# Named dataset sizes, expressed as a number of sessions.
+SCALES: dict[str, int] = {
+    "10k": 10_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+    "10m": 10_000_000,
+}
+
+VENDORS: dict[str, tuple[str, str]] = {
+    "claude": ("Claude Code", "~/.claude"),
+    "gemini": ("Gemini CLI", "~/.gemini"),
+    "openai": ("OpenAI Codex", "~/.codex"),
+}
+_VENDOR_CUM_WEIGHTS = (0.6, 0.9, 1.0)
+_EVENT_TYPES = ("tool_call", "message", "thought", "error")
+_EVENT_CUM_WEIGHTS = (0.45, 0.85, 0.97, 1.0)
+_TOOL_SUCCESS_RATE = 0.95
+
+TOOL_NAMES = (
+    "Read",
+    "Edit",
+    "Write",
+    "Bash",
+    "Grep",
+    "Glob",
+    "WebFetch",
+    "Task",
+    "TodoWrite",
+    "run_shell_command",
+)
+PROJECTS = tuple(f"/home/dev/projects/project-{i:02d}" for i in range(24))
+REPOS = tuple(f"dev/repo-{i:02d}" for i in range(12))
+_PROMPTS = (
+    "fix the failing test in",
+    "refactor the parser for",
+    "add type hints to",
+    "explain how this works:",
+    "write docs for",
+    "speed up the query in",
+    "review the changes to",
+)
+_COMMIT_TRAILERS = (
+    "",
+    "",
+    "",
+    "\n\nCo-Authored-By: Claude <noreply@anthropic.com>",
+    "\n\nGenerated with Gemini CLI",
+    "\n\nCo-authored-by: Codex <codex@openai.com>",
+)
+
+
+@dataclass
+class DatasetStats:
+    """Row counts and timing for a generated dataset.
+
+    Attributes:
+        sessions: Number of sessions written.
+        events: Number of events written.
+        commits: Number of GitHub commits written.
+        elapsed_seconds: Wall-clock time spent generating.
+    """
+
+    sessions: int = 0
+    events: int = 0
+    commits: int = 0
+    elapsed_seconds: float = 0.0
+
+
+def default_anchor() -> datetime:
+    """Return today's midnight (UTC), the default end of the generated time range.
+
+    Anchoring to the day rather than the instant keeps repeated runs on the
+    same day identical while still landing inside the query windows
+    (``days=7``, ``days=30``) used by DatabaseManager.
+
+    Returns:
+        Midnight UTC of the current day.
+    """
+    return datetime.now(tz=UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def parse_scale(value: str) -> int:
+    """Parse a dataset size such as ``10k``, ``1m`` or ``250000``.
+
+    Args:
+        value: Named scale from SCALES or a plain integer.
+
+    Returns:
+        Number of sessions.
+
+    Raises:
+        ValueError: If the value is neither a known scale nor an integer.
+    """
+    key = value.strip().lower()
+    if key in SCALES:
+        return SCALES[key]
+    try:
+        count = int(key.replace("_", ""))
+    except ValueError:
+        msg = f"Unknown scale {value!r}; use one of {', '.join(SCALES)} or an integer"
+        raise ValueError(msg) from None
+    if count < 0:
+        msg = f"Scale must be non-negative, got {count}"
+        raise ValueError(msg)
+    return count
+
+
+def _session_id(seed: int, index: int) -> str:
+    """Build a stable, UUID-shaped session identifier."""
+    digest = hashlib.md5(f"{seed}:{index}".encode(), usedforsecurity=False).hexdigest()
+    return f"{digest[:8]}-{digest[8:12]}-{digest[12:16]}-{digest[16:20]}-{digest[20:32]}"
+
+
+def _sha(seed: int, index: int) -> str:
+    """Build a stable 40-character commit SHA."""
+    return hashlib.sha1(f"commit:{seed}:{index}".encode(), usedforsecurity=False).hexdigest()
+
+
+def _random_start(rng: random.Random, anchor: datetime, days: int) -> datetime:
+    """Pick a start time within ``days`` before ``anchor``."""
+    return anchor - timedelta(seconds=rng.randrange(max(days, 1) * 86_400))
+
+
+def _session_rows(
+    rng: random.Random,
+    *,
+    sessions: int,
+    events_per_session: int,
+    days: int,
+    seed: int,
+    anchor: datetime,
+) -> Iterator[tuple[tuple[Any, ...], list[tuple[Any, ...]]]]:
+    """Yield one ``(session_row, event_rows)`` pair per generated session."""
+    vendors = list(VENDORS)
+    for index in range(sessions):
+        session_id = _session_id(seed, index)
+        vendor_id = rng.choices(vendors, cum_weights=_VENDOR_CUM_WEIGHTS)[0]
+        start = _random_start(rng, anchor, days)
+        event_count = rng.randint(0, events_per_session * 2)
+
+        events: list[tuple[Any, ...]] = []
+        tool_calls = messages = errors = 0
+        offset = 0
+        for _ in range(event_count):
+            offset += rng.randint(1, 90)
+            event_type = rng.choices(_EVENT_TYPES, cum_weights=_EVENT_CUM_WEIGHTS)[0]
+            if event_type == "tool_call":
+                event_name = rng.choice(TOOL_NAMES)
+                tool_calls += 1
+            elif event_type == "message":
+                event_name = rng.choice(("user", "assistant"))
+                messages += 1
+            elif event_type == "thought":
+                event_name = "reasoning"
+            else:
+                event_name = "tool_error"
+                errors += 1
+            events.append(
+                (
+                    session_id,
+                    vendor_id,
+                    event_type,
+                    event_name,
+                    None,
+                    (start + timedelta(seconds=offset)).isoformat(),
+                )
+            )
+
+        duration = offset + rng.randint(5, 600)
+        session = (
+            session_id,
+            vendor_id,
+            rng.choice(PROJECTS),
+            start.isoformat(),
+            (start + timedelta(seconds=duration)).isoformat(),
+            duration,
+            tool_calls,
+            messages,
+            errors,
+        )
+        yield session, events
+
+
+def _commit_rows(
+    rng: random.Random,
+    *,
+    commits: int,
+    days: int,
+    seed: int,
+    anchor: datetime,
+) -> Iterator[tuple[Any, ...]]:
+    """Yield ``github_commits`` rows with a realistic mix of AI trailers."""
+    vendor_for_trailer = {0: None, 1: None, 2: None, 3: "claude", 4: "gemini", 5: "openai"}
+    for index in range(commits):
+        trailer_index = rng.randrange(len(_COMMIT_TRAILERS))
+        subject = f"{rng.choice(_PROMPTS).capitalize()} module {rng.randint(1, 500)}"
+        yield (
+            _sha(seed, index),
+            rng.choice(REPOS),
+            "main",
+            subject + _COMMIT_TRAILERS[trailer_index],
+            "Dev Eloper",
+            "dev@example.com",
+            vendor_for_trailer[trailer_index],
+            _random_start(rng, anchor, days).isoformat(),
+        )
+
+
+def synthetic_commits(
+    count: int,
+    *,
+    days: int = DEFAULT_DAYS,
+    seed: int = DEFAULT_SEED,
+    anchor: datetime | None = None,
+) -> Iterator[GitHubCommit]:
+    """Yield GitHub commits with the same mix of AI trailers as the database.
+
+    Args:
+        count: Number of commits to generate.
+        days: Spread commit times over this many days before ``anchor``.
+        seed: Random seed.
+        anchor: End of the generated time range (default: today, midnight UTC).
+
+    Yields:
+        GitHubCommit objects with unique SHAs.
+    """
+    rng = random.Random(seed)
+    anchor = anchor or default_anchor()
+    for row in _commit_rows(rng, commits=count, days=days, seed=seed, anchor=anchor):
+        sha, repo, branch, message, author_name, author_email, vendor_id, committed_at = row
+        yield GitHubCommit(
+            sha=sha,
+            repo=repo,
+            branch=branch,
+            message=message,
+            author_name=author_name,
+            author_email=author_email,
+            vendor_id=vendor_id,
+            committed_at=datetime.fromisoformat(committed_at),
+        )
+
+
+def _flush(conn: sqlite3.Connection, sql: str, rows: list[tuple[Any, ...]]) -> int:
+    """Insert buffered rows and clear the buffer, returning the row count."""
+    count = len(rows)
+    if rows:
+        conn.executemany(sql, rows)
+        rows.clear()
+    return count
+
+
+_SESSION_INSERT = """
+    INSERT INTO sessions (
+        session_id, vendor_id, project_path, start_time, end_time,
+        duration_seconds, tool_calls_count, messages_count, errors_count
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_EVENT_INSERT = """
+    INSERT INTO events (session_id, vendor_id, event_type, event_name, event_data, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_COMMIT_INSERT = """
+    INSERT OR REPLACE INTO github_commits (
+        sha, repo, branch, message, author_name, author_email, vendor_id, committed_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def populate_database(
+    db_path: Path,
+    *,
+    sessions: int = SCALES["10k"],
+    events_per_session: int = DEFAULT_EVENTS_PER_SESSION,
+    commits: int | None = None,
+    days: int = DEFAULT_DAYS,
+    seed: int = DEFAULT_SEED,
+    anchor: datetime | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> DatasetStats:
+    """Create (or extend) a sessions database filled with synthetic data.
+
+    Rows are inserted with ``executemany`` in batches of ``batch_size`` inside
+    a single transaction, with durability pragmas relaxed for the load.
+
+    Args:
+        db_path: Database file to create; the schema is initialized if needed.
+        sessions: Number of sessions to generate.
+        events_per_session: Average events per session (actual counts vary
+            uniformly between 0 and twice this value).
+        commits: Number of GitHub commits; defaults to one per ten sessions.
+        days: Spread session start times over this many days before ``anchor``.
+        seed: Random seed.
+        anchor: End of the generated time range (default: today, midnight UTC).
+        batch_size: Rows buffered per ``executemany`` call.
+
+    Returns:
+        DatasetStats describing what was written.
+    """
+    started = time.perf_counter()
+    anchor = anchor or default_anchor()
+    commits = sessions // 10 if commits is None else commits
+    rng = random.Random(seed)
+    stats = DatasetStats()
+
+    SchemaManager(db_path).initialize()
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA journal_mode = MEMORY")
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO vendor_profiles (vendor_id, display_name, config_dir) "
+                "VALUES (?, ?, ?)",
+                [(vendor, name, path) for vendor, (name, path) in VENDORS.items()],
+            )
+
+            session_buffer: list[tuple[Any, ...]] = []
+            event_buffer: list[tuple[Any, ...]] = []
+            for session, events in _session_rows(
+                rng,
+                sessions=sessions,
+                events_per_session=events_per_session,
+                days=days,
+                seed=seed,
+                anchor=anchor,
+            ):
+                session_buffer.append(session)
+                event_buffer.extend(events)
+                if len(session_buffer) >= batch_size:
+                    stats.sessions += _flush(conn, _SESSION_INSERT, session_buffer)
+                if len(event_buffer) >= batch_size:
+                    stats.events += _flush(conn, _EVENT_INSERT, event_buffer)
+            stats.sessions += _flush(conn, _SESSION_INSERT, session_buffer)
+            stats.events += _flush(conn, _EVENT_INSERT, event_buffer)
+
+            commit_buffer: list[tuple[Any, ...]] = []
+            for row in _commit_rows(rng, commits=commits, days=days, seed=seed, anchor=anchor):
+                commit_buffer.append(row)
+                if len(commit_buffer) >= batch_size:
+                    stats.commits += _flush(conn, _COMMIT_INSERT, commit_buffer)
+            stats.commits += _flush(conn, _COMMIT_INSERT, commit_buffer)
+    finally:
+        conn.close()
+
+    stats.elapsed_seconds = time.perf_counter() - started
+    return stats
+
+
+def write_history_jsonl(
+    path: Path,
+    *,
+    sessions: int = 1_000,
+    messages_per_session: int = DEFAULT_EVENTS_PER_SESSION,
+    days: int = DEFAULT_DAYS,
+    seed: int = DEFAULT_SEED,
+    anchor: datetime | None = None,
+) -> int:
+    """Write a Claude ``history.jsonl`` file.
+
+    Args:
+        path: Output file; parent directories are created.
+        sessions: Number of distinct sessions.
+        messages_per_session: Average prompts per session.
+        days: Spread sessions over this many days before ``anchor``.
+        seed: Random seed.
+        anchor: End of the generated time range (default: today, midnight UTC).
+
+    Returns:
+        Number of lines written.
+    """
+    anchor = anchor or default_anchor()
+    rng = random.Random(seed)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    lines = 0
+    with path.open("w", encoding="utf-8") as f:
+        for index in range(sessions):
+            session_id = _session_id(seed, index)
+            project = rng.choice(PROJECTS)
+            timestamp_ms = int(_random_start(rng, anchor, days).timestamp() * 1000)
+            for _ in range(rng.randint(1, messages_per_session * 2)):
+                timestamp_ms += rng.randint(5_000, 120_000)
+                entry = {
+                    "display": f"{rng.choice(_PROMPTS)} {project}/src/mod_{rng.randint(1, 99)}.py",
+                    "pastedContents": {},
+                    "timestamp": timestamp_ms,
+                    "project": project,
+                    "sessionId": session_id,
+                }
+                f.write(json.dumps(entry))
+                f.write("\n")
+                lines += 1
+    return lines
+
+
+def write_gemini_tree(
+    base_dir: Path,
+    *,
+    sessions: int = 200,
+    messages_per_session: int = DEFAULT_EVENTS_PER_SESSION,
+    projects: int = 8,
+    days: int = DEFAULT_DAYS,
+    seed: int = DEFAULT_SEED,
+    anchor: datetime | None = None,
+) -> int:
+    """Write a Gemini ``<project>/chats/session-*.json`` tree.
+
+    Args:
+        base_dir: Root of the tree (the equivalent of ``~/.gemini/tmp``).
+        sessions: Number of session files.
+        messages_per_session: Average messages per session.
+        projects: Number of project hash directories to spread sessions over.
+        days: Spread sessions over this many days before ``anchor``.
+        seed: Random seed.
+        anchor: End of the generated time range (default: today, midnight UTC).
+
+    Returns:
+        Number of session files written.
+    """
+    anchor = anchor or default_anchor()
+    rng = random.Random(seed)
+    project_hashes = [
+        hashlib.sha256(f"{seed}:{project}".encode()).hexdigest()
+        for project in PROJECTS[: max(projects, 1)]
+    ]
+
+    for index in range(sessions):
+        session_id = _session_id(seed, index)
+        project_hash = project_hashes[index % len(project_hashes)]
+        start = _random_start(rng, anchor, days)
+        moment = start
+        messages: list[dict[str, Any]] = []
+        for turn in range(rng.randint(1, messages_per_session * 2)):
+            moment += timedelta(seconds=rng.randint(2, 90))
+            stamp = moment.isoformat().replace("+00:00", "Z")
+            message: dict[str, Any] = {
+                "type": "user" if turn % 2 == 0 else "gemini",
+                "content": f"{rng.choice(_PROMPTS)} component {rng.randint(1, 200)}",
+                "timestamp": stamp,
+            }
+            if message["type"] == "gemini":
+                message["thoughts"] = [
+                    {"subject": "Planning", "description": "Decide next step", "timestamp": stamp}
+                    for _ in range(rng.randint(0, 2))
+                ]
+                message["toolCalls"] = [
+                    {
+                        "name": rng.choice(TOOL_NAMES),
+                        "args": {"path": f"src/file_{rng.randint(1, 50)}.py"},
+                        "status": "success" if rng.random() < _TOOL_SUCCESS_RATE else "error",
+                        "result": [],
+                        "timestamp": stamp,
+                    }
+                    for _ in range(rng.randint(0, 3))
+                ]
+            messages.append(message)
+
+        chats_dir = base_dir / project_hash / "chats"
+        chats_dir.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "sessionId": session_id,
+            "projectHash": project_hash,
+            "startTime": start.isoformat().replace("+00:00", "Z"),
+            "lastUpdated": moment.isoformat().replace("+00:00", "Z"),
+            "messages": messages,
+        }
+        file_name = f"session-{start:%Y-%m-%dT%H-%M}-{session_id[:8]}.json"
+        (chats_dir / file_name).write_text(json.dumps(payload), encoding="utf-8")
+    return sessions
+
+
+def write_config_tree(
+    root: Path,
+    *,
+    files: int = 500,
+    file_size: int = 4_096,
+    seed: int = DEFAULT_SEED,
+) -> int:
+    """Write a vendor configuration directory for backup/restore benchmarks.
+
+    Files are spread over the directories a Claude config usually has
+    (agents, commands, hooks, projects, ...). Content is a mix of
+    compressible text and random bytes so compression ratios stay realistic.
+
+    Args:
+        root: Directory to populate (the equivalent of ``~/.claude``).
+        files: Number of files to write, in addition to ``settings.json``.
+        file_size: Approximate size of each file in bytes.
+        seed: Random seed.
+
+    Returns:
+        Total bytes written.
+    """
+    rng = random.Random(seed)
+    subdirs = ("agents", "commands", "hooks", "skills", "projects", "todos", "plugins")
+    root.mkdir(parents=True, exist_ok=True)
+    settings = json.dumps({"model": "sonnet", "permissions": {"allow": ["Bash(git:*)"]}})
+    (root / "settings.json").write_text(settings, encoding="utf-8")
+    total = len(settings)
+
+    for index in range(files):
+        directory = root / rng.choice(subdirs) / f"group-{index % 16:02d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        text_part = (f"# Item {index}\n" + "lorem ipsum dolor sit amet " * 8 + "\n").encode()
+        random_size = file_size // 4
+        body = (text_part * (max(file_size - random_size, 0) // len(text_part) + 1))[
+            : file_size - random_size
+        ]
+        content = body + rng.randbytes(random_size)
+        (directory / f"file-{index:06d}.md").write_bytes(content)
+        total += len(content)
+    return total
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser for ``python -m benchmarks.datagen``."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.datagen",
+        description="Generate deterministic synthetic data for ai-asst-mgr benchmarks.",
+    )
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Random seed")
+    parser.add_argument("--days", type=int, default=DEFAULT_DAYS, help="Time range in days")
+    sub = parser.add_subparsers(dest="kind", required=True)
+
+    db = sub.add_parser("db", help="Populate a sessions database")
+    db.add_argument("output", help="Database file to create")
+    db.add_argument("--scale", default="10k", help=f"Sessions: {', '.join(SCALES)} or N")
+    db.add_argument("--events-per-session", type=int, default=DEFAULT_EVENTS_PER_SESSION)
+    db.add_argument("--commits", type=int, default=None, help="GitHub commits (default: N/10)")
+
+    history = sub.add_parser("history", help="Write a Claude history.jsonl file")
+    history.add_argument("output", help="history.jsonl path")
+    history.add_argument("--sessions", default="1000", help="Sessions: named scale or N")
+    history.add_argument("--messages-per-session", type=int, default=DEFAULT_EVENTS_PER_SESSION)
+
+    gemini = sub.add_parser("gemini", help="Write a Gemini session tree")
+    gemini.add_argument("output", help="Base directory (like ~/.gemini/tmp)")
+    gemini.add_argument("--sessions", default="200", help="Sessions: named scale or N")
+    gemini.add_argument("--messages-per-session", type=int, default=DEFAULT_EVENTS_PER_SESSION)
+
+    config = sub.add_parser("config", help="Write a vendor config directory")
+    config.add_argument("output", help="Directory to populate")
+    config.add_argument("--files", type=int, default=500)
+    config.add_argument("--file-size", type=int, default=4_096)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entry point for ``python -m benchmarks.datagen``.
+
+    Args:
+        argv: Command-line arguments (default: ``sys.argv[1:]``).
+
+    Returns:
+        Process exit code.
+    """
+    args = _build_parser().parse_args(argv)
+    output = Path(args.output)
+
+    if args.kind == "db":
+        stats = populate_database(
+            output,
+            sessions=parse_scale(args.scale),
+            events_per_session=args.events_per_session,
+            commits=args.commits,
+            days=args.days,
+            seed=args.seed,
+        )
+        print(
+            f"{output}: {stats.sessions:,} sessions, {stats.events:,} events, "
+            f"{stats.commits:,} commits in {stats.elapsed_seconds:.1f}s"
+        )
+    elif args.kind == "history":
+        lines = write_history_jsonl(
+            output,
+            sessions=parse_scale(args.sessions),
+            messages_per_session=args.messages_per_session,
+            days=args.days,
+            seed=args.seed,
+        )
+        print(f"{output}: {lines:,} entries")
+    elif args.kind == "gemini":
+        count = write_gemini_tree(
+            output,
+            sessions=parse_scale(args.sessions),
+            messages_per_session=args.messages_per_session,
+            days=args.days,
+            seed=args.seed,
+        )
+        print(f"{output}: {count:,} session files")
+    else:
+        total = write_config_tree(
+            output, files=args.files, file_size=args.file_size, seed=args.seed
+        )
+        print(f"{output}: {total:,} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
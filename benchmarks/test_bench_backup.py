@@ -0,0 +1,186 @@
+"""Benchmarks for backup creation, verification and restore."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ai_asst_mgr.adapters.claude import ClaudeAdapter
+from ai_asst_mgr.operations.backup import BackupManager
+from ai_asst_mgr.operations.restore import RestoreManager
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from ai_asst_mgr.adapters.base import VendorInfo
+
+_ROUNDS = 3
+
+
+class _DirectoryAdapter(ClaudeAdapter):
+    """Claude adapter pointed at an arbitrary configuration directory."""
+
+    def __init__(self, config_dir: Path, vendor_id: str = "claude") -> None:
+        super().__init__()
+        self._config_dir = config_dir
+        self._settings_file = config_dir / "settings.json"
+        self._vendor_id = vendor_id
+
+    @property
+    def info(self) -> VendorInfo:
+        return replace(super().info, vendor_id=self._vendor_id)
+
+
+@pytest.fixture
+def backup_manager(tmp_path: Path) -> BackupManager:
+    """BackupManager writing into a per-test directory, keeping every backup."""
+    return BackupManager(tmp_path / "backups", retention_count=1_000)
+
+
+@pytest.fixture
+def backup_archive(config_tree: Path, backup_manager: BackupManager) -> Path:
+    """A single backup of the synthetic config tree."""
+    result = backup_manager.backup_vendor(_DirectoryAdapter(config_tree))
+    assert result.success
+    assert result.metadata is not None
+    return result.metadata.backup_path
+
+
+class TestBackupBenchmarks:
+    """Backup and restore of a synthetic vendor configuration directory."""
+
+    def test_backup_vendor(
+        self,
+        benchmark: BenchmarkFixture,
+        config_tree: Path,
+        backup_manager: BackupManager,
+    ) -> None:
+        """Archive, checksum, count and record one backup."""
+        adapter = _DirectoryAdapter(config_tree)
+
+        result = benchmark.pedantic(backup_manager.backup_vendor, args=(adapter,), rounds=_ROUNDS)
+        assert result.success
+
+    @pytest.mark.parametrize("max_workers", [1, 3])
+    def test_backup_all_vendors(
+        self,
+        benchmark: BenchmarkFixture,
+        config_tree: Path,
+        backup_manager: BackupManager,
+        max_workers: int,
+    ) -> None:
+        """Back up three vendors sequentially or concurrently."""
+        adapters = {
+            vendor_id: _DirectoryAdapter(config_tree, vendor_id)
+            for vendor_id in ("claude", "gemini", "openai")
+        }
+
+        summary = benchmark.pedantic(
+            backup_manager.backup_all_vendors,
+            args=(adapters,),
+            kwargs={"max_workers": max_workers},
+            rounds=_ROUNDS,
+        )
+        assert summary.successful == len(adapters)
+
+    def test_list_backups(
+        self,
+        benchmark: BenchmarkFixture,
+        backup_manager: BackupManager,
+        backup_archive: Path,
+    ) -> None:
+        """Catalog listing with a few hundred recorded backups."""
+        template = backup_manager.list_backups("claude")[0]
+        older = [
+            replace(
+                template,
+                timestamp=template.timestamp - timedelta(hours=hours),
+                backup_path=backup_archive.with_name(f"older_{hours:03d}.tar.gz"),
+            )
+            for hours in range(1, 500)
+        ]
+        for backup in older:
+            backup.backup_path.touch()
+        backup_manager.catalog.add_many(older)
+
+        backups = benchmark(backup_manager.list_backups, "claude")
+        assert len(backups) == 500
+        assert backups[0].backup_path == backup_archive
+
+    def test_verify_backup(
+        self,
+        benchmark: BenchmarkFixture,
+        backup_manager: BackupManager,
+        backup_archive: Path,
+    ) -> None:
+        """Checksum and integrity verification of an existing backup."""
+        is_valid, _ = benchmark(backup_manager.verify_backup, backup_archive)
+        assert is_valid
+
+    def test_preview_restore(
+        self,
+        benchmark: BenchmarkFixture,
+        backup_manager: BackupManager,
+        backup_archive: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Dry-run listing of what a restore would change."""
+        restore_manager = RestoreManager(backup_manager)
+        adapter = _DirectoryAdapter(tmp_path / "preview-target")
+
+        preview = benchmark(restore_manager.preview_restore, backup_archive, adapter)
+        assert preview is not None
+
+    def test_get_restorable_directories(
+        self,
+        benchmark: BenchmarkFixture,
+        backup_manager: BackupManager,
+        backup_archive: Path,
+    ) -> None:
+        """Top-level directory listing used by selective restore."""
+        restore_manager = RestoreManager(backup_manager)
+
+        directories = benchmark(restore_manager.get_restorable_directories, backup_archive)
+        assert directories
+
+    def test_restore_selective(
+        self,
+        benchmark: BenchmarkFixture,
+        backup_manager: BackupManager,
+        backup_archive: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Restore of one directory, reading only its blocks via the member index."""
+        restore_manager = RestoreManager(backup_manager)
+        adapter = _DirectoryAdapter(tmp_path / "selective-target")
+
+        result = benchmark.pedantic(
+            restore_manager.restore_selective,
+            args=(backup_archive, adapter, ["agents"]),
+            rounds=_ROUNDS,
+        )
+        assert result.success
+
+    def test_restore_vendor(
+        self,
+        benchmark: BenchmarkFixture,
+        backup_manager: BackupManager,
+        backup_archive: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Full verify-and-extract restore into an empty target directory."""
+        restore_manager = RestoreManager(backup_manager)
+        adapter = _DirectoryAdapter(tmp_path / "restore-target")
+
+        result = benchmark.pedantic(
+            restore_manager.restore_vendor,
+            args=(backup_archive, adapter),
+            kwargs={"create_pre_restore_backup": False},
+            rounds=_ROUNDS,
+        )
+        assert result.success
@@ -0,0 +1,75 @@
+"""Benchmarks for GitHub commit attribution and storage."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ai_asst_mgr.database import DatabaseManager
+from ai_asst_mgr.operations.github_parser import DEFAULT_MATCHER
+from benchmarks.datagen import synthetic_commits
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from ai_asst_mgr.operations.github_parser import GitHubCommit
+
+_ROUNDS = 3
+
+
+@pytest.fixture(scope="module")
+def commit_messages(bench_scale: int) -> list[str]:
+    """One synthetic commit message per session of the benchmark scale."""
+    return [commit.message for commit in synthetic_commits(bench_scale)]
+
+
+class TestAttributionBenchmarks:
+    """Vendor attribution over many commit messages."""
+
+    def test_detect_attribution(
+        self, benchmark: BenchmarkFixture, commit_messages: list[str]
+    ) -> None:
+        """Attribute every message with the built-in rules (1M at --bench-scale 1m)."""
+        detect = DEFAULT_MATCHER.detect
+
+        attributed = benchmark.pedantic(
+            lambda: sum(1 for message in commit_messages if detect(message)[0]),
+            rounds=_ROUNDS,
+        )
+
+        assert 0 < attributed < len(commit_messages)
+
+
+@pytest.fixture(scope="module")
+def backfill_commits(bench_scale: int) -> list[GitHubCommit]:
+    """Ten synthetic commits per session (100k at the default scale)."""
+    return list(synthetic_commits(bench_scale * 10))
+
+
+class TestCommitStorageBenchmarks:
+    """Writing commits into the sessions database."""
+
+    def test_backfill_commits_bulk(
+        self,
+        benchmark: BenchmarkFixture,
+        backfill_commits: list[GitHubCommit],
+        tmp_path: Path,
+    ) -> None:
+        """Backfill an empty database with record_github_commits_bulk."""
+        counter = iter(range(1_000_000))
+
+        def fresh_db() -> tuple[tuple[DatabaseManager], dict[str, object]]:
+            db = DatabaseManager(tmp_path / f"backfill-{next(counter)}.db")
+            db.initialize()
+            return (db,), {}
+
+        result = benchmark.pedantic(
+            lambda db: db.record_github_commits_bulk(backfill_commits),
+            setup=fresh_db,
+            rounds=_ROUNDS,
+        )
+
+        assert (result.inserted, result.updated) == (len(backfill_commits), 0)
@@ -0,0 +1,92 @@
+"""Benchmarks for ingesting vendor history into the sessions database."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ai_asst_mgr.database import DatabaseManager
+from ai_asst_mgr.database.sync import sync_history_to_db
+from ai_asst_mgr.database.sync_gemini import sync_gemini_history_to_db
+from benchmarks.datagen import populate_database
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+_ROUNDS = 3
+
+
+@pytest.fixture
+def fresh_db_factory(tmp_path: Path) -> object:
+    """Return a callable that creates a new, empty, initialized database."""
+    counter = iter(range(1_000_000))
+
+    def make() -> tuple[tuple[DatabaseManager], dict[str, object]]:
+        db = DatabaseManager(tmp_path / f"ingest-{next(counter)}.db")
+        db.initialize()
+        return (db,), {}
+
+    return make
+
+
+@pytest.fixture(autouse=True)
+def _isolated_sync_state(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the Claude sync watermark out of the real home directory."""
+    monkeypatch.setattr("ai_asst_mgr.database.sync.SYNC_STATE_FILE", tmp_path / ".sync_state")
+
+
+class TestIngestBenchmarks:
+    """End-to-end ingest of synthetic vendor history."""
+
+    def test_claude_history_sync(
+        self,
+        benchmark: BenchmarkFixture,
+        history_file: Path,
+        fresh_db_factory: object,
+    ) -> None:
+        """Import a synthetic history.jsonl into an empty database."""
+        result = benchmark.pedantic(
+            lambda db: sync_history_to_db(db, history_file, full_sync=True),
+            setup=fresh_db_factory,
+            rounds=_ROUNDS,
+        )
+        assert result.sessions_imported > 0
+        assert not result.errors
+
+    def test_gemini_history_sync(
+        self,
+        benchmark: BenchmarkFixture,
+        gemini_tree: Path,
+        fresh_db_factory: object,
+    ) -> None:
+        """Import a synthetic Gemini session tree into an empty database."""
+        result = benchmark.pedantic(
+            lambda db: sync_gemini_history_to_db(db, gemini_tree, full_sync=True),
+            setup=fresh_db_factory,
+            rounds=_ROUNDS,
+        )
+        assert result.sessions_imported > 0
+        assert not result.errors
+
+    def test_record_event(self, benchmark: BenchmarkFixture, tmp_path: Path) -> None:
+        """Cost of a single DatabaseManager.record_event call."""
+        db = DatabaseManager(tmp_path / "events.db")
+        db.initialize()
+        db.record_session("bench-session", "claude")
+
+        benchmark(db.record_event, "bench-session", "claude", "tool_call", "Read")
+
+    def test_bulk_generate(
+        self, benchmark: BenchmarkFixture, bench_scale: int, tmp_path: Path
+    ) -> None:
+        """Throughput of the synthetic bulk loader itself (the ingest ceiling)."""
+        counter = iter(range(1_000_000))
+
+        def load() -> int:
+            stats = populate_database(tmp_path / f"bulk-{next(counter)}.db", sessions=bench_scale)
+            return stats.sessions
+
+        assert benchmark.pedantic(load, rounds=1) == bench_scale
@@ -0,0 +1,63 @@
+"""Benchmarks for every read query on DatabaseManager."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from ai_asst_mgr.database import DatabaseManager
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+@pytest.fixture(scope="module")
+def bench_db(bench_db_path: Path) -> DatabaseManager:
+    """DatabaseManager over the shared synthetic database."""
+    return DatabaseManager(bench_db_path)
+
+
+# (benchmark id, call) pairs covering each public read method.
+QUERIES: list[tuple[str, Callable[[DatabaseManager], Any]]] = [
+    ("get_vendor_stats", lambda db: db.get_vendor_stats("claude", days=30)),
+    ("get_vendor_stats_summary", lambda db: db.get_vendor_stats_summary(days=30)),
+    ("get_daily_usage", lambda db: db.get_daily_usage(days=7)),
+    ("get_week_stats", lambda db: db.get_week_stats()),
+    ("get_previous_reviews", lambda db: db.get_previous_reviews(limit=10)),
+    ("get_agent_usage_history", lambda db: db.get_agent_usage_history()),
+    ("get_tool_usage", lambda db: db.get_tool_usage(days=30)),
+    ("get_tool_usage_vendor", lambda db: db.get_tool_usage("gemini", days=30)),
+    ("get_tool_stats", lambda db: db.get_tool_stats()),
+    ("get_inefficient_sessions", lambda db: db.get_inefficient_sessions()),
+    ("get_longitudinal_stats", lambda db: db.get_longitudinal_stats("gemini", weeks=4)),
+    ("get_skill_profile_stats", lambda db: db.get_skill_profile_stats("gemini", days=30)),
+    ("get_session_scatter_data", lambda db: db.get_session_scatter_data("gemini", limit=50)),
+    ("get_weekly_event_breakdown", lambda db: db.get_weekly_event_breakdown("gemini", weeks=8)),
+    ("get_github_stats", lambda db: db.get_github_stats()),
+    ("get_github_commits", lambda db: db.get_github_commits(limit=50)),
+    ("get_github_repos", lambda db: db.get_github_repos()),
+    ("get_github_repo_stats", lambda db: db.get_github_repo_stats()),
+    ("get_github_commit_by_sha", lambda db: db.get_github_commit_by_sha("0" * 40)),
+    ("get_github_activities", lambda db: db.get_github_activities(limit=50)),
+    ("get_github_activity_stats", lambda db: db.get_github_activity_stats()),
+]
+
+
+class TestQueryBenchmarks:
+    """Latency of DatabaseManager read methods against the synthetic dataset."""
+
+    @pytest.mark.parametrize(
+        "query", [call for _, call in QUERIES], ids=[name for name, _ in QUERIES]
+    )
+    def test_query(
+        self,
+        benchmark: BenchmarkFixture,
+        bench_db: DatabaseManager,
+        query: Callable[[DatabaseManager], Any],
+    ) -> None:
+        """Time one read method."""
+        benchmark(query, bench_db)
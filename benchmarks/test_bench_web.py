@@ -0,0 +1,45 @@
+"""Benchmarks for web dashboard pages and API endpoints."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ai_asst_mgr.web import create_app
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+ENDPOINTS = [
+    "/",
+    "/sessions",
+    "/github",
+    "/api/stats",
+    "/api/vendors",
+    "/api/sessions",
+    "/api/sessions/stats",
+    "/api/github/stats",
+    "/api/github/commits",
+    "/metrics",
+]
+
+
+@pytest.fixture
+def client(bench_db_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    """Test client whose services read the synthetic database."""
+    monkeypatch.setattr("ai_asst_mgr.web.services.DEFAULT_DB_PATH", bench_db_path)
+    return TestClient(create_app())
+
+
+class TestWebBenchmarks:
+    """Request latency through the full FastAPI stack."""
+
+    @pytest.mark.parametrize("path", ENDPOINTS)
+    def test_endpoint(self, benchmark: BenchmarkFixture, client: TestClient, path: str) -> None:
+        """Time one GET request."""
+        response = benchmark(client.get, path)
+        assert response.status_code == 200
@@ -10,11 +10,15 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from ai_asst_mgr.utils.archive import ArchiveStats
+    from ai_asst_mgr.utils.compression import CompressionSettings
+    from ai_asst_mgr.utils.exclusions import ExclusionRules
+
 
 class VendorStatus(Enum):
     """Status of a vendor installation and configuration.
@@ -68,6 +72,26 @@ class VendorAdapter(ABC):
     keeping vendor-specific logic encapsulated.
     """
 
+    # Paths (gitignore-style patterns) the vendor regenerates by itself and
+    # backups skip by default; users add more with a .backupignore file
+    backup_exclusions: ClassVar[tuple[str, ...]] = ()
+
+    # Stats captured while the most recent backup() archive was written
+    _last_backup_stats: ArchiveStats | None = None
+
+    @property
+    def last_backup_stats(self) -> ArchiveStats | None:
+        """Get stats recorded while the most recent backup archive was written.
+
+        Adapters that write their archive with write_tar_archive() record its
+        checksum, size and file count here, so callers do not need to read the
+        archive back. None if no backup has been made or the stats are unknown.
+
+        Returns:
+            ArchiveStats for the last backup, or None.
+        """
+        return self._last_backup_stats
+
     @property
     @abstractmethod
     def info(self) -> VendorInfo:
@@ -143,11 +167,19 @@ class VendorAdapter(ABC):
         """
 
     @abstractmethod
-    def backup(self, backup_dir: Path) -> Path:
+    def backup(
+        self,
+        backup_dir: Path,
+        compression: CompressionSettings | None = None,
+        exclusions: ExclusionRules | None = None,
+    ) -> Path:
         """Create a backup of the vendor's configuration.
 
         Args:
             backup_dir: Directory where the backup should be stored.
+            compression: Archive compression settings. Defaults to gzip.
+            exclusions: Paths to leave out. Defaults to backup_exclusions plus
+                the config directory's .backupignore.
 
         Returns:
             Path to the created backup file or directory.
@@ -160,6 +192,14 @@ class VendorAdapter(ABC):
     def restore(self, backup_path: Path) -> None:
         """Restore configuration from a backup.
 
+        Paths the backup excluded are kept from the current configuration.
+
+        .. deprecated::
+            Use ``RestoreManager.restore_vendor``, which verifies the backup,
+            swaps the restored tree into place with a rename and keeps the
+            previous configuration until the swap has succeeded. Adapters
+            emit a ``DeprecationWarning`` when this is called.
+
         Args:
             backup_path: Path to the backup file or directory.
 
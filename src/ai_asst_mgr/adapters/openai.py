@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import shutil
 import tarfile
+import warnings
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -15,7 +16,15 @@ from typing import TYPE_CHECKING, Any
 import toml
 
 from ai_asst_mgr.adapters.base import VendorAdapter, VendorInfo, VendorStatus
-from ai_asst_mgr.utils import git_clone, is_command_available, unpack_tar_securely
+from ai_asst_mgr.utils import (
+    CompressionSettings,
+    ExclusionRules,
+    carry_over_excluded,
+    git_clone,
+    is_command_available,
+    unpack_tar_securely,
+    write_tar_archive,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -33,6 +42,9 @@ class OpenAIAdapter(VendorAdapter):
     - AGENTS.md - Documentation and agent hierarchy
     """
 
+    # TUI log files
+    backup_exclusions = ("log/",)
+
     def __init__(self) -> None:
         """Initialize the OpenAI Codex adapter."""
         self._config_dir = Path.home() / ".codex"
@@ -231,14 +243,22 @@ Edit `config.toml` to add or modify profiles.
 
         self._save_config(config)
 
-    def backup(self, backup_dir: Path) -> Path:
+    def backup(
+        self,
+        backup_dir: Path,
+        compression: CompressionSettings | None = None,
+        exclusions: ExclusionRules | None = None,
+    ) -> Path:
         """Create a backup of OpenAI Codex configuration.
 
         Args:
             backup_dir: Directory where the backup should be stored.
+            compression: Archive compression settings. Defaults to gzip.
+            exclusions: Paths to leave out. Defaults to backup_exclusions plus
+                the config directory's .backupignore.
 
         Returns:
-            Path to the created backup tar.gz file.
+            Path to the created backup archive.
 
         Raises:
             RuntimeError: If backup creation fails.
@@ -248,11 +268,15 @@ Edit `config.toml` to add or modify profiles.
 
             # Create timestamped backup filename
             timestamp = datetime.now(tz=UTC).strftime("%Y%m%d_%H%M%S")
-            backup_file = backup_dir / f"openai_backup_{timestamp}.tar.gz"
+            compression = compression or CompressionSettings()
+            backup_file = backup_dir / f"openai_backup_{timestamp}{compression.extension}"
 
-            # Create tar.gz archive
-            with tarfile.open(backup_file, "w:gz") as tar:
-                tar.add(self._config_dir, arcname="codex")
+            # Stream the archive, capturing checksum and counts as it is written
+            if exclusions is None:
+                exclusions = ExclusionRules.for_directory(self._config_dir, self.backup_exclusions)
+            self._last_backup_stats = write_tar_archive(
+                self._config_dir, backup_file, "codex", compression, exclusions
+            )
 
         except (OSError, tarfile.TarError) as e:
             error_msg = f"Failed to create backup: {e}"
@@ -263,6 +287,9 @@ Edit `config.toml` to add or modify profiles.
     def restore(self, backup_path: Path) -> None:
         """Restore configuration from a backup.
 
+        .. deprecated::
+            Use ``RestoreManager.restore_vendor`` instead.
+
         Args:
             backup_path: Path to the backup tar.gz file.
 
@@ -270,6 +297,11 @@ Edit `config.toml` to add or modify profiles.
             FileNotFoundError: If the backup path doesn't exist.
             RuntimeError: If restore operation fails.
         """
+        warnings.warn(
+            "VendorAdapter.restore() is deprecated; use RestoreManager.restore_vendor()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         if not backup_path.exists():
             msg = f"Backup file not found: {backup_path}"
             raise FileNotFoundError(msg)
@@ -279,14 +311,17 @@ Edit `config.toml` to add or modify profiles.
             temp_dir = backup_path.parent / "temp_restore"
             temp_dir.mkdir(exist_ok=True)
 
-            with tarfile.open(backup_path, "r:gz") as tar:
+            # r:* detects gzip, xz, bzip2 (and zstd where supported)
+            with tarfile.open(backup_path, "r:*") as tar:
                 # Use secure unpacking to prevent path traversal attacks
                 unpack_tar_securely(tar, temp_dir)
+                exclusions = ExclusionRules.from_pax_headers(tar.pax_headers or {})
 
             # Move extracted content to config directory
             extracted_dir = temp_dir / "codex"
             if extracted_dir.exists():
-                # Remove existing config if it exists
+                # Keep what the backup deliberately skipped, then replace the rest
+                carry_over_excluded(self._config_dir, extracted_dir, exclusions)
                 if self._config_dir.exists():
                     shutil.rmtree(self._config_dir)
 
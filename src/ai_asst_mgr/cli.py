@@ -13,29 +13,12 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Any
 
 import typer
-import uvicorn
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
 from ai_asst_mgr.adapters.base import VendorStatus
-from ai_asst_mgr.audit import ClaudeAuditor, CodexAuditor, GeminiAuditor
-from ai_asst_mgr.capabilities import AgentType, UniversalAgentManager
-from ai_asst_mgr.coaches import ClaudeCoach, CodexCoach, GeminiCoach, Priority
-from ai_asst_mgr.database import DatabaseManager
-from ai_asst_mgr.database.sync import get_sync_status, sync_history_to_db
-from ai_asst_mgr.database.sync_gemini import sync_gemini_history_to_db
-from ai_asst_mgr.operations import (
-    BackupManager,
-    MergeStrategy,
-    RestoreManager,
-    SyncManager,
-)
-from ai_asst_mgr.operations.github_parser import (
-    GitLogParser,
-    find_git_repos,
-)
 from ai_asst_mgr.platform import (
     IntervalType,
     ScheduleInfo,
@@ -45,11 +28,23 @@ from ai_asst_mgr.platform import (
 )
 from ai_asst_mgr.vendors import VendorRegistry
 
+# Startup time matters: the CLI runs from hooks and cron jobs many times a day.
+# Modules that are only needed by some commands (database, coaches, auditors,
+# backup/sync operations, the web server) are imported inside those commands
+# rather than here. tests/unit/test_cli_startup.py enforces this.
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
     from ai_asst_mgr.adapters.base import VendorAdapter
+    from ai_asst_mgr.capabilities import AgentType, UniversalAgentManager
     from ai_asst_mgr.coaches.base import CoachBase
+    from ai_asst_mgr.database.profiling import QueryProfiler
+    from ai_asst_mgr.operations import BackupManager, MergeStrategy, RestoreManager, SyncManager
+    from ai_asst_mgr.operations.github_parser import AttributionMatcher
+    from ai_asst_mgr.operations.github_sync import GitHubSyncSummary
+    from ai_asst_mgr.utils.compression import CompressionSettings
+    from ai_asst_mgr.utils.exclusions import ExclusionReport
 
 app = typer.Typer(
     name="ai-asst-mgr",
@@ -58,6 +53,97 @@ app = typer.Typer(
 )
 console = Console()
 
+# Number of statements shown in the --profile-sql summary
+_PROFILE_SUMMARY_LIMIT = 10
+
+
+@app.callback()
+def main_callback(
+    ctx: typer.Context,
+    profile_sql: Annotated[
+        bool,
+        typer.Option(
+            "--profile-sql",
+            help="Time every SQL statement and print a summary on exit",
+            envvar="AI_ASST_MGR_PROFILE_SQL",
+        ),
+    ] = False,
+    slow_query_ms: Annotated[
+        float | None,
+        typer.Option(
+            "--slow-query-ms",
+            help="Log statements slower than this many milliseconds [default: 100]",
+            envvar="AI_ASST_MGR_SLOW_QUERY_MS",
+            show_default=False,
+        ),
+    ] = None,
+    explain_slow: Annotated[
+        bool,
+        typer.Option(
+            "--explain-slow",
+            help="Attach EXPLAIN QUERY PLAN output to slow queries",
+            envvar="AI_ASST_MGR_SLOW_QUERY_EXPLAIN",
+        ),
+    ] = False,
+    slow_query_log: Annotated[
+        Path | None,
+        typer.Option(
+            "--slow-query-log",
+            help="Append slow queries to this file",
+            envvar="AI_ASST_MGR_SLOW_QUERY_LOG",
+        ),
+    ] = None,
+) -> None:
+    """Universal AI assistant configuration manager."""
+    if profile_sql:
+        from ai_asst_mgr.database.profiling import DEFAULT_SLOW_QUERY_MS, enable_sql_profiling
+
+        profiler = enable_sql_profiling(
+            DEFAULT_SLOW_QUERY_MS if slow_query_ms is None else slow_query_ms,
+            explain=explain_slow,
+            log_path=slow_query_log,
+        )
+        ctx.call_on_close(lambda: _print_sql_profile(profiler))
+
+
+def _print_sql_profile(profiler: QueryProfiler) -> None:
+    """Print the most expensive SQL statements recorded by the profiler.
+
+    Args:
+        profiler: The profiler enabled by --profile-sql.
+    """
+    summaries = profiler.summaries()
+    err_console = Console(stderr=True)
+    if not summaries:
+        err_console.print("[dim]SQL profile: no statements executed[/dim]")
+        return
+
+    table = Table(title="SQL Profile", show_header=True, header_style="bold cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total ms", justify="right")
+    table.add_column("Avg ms", justify="right")
+    table.add_column("Max ms", justify="right")
+    table.add_column("Rows", justify="right")
+    table.add_column("Statement", overflow="fold")
+    for summary in summaries[:_PROFILE_SUMMARY_LIMIT]:
+        style = "red" if profiler.is_slow(summary.max_ms) else None
+        table.add_row(
+            str(summary.calls),
+            f"{summary.total_ms:.1f}",
+            f"{summary.avg_ms:.2f}",
+            f"{summary.max_ms:.1f}",
+            str(summary.rows),
+            summary.statement,
+            style=style,
+        )
+    err_console.print(table)
+    slow_count = len(profiler.slow_queries())
+    if slow_count:
+        err_console.print(
+            f"[yellow]{slow_count} statement(s) exceeded "
+            f"{profiler.slow_threshold_ms:g} ms (see the slow-query log)[/yellow]"
+        )
+
 
 def _get_status_display(status: VendorStatus) -> str:
     """Get display string for vendor status with emoji and color.
@@ -1239,6 +1325,8 @@ def _get_coach_for_vendor(vendor_id: str) -> CoachBase:
     Raises:
         typer.Exit: If vendor is unknown.
     """
+    from ai_asst_mgr.coaches import ClaudeCoach, CodexCoach, GeminiCoach
+
     coaches: dict[str, CoachBase] = {
         "claude": ClaudeCoach(),
         "gemini": GeminiCoach(),
@@ -1259,6 +1347,8 @@ def _get_all_coaches() -> dict[str, CoachBase]:
     Returns:
         Dictionary mapping vendor IDs to coach instances.
     """
+    from ai_asst_mgr.coaches import ClaudeCoach, CodexCoach, GeminiCoach
+
     return {
         "claude": ClaudeCoach(),
         "gemini": GeminiCoach(),
@@ -1304,6 +1394,8 @@ def _display_coach_recommendations(coach: CoachBase) -> None:
     Args:
         coach: CoachBase instance with analysis results.
     """
+    from ai_asst_mgr.coaches import Priority
+
     recommendations = coach.get_recommendations()
 
     if not recommendations:
@@ -1373,6 +1465,8 @@ def _compare_vendors(coaches: dict[str, CoachBase]) -> None:
     Args:
         coaches: Dictionary of vendor IDs to coach instances.
     """
+    from ai_asst_mgr.coaches import Priority
+
     console.print(Panel.fit("[bold blue]Cross-Vendor Comparison[/bold blue]", border_style="blue"))
 
     # Create comparison table
@@ -1531,18 +1625,64 @@ def coach(
 # ============================================================================
 
 DEFAULT_BACKUP_DIR = Path.home() / ".config" / "ai-asst-mgr" / "backups"
-
-
-def _get_backup_manager(backup_dir: Path | None = None) -> BackupManager:
+DEFAULT_CLONE_CACHE_DIR = Path.home() / ".config" / "ai-asst-mgr" / "repo-cache"
+DEFAULT_SYNC_HASH_DIR = Path.home() / ".config" / "ai-asst-mgr" / "sync-hashes"
+
+
+def _get_backup_manager(
+    backup_dir: Path | None = None,
+    *,
+    incremental: bool = False,
+    compression: CompressionSettings | None = None,
+    exclude: list[str] | None = None,
+    max_file_size: int | None = None,
+) -> BackupManager:
     """Get backup manager instance.
 
     Args:
         backup_dir: Optional backup directory. Uses default if not provided.
+        incremental: Whether new backups are stored as deduplicated snapshots.
+        compression: Codec settings for new archives. Uses gzip if not provided.
+        exclude: Extra patterns to leave out of backups.
+        max_file_size: Leave out files larger than this many bytes.
 
     Returns:
         BackupManager instance.
     """
-    return BackupManager(backup_dir or DEFAULT_BACKUP_DIR)
+    from ai_asst_mgr.operations import BackupManager
+
+    return BackupManager(
+        backup_dir or DEFAULT_BACKUP_DIR,
+        incremental=incremental,
+        compression=compression,
+        exclude=exclude or (),
+        max_file_size=max_file_size,
+    )
+
+
+def _parse_compression(codec: str | None, level: int | None) -> CompressionSettings | None:
+    """Build compression settings from the backup command's options.
+
+    Args:
+        codec: Codec name from --compression, or None.
+        level: Level from --level, or None.
+
+    Returns:
+        CompressionSettings, or None when neither option was given.
+
+    Raises:
+        typer.Exit: If the codec is unknown or the level is out of range.
+    """
+    if codec is None and level is None:
+        return None
+
+    from ai_asst_mgr.utils.compression import DEFAULT_CODEC, CompressionSettings
+
+    try:
+        return CompressionSettings(codec or DEFAULT_CODEC, level)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(code=1) from e
 
 
 def _get_restore_manager(backup_dir: Path | None = None) -> RestoreManager:
@@ -1554,6 +1694,8 @@ def _get_restore_manager(backup_dir: Path | None = None) -> RestoreManager:
     Returns:
         RestoreManager instance.
     """
+    from ai_asst_mgr.operations import RestoreManager
+
     backup_manager = _get_backup_manager(backup_dir)
     return RestoreManager(backup_manager)
 
@@ -1567,11 +1709,17 @@ def _get_sync_manager(backup_dir: Path | None = None) -> SyncManager:
     Returns:
         SyncManager instance.
     """
+    from ai_asst_mgr.operations import SyncManager
+    from ai_asst_mgr.utils.clone_cache import CloneCache
+
     backup_manager = _get_backup_manager(backup_dir)
-    return SyncManager(backup_manager)
+    return SyncManager(
+        backup_manager, CloneCache(DEFAULT_CLONE_CACHE_DIR), hash_cache_dir=DEFAULT_SYNC_HASH_DIR
+    )
 
 
 _BYTES_PER_UNIT = 1024
+_SIZE_SUFFIXES = {"K": 1024, "M": 1024**2, "G": 1024**3}
 _MAX_PREVIEW_FILES = 5
 _MAX_SYNC_PREVIEW_FILES = 3
 
@@ -1593,8 +1741,35 @@ def _format_size_bytes(size_bytes: int) -> str:
     return f"{size:.1f} TB"
 
 
+def _parse_size(value: str | None) -> int | None:
+    """Parse a size such as "500K", "100M" or "2G" into bytes.
+
+    Args:
+        value: Size string from the command line, or None.
+
+    Returns:
+        Size in bytes, or None if no value was given.
+
+    Raises:
+        typer.Exit: If the value is not a valid size.
+    """
+    if value is None:
+        return None
+    text = value.strip().upper().removesuffix("B")
+    multiplier = _SIZE_SUFFIXES.get(text[-1:], 1)
+    digits = text[:-1] if text[-1:] in _SIZE_SUFFIXES else text
+    try:
+        size = int(float(digits) * multiplier)
+    except ValueError:
+        size = -1
+    if size < 0:
+        console.print(f"[red]Invalid size '{value}' (expected e.g. 500K, 100M, 2G)[/red]")
+        raise typer.Exit(code=1)
+    return size
+
+
 @app.command()
-def backup(
+def backup(  # noqa: PLR0913 - one parameter per CLI option
     vendor: Annotated[
         str | None,
         typer.Option("--vendor", "-v", help="Backup specific vendor only"),
@@ -1611,26 +1786,118 @@ def backup(
         Path | None,
         typer.Option("--verify", help="Verify integrity of a backup file"),
     ] = None,
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            "--incremental",
+            help="Store a deduplicated snapshot containing only changed files",
+        ),
+    ] = False,
+    compression: Annotated[
+        str | None,
+        typer.Option(
+            "--compression",
+            "-c",
+            help="Archive codec: gz (default), xz, bz2 or zst (when available)",
+        ),
+    ] = None,
+    level: Annotated[
+        int | None,
+        typer.Option("--level", help="Compression level (codec-specific range)"),
+    ] = None,
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=1,
+            help="Vendors to back up in parallel (default: all at once)",
+        ),
+    ] = None,
+    exclude: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--exclude",
+            "-x",
+            help="Leave out paths matching a gitignore-style pattern (repeatable)",
+        ),
+    ] = None,
+    max_file_size: Annotated[
+        str | None,
+        typer.Option("--max-file-size", help="Leave out files larger than this (e.g. 100M)"),
+    ] = None,
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", help="Show what would be backed up without writing"),
+    ] = False,
+    explain: Annotated[
+        bool,
+        typer.Option("--explain", help="With --dry-run, show bytes saved per exclusion rule"),
+    ] = False,
+    database: Annotated[
+        bool,
+        typer.Option("--database", help="Back up the sessions database instead of vendors"),
+    ] = False,
+    db_path: Annotated[
+        Path | None,
+        typer.Option("--db-path", help="Database to back up with --database"),
+    ] = None,
 ) -> None:
     """Backup AI assistant vendor configurations.
 
     Creates compressed archives of vendor configuration directories with
-    checksum verification and retention policies.
+    checksum verification and retention policies. With --incremental, each
+    backup is a snapshot that stores only files changed since the previous
+    one, which keeps frequent (e.g. hourly) schedules cheap. Archives are
+    compressed in parallel blocks with the codec chosen by --compression.
+
+    Caches and other data the vendor regenerates are skipped by default. Add
+    patterns to a .backupignore file in the vendor's config directory or pass
+    --exclude to skip more (such as session transcripts); restores keep
+    excluded paths that are already on disk.
+
+    With --database, the sessions database is copied online with SQLite's
+    backup API, so syncs can keep writing to it, and the copy is checked
+    with PRAGMA integrity_check before it is stored. --incremental and
+    --compression apply to database backups too.
 
     Examples:
         ai-asst-mgr backup                    # Backup all vendors
         ai-asst-mgr backup --vendor claude    # Backup Claude only
         ai-asst-mgr backup --list             # List all backups
         ai-asst-mgr backup --verify path.tar.gz  # Verify backup integrity
+        ai-asst-mgr backup --incremental      # Deduplicated snapshot backup
+        ai-asst-mgr backup -c zst --level 10  # zstd-compressed archives
+        ai-asst-mgr backup --jobs 1           # Back up vendors one at a time
+        ai-asst-mgr backup -x "projects/" --dry-run --explain  # Bytes saved per rule
+        ai-asst-mgr backup --database         # Back up the sessions database
 
     Args:
         vendor: Optional vendor name to backup. If not provided, backs up all.
         backup_dir: Directory to store backups. Uses default if not provided.
         list_backups: If True, lists existing backups instead of creating new ones.
         verify: Path to backup file to verify.
+        incremental: If True, stores deduplicated snapshots instead of full archives.
+        compression: Codec used for new archives.
+        level: Codec compression level.
+        jobs: Number of vendors backed up concurrently. Defaults to all of them.
+        exclude: Extra patterns to leave out of backups.
+        max_file_size: Size limit for backed-up files (e.g. 100M).
+        dry_run: If True, reports what would be backed up without writing.
+        explain: If True, breaks the dry run down by exclusion rule.
+        database: If True, backs up the sessions database instead of vendors.
+        db_path: Database backed up by --database. Uses the default if not provided.
     """
+    settings = _parse_compression(compression, level)
+    size_limit = _parse_size(max_file_size)
     registry = VendorRegistry()
-    backup_manager = _get_backup_manager(backup_dir)
+    backup_manager = _get_backup_manager(
+        backup_dir,
+        incremental=incremental,
+        compression=settings,
+        exclude=exclude,
+        max_file_size=size_limit,
+    )
 
     # Handle --verify
     if verify:
@@ -1642,8 +1909,130 @@ def backup(
         _backup_list(backup_manager, vendor)
         return
 
+    # Handle --database
+    if database:
+        _backup_database(backup_manager, db_path or DEFAULT_DB_PATH)
+        return
+
+    # Handle --dry-run (--explain implies it)
+    if dry_run or explain:
+        _backup_dry_run(registry, backup_manager, vendor, explain=explain)
+        return
+
     # Create backup(s)
-    _backup_create(registry, backup_manager, vendor)
+    _backup_create(registry, backup_manager, vendor, jobs)
+
+
+def _get_backup_adapter(registry: VendorRegistry, vendor: str) -> VendorAdapter:
+    """Look up the adapter for a vendor named on the command line.
+
+    Args:
+        registry: VendorRegistry instance.
+        vendor: Vendor name.
+
+    Returns:
+        The vendor's adapter.
+
+    Raises:
+        typer.Exit: If the vendor is unknown.
+    """
+    try:
+        return registry.get_vendor(vendor)
+    except KeyError:
+        console.print(f"[red]Error: Unknown vendor '{vendor}'[/red]")
+        available = ", ".join(registry.get_all_vendors().keys())
+        console.print(f"[yellow]Available vendors: {available}[/yellow]")
+        raise typer.Exit(code=1) from None
+
+
+def _backup_dry_run(
+    registry: VendorRegistry,
+    backup_manager: BackupManager,
+    vendor: str | None,
+    *,
+    explain: bool,
+) -> None:
+    """Show what a backup would include and skip, without writing anything.
+
+    Args:
+        registry: VendorRegistry instance.
+        backup_manager: BackupManager instance.
+        vendor: Optional vendor to measure. Measures all installed vendors if None.
+        explain: Whether to break the savings down by exclusion rule.
+    """
+    if vendor:
+        adapters = {vendor: _get_backup_adapter(registry, vendor)}
+    else:
+        adapters = registry.get_installed_vendors()
+    if not adapters:
+        console.print("[yellow]No installed vendors found to backup[/yellow]")
+        return
+
+    reports: dict[str, ExclusionReport] = {}
+    table = Table(title="Backup Dry Run", show_header=True, header_style="bold cyan")
+    table.add_column("Vendor", style="bold", width=12)
+    table.add_column("Files", justify="right", width=8)
+    table.add_column("Size", justify="right", width=10)
+    table.add_column("Excluded", justify="right", width=10)
+    table.add_column("Saved", justify="right", width=10)
+
+    for vendor_id, adapter in adapters.items():
+        try:
+            report = backup_manager.explain_backup(adapter)
+        except OSError as e:
+            table.add_row(vendor_id.capitalize(), "-", "-", "-", f"[red]{e}[/red]")
+            continue
+        reports[vendor_id] = report
+        table.add_row(
+            vendor_id.capitalize(),
+            str(report.included_files),
+            _format_size_bytes(report.included_bytes),
+            str(report.excluded_files),
+            _format_size_bytes(report.excluded_bytes),
+        )
+
+    console.print(table)
+
+    if not explain:
+        return
+
+    for vendor_id, report in reports.items():
+        if not report.excluded:
+            console.print(f"\n[dim]{vendor_id.capitalize()}: no exclusion rules matched[/dim]")
+            continue
+        rules_table = Table(
+            title=f"{vendor_id.capitalize()} Exclusions", show_header=True, header_style="bold"
+        )
+        rules_table.add_column("Rule", width=40)
+        rules_table.add_column("Files", justify="right", width=8)
+        rules_table.add_column("Saved", justify="right", width=10)
+        ranked = sorted(report.excluded.items(), key=lambda item: item[1].bytes, reverse=True)
+        for label, savings in ranked:
+            rules_table.add_row(label, str(savings.files), _format_size_bytes(savings.bytes))
+        console.print(rules_table)
+
+
+def _backup_database(backup_manager: BackupManager, db_path: Path) -> None:
+    """Back up the sessions database.
+
+    Args:
+        backup_manager: BackupManager instance.
+        db_path: Path to the database.
+    """
+
+    def progress_callback(msg: str) -> None:
+        console.print(f"  {msg}")
+
+    console.print(f"\n[bold]Backing up database {db_path}...[/bold]")
+    result = backup_manager.backup_database(db_path, progress_callback)
+
+    if result.success and result.metadata:
+        console.print("\n[green]✓ Database backup created successfully[/green]")
+        console.print(f"  Path: {result.metadata.backup_path}")
+        console.print(f"  Size: {_format_size_bytes(result.metadata.size_bytes)}")
+    else:
+        console.print(f"\n[red]✗ Database backup failed: {result.error}[/red]")
+        raise typer.Exit(code=1)
 
 
 def _backup_verify(backup_manager: BackupManager, backup_path: Path) -> None:
@@ -1701,6 +2090,7 @@ def _backup_create(
     registry: VendorRegistry,
     backup_manager: BackupManager,
     vendor: str | None,
+    jobs: int | None = None,
 ) -> None:
     """Create backup(s).
 
@@ -1708,6 +2098,7 @@ def _backup_create(
         registry: VendorRegistry instance.
         backup_manager: BackupManager instance.
         vendor: Optional vendor to backup.
+        jobs: Vendors to back up concurrently (all vendors if None).
     """
 
     def progress_callback(msg: str) -> None:
@@ -1715,13 +2106,7 @@ def _backup_create(
 
     if vendor:
         # Single vendor backup
-        try:
-            adapter = registry.get_vendor(vendor)
-        except KeyError:
-            console.print(f"[red]Error: Unknown vendor '{vendor}'[/red]")
-            available = ", ".join(registry.get_all_vendors().keys())
-            console.print(f"[yellow]Available vendors: {available}[/yellow]")
-            raise typer.Exit(code=1) from None
+        adapter = _get_backup_adapter(registry, vendor)
 
         console.print(f"\n[bold]Backing up {adapter.info.name}...[/bold]")
         result = backup_manager.backup_vendor(adapter, progress_callback)
@@ -1745,7 +2130,9 @@ def _backup_create(
             console.print("[yellow]No installed vendors found to backup[/yellow]")
             return
 
-        summary = backup_manager.backup_all_vendors(installed, progress_callback)
+        summary = backup_manager.backup_all_vendors(
+            installed, progress_callback, max_workers=jobs or len(installed)
+        )
 
         # Display summary table
         table = Table(title="Backup Summary", show_header=True, header_style="bold")
@@ -2119,6 +2506,8 @@ def sync(
         no_backup: If True, skips creating pre-sync backup.
         backup_dir: Directory for pre-sync backups.
     """
+    from ai_asst_mgr.operations import MergeStrategy
+
     registry = VendorRegistry()
     sync_manager = _get_sync_manager(backup_dir)
 
@@ -2368,6 +2757,8 @@ def _run_vendor_audit(vendor_id: str, config_dir: Path) -> dict[str, Any]:
     Returns:
         Audit report as dictionary.
     """
+    from ai_asst_mgr.audit import ClaudeAuditor, CodexAuditor, GeminiAuditor
+
     auditor_classes: dict[str, type[ClaudeAuditor] | type[GeminiAuditor] | type[CodexAuditor]] = {
         "claude": ClaudeAuditor,
         "gemini": GeminiAuditor,
@@ -2617,6 +3008,8 @@ def _get_agent_manager() -> UniversalAgentManager:
     Returns:
         UniversalAgentManager instance with all vendors.
     """
+    from ai_asst_mgr.capabilities import UniversalAgentManager
+
     registry = VendorRegistry()
     return UniversalAgentManager(registry.get_all_vendors())
 
@@ -2630,6 +3023,8 @@ def _format_agent_type(agent_type: AgentType) -> str:
     Returns:
         Formatted string with color.
     """
+    from ai_asst_mgr.capabilities import AgentType
+
     type_styles = {
         AgentType.AGENT: "[cyan]agent[/cyan]",
         AgentType.SKILL: "[green]skill[/green]",
@@ -2670,6 +3065,8 @@ def agents_list(
         agent_type: Optional agent type to filter by.
         search: Optional search query.
     """
+    from ai_asst_mgr.capabilities import AgentType
+
     manager = _get_agent_manager()
 
     # Parse agent type filter
@@ -2828,6 +3225,8 @@ def agents_create(
         file: Path to file with content.
         description: Optional description.
     """
+    from ai_asst_mgr.capabilities import AgentType
+
     # Parse agent type
     try:
         parsed_type = AgentType(agent_type)
@@ -3278,6 +3677,8 @@ def db_init(
         ai-asst-mgr db init           # Initialize database
         ai-asst-mgr db init --force   # Overwrite existing database
     """
+    from ai_asst_mgr.database import DatabaseManager
+
     if DEFAULT_DB_PATH.exists() and not force:
         console.print(
             f"[yellow]Database already exists at {DEFAULT_DB_PATH}[/yellow]\n"
@@ -3329,6 +3730,10 @@ def db_sync(
         ai-asst-mgr db sync --vendor claude  # Sync Claude
         ai-asst-mgr db sync --full           # Full sync
     """
+    from ai_asst_mgr.database import DatabaseManager
+    from ai_asst_mgr.database.sync import sync_history_to_db
+    from ai_asst_mgr.database.sync_gemini import sync_gemini_history_to_db
+
     if not DEFAULT_DB_PATH.exists():
         console.print("[red]Database not found![/red]\nRun [bold]ai-asst-mgr db init[/bold] first.")
         raise typer.Exit(1)
@@ -3390,6 +3795,9 @@ def db_status() -> None:
     Examples:
         ai-asst-mgr db status
     """
+    from ai_asst_mgr.database import DatabaseManager
+    from ai_asst_mgr.database.sync import get_sync_status
+
     if not DEFAULT_DB_PATH.exists():
         console.print("[red]Database not found![/red]\nRun [bold]ai-asst-mgr db init[/bold] first.")
         raise typer.Exit(1)
@@ -3426,12 +3834,50 @@ _COMMIT_MSG_MAX_LEN = 42
 _REPO_NAME_MAX_LEN = 18
 _REPO_LIST_MAX_LEN = 28
 
+# User-defined attribution rules, read by `github sync` if present
+DEFAULT_ATTRIBUTION_RULES_PATH = Path.home() / ".config" / "ai-asst-mgr" / "attribution-rules.json"
+DEFAULT_REPO_CACHE_PATH = Path.home() / ".config" / "ai-asst-mgr" / "repo-discovery.json"
+
+
+def _load_attribution_matcher(rules_path: Path | None) -> AttributionMatcher | None:
+    """Build a matcher with the user's attribution rules ahead of the built-in ones.
+
+    Returns None (the built-in rules) if no rules file was given and the
+    default one does not exist.
+    """
+    from ai_asst_mgr.operations.github_parser import (
+        DEFAULT_SIGNATURE_RULES,
+        AttributionMatcher,
+        load_signature_rules,
+    )
+
+    if rules_path is None:
+        if not DEFAULT_ATTRIBUTION_RULES_PATH.exists():
+            return None
+        rules_path = DEFAULT_ATTRIBUTION_RULES_PATH
+
+    try:
+        user_rules = load_signature_rules(rules_path)
+        return AttributionMatcher([*user_rules, *DEFAULT_SIGNATURE_RULES])
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Could not load attribution rules: {e}[/red]")
+        raise typer.Exit(1) from e
+
 
 def _resolve_github_repos(
     repo: Path | None,
     base_path: Path | None,
+    prune: list[str] | None = None,
+    jobs: int | None = None,
 ) -> list[Path]:
-    """Resolve which repositories to scan for GitHub sync."""
+    """Resolve which repositories to scan for GitHub sync.
+
+    Directories named in ``prune`` are skipped in addition to the default
+    ones when searching ``base_path``.
+    """
+    from ai_asst_mgr.operations.github_parser import find_git_repos
+    from ai_asst_mgr.utils.repo_discovery import DEFAULT_PRUNE_DIRS
+
     if repo:
         if not repo.exists():
             console.print(f"[red]Repository not found: {repo}[/red]")
@@ -3443,7 +3889,12 @@ def _resolve_github_repos(
             console.print(f"[red]Path not found: {base_path}[/red]")
             raise typer.Exit(1)
         console.print(f"[dim]Searching for git repositories in {base_path}...[/dim]")
-        repos = find_git_repos(base_path)
+        repos = find_git_repos(
+            base_path,
+            prune=DEFAULT_PRUNE_DIRS.union(prune or ()),
+            cache_path=DEFAULT_REPO_CACHE_PATH,
+            max_workers=jobs,
+        )
         if not repos:
             console.print("[yellow]No git repositories found[/yellow]")
             raise typer.Exit(0)
@@ -3465,44 +3916,88 @@ def github_sync(
     ] = None,
     limit: Annotated[
         int,
-        typer.Option("--limit", "-n", help="Maximum commits per repository"),
+        typer.Option(
+            "--limit", "-n", help="Maximum commits to import from a repository's first sync"
+        ),
     ] = 100,
+    full: Annotated[
+        bool,
+        typer.Option("--full", help="Ignore saved sync state and rescan every repository"),
+    ] = False,
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=1,
+            help="Repositories to scan in parallel (default: based on CPU count)",
+        ),
+    ] = None,
+    timings: Annotated[
+        bool,
+        typer.Option("--timings", help="Show how long each repository took, slowest first"),
+    ] = False,
+    rules: Annotated[
+        Path | None,
+        typer.Option(
+            "--rules",
+            help="JSON file of extra attribution rules "
+            "(default: ~/.config/ai-asst-mgr/attribution-rules.json if present)",
+        ),
+    ] = None,
+    prune: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--prune",
+            help="Directory name to skip when searching --base (repeatable; "
+            "node_modules, venv and similar are always skipped)",
+        ),
+    ] = None,
 ) -> None:
     """Sync GitHub commits and detect AI vendor attribution.
 
     Parses git repositories to find commits and detect AI-generated code
     based on commit message signatures (Claude, Gemini, OpenAI).
 
+    Each repository's branch tips are saved after a sync. Later syncs read
+    only commits added since then, on any branch, and skip repositories
+    whose branches have not moved without running git log. Repositories are
+    scanned in parallel.
+
+    Extra attribution rules are checked before the built-in ones. The rules
+    file holds {"rules": [{"vendor": ..., "pattern": ..., "keyword": ...}]}.
+
+    Directory listings from --base searches are cached and reused while a
+    directory is unchanged, so repeated searches only list what changed.
+
     Examples:
         ai-asst-mgr github sync                           # Scan current directory
         ai-asst-mgr github sync --repo /path/to/project   # Specific repo
         ai-asst-mgr github sync --base ~/Developer        # Scan directory for repos
+        ai-asst-mgr github sync --base ~/Developer -j 16 --timings
+        ai-asst-mgr github sync --full                    # Rescan from scratch
+        ai-asst-mgr github sync --rules my-rules.json     # Extra attribution rules
+        ai-asst-mgr github sync --base ~/Developer --prune build --prune dist
     """
+    from ai_asst_mgr.database import DatabaseManager
+    from ai_asst_mgr.operations.github_parser import GitLogParser
+    from ai_asst_mgr.operations.github_sync import GitHubSyncManager
+
     if not DEFAULT_DB_PATH.exists():
         console.print("[red]Database not found![/red]\nRun [bold]ai-asst-mgr db init[/bold] first.")
         raise typer.Exit(1)
 
+    matcher = _load_attribution_matcher(rules)
     db = DatabaseManager(DEFAULT_DB_PATH)
-    parser = GitLogParser()
-    repos = _resolve_github_repos(repo, base_path)
-
-    # Sync each repository
-    total_commits = 0
-    ai_commits = 0
-    errors: list[str] = []
+    repos = _resolve_github_repos(repo, base_path, prune, jobs)
+    manager = GitHubSyncManager(db, GitLogParser(matcher))
+    summary = manager.sync_repos(repos, limit, full=full, max_workers=jobs)
 
-    for repo_path in repos:
-        try:
-            commits = parser.parse_repo(repo_path, limit=limit)
-            for commit in commits:
-                if db.record_github_commit(commit):
-                    total_commits += 1
-                    if commit.vendor_id:
-                        ai_commits += 1
-        except (ValueError, OSError) as e:
-            errors.append(f"{repo_path.name}: {e}")
+    if timings:
+        _print_github_sync_timings(summary)
 
     # Display results
+    errors = summary.errors
     if errors:
         console.print(f"[yellow]Completed with {len(errors)} errors[/yellow]")
         for error in errors[:5]:
@@ -3511,15 +4006,41 @@ def github_sync(
         console.print(
             Panel.fit(
                 f"[bold green]GitHub sync completed![/bold green]\n\n"
-                f"Commits synced: [cyan]{total_commits}[/cyan]\n"
-                f"AI-attributed:  [cyan]{ai_commits}[/cyan]\n"
-                f"Repositories:   [cyan]{len(repos)}[/cyan]",
+                f"Commits synced: [cyan]{summary.total_commits}[/cyan]\n"
+                f"AI-attributed:  [cyan]{summary.ai_commits}[/cyan]\n"
+                f"Repositories:   [cyan]{len(repos)}[/cyan]"
+                f" ([dim]{summary.unchanged} unchanged[/dim])\n"
+                f"Duration:       [cyan]{summary.duration_seconds:.2f}s[/cyan]",
                 title="Sync Results",
                 border_style="green",
             )
         )
 
 
+def _print_github_sync_timings(summary: GitHubSyncSummary) -> None:
+    """Print a per-repository timing table for a GitHub sync, slowest first."""
+    table = Table(title="Repository Timings", show_header=True, header_style="bold")
+    table.add_column("Repository", style="cyan")
+    table.add_column("Time", justify="right")
+    table.add_column("Commits", justify="right")
+    table.add_column("Status")
+
+    for result in sorted(summary.results, key=lambda r: r.duration_seconds, reverse=True):
+        if result.error:
+            status = f"[red]{result.error}[/red]"
+        elif not result.changed:
+            status = "[dim]unchanged[/dim]"
+        else:
+            status = "[green]synced[/green]"
+        table.add_row(
+            result.repo_path.name,
+            f"{result.duration_seconds * 1000:.0f}ms",
+            str(result.commits_synced),
+            status,
+        )
+    console.print(table)
+
+
 @github_app.command("stats")
 def github_stats() -> None:
     """Show GitHub contribution statistics by AI vendor.
@@ -3530,6 +4051,8 @@ def github_stats() -> None:
     Examples:
         ai-asst-mgr github stats
     """
+    from ai_asst_mgr.database import DatabaseManager
+
     if not DEFAULT_DB_PATH.exists():
         console.print("[red]Database not found![/red]\nRun [bold]ai-asst-mgr db init[/bold] first.")
         raise typer.Exit(1)
@@ -3602,6 +4125,8 @@ def github_list(
         ai-asst-mgr github list --vendor none      # Non-AI commits
         ai-asst-mgr github list -n 50              # Show 50 commits
     """
+    from ai_asst_mgr.database import DatabaseManager
+
     if not DEFAULT_DB_PATH.exists():
         console.print("[red]Database not found![/red]\nRun [bold]ai-asst-mgr db init[/bold] first.")
         raise typer.Exit(1)
@@ -3664,6 +4189,8 @@ def github_repos() -> None:
     Examples:
         ai-asst-mgr github repos
     """
+    from ai_asst_mgr.database import DatabaseManager
+
     if not DEFAULT_DB_PATH.exists():
         console.print("[red]Database not found![/red]\nRun [bold]ai-asst-mgr db init[/bold] first.")
         raise typer.Exit(1)
@@ -3737,6 +4264,9 @@ def github_attribution(
         ai-asst-mgr github attribution owner/repo --pr 123
         ai-asst-mgr github attribution owner/repo --summary
     """
+    from ai_asst_mgr.database import DatabaseManager
+    from ai_asst_mgr.operations.github_parser import GitLogParser
+
     if not DEFAULT_DB_PATH.exists():
         console.print("[red]Database not found![/red]\nRun [bold]ai-asst-mgr db init[/bold] first.")
         raise typer.Exit(1)
@@ -3885,6 +4415,8 @@ def github_activity(
         ai-asst-mgr github activity --session abc123
         ai-asst-mgr github activity --vendor claude --limit 20
     """
+    from ai_asst_mgr.database import DatabaseManager
+
     if not DEFAULT_DB_PATH.exists():
         console.print("[red]Database not found![/red]\nRun [bold]ai-asst-mgr db init[/bold] first.")
         raise typer.Exit(1)
@@ -4030,6 +4562,8 @@ def serve(
         )
     )
 
+    import uvicorn
+
     try:
         uvicorn.run(
             "ai_asst_mgr.web:create_app",
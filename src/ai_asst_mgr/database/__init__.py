@@ -8,8 +8,11 @@ from __future__ import annotations
 
 from ai_asst_mgr.database.manager import (
     AgentUsage,
+    CommitUpsertResult,
     DailyUsage,
     DatabaseManager,
+    EventRecord,
+    GitHubSyncState,
     VendorStats,
     WeeklyReview,
     WeekStats,
@@ -28,8 +31,11 @@ from ai_asst_mgr.database.schema import (
 __all__ = [
     "SCHEMA_VERSION",
     "AgentUsage",
+    "CommitUpsertResult",
     "DailyUsage",
     "DatabaseManager",
+    "EventRecord",
+    "GitHubSyncState",
     "MigrationManager",
     "MigrationResult",
     "SchemaManager",
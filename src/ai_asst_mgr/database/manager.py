@@ -6,22 +6,117 @@ including querying, inserting, and aggregating session and event data.
 
 from __future__ import annotations
 
+import functools
 import json
 import sqlite3
+import time
 from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
-from ai_asst_mgr.database.schema import SchemaManager
+from ai_asst_mgr.database.profiling import connect, get_active_profiler
+from ai_asst_mgr.database.schema import GITHUB_SYNC_STATE_SQL, SchemaManager
+from ai_asst_mgr.utils.metrics import REGISTRY
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterable, Iterator, Sequence
     from pathlib import Path
 
+    from ai_asst_mgr.database.profiling import QueryProfiler
     from ai_asst_mgr.operations.github_parser import GitHubCommit
 
 
+# Metrics exported through the web dashboard's /metrics endpoint
+_QUERY_DURATION = REGISTRY.histogram(
+    "ai_asst_mgr_db_operation_duration_seconds",
+    "Latency of DatabaseManager operations in seconds.",
+    ("method",),
+)
+_QUERY_ERRORS = REGISTRY.counter(
+    "ai_asst_mgr_db_operation_errors_total",
+    "DatabaseManager operations that raised an SQLite error.",
+    ("method",),
+)
+_ROWS_RETURNED = REGISTRY.counter(
+    "ai_asst_mgr_db_rows_returned_total",
+    "Rows fetched from SQLite, by DatabaseManager operation.",
+    ("method",),
+)
+_CONNECTIONS_OPENED = REGISTRY.counter(
+    "ai_asst_mgr_db_connections_opened_total",
+    "SQLite connections opened by DatabaseManager.",
+)
+_CONNECTIONS_OPEN = REGISTRY.gauge(
+    "ai_asst_mgr_db_connections_open",
+    "SQLite connections currently held open by DatabaseManager.",
+)
+
+# Rows per executemany call in record_github_commits_bulk()
+DEFAULT_COMMIT_BATCH_SIZE = 5000
+
+_UPSERT_GITHUB_COMMIT_SQL = """
+INSERT INTO github_commits (
+    sha, repo, branch, message, author_name,
+    author_email, vendor_id, committed_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(sha) DO UPDATE SET
+    repo = excluded.repo,
+    branch = excluded.branch,
+    message = excluded.message,
+    author_name = excluded.author_name,
+    author_email = excluded.author_email,
+    vendor_id = excluded.vendor_id,
+    committed_at = excluded.committed_at
+"""
+
+
+# Name of the DatabaseManager operation running in the current context
+_current_operation: ContextVar[str] = ContextVar("_current_operation", default="adhoc")
+
+
+def _instrumented[**P, R](method: Callable[P, R]) -> Callable[P, R]:
+    """Record latency and errors for a DatabaseManager operation.
+
+    Args:
+        method: The DatabaseManager method to wrap.
+
+    Returns:
+        Wrapped method that reports to the metrics registry.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        token = _current_operation.set(name)
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        except sqlite3.Error:
+            _QUERY_ERRORS.inc(method=name)
+            raise
+        finally:
+            _QUERY_DURATION.observe(time.perf_counter() - start, method=name)
+            _current_operation.reset(token)
+
+    return wrapper
+
+
+def _counting_row_factory(cursor: sqlite3.Cursor, row: tuple[Any, ...]) -> sqlite3.Row:
+    """Build a sqlite3.Row while counting it against the current operation.
+
+    Args:
+        cursor: Cursor the row was fetched from.
+        row: Raw row tuple.
+
+    Returns:
+        The row wrapped as sqlite3.Row.
+    """
+    _ROWS_RETURNED.inc(method=_current_operation.get())
+    return sqlite3.Row(cursor, row)
+
+
 @dataclass
 class VendorStats:
     """Statistics for a single vendor."""
@@ -36,6 +131,28 @@ class VendorStats:
     last_session: str | None
 
 
+@dataclass
+class EventRecord:
+    """A single event row for bulk insertion with record_events.
+
+    Attributes:
+        session_id: Session identifier.
+        vendor_id: Vendor identifier.
+        event_type: Type of event (tool_call, message, error).
+        event_name: Optional event name.
+        event_data: Optional event data dictionary, stored as JSON.
+        timestamp: Optional UTC timestamp in SQLite ``datetime('now')`` format;
+            defaults to the time of insertion.
+    """
+
+    session_id: str
+    vendor_id: str
+    event_type: str
+    event_name: str | None = None
+    event_data: dict[str, Any] | None = None
+    timestamp: str | None = None
+
+
 @dataclass
 class DailyUsage:
     """Daily usage metrics."""
@@ -133,6 +250,42 @@ class GitHubCommitRecord:
     created_at: str
 
 
+@dataclass
+class GitHubSyncState:
+    """Where the last GitHub sync of a local repository stopped.
+
+    Attributes:
+        repo_path: Absolute path of the repository.
+        ref_tips: Ref name to commit SHA for HEAD and every branch at the
+            time of the sync.
+        last_sha: SHA of the newest commit recorded so far.
+        last_commit_at: ISO timestamp of that commit.
+    """
+
+    repo_path: str
+    ref_tips: dict[str, str]
+    last_sha: str | None = None
+    last_commit_at: str | None = None
+
+
+@dataclass
+class CommitUpsertResult:
+    """Outcome of DatabaseManager.record_github_commits_bulk().
+
+    Attributes:
+        inserted: Commits that were not recorded before.
+        updated: Commits already recorded (by SHA) whose row was updated.
+    """
+
+    inserted: int = 0
+    updated: int = 0
+
+    @property
+    def total(self) -> int:
+        """Number of distinct commits written."""
+        return self.inserted + self.updated
+
+
 @dataclass
 class GitHubActivityRecord:
     """A GitHub activity record from the database."""
@@ -156,15 +309,20 @@ class DatabaseManager:
     session and event data across all supported vendors.
     """
 
-    def __init__(self, db_path: Path) -> None:
+    def __init__(self, db_path: Path, profiler: QueryProfiler | None = None) -> None:
         """Initialize the database manager.
 
         Args:
             db_path: Path to the SQLite database file.
+            profiler: Optional SQL profiler for this manager. Defaults to the
+                process-wide profiler enabled by AI_ASST_MGR_PROFILE_SQL or
+                the --profile-sql CLI flag.
         """
         self.db_path = db_path
+        self.profiler = profiler
         self._schema_manager = SchemaManager(db_path)
 
+    @_instrumented
     def initialize(self) -> None:
         """Initialize the database schema."""
         self._schema_manager.initialize()
@@ -173,16 +331,23 @@ class DatabaseManager:
     def _connection(self) -> Iterator[sqlite3.Connection]:
         """Create a database connection context manager.
 
+        When SQL profiling is enabled, the connection times every statement
+        and reports slow ones to the slow-query log.
+
         Yields:
             SQLite connection with row factory enabled.
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = connect(self.db_path, self.profiler or get_active_profiler())
+        conn.row_factory = _counting_row_factory
+        _CONNECTIONS_OPENED.inc()
+        _CONNECTIONS_OPEN.inc()
         try:
             yield conn
         finally:
             conn.close()
+            _CONNECTIONS_OPEN.dec()
 
+    @_instrumented
     def get_vendor_stats(self, vendor_id: str, days: int = 30) -> VendorStats | None:
         """Get usage statistics for a specific vendor.
 
@@ -229,6 +394,7 @@ class DatabaseManager:
             last_session=row["last_session"],
         )
 
+    @_instrumented
     def get_vendor_stats_summary(self, days: int = 30) -> list[VendorStats]:
         """Get usage statistics for all vendors.
 
@@ -275,6 +441,7 @@ class DatabaseManager:
             for row in rows
         ]
 
+    @_instrumented
     def get_daily_usage(self, days: int = 7) -> list[DailyUsage]:
         """Get daily usage metrics for charting.
 
@@ -318,6 +485,7 @@ class DatabaseManager:
             for row in rows
         ]
 
+    @_instrumented
     def get_week_stats(self) -> WeekStats:
         """Get statistics for the current week.
 
@@ -366,6 +534,7 @@ class DatabaseManager:
             sessions_by_vendor=sessions_by_vendor,
         )
 
+    @_instrumented
     def get_previous_reviews(self, limit: int = 10) -> list[WeeklyReview]:
         """Get previous weekly reviews.
 
@@ -408,6 +577,7 @@ class DatabaseManager:
             for row in rows
         ]
 
+    @_instrumented
     def save_review(self, review: WeeklyReview) -> int:
         """Save a weekly review.
 
@@ -443,6 +613,7 @@ class DatabaseManager:
             conn.commit()
             return cursor.lastrowid or 0
 
+    @_instrumented
     def get_agent_usage_history(
         self, agent_name: str | None = None, days: int = 30
     ) -> list[AgentUsage]:
@@ -505,6 +676,7 @@ class DatabaseManager:
             for row in rows
         ]
 
+    @_instrumented
     def record_session(
         self,
         session_id: str,
@@ -532,6 +704,7 @@ class DatabaseManager:
             )
             conn.commit()
 
+    @_instrumented
     def end_session(
         self,
         session_id: str,
@@ -582,6 +755,7 @@ class DatabaseManager:
             )
             conn.commit()
 
+    @_instrumented
     def record_event(
         self,
         session_id: str,
@@ -615,6 +789,42 @@ class DatabaseManager:
             )
             conn.commit()
 
+    @_instrumented
+    def record_events(self, events: Sequence[EventRecord]) -> int:
+        """Record many events in a single transaction.
+
+        Args:
+            events: Events to insert, in order.
+
+        Returns:
+            Number of events inserted.
+        """
+        if not events:
+            return 0
+
+        with self._connection() as conn:
+            conn.executemany(
+                """
+                INSERT INTO events (
+                    session_id, vendor_id, event_type, event_name, event_data, timestamp
+                ) VALUES (?, ?, ?, ?, ?, COALESCE(?, datetime('now')))
+                """,
+                [
+                    (
+                        event.session_id,
+                        event.vendor_id,
+                        event.event_type,
+                        event.event_name,
+                        json.dumps(event.event_data) if event.event_data else None,
+                        event.timestamp,
+                    )
+                    for event in events
+                ],
+            )
+            conn.commit()
+        return len(events)
+
+    @_instrumented
     def get_tool_usage(self, vendor_id: str | None = None, days: int = 30) -> list[dict[str, Any]]:
         """Get tool usage statistics.
 
@@ -665,6 +875,7 @@ class DatabaseManager:
 
         return [dict(row) for row in rows]
 
+    @_instrumented
     def get_tool_stats(self, vendor_id: str | None = None) -> dict[str, int]:
         """Get aggregated tool usage statistics.
 
@@ -691,6 +902,7 @@ class DatabaseManager:
             cursor = conn.execute(query, params)
             return {row["event_name"]: row["count"] for row in cursor.fetchall()}
 
+    @_instrumented
     def get_inefficient_sessions(
         self,
         vendor_id: str | None = None,
@@ -727,6 +939,7 @@ class DatabaseManager:
             cursor = conn.execute(query, params)
             return [dict(row) for row in cursor.fetchall()]
 
+    @_instrumented
     def get_longitudinal_stats(self, vendor_id: str = "gemini", weeks: int = 4) -> list[dict[str, Any]]:
         """Get longitudinal performance metrics grouped by week.
 
@@ -782,6 +995,7 @@ class DatabaseManager:
                 
         return results
 
+    @_instrumented
     def get_skill_profile_stats(self, vendor_id: str = "gemini", days: int = 30) -> dict[str, float]:
         """Get raw metrics for the Skill Profile radar chart.
 
@@ -853,6 +1067,7 @@ class DatabaseManager:
             "reasoning": round(reasoning_ratio * 5, 2) # Scale up reasoning
         }
 
+    @_instrumented
     def get_session_scatter_data(self, vendor_id: str = "gemini", limit: int = 50) -> list[dict[str, Any]]:
         """Get session data for the Efficiency Frontier scatter plot.
 
@@ -879,6 +1094,7 @@ class DatabaseManager:
                 for row in cursor.fetchall()
             ]
 
+    @_instrumented
     def get_weekly_event_breakdown(self, vendor_id: str = "gemini", weeks: int = 8) -> dict[str, list[Any]]:
         """Get weekly event counts for Cognitive Load stacked bar chart.
 
@@ -922,6 +1138,7 @@ class DatabaseManager:
 
     # GitHub commit methods
 
+    @_instrumented
     def record_github_commit(self, commit: GitHubCommit) -> bool:
         """Record a GitHub commit with optional vendor attribution.
 
@@ -959,6 +1176,63 @@ class DatabaseManager:
         else:
             return True
 
+    @_instrumented
+    def record_github_commits_bulk(
+        self,
+        commits: Iterable[GitHubCommit],
+        batch_size: int = DEFAULT_COMMIT_BATCH_SIZE,
+    ) -> CommitUpsertResult:
+        """Record many GitHub commits in a single transaction.
+
+        Commits are upserted by SHA with ``INSERT ... ON CONFLICT DO UPDATE``,
+        passed to ``executemany`` in batches of ``batch_size``. An existing
+        row keeps its id and created_at. A SHA that appears more than once
+        is written once, with its last occurrence. The iterable is consumed
+        as it goes, so it can be a generator.
+
+        Args:
+            commits: GitHubCommit objects from the parser module.
+            batch_size: Rows passed to each ``executemany`` call.
+
+        Returns:
+            CommitUpsertResult with the number of commits inserted and updated.
+
+        Raises:
+            sqlite3.Error: If the commits could not be written; none are.
+        """
+        seen: set[str] = set()
+        batch: dict[str, tuple[str | None, ...]] = {}
+        with self._connection() as conn:
+            # Hold the write lock from the first count so it stays exact
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                before = conn.execute("SELECT COUNT(*) FROM github_commits").fetchone()[0]
+                for commit in commits:
+                    seen.add(commit.sha)
+                    batch[commit.sha] = (
+                        commit.sha,
+                        commit.repo,
+                        commit.branch,
+                        commit.message,
+                        commit.author_name,
+                        commit.author_email,
+                        commit.vendor_id,
+                        commit.committed_at.isoformat(),
+                    )
+                    if len(batch) >= batch_size:
+                        conn.executemany(_UPSERT_GITHUB_COMMIT_SQL, batch.values())
+                        batch.clear()
+                conn.executemany(_UPSERT_GITHUB_COMMIT_SQL, batch.values())
+                after = conn.execute("SELECT COUNT(*) FROM github_commits").fetchone()[0]
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+        inserted = after - before
+        return CommitUpsertResult(inserted=inserted, updated=len(seen) - inserted)
+
+    @_instrumented
     def get_github_stats(self) -> GitHubStats:
         """Get summary statistics for GitHub activity.
 
@@ -1017,6 +1291,7 @@ class DatabaseManager:
                 last_commit=None,
             )
 
+    @_instrumented
     def get_github_commits(
         self,
         vendor_id: str | None = None,
@@ -1076,6 +1351,7 @@ class DatabaseManager:
             # Table doesn't exist (old schema)
             return []
 
+    @_instrumented
     def get_github_repos(self) -> list[str]:
         """Get list of tracked repositories.
 
@@ -1099,6 +1375,7 @@ class DatabaseManager:
             # Table doesn't exist (old schema)
             return []
 
+    @_instrumented
     def get_github_repo_stats(self) -> list[dict[str, str | int | None]]:
         """Get repository statistics with commit counts.
 
@@ -1135,6 +1412,7 @@ class DatabaseManager:
             # Table doesn't exist (old schema)
             return []
 
+    @_instrumented
     def get_github_commit_by_sha(self, sha: str) -> GitHubCommitRecord | None:
         """Get a specific commit by SHA.
 
@@ -1172,8 +1450,81 @@ class DatabaseManager:
             # Table doesn't exist (old schema)
             return None
 
+    @_instrumented
+    def get_github_sync_states(self) -> dict[str, GitHubSyncState]:
+        """Get the sync state of every repository synced so far.
+
+        Returns:
+            Mapping of repository path to its GitHubSyncState.
+            Returns an empty dict if the github_sync_state table doesn't exist.
+        """
+        try:
+            with self._connection() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT repo_path, ref_tips, last_sha, last_commit_at
+                    FROM github_sync_state
+                    """
+                ).fetchall()
+        except sqlite3.OperationalError:
+            # Table doesn't exist (old schema)
+            return {}
+
+        states: dict[str, GitHubSyncState] = {}
+        for row in rows:
+            try:
+                ref_tips = json.loads(row["ref_tips"])
+            except (TypeError, ValueError):
+                continue
+            states[row["repo_path"]] = GitHubSyncState(
+                repo_path=row["repo_path"],
+                ref_tips=ref_tips,
+                last_sha=row["last_sha"],
+                last_commit_at=row["last_commit_at"],
+            )
+        return states
+
+    @_instrumented
+    def record_github_sync_states(self, states: Sequence[GitHubSyncState]) -> bool:
+        """Save the sync state of repositories in one transaction.
+
+        Args:
+            states: States to insert or replace, by repository path.
+
+        Returns:
+            True if the states were saved, False on error.
+        """
+        if not states:
+            return True
+        try:
+            with self._connection() as conn:
+                # Databases created before the table existed gain it here
+                conn.execute(GITHUB_SYNC_STATE_SQL)
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO github_sync_state (
+                        repo_path, ref_tips, last_sha, last_commit_at, synced_at
+                    ) VALUES (?, ?, ?, ?, datetime('now'))
+                    """,
+                    [
+                        (
+                            state.repo_path,
+                            json.dumps(state.ref_tips, sort_keys=True),
+                            state.last_sha,
+                            state.last_commit_at,
+                        )
+                        for state in states
+                    ],
+                )
+                conn.commit()
+        except sqlite3.Error:
+            return False
+        else:
+            return True
+
     # GitHub activity methods
 
+    @_instrumented
     def record_github_activity(
         self,
         activity_id: str,
@@ -1232,6 +1583,7 @@ class DatabaseManager:
         else:
             return True
 
+    @_instrumented
     def get_github_activities(
         self,
         vendor_id: str | None = None,
@@ -1303,6 +1655,7 @@ class DatabaseManager:
             # Table doesn't exist (old schema)
             return []
 
+    @_instrumented
     def get_github_activity_stats(self) -> list[dict[str, Any]]:
         """Get aggregated GitHub activity statistics by vendor and operation type.
 
@@ -1333,6 +1686,7 @@ class DatabaseManager:
             # View doesn't exist (old schema)
             return []
 
+    @_instrumented
     def get_github_activity_by_session(self, session_id: str) -> list[GitHubActivityRecord]:
         """Get all GitHub activities for a specific session.
 
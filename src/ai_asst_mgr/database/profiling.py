@@ -0,0 +1,515 @@
+"""SQL statement profiling and slow-query logging.
+
+This module provides a profiling SQLite connection that times every
+statement executed through DatabaseManager, counts the rows it returns,
+and reports statements above a threshold to a slow-query log, optionally
+with their ``EXPLAIN QUERY PLAN`` output attached.
+
+Profiling is off by default. It is enabled process-wide with the
+``AI_ASST_MGR_PROFILE_SQL`` environment variable or the ``--profile-sql``
+CLI flag, or per manager by passing a QueryProfiler to DatabaseManager.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+_logger = logging.getLogger(__name__)
+
+# Logger that receives statements slower than the profiler threshold
+slow_query_logger = logging.getLogger("ai_asst_mgr.database.slow_query")
+
+# Environment variables controlling process-wide profiling
+ENV_PROFILE_SQL = "AI_ASST_MGR_PROFILE_SQL"
+ENV_SLOW_QUERY_MS = "AI_ASST_MGR_SLOW_QUERY_MS"
+ENV_SLOW_QUERY_EXPLAIN = "AI_ASST_MGR_SLOW_QUERY_EXPLAIN"
+ENV_SLOW_QUERY_LOG = "AI_ASST_MGR_SLOW_QUERY_LOG"
+
+DEFAULT_SLOW_QUERY_MS = 100.0
+DEFAULT_HISTORY_SIZE = 1000
+
+_TRUTHY = {"1", "true", "yes", "on"}
+_EXPLAINABLE_PREFIXES = ("select", "with")
+
+
+@dataclass
+class QueryRecord:
+    """A single profiled SQL statement."""
+
+    statement: str
+    duration_ms: float
+    rows: int
+    slow: bool = False
+    plan: list[str] | None = None
+
+
+@dataclass
+class StatementSummary:
+    """Aggregated timings for one distinct SQL statement."""
+
+    statement: str
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    rows: int = 0
+
+    @property
+    def avg_ms(self) -> float:
+        """Average duration per call in milliseconds."""
+        return self.total_ms / self.calls if self.calls else 0.0
+
+
+@dataclass
+class _PendingQuery:
+    """A statement whose rows are still being fetched."""
+
+    statement: str
+    parameters: Any
+    elapsed: float
+    rows: int = 0
+
+
+class QueryProfiler:
+    """Collects statement timings and reports slow queries.
+
+    Hooks registered with add_hook() are called with every QueryRecord,
+    which makes the profiler the extension point for custom sinks.
+    """
+
+    def __init__(
+        self,
+        slow_threshold_ms: float = DEFAULT_SLOW_QUERY_MS,
+        *,
+        explain: bool = False,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+    ) -> None:
+        """Initialize the profiler.
+
+        Args:
+            slow_threshold_ms: Statements at or above this duration are logged as slow.
+            explain: Attach EXPLAIN QUERY PLAN output to slow SELECT statements.
+            history_size: Number of recent QueryRecords to keep.
+        """
+        self.slow_threshold_ms = slow_threshold_ms
+        self.explain = explain
+        self.records: deque[QueryRecord] = deque(maxlen=history_size)
+        self._summaries: dict[str, StatementSummary] = {}
+        self._hooks: list[Callable[[QueryRecord], None]] = []
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook: Callable[[QueryRecord], None]) -> None:
+        """Register a callable invoked with every profiled statement.
+
+        Args:
+            hook: Callable receiving a QueryRecord.
+        """
+        self._hooks.append(hook)
+
+    def record(self, record: QueryRecord) -> None:
+        """Store a profiled statement and dispatch it to hooks.
+
+        Args:
+            record: The profiled statement.
+        """
+        with self._lock:
+            self.records.append(record)
+            summary = self._summaries.get(record.statement)
+            if summary is None:
+                summary = StatementSummary(statement=record.statement)
+                self._summaries[record.statement] = summary
+            summary.calls += 1
+            summary.total_ms += record.duration_ms
+            summary.max_ms = max(summary.max_ms, record.duration_ms)
+            summary.rows += record.rows
+
+        if record.slow:
+            _log_slow_query(record)
+
+        for hook in self._hooks:
+            try:
+                hook(record)
+            except Exception:
+                _logger.exception("SQL profiler hook failed")
+
+    def summaries(self) -> list[StatementSummary]:
+        """Get per-statement aggregates, most expensive first.
+
+        Returns:
+            List of StatementSummary ordered by total time descending.
+        """
+        with self._lock:
+            summaries = [
+                StatementSummary(s.statement, s.calls, s.total_ms, s.max_ms, s.rows)
+                for s in self._summaries.values()
+            ]
+        return sorted(summaries, key=lambda s: s.total_ms, reverse=True)
+
+    def slow_queries(self) -> list[QueryRecord]:
+        """Get recent statements that exceeded the slow threshold.
+
+        Returns:
+            List of slow QueryRecords in execution order.
+        """
+        with self._lock:
+            return [record for record in self.records if record.slow]
+
+    def reset(self) -> None:
+        """Discard all collected records and summaries."""
+        with self._lock:
+            self.records.clear()
+            self._summaries.clear()
+
+    def is_slow(self, duration_ms: float) -> bool:
+        """Check whether a duration exceeds the slow threshold.
+
+        Args:
+            duration_ms: Statement duration in milliseconds.
+
+        Returns:
+            True if the statement counts as slow.
+        """
+        return duration_ms >= self.slow_threshold_ms
+
+
+def _normalize_statement(sql: str) -> str:
+    """Collapse whitespace so equivalent statements aggregate together.
+
+    Args:
+        sql: Raw SQL text.
+
+    Returns:
+        SQL with runs of whitespace collapsed to single spaces.
+    """
+    return " ".join(sql.split())
+
+
+def _log_slow_query(record: QueryRecord) -> None:
+    """Write a slow statement to the slow-query logger.
+
+    Args:
+        record: The slow statement.
+    """
+    if record.plan:
+        slow_query_logger.warning(
+            "%.1f ms, %d rows: %s\n  plan: %s",
+            record.duration_ms,
+            record.rows,
+            record.statement,
+            "\n  plan: ".join(record.plan),
+        )
+    else:
+        slow_query_logger.warning(
+            "%.1f ms, %d rows: %s", record.duration_ms, record.rows, record.statement
+        )
+
+
+class ProfilingCursor(sqlite3.Cursor):
+    """Cursor that times execution and fetches of each statement.
+
+    A statement's record is emitted once its rows are exhausted, when the
+    cursor executes another statement, or when the cursor or its
+    connection is closed.
+    """
+
+    _profiler: QueryProfiler
+    _pending: _PendingQuery | None = None
+
+    def execute(self, sql: str, parameters: Any = (), /) -> ProfilingCursor:  # noqa: ANN401
+        """Execute a statement and start timing it."""
+        self._finish()
+        start = time.perf_counter()
+        super().execute(sql, parameters)
+        self._begin(sql, parameters, time.perf_counter() - start)
+        return self
+
+    def executemany(
+        self,
+        sql: str,
+        seq_of_parameters: Iterable[Any],
+        /,
+    ) -> ProfilingCursor:
+        """Execute a statement for each parameter set and time the batch."""
+        self._finish()
+        start = time.perf_counter()
+        super().executemany(sql, seq_of_parameters)
+        self._begin(sql, None, time.perf_counter() - start)
+        return self
+
+    def fetchone(self) -> Any:  # noqa: ANN401
+        """Fetch the next row, adding fetch time to the current statement."""
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._account(time.perf_counter() - start, 0 if row is None else 1)
+        if row is None:
+            self._finish()
+        return row
+
+    def fetchmany(self, size: int | None = None) -> list[Any]:
+        """Fetch up to size rows, adding fetch time to the current statement."""
+        start = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._account(time.perf_counter() - start, len(rows))
+        if not rows:
+            self._finish()
+        return rows
+
+    def fetchall(self) -> list[Any]:
+        """Fetch all remaining rows and emit the statement's record."""
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._account(time.perf_counter() - start, len(rows))
+        self._finish()
+        return rows
+
+    def __next__(self) -> Any:  # noqa: ANN401
+        """Fetch the next row during iteration."""
+        start = time.perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self._account(time.perf_counter() - start, 0)
+            self._finish()
+            raise
+        self._account(time.perf_counter() - start, 1)
+        return row
+
+    def close(self) -> None:
+        """Emit any pending record and close the cursor."""
+        self._finish()
+        super().close()
+
+    def _begin(self, sql: str, parameters: Any, elapsed: float) -> None:  # noqa: ANN401
+        """Start tracking a freshly executed statement."""
+        # DML reports affected rows up front; SELECT rows are counted as fetched
+        rows = max(self.rowcount, 0) if self.description is None else 0
+        self._pending = _PendingQuery(sql, parameters, elapsed, rows)
+        if self.description is None:
+            self._finish()
+        elif isinstance(self.connection, ProfilingConnection):
+            # Keep the cursor alive until the connection closes so that
+            # partially fetched statements are still reported
+            self.connection.track(self)
+
+    def _account(self, elapsed: float, rows: int) -> None:
+        """Add fetch time and rows to the pending statement."""
+        if self._pending is not None:
+            self._pending.elapsed += elapsed
+            self._pending.rows += rows
+
+    def _finish(self) -> None:
+        """Emit the pending statement's record, if any."""
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return
+        if isinstance(self.connection, ProfilingConnection):
+            self.connection.untrack(self)
+        profiler = self._profiler
+        duration_ms = pending.elapsed * 1000
+        slow = profiler.is_slow(duration_ms)
+        plan = None
+        if slow and profiler.explain:
+            plan = _explain(self.connection, pending.statement, pending.parameters)
+        profiler.record(
+            QueryRecord(
+                statement=_normalize_statement(pending.statement),
+                duration_ms=duration_ms,
+                rows=pending.rows,
+                slow=slow,
+                plan=plan,
+            )
+        )
+
+
+def _explain(conn: sqlite3.Connection, sql: str, parameters: Any) -> list[str] | None:  # noqa: ANN401
+    """Run EXPLAIN QUERY PLAN for a read statement.
+
+    Args:
+        conn: Connection the statement ran on.
+        sql: The statement text.
+        parameters: The statement's bound parameters.
+
+    Returns:
+        Plan detail lines, or None if the statement cannot be explained.
+    """
+    if not sql.lstrip().lower().startswith(_EXPLAINABLE_PREFIXES) or parameters is None:
+        return None
+    try:
+        # A plain cursor avoids profiling the EXPLAIN statement itself
+        cursor = sqlite3.Cursor(conn)
+        cursor.row_factory = None
+        rows = cursor.execute(f"EXPLAIN QUERY PLAN {sql}", parameters).fetchall()
+        cursor.close()
+    except sqlite3.Error:
+        return None
+    return [str(row[-1]) for row in rows]
+
+
+class ProfilingConnection(sqlite3.Connection):
+    """SQLite connection whose statements are timed by a QueryProfiler.
+
+    Use as ``sqlite3.connect(path, factory=ProfilingConnection)`` and then
+    call attach() with the profiler to report to. Until a profiler is
+    attached, statements run on plain cursors and are not timed.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Open the connection without a profiler attached."""
+        super().__init__(*args, **kwargs)
+        self._profiler: QueryProfiler | None = None
+        self._active: set[ProfilingCursor] = set()
+
+    def attach(self, profiler: QueryProfiler) -> None:
+        """Set the profiler that receives this connection's statements.
+
+        Args:
+            profiler: The profiler to report to.
+        """
+        self._profiler = profiler
+
+    def track(self, cursor: ProfilingCursor) -> None:
+        """Hold a cursor whose statement has rows left to fetch.
+
+        Args:
+            cursor: Cursor with a pending statement.
+        """
+        self._active.add(cursor)
+
+    def untrack(self, cursor: ProfilingCursor) -> None:
+        """Release a cursor whose statement has been reported.
+
+        Args:
+            cursor: Cursor that finished its statement.
+        """
+        self._active.discard(cursor)
+
+    def cursor(self, factory: Any = None) -> Any:  # noqa: ANN401
+        """Create a profiling cursor, or a plain one while no profiler is attached."""
+        if self._profiler is None:
+            return super().cursor(factory or sqlite3.Cursor)
+        cursor = super().cursor(factory or ProfilingCursor)
+        if isinstance(cursor, ProfilingCursor):
+            cursor._profiler = self._profiler
+        return cursor
+
+    def execute(self, sql: str, parameters: Any = (), /) -> Any:  # noqa: ANN401
+        """Execute a statement on a new profiling cursor."""
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Iterable[Any], /) -> Any:  # noqa: ANN401
+        """Execute a statement for each parameter set on a new profiling cursor."""
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def close(self) -> None:
+        """Emit records for unfinished statements and close the connection."""
+        for cursor in list(self._active):
+            cursor._finish()
+        super().close()
+
+
+@dataclass
+class _ProfilingState:
+    """Process-wide profiler configuration."""
+
+    profiler: QueryProfiler | None = None
+    configured: bool = False
+    handlers: list[logging.Handler] = field(default_factory=list)
+
+
+_state = _ProfilingState()
+_state_lock = threading.Lock()
+
+
+def enable_sql_profiling(
+    slow_threshold_ms: float = DEFAULT_SLOW_QUERY_MS,
+    *,
+    explain: bool = False,
+    log_path: Path | None = None,
+) -> QueryProfiler:
+    """Enable profiling for every DatabaseManager in this process.
+
+    Args:
+        slow_threshold_ms: Statements at or above this duration are logged as slow.
+        explain: Attach EXPLAIN QUERY PLAN output to slow SELECT statements.
+        log_path: Optional file to append slow-query log entries to.
+
+    Returns:
+        The active QueryProfiler.
+    """
+    profiler = QueryProfiler(slow_threshold_ms, explain=explain)
+    with _state_lock:
+        _remove_handlers()
+        if log_path is not None:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            handler = logging.FileHandler(log_path, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            slow_query_logger.addHandler(handler)
+            _state.handlers.append(handler)
+        _state.profiler = profiler
+        _state.configured = True
+    return profiler
+
+
+def disable_sql_profiling() -> None:
+    """Disable process-wide profiling and detach slow-query log files."""
+    with _state_lock:
+        _remove_handlers()
+        _state.profiler = None
+        _state.configured = True
+
+
+def _remove_handlers() -> None:
+    """Detach and close file handlers added by enable_sql_profiling()."""
+    for handler in _state.handlers:
+        slow_query_logger.removeHandler(handler)
+        handler.close()
+    _state.handlers.clear()
+
+
+def get_active_profiler() -> QueryProfiler | None:
+    """Get the process-wide profiler, configuring it from the environment once.
+
+    Returns:
+        The active QueryProfiler, or None if profiling is disabled.
+    """
+    if not _state.configured:
+        if os.environ.get(ENV_PROFILE_SQL, "").strip().lower() in _TRUTHY:
+            try:
+                threshold = float(os.environ.get(ENV_SLOW_QUERY_MS, DEFAULT_SLOW_QUERY_MS))
+            except ValueError:
+                threshold = DEFAULT_SLOW_QUERY_MS
+            explain = os.environ.get(ENV_SLOW_QUERY_EXPLAIN, "").strip().lower() in _TRUTHY
+            log_path = os.environ.get(ENV_SLOW_QUERY_LOG)
+            enable_sql_profiling(
+                threshold, explain=explain, log_path=Path(log_path) if log_path else None
+            )
+        else:
+            _state.configured = True
+    return _state.profiler
+
+
+def connect(db_path: Path | str, profiler: QueryProfiler | None) -> sqlite3.Connection:
+    """Open an SQLite connection, profiled if a profiler is given.
+
+    Args:
+        db_path: Path to the SQLite database file.
+        profiler: Profiler to attach, or None for a plain connection.
+
+    Returns:
+        A new SQLite connection.
+    """
+    if profiler is None:
+        return sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, factory=ProfilingConnection)
+    conn.attach(profiler)
+    return conn
@@ -184,6 +184,17 @@ CREATE TABLE IF NOT EXISTS github_commits (
 );
 """
 
+# GitHub sync state table (where the last `github sync` of each local repo stopped)
+GITHUB_SYNC_STATE_SQL = """
+CREATE TABLE IF NOT EXISTS github_sync_state (
+    repo_path TEXT PRIMARY KEY,
+    ref_tips TEXT NOT NULL,
+    last_sha TEXT,
+    last_commit_at TEXT,
+    synced_at TEXT DEFAULT (datetime('now'))
+);
+"""
+
 # GitHub activity table (tracks all GitHub operations)
 GITHUB_ACTIVITY_SQL = """
 CREATE TABLE IF NOT EXISTS github_activity (
@@ -393,6 +404,7 @@ def create_schema_sql() -> str:
             COACHING_INSIGHTS_SQL,
             CAPABILITIES_SQL,
             GITHUB_COMMITS_SQL,
+            GITHUB_SYNC_STATE_SQL,
             GITHUB_ACTIVITY_SQL,
             INDEXES_SQL,
             DAILY_USAGE_VIEW_SQL,
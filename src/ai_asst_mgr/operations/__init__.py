@@ -6,10 +6,10 @@ sync, audit, and coaching functionality.
 
 from ai_asst_mgr.operations.backup import (
     BackupManager,
-    BackupMetadata,
     BackupResult,
     BackupSummary,
 )
+from ai_asst_mgr.operations.backup_catalog import BackupMetadata
 from ai_asst_mgr.operations.restore import (
     RestoreManager,
     RestorePreview,
@@ -8,39 +8,40 @@ from __future__ import annotations
 
 import hashlib
 import json
+import shutil
+import sqlite3
 import tarfile
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-if TYPE_CHECKING:
-    from collections.abc import Callable
-
-    from ai_asst_mgr.adapters.base import VendorAdapter
-
-
-@dataclass
-class BackupMetadata:
-    """Metadata for a backup archive.
+from ai_asst_mgr.adapters.base import VendorAdapter
+from ai_asst_mgr.operations.backup_catalog import CATALOG_FILENAME, BackupCatalog, BackupMetadata
+from ai_asst_mgr.operations.database_backup import (
+    DATABASE_BACKUP_ID,
+    DATABASE_CHUNK_SIZE,
+    check_integrity,
+    copy_database,
+)
+from ai_asst_mgr.operations.snapshot import (
+    SNAPSHOT_SUFFIX,
+    STORE_DIRNAME,
+    GarbageCollectionStats,
+    SnapshotRepository,
+    SnapshotStats,
+    is_snapshot,
+)
+from ai_asst_mgr.utils.archive import ArchiveStats, scan_tar_archive, write_tar_archive
+from ai_asst_mgr.utils.archive_index import ArchiveIndex, index_path_for
+from ai_asst_mgr.utils.compression import CompressionSettings, detect_codec, open_decompressed
+from ai_asst_mgr.utils.exclusions import ExclusionReport, ExclusionRules
 
-    Attributes:
-        vendor_id: Identifier of the vendor that was backed up.
-        timestamp: When the backup was created.
-        backup_path: Path to the backup archive.
-        size_bytes: Size of the backup in bytes.
-        checksum: SHA256 checksum of the backup file.
-        file_count: Number of files in the backup.
-        config_dir: Original config directory that was backed up.
-    """
-
-    vendor_id: str
-    timestamp: datetime
-    backup_path: Path
-    size_bytes: int
-    checksum: str
-    file_count: int
-    config_dir: str
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
 
 
 @dataclass
@@ -89,7 +90,9 @@ class BackupManager:
     - Retention policy enforcement
     - Backup verification and integrity checks
     - Progress reporting via callbacks
-    - Backup listing and metadata retrieval
+    - Backup listing and metadata retrieval from an indexed SQLite catalog
+    - Optional incremental mode storing deduplicated snapshots
+    - Online, consistent backups of the sessions database
 
     Example:
         >>> from ai_asst_mgr.vendors import VendorRegistry
@@ -101,32 +104,103 @@ class BackupManager:
     """
 
     DEFAULT_RETENTION_COUNT = 5
-    METADATA_FILENAME = "backup_manifest.json"
+    CATALOG_FILENAME = CATALOG_FILENAME
+    # Per-vendor JSON manifest used before the catalog; imported on first use
+    LEGACY_MANIFEST_FILENAME = "backup_manifest.json"
 
     def __init__(
         self,
         backup_dir: Path,
         retention_count: int = DEFAULT_RETENTION_COUNT,
+        incremental: bool = False,
+        compression: CompressionSettings | None = None,
+        exclude: Sequence[str] = (),
+        max_file_size: int | None = None,
     ) -> None:
         """Initialize the backup manager.
 
         Args:
             backup_dir: Directory where backups will be stored.
             retention_count: Number of backups to keep per vendor.
+            incremental: Create deduplicated snapshots that only store changed
+                files, instead of full tar.gz archives.
+            compression: Codec and level for full archives. Defaults to the
+                adapters' default (multithreaded gzip).
+            exclude: Extra gitignore-style patterns to leave out of backups, on
+                top of vendor defaults and each config dir's .backupignore.
+            max_file_size: Leave out files larger than this many bytes.
         """
         self._backup_dir = Path(backup_dir).expanduser()
         self._retention_count = retention_count
+        self._incremental = incremental
+        self._compression = compression
+        self._exclude = tuple(exclude)
+        self._max_file_size = max_file_size
+        self._catalog: BackupCatalog | None = None
+        self._catalog_lock = threading.Lock()
 
     @property
     def backup_dir(self) -> Path:
         """Get the backup directory path."""
         return self._backup_dir
 
+    @property
+    def catalog(self) -> BackupCatalog:
+        """Get the backup catalog, importing legacy JSON manifests on first use."""
+        with self._catalog_lock:
+            if self._catalog is None:
+                catalog = BackupCatalog(self._backup_dir / self.CATALOG_FILENAME)
+                if self._backup_dir.exists():
+                    self._import_legacy_manifests(catalog)
+                self._catalog = catalog
+            return self._catalog
+
     @property
     def retention_count(self) -> int:
         """Get the retention count setting."""
         return self._retention_count
 
+    @property
+    def incremental(self) -> bool:
+        """Get whether new backups are stored as deduplicated snapshots."""
+        return self._incremental
+
+    @property
+    def compression(self) -> CompressionSettings | None:
+        """Get the compression settings for full archives (None for the default)."""
+        return self._compression
+
+    def exclusion_rules(self, adapter: VendorAdapter) -> ExclusionRules:
+        """Get the rules deciding which paths a vendor's backup leaves out.
+
+        Args:
+            adapter: The vendor adapter to be backed up.
+
+        Returns:
+            Vendor defaults, the config dir's .backupignore and this manager's
+            exclude patterns and size limit, in increasing priority.
+        """
+        defaults = adapter.backup_exclusions if isinstance(adapter, VendorAdapter) else ()
+        return ExclusionRules.for_directory(
+            adapter.info.config_dir, defaults, self._exclude, self._max_file_size
+        )
+
+    def explain_backup(self, adapter: VendorAdapter) -> ExclusionReport:
+        """Measure what a backup would include and what each rule would skip.
+
+        Nothing is written; this backs ``backup --dry-run --explain``.
+
+        Args:
+            adapter: The vendor adapter to measure.
+
+        Returns:
+            ExclusionReport for the vendor's config directory.
+
+        Raises:
+            OSError: If the config directory cannot be read.
+        """
+        return self.exclusion_rules(adapter).explain(adapter.info.config_dir)
+
     def backup_vendor(
         self,
         adapter: VendorAdapter,
@@ -163,44 +237,168 @@ class BackupManager:
                     duration_seconds=self._calc_duration(start_time),
                 )
 
-            report("Creating backup archive...")
+            if self._incremental:
+                report("Creating incremental snapshot...")
+                snapshot = self._create_snapshot(adapter, vendor_backup_dir)
+                report(
+                    f"{snapshot.unchanged_files}/{snapshot.file_count} files unchanged, "
+                    f"{snapshot.new_chunks} new chunk(s) stored"
+                )
+                # Size is what this run added to disk, not the logical size
+                metadata = BackupMetadata(
+                    vendor_id=vendor_id,
+                    timestamp=start_time,
+                    backup_path=snapshot.path,
+                    size_bytes=snapshot.stored_bytes,
+                    checksum=snapshot.checksum,
+                    file_count=snapshot.file_count,
+                    config_dir=str(adapter.info.config_dir),
+                )
+            else:
+                report("Creating backup archive...")
+
+                # Use adapter's backup method; options are only passed when set
+                # so adapters implementing the one-argument form keep working
+                options: dict[str, Any] = {}
+                if self._compression is not None:
+                    options["compression"] = self._compression
+                if self._exclude or self._max_file_size is not None:
+                    options["exclusions"] = self.exclusion_rules(adapter)
+                backup_path = adapter.backup(vendor_backup_dir, **options)
+
+                # Built-in adapters capture checksum and counts while writing the
+                # archive; anything else is scanned once to collect them
+                stats = adapter.last_backup_stats
+                if not isinstance(stats, ArchiveStats) or stats.path != backup_path:
+                    report("Calculating checksum...")
+                    stats = scan_tar_archive(backup_path)
+
+                metadata = BackupMetadata(
+                    vendor_id=vendor_id,
+                    timestamp=start_time,
+                    backup_path=backup_path,
+                    size_bytes=stats.size_bytes,
+                    checksum=stats.checksum,
+                    file_count=stats.file_count,
+                    config_dir=str(adapter.info.config_dir),
+                )
+
+            # Record the backup in the catalog
+            self.catalog.add(metadata)
+
+            report("Applying retention policy...")
+
+            # Apply retention policy
+            self._apply_retention_policy(vendor_id)
+
+            duration = self._calc_duration(start_time)
+            report(f"Backup complete in {duration:.1f}s")
+
+            return BackupResult(
+                success=True,
+                metadata=metadata,
+                duration_seconds=duration,
+            )
+
+        except Exception as e:
+            return BackupResult(
+                success=False,
+                error=str(e),
+                duration_seconds=self._calc_duration(start_time),
+            )
+
+    def backup_database(
+        self,
+        db_path: Path,
+        progress_callback: Callable[[str], None] | None = None,
+    ) -> BackupResult:
+        """Back up the sessions database while it may be in use.
+
+        The database is copied with SQLite's online backup API, checked with
+        ``PRAGMA integrity_check`` and then stored like a vendor backup under
+        ``<backup-dir>/database``: as a compressed archive, or as a snapshot
+        that only stores changed pages in incremental mode. Database backups
+        share the catalog and retention policy with vendor backups.
 
-            # Use adapter's backup method
-            backup_path = adapter.backup(vendor_backup_dir)
+        Args:
+            db_path: Path to the SQLite database to back up.
+            progress_callback: Optional callback for progress updates.
+
+        Returns:
+            BackupResult with success status and metadata or error.
+        """
+        start_time = datetime.now(tz=UTC)
+
+        def report(msg: str) -> None:
+            if progress_callback:
+                progress_callback(msg)
 
-            report("Calculating checksum...")
+        try:
+            if not db_path.is_file():
+                return BackupResult(
+                    success=False,
+                    error=f"Database not found: {db_path}",
+                    duration_seconds=self._calc_duration(start_time),
+                )
 
-            # Calculate metadata
-            checksum = self._calculate_checksum(backup_path)
-            size_bytes = backup_path.stat().st_size
-            file_count = self._count_files_in_archive(backup_path)
+            database_backup_dir = self._backup_dir / DATABASE_BACKUP_ID
+            database_backup_dir.mkdir(parents=True, exist_ok=True)
+
+            # Stage the copy in the backup directory so it shares a filesystem
+            # with the archive or chunk store it ends up in
+            with tempfile.TemporaryDirectory(prefix=".staging-", dir=database_backup_dir) as tmp:
+                staging_dir = Path(tmp)
+                report(f"Copying {db_path.name}...")
+                copy = copy_database(db_path, staging_dir / db_path.name)
+                report(f"Copied {copy.page_count} pages in {copy.steps} step(s)")
+
+                is_valid, message = check_integrity(copy.path)
+                if not is_valid:
+                    return BackupResult(
+                        success=False,
+                        error=message,
+                        duration_seconds=self._calc_duration(start_time),
+                    )
+
+                if self._incremental:
+                    report("Creating incremental snapshot...")
+                    snapshot = self._create_database_snapshot(staging_dir, database_backup_dir)
+                    report(
+                        f"{snapshot.new_chunks} new chunk(s) stored "
+                        f"({snapshot.stored_bytes} of {snapshot.total_bytes} bytes)"
+                    )
+                    backup_path, size_bytes, checksum = (
+                        snapshot.path,
+                        snapshot.stored_bytes,
+                        snapshot.checksum,
+                    )
+                else:
+                    report("Creating backup archive...")
+                    stats = self._archive_database(staging_dir, database_backup_dir)
+                    backup_path, size_bytes, checksum = (
+                        stats.path,
+                        stats.size_bytes,
+                        stats.checksum,
+                    )
 
             metadata = BackupMetadata(
-                vendor_id=vendor_id,
+                vendor_id=DATABASE_BACKUP_ID,
                 timestamp=start_time,
                 backup_path=backup_path,
                 size_bytes=size_bytes,
                 checksum=checksum,
-                file_count=file_count,
-                config_dir=str(adapter.info.config_dir),
+                file_count=1,
+                config_dir=str(db_path),
             )
-
-            # Save metadata
-            self._save_metadata(metadata)
+            self.catalog.add(metadata)
 
             report("Applying retention policy...")
-
-            # Apply retention policy
-            self._apply_retention_policy(vendor_id)
+            self._apply_retention_policy(DATABASE_BACKUP_ID)
 
             duration = self._calc_duration(start_time)
             report(f"Backup complete in {duration:.1f}s")
 
-            return BackupResult(
-                success=True,
-                metadata=metadata,
-                duration_seconds=duration,
-            )
+            return BackupResult(success=True, metadata=metadata, duration_seconds=duration)
 
         except Exception as e:
             return BackupResult(
@@ -213,32 +411,67 @@ class BackupManager:
         self,
         adapters: dict[str, VendorAdapter],
         progress_callback: Callable[[str], None] | None = None,
+        max_workers: int = 1,
     ) -> BackupSummary:
         """Create backups of all vendor configurations.
 
+        With ``max_workers`` above 1, vendors are backed up concurrently on a
+        thread pool. Each vendor writes its archive to its own directory, and
+        compression releases the GIL, so the total time approaches that of the
+        slowest vendor. All vendors record their backups in the shared SQLite
+        catalog: each catalog call opens its own connection, and SQLite's
+        write lock serializes the short insert and retention transactions,
+        with a busy thread waiting for the lock rather than failing.
+        Progress messages are serialized through a lock and prefixed with the
+        vendor ID so interleaved output stays readable.
+
         Args:
             adapters: Dictionary of vendor_id to adapter instances.
             progress_callback: Optional callback for progress updates.
+            max_workers: Number of vendors to back up at the same time.
 
         Returns:
-            BackupSummary with overall results and per-vendor details.
+            BackupSummary with overall results and per-vendor details, in the
+            same order as ``adapters``.
         """
         start_time = datetime.now(tz=UTC)
         results: dict[str, BackupResult] = {}
         total_size = 0
         successful = 0
+        workers = max(1, min(max_workers, len(adapters)))
+        lock = threading.Lock()
 
         def report(msg: str) -> None:
             if progress_callback:
-                progress_callback(msg)
+                with lock:
+                    progress_callback(msg)
 
-        report(f"Starting backup of {len(adapters)} vendor(s)...")
+        def vendor_report(vendor_id: str) -> Callable[[str], None] | None:
+            if not progress_callback:
+                return None
+            if workers == 1:
+                return report
+            return lambda msg: report(f"[{vendor_id}] {msg}")
 
-        for vendor_id, adapter in adapters.items():
+        def run(vendor_id: str, adapter: VendorAdapter) -> BackupResult:
             report(f"\n[{vendor_id}] Backing up {adapter.info.name}...")
-            result = self.backup_vendor(adapter, progress_callback)
-            results[vendor_id] = result
+            return self.backup_vendor(adapter, vendor_report(vendor_id))
+
+        report(f"Starting backup of {len(adapters)} vendor(s)...")
 
+        if workers == 1:
+            for vendor_id, adapter in adapters.items():
+                results[vendor_id] = run(vendor_id, adapter)
+        else:
+            with ThreadPoolExecutor(workers, thread_name_prefix="backup") as executor:
+                futures = {
+                    vendor_id: executor.submit(run, vendor_id, adapter)
+                    for vendor_id, adapter in adapters.items()
+                }
+                # backup_vendor reports failures in its result rather than raising
+                results = {vendor_id: future.result() for vendor_id, future in futures.items()}
+
+        for result in results.values():
             if result.success and result.metadata:
                 successful += 1
                 total_size += result.metadata.size_bytes
@@ -264,45 +497,7 @@ class BackupManager:
         Returns:
             List of BackupMetadata objects sorted by timestamp (newest first).
         """
-        backups: list[BackupMetadata] = []
-
-        if vendor_id:
-            vendor_dirs = [self._backup_dir / vendor_id]
-        else:
-            vendor_dirs = (
-                [d for d in self._backup_dir.iterdir() if d.is_dir()]
-                if self._backup_dir.exists()
-                else []
-            )
-
-        for vendor_dir in vendor_dirs:
-            if not vendor_dir.exists():
-                continue
-
-            manifest_path = vendor_dir / self.METADATA_FILENAME
-            if manifest_path.exists():
-                try:
-                    manifest = self._load_manifest(manifest_path)
-                    for entry in manifest.get("backups", []):
-                        backup_path = Path(entry["backup_path"])
-                        if backup_path.exists():
-                            backups.append(
-                                BackupMetadata(
-                                    vendor_id=entry["vendor_id"],
-                                    timestamp=datetime.fromisoformat(entry["timestamp"]),
-                                    backup_path=backup_path,
-                                    size_bytes=entry["size_bytes"],
-                                    checksum=entry["checksum"],
-                                    file_count=entry["file_count"],
-                                    config_dir=entry["config_dir"],
-                                )
-                            )
-                except (json.JSONDecodeError, KeyError, OSError):
-                    continue
-
-        # Sort by timestamp, newest first
-        backups.sort(key=lambda b: b.timestamp, reverse=True)
-        return backups
+        return [backup for backup in self.catalog.backups(vendor_id) if backup.backup_path.exists()]
 
     def get_latest_backup(self, vendor_id: str) -> BackupMetadata | None:
         """Get the most recent backup for a vendor.
@@ -313,6 +508,10 @@ class BackupManager:
         Returns:
             BackupMetadata for the latest backup, or None if no backups exist.
         """
+        latest = self.catalog.latest(vendor_id)
+        if latest is not None and latest.backup_path.exists():
+            return latest
+        # The newest archive was removed outside ai-asst-mgr; fall back to a scan
         backups = self.list_backups(vendor_id)
         return backups[0] if backups else None
 
@@ -328,28 +527,61 @@ class BackupManager:
         if not backup_path.exists():
             return False, f"Backup file not found: {backup_path}"
 
+        if is_snapshot(backup_path):
+            is_valid, message = self._verify_snapshot(backup_path)
+        else:
+            is_valid, message = self._verify_archive(backup_path)
+
+        if is_valid and backup_path.parent.name == DATABASE_BACKUP_ID:
+            return self._verify_database(backup_path)
+        return is_valid, message
+
+    def _verify_archive(self, backup_path: Path) -> tuple[bool, str]:
+        """Verify a tar archive's members and checksum in a single read."""
         # Check if it's a valid tar.gz
         if not tarfile.is_tarfile(backup_path):
             return False, "Invalid archive format (not a tar file)"
 
         try:
-            # Try to read the archive
-            with tarfile.open(backup_path, "r:gz") as tar:
-                members = tar.getmembers()
-                if not members:
-                    return False, "Archive is empty"
+            # Read the archive once, listing members and hashing it together
+            stats = scan_tar_archive(backup_path)
+            if not stats.member_count:
+                return False, "Archive is empty"
 
             # Verify checksum if we have metadata
             stored_checksum = self._get_stored_checksum(backup_path)
-            if stored_checksum:
-                actual_checksum = self._calculate_checksum(backup_path)
-                if stored_checksum != actual_checksum:
-                    return False, "Checksum mismatch - backup may be corrupted"
-
-            return True, f"Backup valid ({len(members)} files)"
+            if stored_checksum and stored_checksum != stats.checksum:
+                return False, "Checksum mismatch - backup may be corrupted"
 
         except tarfile.TarError as e:
             return False, f"Archive error: {e}"
+        else:
+            codec = detect_codec(backup_path) or "uncompressed"
+            return True, f"Backup valid ({stats.member_count} files, {codec})"
+
+    def load_archive_index(self, backup_path: Path) -> ArchiveIndex | None:
+        """Load a backup archive's member index for random-access reads.
+
+        The index is only trusted when its recorded checksum matches the one in
+        the backup manifest, so a stale sidecar is never used. Reads through the
+        index check each block they touch, which stands in for a full verify.
+
+        Args:
+            backup_path: Path to the backup archive.
+
+        Returns:
+            The archive's index, or None for snapshots, archives written before
+            indexes existed, and indexes that do not match the manifest.
+        """
+        if is_snapshot(backup_path):
+            return None
+        index = ArchiveIndex.load(backup_path)
+        if index is None:
+            return None
+        stored_checksum = self._get_stored_checksum(backup_path)
+        if stored_checksum and stored_checksum != index.checksum:
+            return None
+        return index
 
     def delete_backup(self, backup_path: Path) -> bool:
         """Delete a backup archive.
@@ -363,14 +595,126 @@ class BackupManager:
         if not backup_path.exists():
             return False
 
-        backup_path.unlink()
-
-        # Update manifest
-        vendor_id = backup_path.parent.name
-        self._remove_from_manifest(vendor_id, backup_path)
+        self._delete_files(backup_path)
+        self.catalog.remove([backup_path])
 
         return True
 
+    def collect_garbage(self, vendor_id: str) -> GarbageCollectionStats:
+        """Remove snapshot chunks no longer referenced by any snapshot of a vendor.
+
+        Every snapshot manifest still on disk is treated as live, including
+        ones missing from the backup manifest, so nothing restorable is lost.
+
+        Args:
+            vendor_id: The vendor whose chunk store should be cleaned.
+
+        Returns:
+            GarbageCollectionStats with the number of chunks and bytes removed.
+        """
+        vendor_dir = self._backup_dir / vendor_id
+        if not (vendor_dir / STORE_DIRNAME).exists():
+            return GarbageCollectionStats()
+
+        live = sorted(vendor_dir.glob(f"*{SNAPSHOT_SUFFIX}"))
+        return self._snapshot_repository(vendor_id).collect_garbage(live)
+
+    def _create_snapshot(self, adapter: VendorAdapter, vendor_backup_dir: Path) -> SnapshotStats:
+        """Snapshot a vendor's config directory, reusing the latest snapshot's hashes."""
+        vendor_id = adapter.info.vendor_id
+        config_dir = adapter.info.config_dir
+        timestamp = datetime.now(tz=UTC).strftime("%Y%m%d_%H%M%S_%f")
+        manifest_path = vendor_backup_dir / f"{vendor_id}_snapshot_{timestamp}{SNAPSHOT_SUFFIX}"
+
+        previous = self._latest_snapshot(vendor_id)
+        # Same top-level name the adapters use in their tar archives (.claude -> claude)
+        arcname = config_dir.name.lstrip(".") or vendor_id
+
+        return self._snapshot_repository(vendor_id).create_snapshot(
+            config_dir, manifest_path, arcname, previous, self.exclusion_rules(adapter)
+        )
+
+    def _verify_snapshot(self, manifest_path: Path) -> tuple[bool, str]:
+        """Verify a snapshot manifest's checksum and every chunk it references."""
+        stored_checksum = self._get_stored_checksum(manifest_path)
+        if stored_checksum and stored_checksum != self._calculate_checksum(manifest_path):
+            return False, "Checksum mismatch - backup may be corrupted"
+
+        repository = SnapshotRepository(manifest_path.parent / STORE_DIRNAME)
+        return repository.verify_snapshot(manifest_path)
+
+    def _create_database_snapshot(
+        self, staging_dir: Path, database_backup_dir: Path
+    ) -> SnapshotStats:
+        """Snapshot a staged database copy in page-aligned chunks."""
+        timestamp = datetime.now(tz=UTC).strftime("%Y%m%d_%H%M%S_%f")
+        manifest_path = (
+            database_backup_dir / f"{DATABASE_BACKUP_ID}_snapshot_{timestamp}{SNAPSHOT_SUFFIX}"
+        )
+        repository = SnapshotRepository(
+            database_backup_dir / STORE_DIRNAME, chunk_size=DATABASE_CHUNK_SIZE
+        )
+        return repository.create_snapshot(
+            staging_dir,
+            manifest_path,
+            DATABASE_BACKUP_ID,
+            self._latest_snapshot(DATABASE_BACKUP_ID),
+        )
+
+    def _archive_database(self, staging_dir: Path, database_backup_dir: Path) -> ArchiveStats:
+        """Archive a staged database copy with this manager's compression settings."""
+        compression = self._compression or CompressionSettings()
+        timestamp = datetime.now(tz=UTC).strftime("%Y%m%d_%H%M%S")
+        archive_path = (
+            database_backup_dir / f"{DATABASE_BACKUP_ID}_backup_{timestamp}{compression.extension}"
+        )
+        return write_tar_archive(staging_dir, archive_path, DATABASE_BACKUP_ID, compression)
+
+    def _verify_database(self, backup_path: Path) -> tuple[bool, str]:
+        """Extract the database from a backup and run an integrity check on it."""
+        with tempfile.TemporaryDirectory(prefix="ai-asst-mgr-verify-") as tmp:
+            try:
+                db_copy = self._extract_database(backup_path, Path(tmp))
+            except (OSError, ValueError, tarfile.TarError) as e:
+                return False, f"Could not extract database: {e}"
+            if db_copy is None:
+                return False, "Backup does not contain a database"
+            return check_integrity(db_copy)
+
+    def _extract_database(self, backup_path: Path, dest_dir: Path) -> Path | None:
+        """Write the database file held by a database backup into dest_dir."""
+        if is_snapshot(backup_path):
+            repository = SnapshotRepository(backup_path.parent / STORE_DIRNAME)
+            for entry in repository.load_entries(backup_path):
+                if entry.kind == "file":
+                    dest = dest_dir / Path(entry.path).name
+                    repository.write_file(entry, dest)
+                    return dest
+            return None
+
+        with backup_path.open("rb") as raw:
+            decompressed = open_decompressed(raw, detect_codec(backup_path))
+            with tarfile.open(fileobj=decompressed, mode="r|") as tar:
+                for member in tar:
+                    source = tar.extractfile(member) if member.isfile() else None
+                    if source is not None:
+                        dest = dest_dir / Path(member.name).name
+                        with dest.open("wb") as f:
+                            shutil.copyfileobj(source, f)
+                        return dest
+        return None
+
+    def _latest_snapshot(self, vendor_id: str) -> Path | None:
+        """Get the newest snapshot manifest of a vendor, if any."""
+        return next(
+            (b.backup_path for b in self.list_backups(vendor_id) if is_snapshot(b.backup_path)),
+            None,
+        )
+
+    def _snapshot_repository(self, vendor_id: str) -> SnapshotRepository:
+        """Get the snapshot repository holding a vendor's chunks."""
+        return SnapshotRepository(self._backup_dir / vendor_id / STORE_DIRNAME)
+
     def _calculate_checksum(self, file_path: Path) -> str:
         """Calculate SHA256 checksum of a file."""
         sha256 = hashlib.sha256()
@@ -379,98 +723,56 @@ class BackupManager:
                 sha256.update(chunk)
         return sha256.hexdigest()
 
-    def _count_files_in_archive(self, archive_path: Path) -> int:
-        """Count the number of files in a tar archive."""
-        try:
-            with tarfile.open(archive_path, "r:gz") as tar:
-                return len([m for m in tar.getmembers() if m.isfile()])
-        except tarfile.TarError:
-            return 0
-
-    def _save_metadata(self, metadata: BackupMetadata) -> None:
-        """Save backup metadata to manifest file."""
-        manifest_path = self._backup_dir / metadata.vendor_id / self.METADATA_FILENAME
-
-        manifest = (
-            self._load_manifest(manifest_path)
-            if manifest_path.exists()
-            else {
-                "vendor_id": metadata.vendor_id,
-                "backups": [],
-            }
-        )
-
-        manifest["backups"].append(
-            {
-                "vendor_id": metadata.vendor_id,
-                "timestamp": metadata.timestamp.isoformat(),
-                "backup_path": str(metadata.backup_path),
-                "size_bytes": metadata.size_bytes,
-                "checksum": metadata.checksum,
-                "file_count": metadata.file_count,
-                "config_dir": metadata.config_dir,
-            }
-        )
+    def _import_legacy_manifests(self, catalog: BackupCatalog) -> None:
+        """Move entries from pre-catalog JSON manifests into the catalog.
 
-        with manifest_path.open("w") as f:
-            json.dump(manifest, f, indent=2)
-
-    def _load_manifest(self, manifest_path: Path) -> dict[str, Any]:
-        """Load manifest file."""
-        with manifest_path.open() as f:
-            result = json.load(f)
-            if isinstance(result, dict):
-                return result
-            return {"backups": []}
+        Each imported manifest is renamed to ``*.migrated`` so it is read only
+        once. Unreadable manifests are left in place and skipped.
+        """
+        for manifest_path in self._backup_dir.glob(f"*/{self.LEGACY_MANIFEST_FILENAME}"):
+            try:
+                with manifest_path.open() as f:
+                    manifest = json.load(f)
+                entries = manifest.get("backups", []) if isinstance(manifest, dict) else []
+                catalog.add_many(
+                    BackupMetadata(
+                        vendor_id=entry["vendor_id"],
+                        timestamp=datetime.fromisoformat(entry["timestamp"]),
+                        backup_path=Path(entry["backup_path"]),
+                        size_bytes=entry["size_bytes"],
+                        checksum=entry["checksum"],
+                        file_count=entry["file_count"],
+                        config_dir=entry["config_dir"],
+                    )
+                    for entry in entries
+                )
+                manifest_path.replace(manifest_path.with_name(f"{manifest_path.name}.migrated"))
+            except (KeyError, TypeError, ValueError, OSError, sqlite3.Error):
+                continue
 
     def _apply_retention_policy(self, vendor_id: str) -> None:
         """Apply retention policy to vendor backups."""
-        backups = self.list_backups(vendor_id)
-
-        if len(backups) <= self._retention_count:
+        expired = self.catalog.expired(vendor_id, self._retention_count)
+        if not expired:
             return
 
-        # Delete oldest backups beyond retention count
-        for backup in backups[self._retention_count :]:
-            self.delete_backup(backup.backup_path)
-
-    def _get_stored_checksum(self, backup_path: Path) -> str | None:
-        """Get stored checksum for a backup from manifest."""
-        vendor_id = backup_path.parent.name
-        manifest_path = self._backup_dir / vendor_id / self.METADATA_FILENAME
-
-        if not manifest_path.exists():
-            return None
-
-        try:
-            manifest = self._load_manifest(manifest_path)
-            for entry in manifest.get("backups", []):
-                if Path(entry["backup_path"]) == backup_path:
-                    checksum = entry.get("checksum")
-                    return str(checksum) if checksum is not None else None
-        except (json.JSONDecodeError, KeyError, OSError):
-            pass
+        # Delete the oldest backups, then drop all their entries in one transaction
+        for backup in expired:
+            self._delete_files(backup.backup_path)
+        self.catalog.remove(backup.backup_path for backup in expired)
 
-        return None
-
-    def _remove_from_manifest(self, vendor_id: str, backup_path: Path) -> None:
-        """Remove a backup entry from the manifest."""
-        manifest_path = self._backup_dir / vendor_id / self.METADATA_FILENAME
+        # Drop chunks that only the expired snapshots referenced
+        if any(is_snapshot(backup.backup_path) for backup in expired):
+            self.collect_garbage(vendor_id)
 
-        if not manifest_path.exists():
-            return
+    def _delete_files(self, backup_path: Path) -> None:
+        """Delete a backup archive or snapshot manifest and its member index."""
+        backup_path.unlink(missing_ok=True)
+        index_path_for(backup_path).unlink(missing_ok=True)
 
-        try:
-            manifest = self._load_manifest(manifest_path)
-            manifest["backups"] = [
-                entry
-                for entry in manifest.get("backups", [])
-                if Path(entry["backup_path"]) != backup_path
-            ]
-            with manifest_path.open("w") as f:
-                json.dump(manifest, f, indent=2)
-        except (json.JSONDecodeError, OSError):
-            pass
+    def _get_stored_checksum(self, backup_path: Path) -> str | None:
+        """Get the checksum recorded in the catalog for a backup."""
+        return self.catalog.checksum(backup_path)
 
     def _calc_duration(self, start_time: datetime) -> float:
         """Calculate duration in seconds from start time."""
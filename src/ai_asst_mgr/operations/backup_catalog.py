@@ -0,0 +1,285 @@
+"""SQLite catalog of backups.
+
+Backups used to be recorded in a ``backup_manifest.json`` per vendor that was
+re-read and rewritten in full on every backup and on every deletion, so a
+retention run pruning N backups rewrote the manifest N times. The catalog
+keeps the same records in one SQLite table beside the archives
+(``<backup-dir>/backup_catalog.db``). Listing, latest-backup and retention
+queries are answered from an index on ``(vendor_id, timestamp)``, and bulk
+deletions run in a single transaction.
+
+The catalog lives in the backup directory rather than the session database:
+that database is optional (created by ``db init``) and lives elsewhere, while
+the catalog must travel with the archives it describes.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+CATALOG_FILENAME = "backup_catalog.db"
+
+CATALOG_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS backups (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    vendor_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    backup_path TEXT NOT NULL UNIQUE,
+    size_bytes INTEGER NOT NULL,
+    checksum TEXT NOT NULL,
+    file_count INTEGER NOT NULL,
+    config_dir TEXT NOT NULL,
+    created_at TEXT DEFAULT (datetime('now'))
+);
+CREATE INDEX IF NOT EXISTS idx_backups_vendor_time ON backups(vendor_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_backups_time ON backups(timestamp);
+"""
+
+_COLUMNS = "vendor_id, timestamp, backup_path, size_bytes, checksum, file_count, config_dir"
+
+# Seconds to wait for another writer (e.g. a parallel vendor backup)
+_BUSY_TIMEOUT = 30.0
+
+
+@dataclass
+class BackupMetadata:
+    """Metadata for a backup archive.
+
+    Attributes:
+        vendor_id: Identifier of the vendor that was backed up.
+        timestamp: When the backup was created.
+        backup_path: Path to the backup archive.
+        size_bytes: Size of the backup in bytes.
+        checksum: SHA256 checksum of the backup file.
+        file_count: Number of files in the backup.
+        config_dir: Original config directory that was backed up.
+    """
+
+    vendor_id: str
+    timestamp: datetime
+    backup_path: Path
+    size_bytes: int
+    checksum: str
+    file_count: int
+    config_dir: str
+
+
+def _format_timestamp(timestamp: datetime) -> str:
+    """Format a timestamp so that text order is chronological order."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    return timestamp.astimezone(UTC).isoformat(timespec="microseconds")
+
+
+def _to_row(metadata: BackupMetadata) -> tuple[str, str, str, int, str, int, str]:
+    """Convert metadata to a row in _COLUMNS order."""
+    return (
+        metadata.vendor_id,
+        _format_timestamp(metadata.timestamp),
+        str(metadata.backup_path),
+        metadata.size_bytes,
+        metadata.checksum,
+        metadata.file_count,
+        metadata.config_dir,
+    )
+
+
+def _from_row(row: sqlite3.Row) -> BackupMetadata:
+    """Convert a catalog row back to metadata."""
+    return BackupMetadata(
+        vendor_id=row["vendor_id"],
+        timestamp=datetime.fromisoformat(row["timestamp"]),
+        backup_path=Path(row["backup_path"]),
+        size_bytes=row["size_bytes"],
+        checksum=row["checksum"],
+        file_count=row["file_count"],
+        config_dir=row["config_dir"],
+    )
+
+
+class BackupCatalog:
+    """Indexed store of backup metadata.
+
+    Every call opens its own short-lived connection, so one catalog can be
+    shared by threads backing up vendors in parallel. Reads on a catalog that
+    has not been written yet return nothing without creating the file.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """Initialize the catalog.
+
+        Args:
+            db_path: Path to the SQLite catalog file.
+        """
+        self._db_path = db_path
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    @property
+    def db_path(self) -> Path:
+        """Get the catalog file path."""
+        return self._db_path
+
+    def add(self, metadata: BackupMetadata) -> None:
+        """Record a backup, replacing any entry for the same path.
+
+        Args:
+            metadata: The backup to record.
+
+        Raises:
+            sqlite3.Error: If the catalog cannot be written.
+        """
+        self.add_many([metadata])
+
+    def add_many(self, entries: Iterable[BackupMetadata]) -> int:
+        """Record several backups in one transaction.
+
+        Args:
+            entries: Backups to record.
+
+        Returns:
+            Number of entries written.
+
+        Raises:
+            sqlite3.Error: If the catalog cannot be written.
+        """
+        rows = [_to_row(entry) for entry in entries]
+        with self._connection() as conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO backups ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def backups(self, vendor_id: str | None = None) -> list[BackupMetadata]:
+        """List backups, newest first.
+
+        Args:
+            vendor_id: Only list this vendor's backups. None lists all.
+
+        Returns:
+            Matching backups sorted by timestamp, newest first.
+        """
+        if not self._db_path.exists():
+            return []
+        with self._connection() as conn:
+            if vendor_id is None:
+                rows = conn.execute(
+                    f"SELECT {_COLUMNS} FROM backups ORDER BY timestamp DESC, id DESC"
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    f"SELECT {_COLUMNS} FROM backups WHERE vendor_id = ? "
+                    "ORDER BY timestamp DESC, id DESC",
+                    (vendor_id,),
+                ).fetchall()
+        return [_from_row(row) for row in rows]
+
+    def latest(self, vendor_id: str) -> BackupMetadata | None:
+        """Get a vendor's most recent backup.
+
+        Args:
+            vendor_id: The vendor to look up.
+
+        Returns:
+            The newest entry, or None if the vendor has none.
+        """
+        if not self._db_path.exists():
+            return None
+        with self._connection() as conn:
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM backups WHERE vendor_id = ? "
+                "ORDER BY timestamp DESC, id DESC LIMIT 1",
+                (vendor_id,),
+            ).fetchone()
+        return _from_row(row) if row else None
+
+    def expired(self, vendor_id: str, keep: int) -> list[BackupMetadata]:
+        """List a vendor's backups beyond the newest ``keep``.
+
+        Args:
+            vendor_id: The vendor whose retention policy is applied.
+            keep: Number of newest backups to retain.
+
+        Returns:
+            Backups to delete, newest first.
+        """
+        if not self._db_path.exists():
+            return []
+        with self._connection() as conn:
+            rows = conn.execute(
+                f"SELECT {_COLUMNS} FROM backups WHERE vendor_id = ? "
+                "ORDER BY timestamp DESC, id DESC LIMIT -1 OFFSET ?",
+                (vendor_id, max(keep, 0)),
+            ).fetchall()
+        return [_from_row(row) for row in rows]
+
+    def checksum(self, backup_path: Path) -> str | None:
+        """Get the checksum recorded for a backup.
+
+        Args:
+            backup_path: Path of the backup.
+
+        Returns:
+            The recorded SHA256 checksum, or None if the backup is not catalogued.
+        """
+        if not self._db_path.exists():
+            return None
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT checksum FROM backups WHERE backup_path = ?", (str(backup_path),)
+            ).fetchone()
+        return str(row["checksum"]) if row else None
+
+    def remove(self, backup_paths: Iterable[Path]) -> int:
+        """Forget backups, all in one transaction.
+
+        Args:
+            backup_paths: Paths of the backups to remove.
+
+        Returns:
+            Number of entries removed.
+
+        Raises:
+            sqlite3.Error: If the catalog cannot be written.
+        """
+        params = [(str(path),) for path in backup_paths]
+        if not params or not self._db_path.exists():
+            return 0
+        with self._connection() as conn:
+            before = conn.total_changes
+            conn.executemany("DELETE FROM backups WHERE backup_path = ?", params)
+            return conn.total_changes - before
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, creating the catalog if needed and committing on success.
+
+        Yields:
+            Connection with row access by column name.
+        """
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self._db_path, timeout=_BUSY_TIMEOUT)
+        conn.row_factory = sqlite3.Row
+        try:
+            self._ensure_schema(conn)
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        """Create the table and indexes once per catalog instance."""
+        with self._schema_lock:
+            if not self._schema_ready:
+                conn.executescript(CATALOG_SCHEMA_SQL)
+                self._schema_ready = True
@@ -0,0 +1,184 @@
+"""Online, consistent copies of the sessions database.
+
+``sessions.db`` is written by ``db sync`` and the web dashboard while a backup
+may be running. Archiving the file with ``tar`` can capture a torn copy: some
+pages from before a transaction and some from after, without the WAL that
+would reconcile them. The helpers here copy it through SQLite's online backup
+API instead, which always produces a consistent snapshot of one committed
+state.
+
+The copy runs a fixed number of pages per step and sleeps between steps. The
+source is only read-locked during a step, so writers are delayed by at most
+one step rather than for the whole copy. If a writer commits in between,
+SQLite restarts the copy from that newer state; a database that is written
+to faster than it can be copied would restart forever, so after
+MAX_RESTARTS restarts the copy is redone in a single step, holding the read
+lock for one pass.
+
+Because the backup API copies page N of the source to page N of the copy,
+successive copies of a slowly changing database differ only in the pages that
+changed. Incremental database backups rely on this: the copy is snapshotted in
+page-aligned chunks (see DATABASE_CHUNK_SIZE), so only chunks holding changed
+pages are stored again.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+# Catalog vendor ID and backup subdirectory for database backups
+DATABASE_BACKUP_ID = "database"
+
+# 1024 pages is 4 MiB per step at SQLite's default 4 KiB page size
+DEFAULT_PAGES_PER_STEP = 1024
+DEFAULT_STEP_DELAY = 0.01
+
+# Restarts caused by concurrent commits before falling back to a single step
+MAX_RESTARTS = 3
+
+# Snapshot chunk size for database copies; a multiple of every valid SQLite
+# page size (512 B - 64 KiB), so a changed page never spills into two chunks
+DATABASE_CHUNK_SIZE = 64 * 1024
+
+# Seconds to wait for a writer holding the source locked
+_BUSY_TIMEOUT = 30.0
+
+# Integrity problems listed in a verification message before truncating
+_MAX_REPORTED_PROBLEMS = 3
+
+
+class _TooManyRestartsError(Exception):
+    """Raised from the progress callback to abandon a paged copy."""
+
+
+@dataclass(frozen=True)
+class DatabaseCopyStats:
+    """Facts about an online database copy.
+
+    Attributes:
+        path: Path of the copy.
+        page_size: Page size of the database in bytes.
+        page_count: Number of pages copied.
+        steps: Number of backup steps the copy took (including restarts).
+    """
+
+    path: Path
+    page_size: int
+    page_count: int
+    steps: int
+
+    @property
+    def size_bytes(self) -> int:
+        """Get the size of the copy in bytes."""
+        return self.page_size * self.page_count
+
+
+def copy_database(
+    source: Path,
+    dest: Path,
+    pages_per_step: int = DEFAULT_PAGES_PER_STEP,
+    step_delay: float = DEFAULT_STEP_DELAY,
+    progress_callback: Callable[[int, int], None] | None = None,
+) -> DatabaseCopyStats:
+    """Copy a live SQLite database to a new file using the online backup API.
+
+    The source is opened read-only and may be written to by other processes
+    throughout. The copy is switched to rollback-journal mode so it is a
+    single self-contained file even when the source uses WAL.
+
+    Writers are only held off for one step at a time. If commits keep
+    restarting the copy (see MAX_RESTARTS), it is finished in a single step.
+
+    Args:
+        source: Database to copy.
+        dest: Path of the copy; an existing file is replaced.
+        pages_per_step: Pages copied per step. Zero or negative copies
+            everything in one step, holding the read lock throughout.
+        step_delay: Seconds to sleep between steps so writers can commit.
+        progress_callback: Optional callback receiving (pages copied, total
+            pages) after each step.
+
+    Returns:
+        DatabaseCopyStats for the copy.
+
+    Raises:
+        FileNotFoundError: If the source does not exist.
+        sqlite3.Error: If the source cannot be read or the copy written.
+    """
+    if not source.is_file():
+        msg = f"Database not found: {source}"
+        raise FileNotFoundError(msg)
+
+    steps = 0
+    restarts = 0
+    last_remaining: int | None = None
+
+    def on_step(_status: int, remaining: int, total: int) -> None:
+        nonlocal steps, restarts, last_remaining
+        steps += 1
+        # Remaining pages only grow when a commit restarted the copy
+        if last_remaining is not None and remaining >= last_remaining:
+            restarts += 1
+            if restarts > MAX_RESTARTS:
+                raise _TooManyRestartsError
+        last_remaining = remaining
+        if progress_callback:
+            progress_callback(total - remaining, total)
+        if remaining and step_delay > 0:
+            time.sleep(step_delay)
+
+    dest.unlink(missing_ok=True)
+    src = sqlite3.connect(f"{source.resolve().as_uri()}?mode=ro", uri=True, timeout=_BUSY_TIMEOUT)
+    try:
+        dst = sqlite3.connect(dest)
+        try:
+            try:
+                src.backup(dst, pages=pages_per_step, progress=on_step)
+            except _TooManyRestartsError:
+                src.backup(dst, pages=-1, progress=on_step)
+            dst.execute("PRAGMA journal_mode=DELETE")
+            page_size = int(dst.execute("PRAGMA page_size").fetchone()[0])
+            page_count = int(dst.execute("PRAGMA page_count").fetchone()[0])
+        finally:
+            dst.close()
+    finally:
+        src.close()
+
+    return DatabaseCopyStats(path=dest, page_size=page_size, page_count=page_count, steps=steps)
+
+
+def check_integrity(db_path: Path) -> tuple[bool, str]:
+    """Run ``PRAGMA integrity_check`` on a database file.
+
+    Args:
+        db_path: Database to check; it is opened read-only.
+
+    Returns:
+        Tuple of (is_valid, message).
+    """
+    if not db_path.is_file():
+        return False, f"Database not found: {db_path}"
+
+    try:
+        conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            problems = [str(row[0]) for row in conn.execute("PRAGMA integrity_check")]
+            page_count = int(conn.execute("PRAGMA page_count").fetchone()[0])
+        finally:
+            conn.close()
+    except sqlite3.DatabaseError as e:
+        return False, f"Not a valid SQLite database: {e}"
+
+    if problems != ["ok"]:
+        shown = "; ".join(problems[:_MAX_REPORTED_PROBLEMS])
+        more = len(problems) - _MAX_REPORTED_PROBLEMS
+        suffix = f" (and {more} more)" if more > 0 else ""
+        return False, f"Database integrity check failed: {shown}{suffix}"
+    return True, f"Database integrity ok ({page_count} pages)"
@@ -6,26 +6,41 @@ and detect AI vendor signatures in commit messages (Claude, Gemini, OpenAI).
 
 from __future__ import annotations
 
+import contextlib
+import json
 import re
 import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, ClassVar
 
+from ai_asst_mgr.utils.repo_discovery import DEFAULT_PRUNE_DIRS, RepoDiscovery
+
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Generator, Iterable, Iterator, Mapping, Sequence
     from pathlib import Path
+    from typing import IO
+
+# Git log format: one NUL-terminated field each for
+# sha, author_name, author_email, date, refs, subject and body.
+# With -z each record is terminated by a NUL too, and none of the fields
+# can contain one, so the output splits unambiguously however commit
+# messages are written.
+GIT_LOG_FORMAT = "%H%x00%an%x00%ae%x00%aI%x00%D%x00%s%x00%b"
+GIT_LOG_FIELDS = 7
+
+# Bytes read from git's output at a time
+_LOG_READ_SIZE = 64 * 1024
 
-# Git log format: %H|%an|%ae|%aI|%s|%D|%b
-# sha|author_name|author_email|date|subject|refs|body
-GIT_LOG_FORMAT = "%H|%an|%ae|%aI|%s|%D"
-GIT_LOG_SEP = "|"
-# For body, we need a separate call since body can contain |
+# Exit status of `git show-ref` when a repository has no refs yet
+_SHOW_REF_NO_REFS = 1
 
-# Minimum required fields in git log output: sha, author_name, author_email, date, subject
-MIN_GIT_LOG_PARTS = 5
-# Maximum parts to split (6 parts: sha, name, email, date, subject, refs)
-MAX_GIT_LOG_SPLIT = 5
+# Ref namespaces whose tips are tracked between syncs
+_TRACKED_REF_PREFIXES = ("refs/heads/", "refs/remotes/")
 
 
 @dataclass
@@ -63,6 +78,31 @@ class GitHubCommit:
         return self.vendor_id is not None
 
 
+@dataclass
+class RepoScan:
+    """Commits found in a repository since its last sync.
+
+    Attributes:
+        repo_path: Path of the repository that was scanned.
+        commits: Commits not reachable from the previously known ref tips,
+            newest first.
+        ref_tips: Current tips of HEAD and every local and remote-tracking
+            branch, as ref name to commit SHA.
+        changed: False if the ref tips matched the known ones, in which case
+            ``git log`` was not run.
+    """
+
+    repo_path: Path
+    commits: list[GitHubCommit]
+    ref_tips: dict[str, str]
+    changed: bool = True
+
+    @property
+    def newest_commit(self) -> GitHubCommit | None:
+        """Return the most recently committed commit found, if any."""
+        return max(self.commits, key=lambda c: c.committed_at, default=None)
+
+
 @dataclass
 class Attribution:
     """Represents vendor attribution for a GitHub resource.
@@ -121,6 +161,193 @@ VENDOR_EMAIL_DOMAINS: dict[str, list[str]] = {
 }
 
 
+# Confidence and detection method of each kind of signature
+CO_AUTHOR_CONFIDENCE = 0.95
+SIGNATURE_CONFIDENCE = 1.0
+EMAIL_DOMAIN_CONFIDENCE = 0.8
+
+
+@dataclass(frozen=True)
+class SignatureRule:
+    """A text pattern that attributes content to an AI vendor.
+
+    Attributes:
+        vendor_id: Vendor the pattern identifies.
+        pattern: Regular expression, matched case-insensitively.
+        keyword: Lowercase text every match contains. Content without it is
+            not searched with ``pattern`` at all; None searches every text.
+        confidence: Confidence score reported for a match, 0.0 to 1.0.
+        method: Detection method reported for a match.
+    """
+
+    vendor_id: str
+    pattern: str
+    keyword: str | None = None
+    confidence: float = SIGNATURE_CONFIDENCE
+    method: str = "signature"
+
+
+def _co_author(vendor_id: str, name: str) -> SignatureRule:
+    return SignatureRule(
+        vendor_id, rf"Co-Authored-By:\s*{name}", name.lower(), CO_AUTHOR_CONFIDENCE, "co_author"
+    )
+
+
+# Built-in rules, highest priority first: co-author trailers are the most
+# specific, then generation signatures by vendor.
+DEFAULT_SIGNATURE_RULES: tuple[SignatureRule, ...] = (
+    _co_author("claude", "Claude"),
+    _co_author("gemini", "Gemini"),
+    _co_author("openai", "OpenAI"),
+    SignatureRule("claude", r"Generated with \[Claude Code\]", "claude"),
+    SignatureRule("claude", r"Generated by Claude", "claude"),
+    SignatureRule("claude", r"🤖.*Claude", "claude"),
+    SignatureRule("claude", r"claude-code", "claude"),
+    SignatureRule("claude", r"anthropic\.com", "anthropic"),
+    SignatureRule("gemini", r"Generated by Gemini", "gemini"),
+    SignatureRule("gemini", r"Gemini CLI", "gemini"),
+    SignatureRule("gemini", r"gemini-cli", "gemini"),
+    SignatureRule("gemini", r"google\.com.*gemini", "gemini"),
+    SignatureRule("openai", r"Generated by OpenAI", "openai"),
+    SignatureRule("openai", r"Generated by Codex", "codex"),
+    SignatureRule("openai", r"ChatGPT", "chatgpt"),
+    SignatureRule("openai", r"GPT-4", "gpt-4"),
+    SignatureRule("openai", r"openai\.com", "openai"),
+)
+
+
+class AttributionMatcher:
+    """Detects AI vendors in text with a fixed, precompiled set of rules.
+
+    Rules are compiled once, when the matcher is built. Detection lowercases
+    the text once and checks it for each rule's keyword, a plain substring
+    search; only rules whose keyword is present have their regular
+    expression run, in priority order. Most commit messages contain none of
+    the keywords and are never searched with a regular expression. (In
+    CPython's ``re`` one alternation of every pattern is slower than this:
+    it cannot use the fast literal-prefix search the separate patterns get.)
+
+    Example:
+        >>> matcher = AttributionMatcher()
+        >>> matcher.detect("Co-Authored-By: Claude <noreply@anthropic.com>")
+        ('claude', 0.95, 'co_author')
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[SignatureRule] = DEFAULT_SIGNATURE_RULES,
+        email_domains: Mapping[str, Sequence[str]] | None = None,
+    ) -> None:
+        """Compile a matcher.
+
+        Args:
+            rules: Signature rules, highest priority first.
+            email_domains: Author email domains by vendor, checked when no
+                rule matches (default: VENDOR_EMAIL_DOMAINS).
+
+        Raises:
+            ValueError: If a rule's pattern is not a valid regular expression.
+        """
+        self.rules = tuple(rules)
+        self._compiled: list[tuple[str | None, re.Pattern[str], SignatureRule]] = []
+        for rule in self.rules:
+            try:
+                pattern = re.compile(rule.pattern, re.IGNORECASE)
+            except re.error as e:
+                msg = f"Invalid pattern for {rule.vendor_id}: {rule.pattern!r}: {e}"
+                raise ValueError(msg) from e
+            keyword = rule.keyword.lower() if rule.keyword else None
+            self._compiled.append((keyword, pattern, rule))
+        self._keywords = {keyword for keyword, _, _ in self._compiled if keyword}
+        self._email_domains = [
+            (vendor_id, domain.lower())
+            for vendor_id, domains in (email_domains or VENDOR_EMAIL_DOMAINS).items()
+            for domain in domains
+        ]
+
+    def detect(
+        self, content: str, author_email: str | None = None
+    ) -> tuple[str | None, float, str]:
+        """Detect the AI vendor of a text.
+
+        Args:
+            content: Text to search (commit message, PR body, etc.).
+            author_email: Optional author email for domain-based detection.
+
+        Returns:
+            Tuple of (vendor_id, confidence, detection_method) for the
+            highest-priority rule that matches; vendor_id is None if none
+            does.
+        """
+        lowered = content.lower()
+        present = {keyword for keyword in self._keywords if keyword in lowered}
+        if present or len(self._keywords) < len(self._compiled):
+            for keyword, pattern, rule in self._compiled:
+                if (keyword is None or keyword in present) and pattern.search(content):
+                    return (rule.vendor_id, rule.confidence, rule.method)
+
+        if author_email:
+            email_lower = author_email.lower()
+            for vendor_id, domain in self._email_domains:
+                if domain in email_lower:
+                    return (vendor_id, EMAIL_DOMAIN_CONFIDENCE, "email_domain")
+
+        return (None, 0.0, "none")
+
+
+def load_signature_rules(path: Path) -> list[SignatureRule]:
+    """Read user-defined signature rules from a JSON file.
+
+    The file holds a ``rules`` list of objects with ``vendor`` and
+    ``pattern`` and optionally ``keyword``, ``confidence`` and ``method``::
+
+        {"rules": [{"vendor": "claude", "pattern": "Assisted-by: Claude", "keyword": "claude"}]}
+
+    Args:
+        path: JSON file to read.
+
+    Returns:
+        The rules, in file order.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not valid JSON or a rule is malformed.
+    """
+    try:
+        payload = json.loads(path.read_text())
+    except json.JSONDecodeError as e:
+        msg = f"{path}: invalid JSON: {e}"
+        raise ValueError(msg) from e
+    try:
+        entries = list(payload["rules"])
+    except (KeyError, TypeError) as e:
+        msg = f"{path}: expected an object with a 'rules' list"
+        raise ValueError(msg) from e
+
+    rules: list[SignatureRule] = []
+    for index, entry in enumerate(entries):
+        try:
+            rule = SignatureRule(
+                vendor_id=str(entry["vendor"]),
+                pattern=str(entry["pattern"]),
+                keyword=str(entry["keyword"]) if entry.get("keyword") else None,
+                confidence=float(entry.get("confidence", SIGNATURE_CONFIDENCE)),
+                method=str(entry.get("method", "signature")),
+            )
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            msg = f"{path}: rule {index} is malformed: {e}"
+            raise ValueError(msg) from e
+        if not 0.0 <= rule.confidence <= 1.0:
+            msg = f"{path}: rule {index} has confidence outside 0.0-1.0"
+            raise ValueError(msg)
+        rules.append(rule)
+    return rules
+
+
+# Matcher for the built-in rules, compiled at import
+DEFAULT_MATCHER = AttributionMatcher()
+
+
 def detect_vendor_attribution_detailed(
     content: str,
     author_email: str | None = None,
@@ -132,6 +359,8 @@ def detect_vendor_attribution_detailed(
     2. Generation/signature patterns (confidence 1.0)
     3. Email domain patterns (confidence 0.8)
 
+    Uses DEFAULT_MATCHER; build an AttributionMatcher to add rules.
+
     Args:
         content: Text content to search (commit message, PR body, etc.)
         author_email: Optional email for domain-based detection
@@ -140,56 +369,7 @@ def detect_vendor_attribution_detailed(
         Tuple of (vendor_id, confidence, detection_method)
         vendor_id is None if no attribution found
     """
-    # Check for co-author patterns first (high confidence, most specific)
-    co_author_patterns = {
-        "claude": re.compile(r"Co-Authored-By:\s*Claude", re.IGNORECASE),
-        "gemini": re.compile(r"Co-Authored-By:\s*Gemini", re.IGNORECASE),
-        "openai": re.compile(r"Co-Authored-By:\s*OpenAI", re.IGNORECASE),
-    }
-
-    for vendor_id, pattern in co_author_patterns.items():
-        if pattern.search(content):
-            return (vendor_id, 0.95, "co_author")
-
-    # Check for explicit generation/signature patterns (highest confidence)
-    signature_patterns = {
-        "claude": [
-            re.compile(r"Generated with \[Claude Code\]", re.IGNORECASE),
-            re.compile(r"Generated by Claude", re.IGNORECASE),
-            re.compile(r"🤖.*Claude", re.IGNORECASE),
-            re.compile(r"claude-code", re.IGNORECASE),
-            re.compile(r"anthropic\.com", re.IGNORECASE),
-        ],
-        "gemini": [
-            re.compile(r"Generated by Gemini", re.IGNORECASE),
-            re.compile(r"Gemini CLI", re.IGNORECASE),
-            re.compile(r"gemini-cli", re.IGNORECASE),
-            re.compile(r"google\.com.*gemini", re.IGNORECASE),
-        ],
-        "openai": [
-            re.compile(r"Generated by OpenAI", re.IGNORECASE),
-            re.compile(r"Generated by Codex", re.IGNORECASE),
-            re.compile(r"ChatGPT", re.IGNORECASE),
-            re.compile(r"GPT-4", re.IGNORECASE),
-            re.compile(r"openai\.com", re.IGNORECASE),
-        ],
-    }
-
-    for vendor_id, patterns in signature_patterns.items():
-        for pattern in patterns:
-            if pattern.search(content):
-                return (vendor_id, 1.0, "signature")
-
-    # Check email domain patterns (moderate confidence)
-    if author_email:
-        email_lower = author_email.lower()
-        for vendor_id, domains in VENDOR_EMAIL_DOMAINS.items():
-            for domain in domains:
-                if domain in email_lower:
-                    return (vendor_id, 0.8, "email_domain")
-
-    # No attribution found
-    return (None, 0.0, "none")
+    return DEFAULT_MATCHER.detect(content, author_email)
 
 
 def detect_vendor_attribution(message: str) -> str | None:
@@ -307,6 +487,18 @@ class GitLogParser:
     # Maximum commits to parse in one operation (safety limit)
     MAX_COMMITS: ClassVar[int] = 10000
 
+    # Seconds git log may go without producing output before it is killed
+    LOG_TIMEOUT: ClassVar[float] = 60.0
+
+    def __init__(self, matcher: AttributionMatcher | None = None) -> None:
+        """Initialize the parser.
+
+        Args:
+            matcher: Matcher attributing commit messages to vendors
+                (default: DEFAULT_MATCHER, the built-in rules).
+        """
+        self._matcher = matcher or DEFAULT_MATCHER
+
     def parse_repo(
         self,
         repo_path: Path,
@@ -317,6 +509,10 @@ class GitLogParser:
     ) -> list[GitHubCommit]:
         """Parse commits from a git repository.
 
+        Collects iter_commits() into a list, so the number of commits is
+        capped at MAX_COMMITS; iterate over iter_commits() directly to read
+        a full history.
+
         Args:
             repo_path: Path to the git repository root.
             since: Only include commits after this date.
@@ -335,48 +531,237 @@ class GitLogParser:
             msg = f"Not a git repository: {repo_path}"
             raise ValueError(msg)
 
-        # Build git log command
-        cmd = self._build_git_log_command(since, until, branch, limit)
-
-        # Run git log
-        result = subprocess.run(
-            cmd,
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=60,
+        return list(
+            self.iter_commits(
+                repo_path,
+                [branch] if branch else (),
+                since=since,
+                until=until,
+                limit=min(limit or self.MAX_COMMITS, self.MAX_COMMITS),
+            )
         )
 
-        # Parse output
+    def iter_commits(
+        self,
+        repo_path: Path,
+        revisions: Sequence[str] = (),
+        *,
+        exclude: Sequence[str] = (),
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int | None = None,
+    ) -> Generator[GitHubCommit]:
+        """Stream commits from a git repository as git produces them.
+
+        ``git log`` runs in the background and its output is parsed in
+        fixed-size reads, so memory stays flat however long the history is
+        and callers can store commits while git is still walking it. There
+        is no cap on the number of commits beyond ``limit``. Stopping the
+        iteration early stops git.
+
+        Rather than bounding the whole run, which a long history may
+        legitimately exceed, git is killed if it goes LOG_TIMEOUT seconds
+        without producing output. Time the caller spends between commits
+        does not count.
+
+        Args:
+            repo_path: Path to the git repository root.
+            revisions: Commits or refs to start from (default: HEAD).
+            exclude: Commits whose history is left out (``--not``). Ones
+                that do not exist are ignored.
+            since: Only include commits after this date.
+            until: Only include commits before this date.
+            limit: Maximum number of commits to yield.
+
+        Yields:
+            GitHubCommit objects, newest first.
+
+        Raises:
+            subprocess.CalledProcessError: If git exits with an error (for
+                example because repo_path is not a git repository).
+            subprocess.TimeoutExpired: If git stalls for LOG_TIMEOUT seconds.
+        """
         repo_name = self._get_repo_name(repo_path)
-        return self._parse_git_log_output(result.stdout, repo_name)
+        cmd = self._build_git_log_command(since, until, None, limit)
+        cmd.extend(revisions)
+        if exclude:
+            cmd.extend(["--ignore-missing", "--not", *exclude])
+
+        with (
+            tempfile.TemporaryFile() as stderr,
+            subprocess.Popen(
+                cmd, cwd=repo_path, stdout=subprocess.PIPE, stderr=stderr, bufsize=0
+            ) as proc,
+            _Watchdog(proc, self.LOG_TIMEOUT) as watchdog,
+        ):
+            stdout = proc.stdout
+            try:
+                for fields in _iter_log_records(stdout) if stdout else ():
+                    commit = self._commit_from_fields(fields, repo_name)
+                    if commit:
+                        watchdog.pause()
+                        yield commit
+                        watchdog.arm()
+                proc.wait(timeout=self.LOG_TIMEOUT)
+            except BaseException:
+                # Stopped early (or failed): don't wait for git to finish the walk
+                proc.kill()
+                raise
+            if watchdog.expired:
+                raise subprocess.TimeoutExpired(cmd, self.LOG_TIMEOUT)
+            if proc.returncode != 0:
+                stderr.seek(0)
+                raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr.read())
+
+    def read_ref_tips(self, repo_path: Path) -> dict[str, str]:
+        """Read the tips of HEAD and all local and remote-tracking branches.
+
+        A single ``git show-ref`` reads every ref, so this is cheap enough to
+        run on each sync to tell whether a repository changed at all.
+
+        Args:
+            repo_path: Path to the git repository root.
+
+        Returns:
+            Mapping of ref name (``HEAD``, ``refs/heads/main``, ...) to commit
+            SHA. Empty for a repository without commits.
+
+        Raises:
+            ValueError: If repo_path is not a git repository.
+            subprocess.SubprocessError: If git times out.
+        """
+        try:
+            result = subprocess.run(
+                ["git", "show-ref", "--head"],
+                cwd=repo_path,
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=10,
+            )
+        except (FileNotFoundError, NotADirectoryError) as e:
+            msg = f"Not a git repository: {repo_path}"
+            raise ValueError(msg) from e
+        if result.returncode == _SHOW_REF_NO_REFS and not result.stdout:
+            return {}
+        if result.returncode != 0:
+            msg = f"Not a git repository: {repo_path}"
+            raise ValueError(msg)
+
+        tips: dict[str, str] = {}
+        for line in result.stdout.splitlines():
+            sha, _, ref = line.partition(" ")
+            if ref == "HEAD" or (
+                ref.startswith(_TRACKED_REF_PREFIXES) and not ref.endswith("/HEAD")
+            ):
+                tips[ref] = sha
+        return tips
+
+    def scan_repo(
+        self,
+        repo_path: Path,
+        known_tips: Mapping[str, str] | None = None,
+        limit: int | None = None,
+    ) -> RepoScan:
+        """Find the commits added to a repository since its last sync.
+
+        The ref tips recorded by the previous sync are its high-water mark:
+        only commits reachable from a current tip and from none of the known
+        tips are read (``git log <tips> --not <known tips>``), across all
+        branches. If no tip moved, ``git log`` is not run at all.
+
+        Args:
+            repo_path: Path to the git repository root.
+            known_tips: Ref tips recorded by the previous sync, or None to
+                read the repository's history from the start.
+            limit: Maximum number of commits to read when ``known_tips`` is
+                None. Incremental scans read every new commit, so none are
+                skipped.
+
+        Returns:
+            RepoScan with the new commits and the current ref tips.
+
+        Raises:
+            ValueError: If repo_path is not a git repository.
+            subprocess.SubprocessError: If a git command fails.
+        """
+        tips = self.read_ref_tips(repo_path)
+        if known_tips is not None and tips == dict(known_tips):
+            return RepoScan(repo_path, [], tips, changed=False)
+        return RepoScan(
+            repo_path, list(self.iter_new_commits(repo_path, tips, known_tips, limit)), tips
+        )
+
+    def iter_new_commits(
+        self,
+        repo_path: Path,
+        tips: Mapping[str, str],
+        known_tips: Mapping[str, str] | None = None,
+        limit: int | None = None,
+    ) -> Generator[GitHubCommit]:
+        """Stream the commits reachable from some ref tips but not from others.
+
+        This is the streaming half of scan_repo(), for callers that read
+        the tips themselves and want to store commits as they arrive.
+
+        Args:
+            repo_path: Path to the git repository root.
+            tips: Current ref tips (see read_ref_tips()).
+            known_tips: Ref tips recorded by the previous sync, or None to
+                read the repository's history from the start.
+            limit: Maximum number of commits to read when ``known_tips`` is
+                None. Incremental scans read every new commit.
+
+        Yields:
+            GitHubCommit objects, newest first.
+
+        Raises:
+            subprocess.CalledProcessError: If git log fails.
+        """
+        if not tips:
+            return
+        # Tips that no longer exist (e.g. after a force push and gc) are skipped
+        yield from self.iter_commits(
+            repo_path,
+            sorted(set(tips.values())),
+            exclude=sorted(set(known_tips.values())) if known_tips else (),
+            limit=limit if known_tips is None else None,
+        )
 
     def parse_multiple_repos(
         self,
         repo_paths: Sequence[Path],
         since: datetime | None = None,
         until: datetime | None = None,
+        max_workers: int | None = None,
     ) -> list[GitHubCommit]:
         """Parse commits from multiple repositories.
 
+        Repositories are parsed concurrently on a thread pool; each parse is
+        spent waiting on git subprocesses.
+
         Args:
             repo_paths: Sequence of paths to git repositories.
             since: Only include commits after this date.
             until: Only include commits before this date.
+            max_workers: Repositories to parse at the same time (default:
+                the ThreadPoolExecutor default).
 
         Returns:
             Combined list of commits from all repos, sorted by date (newest first).
         """
-        all_commits: list[GitHubCommit] = []
 
-        for repo_path in repo_paths:
+        def parse(repo_path: Path) -> list[GitHubCommit]:
             try:
-                commits = self.parse_repo(repo_path, since=since, until=until)
-                all_commits.extend(commits)
+                return self.parse_repo(repo_path, since=since, until=until)
             except (ValueError, subprocess.SubprocessError):
                 # Skip invalid repos
-                continue
+                return []
+
+        with ThreadPoolExecutor(max_workers, thread_name_prefix="git-log") as executor:
+            all_commits = [
+                commit for commits in executor.map(parse, repo_paths) for commit in commits
+            ]
 
         # Sort by committed_at, newest first
         all_commits.sort(key=lambda c: c.committed_at, reverse=True)
@@ -405,11 +790,7 @@ class GitLogParser:
         limit: int | None,
     ) -> list[str]:
         """Build the git log command with appropriate arguments."""
-        cmd = [
-            "git",
-            "log",
-            f"--format={GIT_LOG_FORMAT}%n%b%n---COMMIT_END---",
-        ]
+        cmd = ["git", "log", "-z", f"--format={GIT_LOG_FORMAT}"]
 
         if since:
             cmd.append(f"--since={since.isoformat()}")
@@ -418,9 +799,8 @@ class GitLogParser:
         if branch:
             cmd.append(branch)
 
-        # Apply limit (with safety cap)
-        effective_limit = min(limit or self.MAX_COMMITS, self.MAX_COMMITS)
-        cmd.append(f"-{effective_limit}")
+        if limit:
+            cmd.append(f"-{limit}")
 
         return cmd
 
@@ -451,70 +831,33 @@ class GitLogParser:
             # Fall back to directory name
             return repo_path.name
 
-    def _parse_git_log_output(self, output: str, repo_name: str) -> list[GitHubCommit]:
-        """Parse raw git log output into GitHubCommit objects."""
-        commits: list[GitHubCommit] = []
-
-        # Split by commit delimiter
-        commit_blocks = output.split("---COMMIT_END---")
-
-        for raw_block in commit_blocks:
-            block = raw_block.strip()
-            if not block:
-                continue
-
-            try:
-                commit = self._parse_commit_block(block, repo_name)
-                if commit:
-                    commits.append(commit)
-            except (ValueError, IndexError):
-                # Skip malformed commits
-                continue
-
-        return commits
-
-    def _parse_commit_block(self, block: str, repo_name: str) -> GitHubCommit | None:
-        """Parse a single commit block into a GitHubCommit."""
-        lines = block.split("\n")
-        if not lines:
+    def _commit_from_fields(self, fields: Sequence[str], repo_name: str) -> GitHubCommit | None:
+        """Build a GitHubCommit from the fields of one git log record."""
+        if len(fields) != GIT_LOG_FIELDS:
             return None
-
-        # First line is the formatted header
-        header = lines[0]
-        parts = header.split(GIT_LOG_SEP, MAX_GIT_LOG_SPLIT)
-        if len(parts) < MIN_GIT_LOG_PARTS:
+        sha, author_name, author_email, date_str, refs, subject, body = fields
+        if not sha:
             return None
 
-        sha = parts[0]
-        author_name = parts[1] or None
-        author_email = parts[2] or None
-        date_str = parts[3]
-        subject = parts[4]
-        refs = parts[MIN_GIT_LOG_PARTS] if len(parts) > MIN_GIT_LOG_PARTS else ""
-
-        # Rest is the body
-        body = "\n".join(lines[1:]).strip()
-        full_message = f"{subject}\n\n{body}".strip()
+        full_message = f"{subject}\n\n{body.strip()}".strip()
 
-        # Parse date
-        committed_at = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        # Parse date; skip commits with a malformed one
+        try:
+            committed_at = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        except ValueError:
+            return None
         if committed_at.tzinfo is None:
             committed_at = committed_at.replace(tzinfo=UTC)
 
-        # Extract branch from refs (e.g., "HEAD -> main, origin/main")
-        branch = self._extract_branch_from_refs(refs)
-
-        # Detect vendor attribution
-        vendor_id = detect_vendor_attribution(full_message)
-
         return GitHubCommit(
             sha=sha,
             repo=repo_name,
-            branch=branch,
+            # Extract branch from refs (e.g., "HEAD -> main, origin/main")
+            branch=self._extract_branch_from_refs(refs),
             message=full_message,
-            author_name=author_name,
-            author_email=author_email,
-            vendor_id=vendor_id,
+            author_name=author_name or None,
+            author_email=author_email or None,
+            vendor_id=self._matcher.detect(full_message)[0],
             committed_at=committed_at,
         )
 
@@ -537,6 +880,71 @@ class GitLogParser:
         return None
 
 
+class _Watchdog:
+    """Kills a process that goes too long without being heard from.
+
+    The countdown runs while armed (waiting on the process) and is paused
+    while the caller is busy with what the process produced.
+    """
+
+    def __init__(self, proc: subprocess.Popen[bytes], timeout: float) -> None:
+        """Initialize the watchdog, armed.
+
+        Args:
+            proc: Process to kill.
+            timeout: Seconds the process may stay silent while armed.
+        """
+        self._proc = proc
+        self._timeout = timeout
+        self._deadline: float | None = time.monotonic() + timeout
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._watch, name="git-log-watchdog", daemon=True)
+        self.expired = False
+
+    def __enter__(self) -> _Watchdog:
+        """Start watching."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop watching."""
+        self._stopped.set()
+        self._thread.join()
+
+    def arm(self) -> None:
+        """Restart the countdown."""
+        self._deadline = time.monotonic() + self._timeout
+
+    def pause(self) -> None:
+        """Stop the countdown until the next arm()."""
+        self._deadline = None
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(min(self._timeout, 1.0)):
+            deadline = self._deadline
+            if deadline is not None and time.monotonic() > deadline:
+                self.expired = True
+                self._proc.kill()
+                return
+
+
+def _iter_log_records(stream: IO[bytes]) -> Iterator[list[str]]:
+    """Split ``git log -z`` output into records of GIT_LOG_FIELDS fields.
+
+    The stream is read in fixed-size chunks, so only the record being
+    assembled is held in memory.
+    """
+    fields: list[str] = []
+    partial = b""
+    while chunk := stream.read(_LOG_READ_SIZE):
+        *complete, partial = (partial + chunk).split(b"\0")
+        for raw in complete:
+            fields.append(raw.decode("utf-8", errors="replace"))
+            if len(fields) == GIT_LOG_FIELDS:
+                yield fields
+                fields = []
+
+
 def parse_git_log(
     repo_path: Path,
     since: datetime | None = None,
@@ -563,32 +971,30 @@ def parse_git_log(
 def find_git_repos(
     base_path: Path,
     max_depth: int = 3,
+    *,
+    prune: Iterable[str] = DEFAULT_PRUNE_DIRS,
+    cache_path: Path | None = None,
+    max_workers: int | None = None,
 ) -> list[Path]:
     """Find git repositories under a base path.
 
+    Hidden directories and directories named in ``prune`` are skipped, and
+    repositories are not searched for nested repositories.
+
     Args:
         base_path: Base directory to search.
         max_depth: Maximum directory depth to search.
+        prune: Names of directories never to enter.
+        cache_path: JSON file of directory listings to reuse and update.
+        max_workers: Directories to list at the same time (default: based
+            on CPU count).
 
     Returns:
-        List of paths to git repository roots.
+        Sorted paths of git repository roots. A cache file that cannot be
+        written is left as it was.
     """
-    repos: list[Path] = []
-
-    def _search(path: Path, depth: int) -> None:
-        if depth > max_depth:
-            return
-
-        if (path / ".git").is_dir():
-            repos.append(path)
-            return  # Don't recurse into nested repos
-
-        try:
-            for child in path.iterdir():
-                if child.is_dir() and not child.name.startswith("."):
-                    _search(child, depth + 1)
-        except PermissionError:
-            pass
-
-    _search(base_path, 0)
+    discovery = RepoDiscovery(prune, cache_path=cache_path, max_workers=max_workers)
+    repos = discovery.find(base_path, max_depth)
+    with contextlib.suppress(OSError):
+        discovery.save()
     return repos
@@ -0,0 +1,368 @@
+"""Import commits from many local repositories into the database.
+
+``github sync`` used to visit repositories one after another, so a workspace
+of a few hundred repositories paid for a few hundred rounds of git
+subprocesses in sequence, and each commit was written with its own
+connection and transaction.
+
+GitHubSyncManager scans repositories on a thread pool. The work is almost
+entirely waiting on git subprocesses, so threads overlap it well despite the
+GIL. Each worker streams its repository's new commits from ``git log`` (see
+GitLogParser.iter_new_commits) and hands them over in small chunks through a
+bounded queue, so a repository with a long history is written while git is
+still walking it and memory does not grow with its size. The calling thread
+is the only one writing to SQLite: it buffers commits and records each batch
+in a single transaction, then saves the ref tips of the repositories whose
+commits have all been written, so an interrupted sync resumes after the last
+complete batch.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import queue
+import sqlite3
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, ClassVar
+
+from ai_asst_mgr.database.manager import GitHubSyncState
+from ai_asst_mgr.operations.github_parser import GitLogParser
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from pathlib import Path
+
+    from ai_asst_mgr.database.manager import DatabaseManager
+    from ai_asst_mgr.operations.github_parser import GitHubCommit
+
+
+@dataclass
+class RepoSyncResult:
+    """Result of syncing one repository.
+
+    Attributes:
+        repo_path: Path of the repository.
+        commits_synced: Commits recorded in the database.
+        ai_commits: Recorded commits attributed to an AI vendor.
+        changed: False if the repository's refs had not moved since the last sync.
+        duration_seconds: Time spent reading the repository with git.
+        error: Error message if the repository could not be synced.
+    """
+
+    repo_path: Path
+    commits_synced: int = 0
+    ai_commits: int = 0
+    changed: bool = True
+    duration_seconds: float = 0.0
+    error: str | None = None
+
+
+@dataclass
+class GitHubSyncSummary:
+    """Summary of syncing several repositories.
+
+    Attributes:
+        results: Per-repository results, in the order the scans finished.
+        duration_seconds: Total duration of the sync.
+    """
+
+    results: list[RepoSyncResult] = field(default_factory=list)
+    duration_seconds: float = 0.0
+
+    @property
+    def total_commits(self) -> int:
+        """Total commits recorded."""
+        return sum(r.commits_synced for r in self.results)
+
+    @property
+    def ai_commits(self) -> int:
+        """Total recorded commits attributed to an AI vendor."""
+        return sum(r.ai_commits for r in self.results)
+
+    @property
+    def unchanged(self) -> int:
+        """Number of repositories skipped because their refs had not moved."""
+        return sum(1 for r in self.results if not r.changed and r.error is None)
+
+    @property
+    def errors(self) -> list[str]:
+        """Error messages, prefixed with the repository name."""
+        return [f"{r.repo_path.name}: {r.error}" for r in self.results if r.error]
+
+
+# Commits a worker hands over at a time
+_CHUNK_SIZE = 256
+
+# Chunks waiting for the writer before workers block
+_QUEUE_SIZE = 32
+
+# Seconds a blocked worker (or the writer) waits before checking on the others
+_PUT_INTERVAL = 0.1
+
+
+class _SyncAbortedError(Exception):
+    """Raised in a worker when the writer has given up on the sync."""
+
+
+@dataclass
+class _Chunk:
+    """Commits read from a repository, waiting to be written."""
+
+    result: RepoSyncResult
+    commits: list[GitHubCommit]
+
+
+@dataclass
+class _Done:
+    """A repository has been read.
+
+    ``state`` is None if nothing should be saved; ``exception`` is an
+    unexpected error the worker hit, to be raised by the calling thread.
+    """
+
+    result: RepoSyncResult
+    state: GitHubSyncState | None
+    exception: BaseException | None = None
+
+
+class GitHubSyncManager:
+    """Syncs commits from local git repositories into the database.
+
+    Example:
+        >>> manager = GitHubSyncManager(DatabaseManager(db_path))
+        >>> summary = manager.sync_repos(find_git_repos(Path("~/Developer").expanduser()))
+        >>> print(summary.total_commits, summary.unchanged)
+    """
+
+    # Commits buffered before they are written in one transaction
+    DEFAULT_BATCH_SIZE: ClassVar[int] = 1000
+
+    def __init__(
+        self,
+        db: DatabaseManager,
+        parser: GitLogParser | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Initialize the sync manager.
+
+        Args:
+            db: Database to record commits and sync state in.
+            parser: Parser used to read repositories.
+            batch_size: Commits to buffer before writing them.
+        """
+        self._db = db
+        self._parser = parser or GitLogParser()
+        self._batch_size = max(1, batch_size)
+
+    def sync_repos(
+        self,
+        repo_paths: Sequence[Path],
+        limit: int | None = None,
+        *,
+        full: bool = False,
+        max_workers: int | None = None,
+        progress_callback: Callable[[RepoSyncResult], None] | None = None,
+    ) -> GitHubSyncSummary:
+        """Sync commits from several repositories.
+
+        Args:
+            repo_paths: Repositories to sync.
+            limit: Maximum commits to read from a repository's first sync.
+            full: Ignore the saved sync state and rescan every repository.
+            max_workers: Repositories to scan at the same time (default:
+                the ThreadPoolExecutor default).
+            progress_callback: Called with each repository's result once its
+                scan has finished (before its commits are written).
+
+        Returns:
+            GitHubSyncSummary with per-repository results.
+        """
+        start = time.perf_counter()
+        summary = GitHubSyncSummary()
+        known = {} if full else self._db.get_github_sync_states()
+        items: queue.Queue[_Chunk | _Done] = queue.Queue(_QUEUE_SIZE)
+        stop = threading.Event()
+        writer = _BatchWriter(self._db)
+
+        with ThreadPoolExecutor(max_workers, thread_name_prefix="github-sync") as executor:
+            futures = [
+                executor.submit(self._scan, repo_path, known, limit, items, stop)
+                for repo_path in repo_paths
+            ]
+            try:
+                remaining = len(repo_paths)
+                while remaining:
+                    item = _next_item(items, futures)
+                    if isinstance(item, _Chunk):
+                        writer.add(item)
+                        if writer.buffered >= self._batch_size:
+                            writer.flush()
+                        continue
+
+                    if item.exception is not None:
+                        raise item.exception
+                    remaining -= 1
+                    summary.results.append(item.result)
+                    if progress_callback:
+                        progress_callback(item.result)
+                    writer.finish(item)
+                writer.flush()
+            finally:
+                stop.set()
+
+        summary.duration_seconds = time.perf_counter() - start
+        return summary
+
+    def _scan(
+        self,
+        repo_path: Path,
+        known: Mapping[str, GitHubSyncState],
+        limit: int | None,
+        items: queue.Queue[_Chunk | _Done],
+        stop: threading.Event,
+    ) -> None:
+        """Stream one repository's new commits to the writer on a worker thread.
+
+        Always ends by queueing a _Done for the repository, unless the sync
+        was aborted.
+        """
+
+        def put(item: _Chunk | _Done) -> None:
+            while True:
+                if stop.is_set():
+                    raise _SyncAbortedError
+                try:
+                    items.put(item, timeout=_PUT_INTERVAL)
+                except queue.Full:
+                    continue
+                return
+
+        result = RepoSyncResult(repo_path)
+        done = _Done(result, None)
+        start = time.perf_counter()
+        try:
+            done.state = self._stream(repo_path, known, limit, result, put)
+        except (ValueError, OSError, subprocess.SubprocessError) as e:
+            result.changed = False
+            result.error = str(e)
+        except _SyncAbortedError:
+            return
+        except BaseException as e:
+            # Unexpected: hand it to the calling thread rather than lose it
+            done.exception = e
+        finally:
+            result.duration_seconds = time.perf_counter() - start
+        with contextlib.suppress(_SyncAbortedError):
+            put(done)
+
+    def _stream(
+        self,
+        repo_path: Path,
+        known: Mapping[str, GitHubSyncState],
+        limit: int | None,
+        result: RepoSyncResult,
+        put: Callable[[_Chunk], None],
+    ) -> GitHubSyncState | None:
+        """Queue a repository's new commits in chunks and return its new sync state."""
+        key = str(repo_path.resolve())
+        previous = known.get(key)
+        tips = self._parser.read_ref_tips(repo_path)
+        if previous is not None and tips == previous.ref_tips:
+            result.changed = False
+            return None
+
+        newest: GitHubCommit | None = None
+        chunk: list[GitHubCommit] = []
+        with contextlib.closing(
+            self._parser.iter_new_commits(
+                repo_path, tips, previous.ref_tips if previous else None, limit
+            )
+        ) as commits:
+            for commit in commits:
+                if newest is None or commit.committed_at > newest.committed_at:
+                    newest = commit
+                chunk.append(commit)
+                if len(chunk) >= _CHUNK_SIZE:
+                    put(_Chunk(result, chunk))
+                    chunk = []
+        if chunk:
+            put(_Chunk(result, chunk))
+
+        if newest is not None:
+            return GitHubSyncState(key, tips, newest.sha, newest.committed_at.isoformat())
+        if previous is not None:
+            return GitHubSyncState(key, tips, previous.last_sha, previous.last_commit_at)
+        return GitHubSyncState(key, tips)
+
+
+def _next_item(
+    items: queue.Queue[_Chunk | _Done], futures: Sequence[Future[None]]
+) -> _Chunk | _Done:
+    """Wait for the next item from the workers.
+
+    Workers always queue a _Done, even on unexpected errors; as a safety net
+    an exception escaping a worker is raised here instead of waiting forever.
+    """
+    while True:
+        try:
+            return items.get(timeout=_PUT_INTERVAL)
+        except queue.Empty:
+            for future in futures:
+                error = future.exception() if future.done() else None
+                if error is not None:
+                    raise error from None
+
+
+class _BatchWriter:
+    """Buffers streamed commits and writes them with the sync state they complete.
+
+    A repository's sync state is only saved once all of its commits are in
+    the database, so a failed write is retried by the next sync.
+    """
+
+    def __init__(self, db: DatabaseManager) -> None:
+        """Initialize the writer.
+
+        Args:
+            db: Database to record commits and sync state in.
+        """
+        self._db = db
+        self._chunks: list[_Chunk] = []
+        self._done: list[_Done] = []
+        self._failed: set[int] = set()
+        self.buffered = 0
+
+    def add(self, chunk: _Chunk) -> None:
+        """Buffer a chunk of commits."""
+        self._chunks.append(chunk)
+        self.buffered += len(chunk.commits)
+
+    def finish(self, done: _Done) -> None:
+        """Queue a repository's state to be saved with the next write."""
+        if done.state is not None and id(done.result) not in self._failed:
+            self._done.append(done)
+
+    def flush(self) -> None:
+        """Write the buffered commits, then the sync state of finished repositories."""
+        chunks, done = self._chunks, self._done
+        self._chunks, self._done, self.buffered = [], [], 0
+        if chunks:
+            try:
+                self._db.record_github_commits_bulk([c for chunk in chunks for c in chunk.commits])
+            except sqlite3.Error as e:
+                for chunk in chunks:
+                    chunk.result.error = f"could not record commits: {e}"
+                    self._failed.add(id(chunk.result))
+                done = [d for d in done if id(d.result) not in self._failed]
+            else:
+                for chunk in chunks:
+                    chunk.result.commits_synced += len(chunk.commits)
+                    chunk.result.ai_commits += sum(1 for c in chunk.commits if c.vendor_id)
+
+        if done and not self._db.record_github_sync_states([d.state for d in done if d.state]):
+            for d in done:
+                d.result.error = "could not save sync state"
@@ -6,20 +6,35 @@ pre-restore backup creation, selective restore, and rollback capabilities.
 
 from __future__ import annotations
 
+import hashlib
 import shutil
 import tarfile
+import tempfile
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ai_asst_mgr.utils import unpack_members_securely
+from ai_asst_mgr.operations.snapshot import (
+    SNAPSHOT_SUFFIX,
+    STORE_DIRNAME,
+    SnapshotRepository,
+    is_snapshot,
+)
+from ai_asst_mgr.utils import (
+    ExclusionRules,
+    carry_over_excluded,
+    extract_tar_archive,
+    unpack_members_securely,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
     from ai_asst_mgr.adapters.base import VendorAdapter
     from ai_asst_mgr.operations.backup import BackupManager
+    from ai_asst_mgr.utils import ArchiveIndex, ExtractedArchive
 
 
 @dataclass
@@ -108,52 +123,51 @@ class RestoreManager:
         if not backup_path.exists():
             return None
 
-        if not tarfile.is_tarfile(backup_path):
+        if not is_snapshot(backup_path) and not tarfile.is_tarfile(backup_path):
             return None
 
         try:
-            with tarfile.open(backup_path, "r:gz") as tar:
-                members = tar.getmembers()
-
-                files_to_restore = [m.name for m in members if m.isfile()]
-                dirs_to_restore = [m.name for m in members if m.isdir()]
-
-                # Check which files would be overwritten
-                config_dir = adapter.info.config_dir
-                files_to_overwrite: list[str] = []
-
-                for file_path in files_to_restore:
-                    # Remove the vendor prefix from archive path
-                    parts = Path(file_path).parts
-                    if len(parts) > 1:
-                        relative_path = Path(*parts[1:])
-                        full_path = config_dir / relative_path
-                        if full_path.exists():
-                            files_to_overwrite.append(str(relative_path))
-
-                # Check which directories would be created
-                dirs_to_create: list[str] = []
-                for dir_path in dirs_to_restore:
-                    parts = Path(dir_path).parts
-                    if len(parts) > 1:
-                        relative_path = Path(*parts[1:])
-                        full_path = config_dir / relative_path
-                        if not full_path.exists():
-                            dirs_to_create.append(str(relative_path))
-
-                total_size = sum(m.size for m in members if m.isfile())
-
-                # Get backup timestamp from metadata or file mtime
-                backup_time = self._get_backup_timestamp(backup_path)
-
-                return RestorePreview(
-                    vendor_id=adapter.info.vendor_id,
-                    backup_timestamp=backup_time,
-                    files_to_restore=files_to_restore,
-                    files_to_overwrite=files_to_overwrite,
-                    directories_to_create=dirs_to_create,
-                    estimated_size_bytes=total_size,
-                )
+            members = self._read_members(backup_path)
+
+            files_to_restore = [m.name for m in members if m.isfile()]
+            dirs_to_restore = [m.name for m in members if m.isdir()]
+
+            # Check which files would be overwritten
+            config_dir = adapter.info.config_dir
+            files_to_overwrite: list[str] = []
+
+            for file_path in files_to_restore:
+                # Remove the vendor prefix from archive path
+                parts = Path(file_path).parts
+                if len(parts) > 1:
+                    relative_path = Path(*parts[1:])
+                    full_path = config_dir / relative_path
+                    if full_path.exists():
+                        files_to_overwrite.append(str(relative_path))
+
+            # Check which directories would be created
+            dirs_to_create: list[str] = []
+            for dir_path in dirs_to_restore:
+                parts = Path(dir_path).parts
+                if len(parts) > 1:
+                    relative_path = Path(*parts[1:])
+                    full_path = config_dir / relative_path
+                    if not full_path.exists():
+                        dirs_to_create.append(str(relative_path))
+
+            total_size = sum(m.size for m in members if m.isfile())
+
+            # Get backup timestamp from metadata or file mtime
+            backup_time = self._get_backup_timestamp(backup_path)
+
+            return RestorePreview(
+                vendor_id=adapter.info.vendor_id,
+                backup_timestamp=backup_time,
+                files_to_restore=files_to_restore,
+                files_to_overwrite=files_to_overwrite,
+                directories_to_create=dirs_to_create,
+                estimated_size_bytes=total_size,
+            )
 
         except tarfile.TarError:
             return None
@@ -167,6 +181,14 @@ class RestoreManager:
     ) -> RestoreResult:
         """Restore a vendor's configuration from backup.
 
+        The archive is read once: it is extracted into a staging directory
+        next to the config directory while its checksum is computed and its
+        files are counted. Only a backup that matches its catalog checksum
+        replaces the configuration, by renaming the staging directory into
+        place; anything else leaves the configuration untouched. Paths the
+        backup excluded are then moved over from the previous configuration,
+        which is only deleted once that has succeeded.
+
         Args:
             backup_path: Path to the backup archive.
             adapter: The vendor adapter to restore to.
@@ -186,32 +208,56 @@ class RestoreManager:
         try:
             report(f"Starting restore for {adapter.info.name}...")
 
-            # Validate backup
-            report("Validating backup...")
-            is_valid, message = self._backup_manager.verify_backup(backup_path)
-            if not is_valid:
-                return RestoreResult(
-                    success=False,
-                    error=f"Backup validation failed: {message}",
-                    duration_seconds=self._calc_duration(start_time),
-                )
-
-            # Create pre-restore backup if requested
-            if create_pre_restore_backup and adapter.is_installed():
-                report("Creating pre-restore backup...")
-                backup_result = self._backup_manager.backup_vendor(adapter)
-                if backup_result.success and backup_result.metadata:
-                    pre_restore_backup = backup_result.metadata.backup_path
-                    report(f"Pre-restore backup created: {pre_restore_backup}")
-
-            report("Restoring configuration...")
-
-            # Use adapter's restore method
-            adapter.restore(backup_path)
-
-            # Count restored files
-            restored_count = self._count_files_in_archive(backup_path)
+            # Swap the directory a symlinked config dir points to, not the link
+            config_dir = adapter.info.config_dir.resolve()
+            config_dir.parent.mkdir(parents=True, exist_ok=True)
+            self._recover_stale_staging(config_dir, report)
+            # Stage next to the config dir so the final swap is a rename
+            staging_dir = Path(
+                tempfile.mkdtemp(prefix=f".{config_dir.name}.restore-", dir=config_dir.parent)
+            )
+            keep_staging = False
+            try:
+                # Validate the backup while extracting it
+                report("Extracting and validating backup...")
+                extract_dir = staging_dir / "extracted"
+                extract_dir.mkdir()
+                extracted, message = self._extract_backup(backup_path, extract_dir)
+                if extracted is None:
+                    return RestoreResult(
+                        success=False,
+                        error=f"Backup validation failed: {message}",
+                        duration_seconds=self._calc_duration(start_time),
+                    )
 
+                # Create pre-restore backup if requested
+                if create_pre_restore_backup and adapter.is_installed():
+                    report("Creating pre-restore backup...")
+                    backup_result = self._backup_manager.backup_vendor(adapter)
+                    if backup_result.success and backup_result.metadata:
+                        pre_restore_backup = backup_result.metadata.backup_path
+                        report(f"Pre-restore backup created: {pre_restore_backup}")
+
+                report("Restoring configuration...")
+                restored_dir = extract_dir / extracted.root_name
+                previous_dir = self._swap_into_place(restored_dir, config_dir, staging_dir)
+                if previous_dir is not None:
+                    # Bring back what the backup deliberately skipped
+                    exclusions = ExclusionRules.from_pax_headers(extracted.pax_headers)
+                    try:
+                        carry_over_excluded(previous_dir, config_dir, exclusions)
+                    except OSError as e:
+                        keep_staging = True
+                        msg = (
+                            f"Restored, but paths excluded from the backup could not be "
+                            f"moved back ({e}); they are still in {previous_dir}"
+                        )
+                        raise RuntimeError(msg) from e
+            finally:
+                if not keep_staging:
+                    shutil.rmtree(staging_dir, ignore_errors=True)
+
+            restored_count = extracted.stats.file_count
             duration = self._calc_duration(start_time)
             report(f"Restore complete in {duration:.1f}s ({restored_count} files)")
 
@@ -258,31 +304,27 @@ class RestoreManager:
             report(f"Starting selective restore for {adapter.info.name}...")
             report(f"Directories to restore: {', '.join(directories)}")
 
-            # Validate backup
-            is_valid, message = self._backup_manager.verify_backup(backup_path)
-            if not is_valid:
-                return RestoreResult(
-                    success=False,
-                    error=f"Backup validation failed: {message}",
-                    duration_seconds=self._calc_duration(start_time),
-                )
-
-            config_dir = adapter.info.config_dir
-            restored_count = 0
-
-            with tarfile.open(backup_path, "r:gz") as tar:
-                # Get the archive prefix (vendor name)
-                members = tar.getmembers()
-                if not members:
+            # Indexed archives are checked block by block as they are read;
+            # anything else is verified in full up front
+            index = self._backup_manager.load_archive_index(backup_path)
+            if index is None:
+                is_valid, message = self._backup_manager.verify_backup(backup_path)
+                if not is_valid:
                     return RestoreResult(
                         success=False,
-                        error="Archive is empty",
+                        error=f"Backup validation failed: {message}",
                         duration_seconds=self._calc_duration(start_time),
                     )
 
-                # Find the root directory in archive
-                root_name = members[0].name.split("/")[0]
+            config_dir = adapter.info.config_dir.resolve()
+            restored_count = 0
 
+            with self._open_selection(backup_path, index, directories) as (
+                tar,
+                members,
+                root_name,
+                exclusions,
+            ):
                 for dirname in directories:
                     report(f"Restoring {dirname}/...")
 
@@ -294,9 +336,14 @@ class RestoreManager:
                         report(f"  No files found for {dirname}")
                         continue
 
-                    # Create temp extraction directory
-                    temp_dir = config_dir.parent / f"temp_restore_{adapter.info.vendor_id}"
-                    temp_dir.mkdir(parents=True, exist_ok=True)
+                    # Extract next to the config dir so moving into place is a rename
+                    config_dir.mkdir(parents=True, exist_ok=True)
+                    temp_dir = Path(
+                        tempfile.mkdtemp(
+                            prefix=f"temp_restore_{adapter.info.vendor_id}-", dir=config_dir.parent
+                        )
+                    )
+                    keep_temp = False
 
                     try:
                         # Extract matching files to temp using secure extraction
@@ -307,16 +354,26 @@ class RestoreManager:
                         dest_dir = config_dir / dirname
 
                         if src_dir.exists():
-                            if dest_dir.exists():
-                                shutil.rmtree(dest_dir)
-                            shutil.move(str(src_dir), str(dest_dir))
+                            previous_dir = self._swap_into_place(src_dir, dest_dir, temp_dir)
+                            if previous_dir is not None:
+                                # Bring back what the backup deliberately skipped
+                                try:
+                                    carry_over_excluded(previous_dir, dest_dir, exclusions, dirname)
+                                except OSError as e:
+                                    keep_temp = True
+                                    msg = (
+                                        f"Restored {dirname}/, but paths excluded from the "
+                                        f"backup could not be moved back ({e}); they are "
+                                        f"still in {previous_dir}"
+                                    )
+                                    raise RuntimeError(msg) from e
                             restored_count += len([m for m in matching_members if m.isfile()])
                             report(f"  Restored {dirname}/")
 
                     finally:
                         # Clean up temp directory
-                        if temp_dir.exists():
-                            shutil.rmtree(temp_dir)
+                        if not keep_temp:
+                            shutil.rmtree(temp_dir, ignore_errors=True)
 
             duration = self._calc_duration(start_time)
             report(f"Selective restore complete ({restored_count} files)")
@@ -374,36 +431,192 @@ class RestoreManager:
         Returns:
             List of top-level directory names in the backup.
         """
-        if not backup_path.exists() or not tarfile.is_tarfile(backup_path):
+        if not backup_path.exists():
+            return []
+        if not is_snapshot(backup_path) and not tarfile.is_tarfile(backup_path):
             return []
 
         try:
-            with tarfile.open(backup_path, "r:gz") as tar:
-                members = tar.getmembers()
+            members = self._read_members(backup_path)
 
-                # Find root directory
-                if not members:
-                    return []
+            # Find root directory
+            if not members:
+                return []
 
-                root_name = members[0].name.split("/")[0]
-                root_prefix = f"{root_name}/"
+            root_name = members[0].name.split("/")[0]
+            root_prefix = f"{root_name}/"
 
-                # Get unique top-level directories
-                directories: set[str] = set()
-                for member in members:
-                    if member.name.startswith(root_prefix):
-                        # Get the directory name after root
-                        relative = member.name[len(root_prefix) :]
-                        if "/" in relative:
-                            dirname = relative.split("/")[0]
-                            if dirname:
-                                directories.add(dirname)
+            # Get unique top-level directories
+            directories: set[str] = set()
+            for member in members:
+                if member.name.startswith(root_prefix):
+                    # Get the directory name after root
+                    relative = member.name[len(root_prefix) :]
+                    if "/" in relative:
+                        dirname = relative.split("/")[0]
+                        if dirname:
+                            directories.add(dirname)
 
-                return sorted(directories)
+            return sorted(directories)
 
         except tarfile.TarError:
             return []
 
+    def _read_members(self, backup_path: Path) -> list[tarfile.TarInfo]:
+        """List a backup's members from its index or snapshot manifest if it has one.
+
+        Raises:
+            tarfile.TarError: If the archive or snapshot manifest is unreadable.
+        """
+        if not is_snapshot(backup_path):
+            index = self._backup_manager.load_archive_index(backup_path)
+            if index is not None:
+                return index.tarinfos()
+            with tarfile.open(backup_path, "r:*") as tar:
+                return tar.getmembers()
+
+        repository = SnapshotRepository(backup_path.parent / STORE_DIRNAME)
+        try:
+            entries = repository.load_entries(backup_path)
+        except (OSError, ValueError) as e:
+            raise tarfile.ReadError(str(e)) from e
+        return [entry.to_tarinfo() for entry in entries]
+
+    @contextmanager
+    def _open_selection(
+        self, backup_path: Path, index: ArchiveIndex | None, directories: list[str]
+    ) -> Iterator[tuple[tarfile.TarFile, list[tarfile.TarInfo], str, ExclusionRules]]:
+        """Open the part of a backup needed to restore some directories.
+
+        With an index, only the blocks holding those directories are read;
+        otherwise the whole archive (or exported snapshot) is opened.
+
+        Yields:
+            Tuple of (tar file, its members, archive root name, exclusion rules).
+
+        Raises:
+            tarfile.ReadError: If the archive is empty or unreadable.
+        """
+        if index is not None:
+            if not index.members:
+                msg = "Archive is empty"
+                raise tarfile.ReadError(msg)
+            root_name = index.members[0].name.split("/")[0]
+            prefixes = tuple(f"{root_name}/{dirname}" for dirname in directories)
+            selected = [m for m in index.members if m.name.startswith(prefixes)]
+            with index.open_members(selected) as tar:
+                exclusions = ExclusionRules.from_pax_headers(index.pax_headers)
+                yield tar, tar.getmembers(), root_name, exclusions
+            return
+
+        with (
+            self._archive_for(backup_path) as archive_path,
+            tarfile.open(archive_path, "r:*") as tar,
+        ):
+            members = tar.getmembers()
+            if not members:
+                msg = "Archive is empty"
+                raise tarfile.ReadError(msg)
+            exclusions = ExclusionRules.from_pax_headers(tar.pax_headers or {})
+            yield tar, members, members[0].name.split("/")[0], exclusions
+
+    def _extract_backup(
+        self, backup_path: Path, dest_dir: Path
+    ) -> tuple[ExtractedArchive | None, str]:
+        """Extract a backup into dest_dir, checking it against the catalog on the way.
+
+        Returns:
+            Tuple of (extracted archive, message); the archive is None when the
+            backup is missing, unreadable, empty or fails its checksum.
+        """
+        if not backup_path.exists():
+            return None, f"Backup file not found: {backup_path}"
+
+        stored_checksum = self._backup_manager.catalog.checksum(backup_path)
+        if is_snapshot(backup_path):
+            # Chunks are verified against their digests as they are exported,
+            # so only the manifest itself needs checking here
+            with backup_path.open("rb") as f:
+                manifest_checksum = hashlib.file_digest(f, "sha256").hexdigest()
+            if stored_checksum and stored_checksum != manifest_checksum:
+                return None, "Checksum mismatch - backup may be corrupted"
+            stored_checksum = None
+
+        try:
+            with self._archive_for(backup_path) as archive_path:
+                extracted = extract_tar_archive(archive_path, dest_dir)
+        except (tarfile.TarError, ValueError, FileNotFoundError) as e:
+            return None, f"Archive error: {e}"
+
+        # Nothing was extracted, or nothing under a top-level directory
+        if not extracted.root_name or not (dest_dir / extracted.root_name).is_dir():
+            return None, "Archive is empty"
+        if stored_checksum and stored_checksum != extracted.stats.checksum:
+            return None, "Checksum mismatch - backup may be corrupted"
+        return extracted, f"Backup valid ({extracted.stats.member_count} files)"
+
+    @staticmethod
+    def _recover_stale_staging(config_dir: Path, report: Callable[[str], None]) -> None:
+        """Clean up staging dirs left by restores that were killed part-way.
+
+        A staging dir holding ``previous`` may contain the only copy of the
+        configuration (or of paths the backup excluded), so it is never
+        deleted: it is renamed back if the config dir is missing, and
+        otherwise left in place with a warning.
+        """
+        for stale in config_dir.parent.glob(f".{config_dir.name}.restore-*"):
+            previous_dir = stale / "previous"
+            if not (previous_dir.exists() or previous_dir.is_symlink()):
+                shutil.rmtree(stale, ignore_errors=True)
+            elif not (config_dir.exists() or config_dir.is_symlink()):
+                previous_dir.rename(config_dir)
+                report(f"Recovered configuration from interrupted restore {stale}")
+                shutil.rmtree(stale, ignore_errors=True)
+            else:
+                report(
+                    f"Warning: {stale} holds files from an interrupted restore; "
+                    "review and remove it by hand"
+                )
+
+    @staticmethod
+    def _swap_into_place(new_dir: Path, config_dir: Path, staging_dir: Path) -> Path | None:
+        """Replace config_dir with new_dir by renaming, restoring it if that fails.
+
+        The current configuration is moved into staging_dir, which the caller
+        removes once it has taken what it needs from it.
+
+        Returns:
+            Where the previous configuration now is, or None if there was none.
+        """
+        previous_dir: Path | None = None
+        if config_dir.exists() or config_dir.is_symlink():
+            previous_dir = staging_dir / "previous"
+            config_dir.rename(previous_dir)
+        try:
+            new_dir.rename(config_dir)
+        except OSError:
+            if previous_dir is not None:
+                previous_dir.rename(config_dir)
+            raise
+        return previous_dir
+
+    @contextmanager
+    def _archive_for(self, backup_path: Path) -> Iterator[Path]:
+        """Yield a tar archive for a backup, exporting snapshots to a temporary file.
+
+        Snapshots are exported uncompressed: the archive is read once and
+        deleted, so compressing it would only cost time on both sides.
+        """
+        if not is_snapshot(backup_path):
+            yield backup_path
+            return
+
+        repository = SnapshotRepository(backup_path.parent / STORE_DIRNAME)
+        with tempfile.TemporaryDirectory(prefix="ai-asst-mgr-restore-") as temp_dir:
+            archive_path = Path(temp_dir) / backup_path.name.replace(SNAPSHOT_SUFFIX, ".tar")
+            repository.export_archive(backup_path, archive_path, compress=False)
+            yield archive_path
+
     def _get_backup_timestamp(self, backup_path: Path) -> datetime:
         """Get the timestamp of a backup from metadata or file mtime."""
         # Try to get from backup manager's metadata
@@ -415,14 +628,6 @@ class RestoreManager:
         # Fall back to file modification time
         return datetime.fromtimestamp(backup_path.stat().st_mtime, tz=UTC)
 
-    def _count_files_in_archive(self, archive_path: Path) -> int:
-        """Count the number of files in a tar archive."""
-        try:
-            with tarfile.open(archive_path, "r:gz") as tar:
-                return len([m for m in tar.getmembers() if m.isfile()])
-        except tarfile.TarError:
-            return 0
-
     def _calc_duration(self, start_time: datetime) -> float:
         """Calculate duration in seconds from start time."""
         return (datetime.now(tz=UTC) - start_time).total_seconds()
@@ -0,0 +1,541 @@
+"""Content-addressed, deduplicating snapshot backups.
+
+A full tar.gz backup stores every file again on every run, even though most
+of a vendor configuration directory is unchanged between backups. Snapshot
+backups split each file into fixed-size chunks, store every chunk once under
+its SHA256 digest, and describe each backup with a small JSON manifest listing
+the chunks of each file. Unchanged files cost nothing beyond a manifest line,
+and append-only files such as ``history.jsonl`` only add their new tail chunk.
+
+Layout under a vendor's backup directory::
+
+    <vendor>/
+        claude_snapshot_20250101_020000.snapshot.json   # manifest per backup
+        .store/objects/ab/abcdef...                     # zlib-compressed chunks
+
+Chunks no longer referenced by any manifest are removed by collect_garbage(),
+which BackupManager runs after applying its retention policy.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import shutil
+import stat
+import tarfile
+import zlib
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ai_asst_mgr.utils.exclusions import ExclusionRules
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+SNAPSHOT_SUFFIX = ".snapshot.json"
+SNAPSHOT_FORMAT_VERSION = 1
+STORE_DIRNAME = ".store"
+
+# Fixed-size chunking keeps unchanged prefixes of growing files deduplicated
+CHUNK_SIZE = 4 * 1024 * 1024
+_COMPRESSION_LEVEL = 6
+
+
+def is_snapshot(path: Path) -> bool:
+    """Check whether a backup path refers to a snapshot manifest.
+
+    Args:
+        path: Backup path to check.
+
+    Returns:
+        True if the path names a snapshot manifest.
+    """
+    return path.name.endswith(SNAPSHOT_SUFFIX)
+
+
+@dataclass
+class SnapshotEntry:
+    """One file, directory or symlink recorded in a snapshot manifest.
+
+    Attributes:
+        path: POSIX path inside the snapshot, starting with the archive root.
+        kind: One of "file", "dir" or "symlink".
+        mode: Permission bits.
+        mtime_ns: Modification time in nanoseconds.
+        size: File size in bytes (0 for directories and symlinks).
+        chunks: SHA256 digests of the file's chunks, in order.
+        target: Link target for symlinks.
+    """
+
+    path: str
+    kind: str
+    mode: int
+    mtime_ns: int
+    size: int = 0
+    chunks: list[str] = field(default_factory=list)
+    target: str | None = None
+
+    def to_tarinfo(self) -> tarfile.TarInfo:
+        """Build the tar header this entry would have in a full backup archive.
+
+        Returns:
+            TarInfo with name, type, mode, mtime, size and link target set.
+        """
+        info = tarfile.TarInfo(self.path)
+        info.mode = self.mode
+        info.mtime = self.mtime_ns // 1_000_000_000
+        if self.kind == "dir":
+            info.type = tarfile.DIRTYPE
+        elif self.kind == "symlink":
+            info.type = tarfile.SYMTYPE
+            info.linkname = self.target or ""
+        else:
+            info.size = self.size
+        return info
+
+
+@dataclass
+class SnapshotStats:
+    """Result of creating a snapshot.
+
+    Attributes:
+        path: Path to the manifest file.
+        checksum: SHA256 checksum of the manifest file.
+        file_count: Number of regular files in the snapshot.
+        total_bytes: Logical size of all files in the snapshot.
+        stored_bytes: Compressed bytes added to the chunk store by this run.
+        new_chunks: Number of chunks added to the store by this run.
+        unchanged_files: Files reused from the previous snapshot without reading.
+    """
+
+    path: Path
+    checksum: str
+    file_count: int
+    total_bytes: int
+    stored_bytes: int
+    new_chunks: int
+    unchanged_files: int
+
+
+@dataclass
+class GarbageCollectionStats:
+    """Result of removing unreferenced chunks.
+
+    Attributes:
+        removed_chunks: Number of chunk files deleted.
+        freed_bytes: Bytes freed on disk.
+    """
+
+    removed_chunks: int = 0
+    freed_bytes: int = 0
+
+
+class ChunkStore:
+    """Directory of zlib-compressed chunks addressed by their SHA256 digest."""
+
+    def __init__(self, root: Path) -> None:
+        """Initialize the chunk store.
+
+        Args:
+            root: Store directory (created on first write).
+        """
+        self._objects_dir = root / "objects"
+
+    def object_path(self, digest: str) -> Path:
+        """Get the on-disk path of a chunk.
+
+        Args:
+            digest: SHA256 hex digest of the chunk.
+
+        Returns:
+            Path of the chunk file.
+        """
+        return self._objects_dir / digest[:2] / digest
+
+    def has(self, digest: str) -> bool:
+        """Check whether a chunk is stored.
+
+        Args:
+            digest: SHA256 hex digest of the chunk.
+
+        Returns:
+            True if the chunk exists in the store.
+        """
+        return self.object_path(digest).exists()
+
+    def put(self, data: bytes) -> tuple[str, int]:
+        """Store a chunk unless an identical one already exists.
+
+        Args:
+            data: Uncompressed chunk contents.
+
+        Returns:
+            Tuple of (digest, compressed bytes written; 0 if already stored).
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.object_path(digest)
+        if path.exists():
+            return digest, 0
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        compressed = zlib.compress(data, _COMPRESSION_LEVEL)
+        partial = path.with_name(f"{digest}.partial")
+        partial.write_bytes(compressed)
+        partial.replace(path)
+        return digest, len(compressed)
+
+    def get(self, digest: str) -> bytes:
+        """Read and verify a chunk.
+
+        Args:
+            digest: SHA256 hex digest of the chunk.
+
+        Returns:
+            Uncompressed chunk contents.
+
+        Raises:
+            FileNotFoundError: If the chunk is missing.
+            ValueError: If the chunk is corrupt.
+        """
+        try:
+            data = zlib.decompress(self.object_path(digest).read_bytes())
+        except zlib.error as e:
+            msg = f"Corrupt chunk {digest}: {e}"
+            raise ValueError(msg) from e
+        if hashlib.sha256(data).hexdigest() != digest:
+            msg = f"Corrupt chunk {digest}: digest mismatch"
+            raise ValueError(msg)
+        return data
+
+    def digests(self) -> Iterator[str]:
+        """Iterate over the digests of all stored chunks.
+
+        Yields:
+            SHA256 hex digest of each stored chunk.
+        """
+        if not self._objects_dir.exists():
+            return
+        for prefix_dir in self._objects_dir.iterdir():
+            for chunk_path in prefix_dir.iterdir():
+                if not chunk_path.name.endswith(".partial"):
+                    yield chunk_path.name
+
+
+class _ChunkReader:
+    """File-like reader over a file's chunks, used when exporting to tar."""
+
+    def __init__(self, store: ChunkStore, chunks: list[str]) -> None:
+        self._store = store
+        self._pending = iter(chunks)
+        self._current = b""
+        self._offset = 0
+
+    def read(self, size: int = -1) -> bytes:
+        parts: list[bytes] = []
+        wanted = size
+        while wanted != 0:
+            if self._offset >= len(self._current):
+                digest = next(self._pending, None)
+                if digest is None:
+                    break
+                self._current, self._offset = self._store.get(digest), 0
+            end = len(self._current) if wanted < 0 else self._offset + wanted
+            part = self._current[self._offset : end]
+            self._offset += len(part)
+            parts.append(part)
+            if wanted > 0:
+                wanted -= len(part)
+        return b"".join(parts)
+
+
+class SnapshotRepository:
+    """Creates, verifies, exports and garbage-collects snapshot backups.
+
+    Example:
+        >>> repo = SnapshotRepository(Path("~/.aim/backups/claude/.store"))
+        >>> stats = repo.create_snapshot(
+        ...     Path("~/.claude"), Path("claude_snapshot_1.snapshot.json"), "claude"
+        ... )
+        >>> print(f"{stats.new_chunks} new chunks, {stats.stored_bytes} bytes")
+    """
+
+    def __init__(self, store_dir: Path, chunk_size: int | None = None) -> None:
+        """Initialize the repository.
+
+        Args:
+            store_dir: Directory holding the chunk store.
+            chunk_size: Size of the chunks new snapshots split files into.
+                Defaults to CHUNK_SIZE.
+        """
+        self._store = ChunkStore(store_dir)
+        self._chunk_size = chunk_size
+
+    @property
+    def store(self) -> ChunkStore:
+        """Get the underlying chunk store."""
+        return self._store
+
+    def create_snapshot(
+        self,
+        source_dir: Path,
+        manifest_path: Path,
+        arcname: str,
+        previous: Path | None = None,
+        exclusions: ExclusionRules | None = None,
+    ) -> SnapshotStats:
+        """Snapshot a directory, storing only chunks not already in the store.
+
+        Files whose size, mtime and mode match the previous snapshot reuse its
+        chunk list without being read.
+
+        Args:
+            source_dir: Directory to snapshot.
+            manifest_path: Where to write the snapshot manifest.
+            arcname: Root name for paths inside the snapshot.
+            previous: Optional earlier manifest used to skip unchanged files.
+            exclusions: Paths to leave out; recorded in the manifest so
+                exported archives carry them for restore.
+
+        Returns:
+            SnapshotStats describing the new snapshot.
+
+        Raises:
+            OSError: If the source cannot be read or the store cannot be written.
+        """
+        known = self._previous_entries(previous)
+        entries: list[SnapshotEntry] = []
+        stats = SnapshotStats(
+            path=manifest_path,
+            checksum="",
+            file_count=0,
+            total_bytes=0,
+            stored_bytes=0,
+            new_chunks=0,
+            unchanged_files=0,
+        )
+
+        rules = exclusions or ExclusionRules()
+        for path, archive_name in self._walk(source_dir, arcname, rules):
+            st = path.lstat()
+            mode = stat.S_IMODE(st.st_mode)
+            if stat.S_ISLNK(st.st_mode):
+                entries.append(
+                    SnapshotEntry(
+                        archive_name, "symlink", mode, st.st_mtime_ns, target=str(path.readlink())
+                    )
+                )
+            elif stat.S_ISDIR(st.st_mode):
+                entries.append(SnapshotEntry(archive_name, "dir", mode, st.st_mtime_ns))
+            elif stat.S_ISREG(st.st_mode):
+                entry = SnapshotEntry(archive_name, "file", mode, st.st_mtime_ns, st.st_size)
+                prior = known.get(archive_name)
+                if prior is not None and self._is_unchanged(prior, entry):
+                    entry.chunks = prior.chunks
+                    stats.unchanged_files += 1
+                else:
+                    entry.chunks = self._store_file(path, stats)
+                entries.append(entry)
+                stats.file_count += 1
+                stats.total_bytes += entry.size
+
+        payload = json.dumps(
+            {
+                "version": SNAPSHOT_FORMAT_VERSION,
+                "root": arcname,
+                "chunk_size": self._chunk_size or CHUNK_SIZE,
+                "exclusions": rules.to_pax_headers(),
+                "entries": [asdict(entry) for entry in entries],
+            },
+            separators=(",", ":"),
+        ).encode()
+        partial = manifest_path.with_name(f"{manifest_path.name}.partial")
+        partial.write_bytes(payload)
+        partial.replace(manifest_path)
+
+        stats.checksum = hashlib.sha256(payload).hexdigest()
+        return stats
+
+    def load_entries(self, manifest_path: Path) -> list[SnapshotEntry]:
+        """Read the entries of a snapshot manifest.
+
+        Args:
+            manifest_path: Snapshot manifest to read.
+
+        Returns:
+            List of SnapshotEntry objects in archive order.
+
+        Raises:
+            OSError: If the manifest cannot be read.
+            ValueError: If the manifest is malformed.
+        """
+        try:
+            data = json.loads(manifest_path.read_text())
+            return [SnapshotEntry(**entry) for entry in data["entries"]]
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            msg = f"Invalid snapshot manifest {manifest_path}: {e}"
+            raise ValueError(msg) from e
+
+    def verify_snapshot(self, manifest_path: Path) -> tuple[bool, str]:
+        """Check that every chunk of a snapshot is present and intact.
+
+        Args:
+            manifest_path: Snapshot manifest to verify.
+
+        Returns:
+            Tuple of (is_valid, message).
+        """
+        try:
+            entries = self.load_entries(manifest_path)
+        except (OSError, ValueError) as e:
+            return False, str(e)
+
+        if not entries:
+            return False, "Snapshot is empty"
+
+        checked: set[str] = set()
+        for entry in entries:
+            for digest in entry.chunks:
+                if digest in checked:
+                    continue
+                try:
+                    self._store.get(digest)
+                except FileNotFoundError:
+                    return False, f"Missing chunk {digest[:12]} for {entry.path}"
+                except ValueError as e:
+                    return False, str(e)
+                checked.add(digest)
+
+        file_count = sum(1 for entry in entries if entry.kind == "file")
+        return True, f"Snapshot valid ({file_count} files, {len(checked)} chunks)"
+
+    def export_archive(
+        self, manifest_path: Path, archive_path: Path, *, compress: bool = True
+    ) -> int:
+        """Reassemble a snapshot into a tar.gz archive.
+
+        The archive has the same layout as a full backup, so the adapters'
+        restore methods and selective restore can use it unchanged.
+
+        Args:
+            manifest_path: Snapshot manifest to export.
+            archive_path: Destination tar.gz path.
+            compress: Gzip the archive. Restores pass False, since the
+                archive is extracted straight away and then deleted.
+
+        Returns:
+            Number of regular files written.
+
+        Raises:
+            OSError: If the archive cannot be written.
+            FileNotFoundError: If a chunk is missing.
+            ValueError: If the manifest or a chunk is corrupt.
+        """
+        file_count = 0
+        entries = self.load_entries(manifest_path)
+        with tarfile.open(
+            archive_path,
+            "w:gz" if compress else "w",
+            pax_headers=self._recorded_exclusions(manifest_path),
+        ) as tar:
+            for entry in entries:
+                if entry.kind == "file":
+                    tar.addfile(entry.to_tarinfo(), _ChunkReader(self._store, entry.chunks))
+                    file_count += 1
+                else:
+                    tar.addfile(entry.to_tarinfo())
+        return file_count
+
+    def write_file(self, entry: SnapshotEntry, dest: Path) -> int:
+        """Reassemble one file of a snapshot from its chunks.
+
+        Args:
+            entry: File entry from load_entries().
+            dest: Path to write the file's contents to.
+
+        Returns:
+            Number of bytes written.
+
+        Raises:
+            OSError: If the file cannot be written.
+            FileNotFoundError: If a chunk is missing.
+            ValueError: If a chunk is corrupt.
+        """
+        with dest.open("wb") as f:
+            shutil.copyfileobj(_ChunkReader(self._store, entry.chunks), f)
+            return f.tell()
+
+    def collect_garbage(self, live_manifests: Iterable[Path]) -> GarbageCollectionStats:
+        """Delete chunks that no live snapshot references.
+
+        Args:
+            live_manifests: Manifests of every snapshot that must stay restorable.
+
+        Returns:
+            GarbageCollectionStats with the number of chunks and bytes removed.
+
+        Raises:
+            ValueError: If a live manifest cannot be parsed (nothing is deleted).
+        """
+        live: set[str] = set()
+        for manifest_path in live_manifests:
+            for entry in self.load_entries(manifest_path):
+                live.update(entry.chunks)
+
+        stats = GarbageCollectionStats()
+        for digest in list(self._store.digests()):
+            if digest in live:
+                continue
+            chunk_path = self._store.object_path(digest)
+            stats.freed_bytes += chunk_path.stat().st_size
+            chunk_path.unlink()
+            stats.removed_chunks += 1
+        return stats
+
+    @staticmethod
+    def _recorded_exclusions(manifest_path: Path) -> dict[str, str]:
+        """Read the exclusion rules a snapshot was taken with, as PAX headers."""
+        headers = json.loads(manifest_path.read_text()).get("exclusions") or {}
+        return {str(key): str(value) for key, value in headers.items()}
+
+    def _previous_entries(self, previous: Path | None) -> dict[str, SnapshotEntry]:
+        """Index a previous snapshot's file entries by path, ignoring bad manifests."""
+        if previous is None or not previous.exists():
+            return {}
+        try:
+            entries = self.load_entries(previous)
+        except (OSError, ValueError):
+            return {}
+        return {entry.path: entry for entry in entries if entry.kind == "file"}
+
+    def _is_unchanged(self, prior: SnapshotEntry, current: SnapshotEntry) -> bool:
+        """Check whether a file can reuse its previous chunks without being read."""
+        return (
+            prior.size == current.size
+            and prior.mtime_ns == current.mtime_ns
+            and prior.mode == current.mode
+            and all(self._store.has(digest) for digest in prior.chunks)
+        )
+
+    def _store_file(self, path: Path, stats: SnapshotStats) -> list[str]:
+        """Chunk a file into the store, updating stats with what was added."""
+        chunks: list[str] = []
+        with path.open("rb") as f:
+            while data := f.read(self._chunk_size or CHUNK_SIZE):
+                digest, written = self._store.put(data)
+                chunks.append(digest)
+                if written:
+                    stats.new_chunks += 1
+                    stats.stored_bytes += written
+        return chunks
+
+    @staticmethod
+    def _walk(
+        source_dir: Path, arcname: str, exclusions: ExclusionRules
+    ) -> Iterator[tuple[Path, str]]:
+        """Yield (path, archive name) pairs in a stable, parent-first order."""
+        yield source_dir, arcname
+        for entry, rel_path, excluded_by in exclusions.walk(source_dir):
+            if excluded_by is None:
+                yield Path(entry.path), f"{arcname}/{rel_path}"
@@ -6,6 +6,7 @@ from Git repositories, including diff preview, merge strategies, and dry-run mod
 
 from __future__ import annotations
 
+import hashlib
 import shutil
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -14,12 +15,21 @@ from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
 from ai_asst_mgr.utils import git_clone
+from ai_asst_mgr.utils.tree_apply import apply_tree_diff, install_file
+from ai_asst_mgr.utils.tree_index import (
+    HashCache,
+    TreeSnapshot,
+    diff_trees,
+    file_digest,
+    files_match,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
     from ai_asst_mgr.adapters.base import VendorAdapter
     from ai_asst_mgr.operations.backup import BackupManager
+    from ai_asst_mgr.utils.clone_cache import CloneCache
 
 
 class MergeStrategy(Enum):
@@ -111,6 +121,9 @@ class _PreviewContext:
         files_to_modify: List of files to be modified.
         files_to_delete: List of files to be deleted.
         conflicts: List of conflicting files.
+        local: Snapshot of the vendor's sync paths in the config directory.
+        remote: Snapshot of the vendor's sync paths in the checkout.
+        hashes: Hash cache for files in the config directory.
     """
 
     vendor_id: str
@@ -120,6 +133,9 @@ class _PreviewContext:
     files_to_modify: list[str]
     files_to_delete: list[str]
     conflicts: list[str]
+    local: TreeSnapshot
+    remote: TreeSnapshot
+    hashes: HashCache
 
 
 @dataclass
@@ -158,6 +174,7 @@ class SyncManager:
     - Conflict detection
     - Pre-sync backup creation
     - Progress reporting
+    - Optional persistent clone cache, so repeated syncs only fetch new commits
 
     Example:
         >>> from ai_asst_mgr.vendors import VendorRegistry
@@ -185,13 +202,25 @@ class SyncManager:
         "openai": ["AGENTS.md", "config.toml"],
     }
 
-    def __init__(self, backup_manager: BackupManager | None = None) -> None:
+    def __init__(
+        self,
+        backup_manager: BackupManager | None = None,
+        clone_cache: CloneCache | None = None,
+        hash_cache_dir: Path | None = None,
+    ) -> None:
         """Initialize the sync manager.
 
         Args:
             backup_manager: Optional BackupManager for creating pre-sync backups.
+            clone_cache: Optional cache of source repositories. With a cache,
+                each repository is fetched once per SyncManager and only new
+                commits are transferred; without one, every operation clones.
+            hash_cache_dir: Optional directory for hashes of local config
+                files, so unchanged files are not re-read by later previews.
         """
         self._backup_manager = backup_manager
+        self._clone_cache = clone_cache
+        self._hash_cache_dir = hash_cache_dir
 
     def preview_sync(
         self,
@@ -215,10 +244,11 @@ class SyncManager:
 
         try:
             # Clone repository
-            if not self._clone_repo(repo_url, temp_dir, branch):
+            sync_paths = self._sync_paths(vendor_id)
+            if not self._clone_repo(repo_url, temp_dir, branch, sync_paths):
                 return None
 
-            # Create preview context
+            # Walk each side once; contents are only compared where sizes match
             ctx = _PreviewContext(
                 vendor_id=vendor_id,
                 temp_dir=temp_dir,
@@ -227,11 +257,16 @@ class SyncManager:
                 files_to_modify=[],
                 files_to_delete=[],
                 conflicts=[],
+                local=TreeSnapshot.scan(config_dir, sync_paths or []),
+                remote=TreeSnapshot.scan(temp_dir, sync_paths or []),
+                hashes=self._hash_cache(config_dir, vendor_id),
             )
 
             # Check directories and files
             self._preview_directories(ctx)
             self._preview_files(ctx)
+            ctx.hashes.retain(ctx.local)
+            ctx.hashes.save()
 
             return SyncPreview(
                 vendor_id=vendor_id,
@@ -255,72 +290,66 @@ class SyncManager:
         """Preview directory changes for sync operation.
 
         Args:
-            ctx: Preview context with paths and result lists.
+            ctx: Preview context with snapshots and result lists.
         """
         sync_dirs = self.VENDOR_SYNC_DIRS.get(ctx.vendor_id, [])
         for dirname in sync_dirs:
-            remote_dir = ctx.temp_dir / dirname
-            local_dir = ctx.config_dir / dirname
-
-            if remote_dir.exists():
-                self._preview_remote_files(remote_dir, ctx)
+            self._preview_remote_files(dirname, ctx)
 
             # Check for files that would be deleted in REPLACE mode
-            if local_dir.exists():
-                self._preview_local_deletions(local_dir, ctx)
+            self._preview_local_deletions(dirname, ctx)
 
-    def _preview_remote_files(self, remote_dir: Path, ctx: _PreviewContext) -> None:
+    def _preview_remote_files(self, dirname: str, ctx: _PreviewContext) -> None:
         """Preview changes for remote files in a directory.
 
         Args:
-            remote_dir: Remote directory to check.
-            ctx: Preview context with paths and result lists.
+            dirname: Sync directory, relative to the repository root.
+            ctx: Preview context with snapshots and result lists.
         """
-        for remote_file in remote_dir.rglob("*"):
-            if remote_file.is_file():
-                rel_path = remote_file.relative_to(ctx.temp_dir)
-                local_file = ctx.config_dir / rel_path
-
-                if local_file.exists():
-                    # Check if content differs
-                    if self._files_differ(local_file, remote_file):
-                        ctx.files_to_modify.append(str(rel_path))
-                        ctx.conflicts.append(str(rel_path))
-                else:
-                    ctx.files_to_add.append(str(rel_path))
-
-    def _preview_local_deletions(self, local_dir: Path, ctx: _PreviewContext) -> None:
+        for rel_path in ctx.remote.under(dirname):
+            self._preview_remote_file(rel_path, ctx)
+
+    def _preview_local_deletions(self, dirname: str, ctx: _PreviewContext) -> None:
         """Preview local files that would be deleted in REPLACE mode.
 
         Args:
-            local_dir: Local directory to check.
-            ctx: Preview context with paths and result lists.
+            dirname: Sync directory, relative to the config directory.
+            ctx: Preview context with snapshots and result lists.
         """
-        for local_file in local_dir.rglob("*"):
-            if local_file.is_file():
-                rel_path = local_file.relative_to(ctx.config_dir)
-                remote_file = ctx.temp_dir / rel_path
-                if not remote_file.exists():
-                    ctx.files_to_delete.append(str(rel_path))
+        ctx.files_to_delete.extend(
+            rel_path for rel_path in ctx.local.under(dirname) if rel_path not in ctx.remote
+        )
 
     def _preview_files(self, ctx: _PreviewContext) -> None:
         """Preview individual file changes for sync operation.
 
         Args:
-            ctx: Preview context with paths and result lists.
+            ctx: Preview context with snapshots and result lists.
         """
         sync_files = self.VENDOR_SYNC_FILES.get(ctx.vendor_id, [])
         for filename in sync_files:
-            remote_file = ctx.temp_dir / filename
-            local_file = ctx.config_dir / filename
+            if filename in ctx.remote:
+                self._preview_remote_file(filename, ctx)
 
-            if remote_file.exists():
-                if local_file.exists():
-                    if self._files_differ(local_file, remote_file):
-                        ctx.files_to_modify.append(filename)
-                        ctx.conflicts.append(filename)
-                else:
-                    ctx.files_to_add.append(filename)
+    def _preview_remote_file(self, rel_path: str, ctx: _PreviewContext) -> None:
+        """Classify one remote file as an addition or a modification.
+
+        Args:
+            rel_path: Path of the file relative to both roots.
+            ctx: Preview context with snapshots and result lists.
+        """
+        if rel_path not in ctx.local:
+            ctx.files_to_add.append(rel_path)
+        elif not files_match(ctx.local, ctx.remote, rel_path, ctx.hashes):
+            ctx.files_to_modify.append(rel_path)
+            ctx.conflicts.append(rel_path)
+
+    def _hash_cache(self, config_dir: Path, vendor_id: str) -> HashCache:
+        """Get the hash cache for a vendor's config directory."""
+        if self._hash_cache_dir is None:
+            return HashCache()
+        key = hashlib.sha256(str(config_dir).encode()).hexdigest()[:12]
+        return HashCache(self._hash_cache_dir / f"{vendor_id}-{key}.json")
 
     def sync_vendor(
         self,
@@ -383,7 +412,8 @@ class SyncManager:
 
             # Clone repository
             report("Cloning repository...")
-            if not self._clone_repo(config.repo_url, temp_dir, config.branch):
+            sync_paths = self._sync_paths(vendor_id)
+            if not self._clone_repo(config.repo_url, temp_dir, config.branch, sync_paths):
                 return SyncResult(
                     success=False,
                     error="Failed to clone repository",
@@ -480,11 +510,12 @@ class SyncManager:
         files_added = 0
         files_modified = 0
         files_deleted = 0
+        hashes = self._hash_cache(config_dir, vendor_id)
 
         # Sync directories
         report("Syncing directories...")
         added, modified, deleted = self._sync_directories(
-            vendor_id, temp_dir, config_dir, strategy, report
+            vendor_id, temp_dir, config_dir, strategy, report, hashes
         )
         files_added += added
         files_modified += modified
@@ -496,6 +527,7 @@ class SyncManager:
         files_added += added
         files_modified += modified
 
+        hashes.save()
         return files_added, files_modified, files_deleted
 
     def _sync_directories(
@@ -505,6 +537,7 @@ class SyncManager:
         config_dir: Path,
         strategy: MergeStrategy,
         report: Callable[[str], None],
+        hashes: HashCache | None = None,
     ) -> tuple[int, int, int]:
         """Sync all directories for a vendor.
 
@@ -514,6 +547,7 @@ class SyncManager:
             config_dir: Local configuration directory.
             strategy: Merge strategy to use.
             report: Progress reporting callback.
+            hashes: Optional hash cache for files in the config directory.
 
         Returns:
             Tuple of (files_added, files_modified, files_deleted).
@@ -528,7 +562,9 @@ class SyncManager:
             local_dir = config_dir / dirname
 
             if remote_dir.exists():
-                added, modified, deleted = self._sync_directory(remote_dir, local_dir, strategy)
+                added, modified, deleted = self._sync_directory(
+                    remote_dir, local_dir, strategy, hashes
+                )
                 files_added += added
                 files_modified += modified
                 files_deleted += deleted
@@ -621,22 +657,43 @@ class SyncManager:
 
         return results
 
-    def _clone_repo(self, repo_url: str, dest_dir: Path, branch: str) -> bool:
+    def _sync_paths(self, vendor_id: str) -> list[str] | None:
+        """Get the repository paths a vendor syncs, or None if it has none configured."""
+        paths = self.VENDOR_SYNC_DIRS.get(vendor_id, []) + self.VENDOR_SYNC_FILES.get(vendor_id, [])
+        return paths or None
+
+    def _clone_repo(
+        self,
+        repo_url: str,
+        dest_dir: Path,
+        branch: str,
+        paths: list[str] | None = None,
+    ) -> bool:
         """Clone a Git repository securely.
 
-        Uses the git_clone utility which validates inputs to prevent
-        command injection and uses absolute paths to the git executable.
+        Uses the clone cache when one is configured, otherwise the git_clone
+        utility. Both validate inputs to prevent command injection. With
+        ``paths``, only those files and directories are downloaded and
+        checked out.
         """
         # Remove existing temp directory
         if dest_dir.exists():
             shutil.rmtree(dest_dir)
 
-        return git_clone(repo_url, dest_dir, branch)
+        if self._clone_cache is not None:
+            return self._clone_cache.checkout(repo_url, dest_dir, branch, paths)
+        return git_clone(repo_url, dest_dir, branch, sparse_paths=paths)
 
     def _files_differ(self, file1: Path, file2: Path) -> bool:
-        """Check if two files have different content."""
+        """Check if two files have different content.
+
+        Sizes are compared first; contents are hashed in blocks, never read
+        into memory whole.
+        """
         try:
-            return file1.read_bytes() != file2.read_bytes()
+            if file1.stat().st_size != file2.stat().st_size:
+                return True
+            return file_digest(file1) != file_digest(file2)
         except OSError:
             return True
 
@@ -645,41 +702,35 @@ class SyncManager:
         remote_dir: Path,
         local_dir: Path,
         strategy: MergeStrategy,
+        hashes: HashCache | None = None,
     ) -> tuple[int, int, int]:
         """Sync a directory using the specified strategy.
 
+        Both trees are scanned and compared, and only the differences are
+        written: identical files are left alone, so their inodes and
+        timestamps survive the sync.
+
         Returns:
             Tuple of (files_added, files_modified, files_deleted).
         """
-        added = 0
-        modified = 0
-        deleted = 0
-
-        if strategy == MergeStrategy.REPLACE:
-            # Remove local directory and replace with remote
-            if local_dir.exists():
-                old_files = list(local_dir.rglob("*"))
-                deleted = len([f for f in old_files if f.is_file()])
-                shutil.rmtree(local_dir)
-
-            shutil.copytree(remote_dir, local_dir)
-            added = len(list(local_dir.rglob("*")))
-            return added, 0, deleted
-
-        # For other strategies, sync file by file
         local_dir.mkdir(parents=True, exist_ok=True)
+        diff = diff_trees(TreeSnapshot.scan(local_dir), TreeSnapshot.scan(remote_dir), hashes)
 
-        for remote_file in remote_dir.rglob("*"):
-            if remote_file.is_file():
-                rel_path = remote_file.relative_to(remote_dir)
-                local_file = local_dir / rel_path
-
-                local_file.parent.mkdir(parents=True, exist_ok=True)
-                a, m = self._sync_file(remote_file, local_file, strategy)
-                added += a
-                modified += m
-
-        return added, modified, deleted
+        if strategy == MergeStrategy.MERGE:
+            # Leave local edits in place; write remote versions alongside them
+            result = apply_tree_diff(remote_dir, local_dir, diff, update_modified=False)
+            for rel_path in diff.modified:
+                install_file(remote_dir / rel_path, local_dir / f"{rel_path}.remote")
+            return result.added, len(diff.modified), 0
+
+        result = apply_tree_diff(
+            remote_dir,
+            local_dir,
+            diff,
+            update_modified=strategy != MergeStrategy.KEEP_LOCAL,
+            delete=strategy == MergeStrategy.REPLACE,
+        )
+        return result.added, result.modified, result.deleted
 
     def _sync_file(
         self,
@@ -689,31 +740,25 @@ class SyncManager:
     ) -> tuple[int, int]:
         """Sync a single file using the specified strategy.
 
+        An identical local file is left untouched.
+
         Returns:
             Tuple of (added, modified) counts (0 or 1 each).
         """
-        file_exists = local_file.exists()
+        if not local_file.exists():
+            install_file(remote_file, local_file)
+            return 1, 0
 
-        if strategy == MergeStrategy.KEEP_LOCAL and file_exists:
+        if strategy == MergeStrategy.KEEP_LOCAL or not self._files_differ(local_file, remote_file):
             return 0, 0
 
-        if strategy in (MergeStrategy.KEEP_REMOTE, MergeStrategy.REPLACE):
-            local_file.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(remote_file, local_file)
-            return (0, 1) if file_exists else (1, 0)
-
         if strategy == MergeStrategy.MERGE:
-            if not file_exists:
-                local_file.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(remote_file, local_file)
-                return 1, 0
-            if self._files_differ(local_file, remote_file):
-                # Create .remote version for manual merge
-                remote_version = local_file.with_suffix(local_file.suffix + ".remote")
-                shutil.copy2(remote_file, remote_version)
-                return 0, 1
-
-        return 0, 0
+            # Create .remote version for manual merge
+            remote_version = local_file.with_suffix(local_file.suffix + ".remote")
+            install_file(remote_file, remote_version)
+        else:
+            install_file(remote_file, local_file)
+        return 0, 1
 
     def _calc_duration(self, start_time: datetime) -> float:
         """Calculate duration in seconds from start time."""
@@ -6,8 +6,11 @@ tool calls, and events across all supported AI assistant vendors.
 
 from __future__ import annotations
 
+from ai_asst_mgr.tracking.buffered_writer import BufferedEventWriter, WriterStats
 from ai_asst_mgr.tracking.session_tracker import VendorSessionTracker
 
 __all__ = [
+    "BufferedEventWriter",
     "VendorSessionTracker",
+    "WriterStats",
 ]
@@ -0,0 +1,350 @@
+"""Background buffered event writer for session tracking.
+
+Tracker calls run on the hook path that the AI assistant waits on, and a
+synchronous INSERT and COMMIT per event puts SQLite fsync latency in front of
+every tool call. BufferedEventWriter moves that work to a background thread:
+callers enqueue events into a bounded queue and return immediately, and the
+thread writes them in group commits every ``flush_interval_ms`` or
+``batch_size`` events, whichever comes first.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from ai_asst_mgr.database.manager import EventRecord
+from ai_asst_mgr.utils.metrics import REGISTRY
+
+if TYPE_CHECKING:
+    from ai_asst_mgr.database.manager import DatabaseManager
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_QUEUE_SIZE = 10_000
+DEFAULT_FLUSH_INTERVAL_MS = 50.0
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_PUT_TIMEOUT_SECONDS = 1.0
+
+# Metrics exported through the web dashboard's /metrics endpoint
+_QUEUE_DEPTH = REGISTRY.gauge(
+    "ai_asst_mgr_tracker_queue_depth",
+    "Events waiting in the buffered tracker queue.",
+)
+_EVENTS_SUBMITTED = REGISTRY.counter(
+    "ai_asst_mgr_tracker_events_submitted_total",
+    "Events accepted into the buffered tracker queue.",
+)
+_EVENTS_WRITTEN = REGISTRY.counter(
+    "ai_asst_mgr_tracker_events_written_total",
+    "Events committed to the database by the buffered writer.",
+)
+_EVENTS_DROPPED = REGISTRY.counter(
+    "ai_asst_mgr_tracker_events_dropped_total",
+    "Events discarded because the queue stayed full or a write failed.",
+    ("reason",),
+)
+_QUEUE_FULL = REGISTRY.counter(
+    "ai_asst_mgr_tracker_queue_full_total",
+    "Submissions that found the tracker queue full (backpressure).",
+)
+_BACKPRESSURE_WAIT = REGISTRY.histogram(
+    "ai_asst_mgr_tracker_backpressure_wait_seconds",
+    "Time callers spent waiting for space in a full tracker queue.",
+)
+_BATCH_SIZE = REGISTRY.histogram(
+    "ai_asst_mgr_tracker_batch_size",
+    "Events written per group commit.",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+_COMMIT_DURATION = REGISTRY.histogram(
+    "ai_asst_mgr_tracker_commit_duration_seconds",
+    "Latency of buffered tracker group commits in seconds.",
+)
+
+# Sentinel telling the writer thread to commit what it has and exit
+_STOP = object()
+
+
+@dataclass
+class WriterStats:
+    """Counters for a single BufferedEventWriter.
+
+    Attributes:
+        submitted: Events accepted into the queue.
+        written: Events committed to the database.
+        dropped: Events discarded (queue full past the timeout, or write failure).
+        queue_full: Submissions that found the queue full.
+        batches: Group commits performed.
+        write_errors: Group commits that failed.
+        max_queue_depth: Highest queue depth observed at submission.
+    """
+
+    submitted: int = 0
+    written: int = 0
+    dropped: int = 0
+    queue_full: int = 0
+    batches: int = 0
+    write_errors: int = 0
+    max_queue_depth: int = 0
+
+
+def _sqlite_now() -> str:
+    """Return the current UTC time in SQLite's ``datetime('now')`` format."""
+    return datetime.now(tz=UTC).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _time_left(deadline: float | None) -> float | None:
+    """Seconds until a ``time.monotonic()`` deadline, or None for no deadline."""
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+
+class BufferedEventWriter:
+    """Writes tracker events to the database from a background thread.
+
+    Events are timestamped when submitted, not when committed, so buffering
+    does not shift event times. Call flush() to wait for everything submitted
+    so far to be committed, and close() (also registered with atexit) to
+    drain the queue and stop the thread.
+
+    When the queue is full, submit() blocks for up to ``put_timeout`` seconds
+    (or not at all when ``block`` is False) and then drops the event. Both
+    cases are counted in WriterStats and the tracker backpressure metrics.
+    """
+
+    def __init__(
+        self,
+        db: DatabaseManager,
+        *,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        flush_interval_ms: float = DEFAULT_FLUSH_INTERVAL_MS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        block: bool = True,
+        put_timeout: float = DEFAULT_PUT_TIMEOUT_SECONDS,
+    ) -> None:
+        """Initialize the writer and start its background thread.
+
+        Args:
+            db: DatabaseManager the events are written to.
+            max_queue_size: Maximum number of events waiting to be written.
+            flush_interval_ms: Longest time an event waits before its batch commits.
+            batch_size: Number of events that triggers an immediate commit.
+            block: Whether submit() waits for queue space when the queue is full.
+            put_timeout: Seconds submit() waits for queue space before dropping.
+        """
+        self._db = db
+        self._flush_interval = flush_interval_ms / 1000
+        self._batch_size = max(batch_size, 1)
+        self._block = block
+        self._put_timeout = put_timeout
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=max_queue_size)
+        self._stats = WriterStats()
+        self._lock = threading.Lock()
+        # Signalled when the last in-flight submit() finishes, so close() can
+        # queue the stop marker behind every event already accepted
+        self._submits_done = threading.Condition(self._lock)
+        self._submitting = 0
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="ai-asst-mgr-event-writer", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    @property
+    def closed(self) -> bool:
+        """Whether close() has been called."""
+        return self._closed
+
+    def stats(self) -> WriterStats:
+        """Return a snapshot of the writer's counters.
+
+        Returns:
+            Copy of the current WriterStats.
+        """
+        with self._lock:
+            return replace(self._stats)
+
+    def submit(self, event: EventRecord) -> bool:
+        """Queue an event for writing.
+
+        Args:
+            event: Event to write. Its timestamp is set to now if missing.
+
+        Returns:
+            True if the event was queued, False if it was dropped.
+
+        Raises:
+            RuntimeError: If the writer has been closed.
+        """
+        with self._lock:
+            if self._closed:
+                msg = "BufferedEventWriter is closed"
+                raise RuntimeError(msg)
+            self._submitting += 1
+        try:
+            return self._enqueue(event)
+        finally:
+            with self._lock:
+                self._submitting -= 1
+                if not self._submitting:
+                    self._submits_done.notify_all()
+
+    def _enqueue(self, event: EventRecord) -> bool:
+        """Stamp and queue an event, applying the backpressure policy.
+
+        Args:
+            event: Event to write.
+
+        Returns:
+            True if the event was queued, False if it was dropped.
+        """
+        if event.timestamp is None:
+            event.timestamp = _sqlite_now()
+
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            if not self._enqueue_under_backpressure(event):
+                return False
+
+        depth = self._queue.qsize()
+        _EVENTS_SUBMITTED.inc()
+        _QUEUE_DEPTH.set(depth)
+        with self._lock:
+            self._stats.submitted += 1
+            self._stats.max_queue_depth = max(self._stats.max_queue_depth, depth)
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every event submitted so far has been committed.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely).
+
+        Returns:
+            True if the flush completed, False if it timed out.
+        """
+        with self._lock:
+            closed = self._closed
+        if closed or not self._thread.is_alive():
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        marker = threading.Event()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.wait(_time_left(deadline))
+
+    def close(self, timeout: float | None = None) -> None:
+        """Commit pending events and stop the background thread.
+
+        Submits already in progress are allowed to finish first, so their
+        events are written before the thread stops.
+
+        Args:
+            timeout: Maximum seconds to wait for the thread to finish.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._submits_done.wait_for(lambda: not self._submitting, timeout)
+        atexit.unregister(self.close)
+        if self._thread.is_alive():
+            try:
+                self._queue.put(_STOP, timeout=_time_left(deadline))
+            except queue.Full:
+                return
+            self._thread.join(_time_left(deadline))
+
+    def _enqueue_under_backpressure(self, event: EventRecord) -> bool:
+        """Handle a full queue according to the blocking policy.
+
+        Args:
+            event: Event that did not fit in the queue.
+
+        Returns:
+            True if the event was eventually queued, False if it was dropped.
+        """
+        _QUEUE_FULL.inc()
+        with self._lock:
+            self._stats.queue_full += 1
+
+        if self._block:
+            started = time.perf_counter()
+            try:
+                self._queue.put(event, timeout=self._put_timeout)
+            except queue.Full:
+                pass
+            else:
+                return True
+            finally:
+                _BACKPRESSURE_WAIT.observe(time.perf_counter() - started)
+
+        _EVENTS_DROPPED.inc(reason="queue_full")
+        with self._lock:
+            self._stats.dropped += 1
+        return False
+
+    def _run(self) -> None:
+        """Collect queued events into batches and commit them."""
+        batch: list[EventRecord] = []
+        deadline = 0.0
+        while True:
+            timeout = None if not batch else max(deadline - time.monotonic(), 0.0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None  # group-commit interval elapsed
+
+            if isinstance(item, EventRecord):
+                if not batch:
+                    deadline = time.monotonic() + self._flush_interval
+                batch.append(item)
+                if len(batch) < self._batch_size:
+                    continue
+
+            self._commit(batch)
+            batch = []
+            _QUEUE_DEPTH.set(self._queue.qsize())
+
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is _STOP:
+                return
+
+    def _commit(self, batch: list[EventRecord]) -> None:
+        """Write one batch in a single transaction.
+
+        Args:
+            batch: Events to write; may be empty.
+        """
+        if not batch:
+            return
+        try:
+            with _COMMIT_DURATION.time():
+                self._db.record_events(batch)
+        except Exception:
+            _logger.exception("Failed to write %d tracker events", len(batch))
+            _EVENTS_DROPPED.inc(len(batch), reason="write_error")
+            with self._lock:
+                self._stats.write_errors += 1
+                self._stats.dropped += len(batch)
+            return
+
+        _EVENTS_WRITTEN.inc(len(batch))
+        _BATCH_SIZE.observe(len(batch))
+        with self._lock:
+            self._stats.written += len(batch)
+            self._stats.batches += 1
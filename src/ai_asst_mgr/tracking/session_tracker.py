@@ -13,10 +13,12 @@ from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
-from ai_asst_mgr.database.manager import DatabaseManager, VendorStats
+from ai_asst_mgr.database.manager import DatabaseManager, EventRecord, VendorStats
+from ai_asst_mgr.tracking.buffered_writer import BufferedEventWriter
 
 if TYPE_CHECKING:
     from pathlib import Path
+    from types import TracebackType
 
 
 # Patterns for credential redaction
@@ -52,6 +54,11 @@ class VendorSessionTracker:
     logging tool calls and messages, and tracking errors with
     automatic credential redaction.
 
+    By default every event is written synchronously. With ``buffered=True``
+    (or an explicit ``writer``) events are handed to a BufferedEventWriter
+    and committed in groups by a background thread; end_session(), flush()
+    and close() wait for pending events to be written.
+
     Attributes:
         db_path: Path to the SQLite database.
         vendor_id: Default vendor identifier for sessions.
@@ -63,6 +70,8 @@ class VendorSessionTracker:
         vendor_id: str = "claude",
         *,
         auto_initialize: bool = True,
+        buffered: bool = False,
+        writer: BufferedEventWriter | None = None,
     ) -> None:
         """Initialize the session tracker.
 
@@ -70,6 +79,9 @@ class VendorSessionTracker:
             db_path: Path to the SQLite database file.
             vendor_id: Default vendor identifier (claude, gemini, openai).
             auto_initialize: Whether to auto-initialize database schema.
+            buffered: Write events through a background BufferedEventWriter
+                with default settings.
+            writer: Custom BufferedEventWriter to use (implies buffered).
         """
         self.db_path = db_path
         self.vendor_id = vendor_id
@@ -79,6 +91,46 @@ class VendorSessionTracker:
         if auto_initialize:
             self._db.initialize()
 
+        if writer is None and buffered:
+            writer = BufferedEventWriter(self._db)
+        self._writer = writer
+
+    def __enter__(self) -> VendorSessionTracker:
+        """Return the tracker for use in a with block."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Write pending events and stop the background writer, if any."""
+        self.close()
+
+    @property
+    def writer(self) -> BufferedEventWriter | None:
+        """The background event writer, or None when writing synchronously."""
+        return self._writer
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until all buffered events have been written.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely).
+
+        Returns:
+            True if all events were written (always True when unbuffered).
+        """
+        if self._writer is None:
+            return True
+        return self._writer.flush(timeout)
+
+    def close(self) -> None:
+        """Write pending events and stop the background writer, if any."""
+        if self._writer is not None:
+            self._writer.close()
+
     def start_session(
         self,
         vendor_id: str | None = None,
@@ -126,6 +178,7 @@ class VendorSessionTracker:
             Summary of the session including duration and counts.
         """
         context = self._active_sessions.pop(session_id, None)
+        self.flush()
 
         if context:
             self._db.end_session(
@@ -186,13 +239,7 @@ class VendorSessionTracker:
         if tool_output:
             event_data["output_hash"] = self._hash_content(tool_output)
 
-        self._db.record_event(
-            session_id=session_id,
-            vendor_id=vendor,
-            event_type="tool_call",
-            event_name=tool_name,
-            event_data=event_data,
-        )
+        self._record_event(session_id, vendor, "tool_call", tool_name, event_data)
 
     def log_message(
         self,
@@ -220,13 +267,7 @@ class VendorSessionTracker:
         if content_length is not None:
             event_data["content_length"] = content_length
 
-        self._db.record_event(
-            session_id=session_id,
-            vendor_id=vendor,
-            event_type="message",
-            event_name=role,
-            event_data=event_data,
-        )
+        self._record_event(session_id, vendor, "message", role, event_data)
 
     def log_error(
         self,
@@ -254,13 +295,7 @@ class VendorSessionTracker:
         if error_message:
             event_data["message"] = self._redact_text(error_message)
 
-        self._db.record_event(
-            session_id=session_id,
-            vendor_id=vendor,
-            event_type="error",
-            event_name=error_type,
-            event_data=event_data,
-        )
+        self._record_event(session_id, vendor, "error", error_type, event_data)
 
     def get_active_sessions(self) -> list[str]:
         """Get list of active session IDs.
@@ -308,6 +343,37 @@ class VendorSessionTracker:
         vendor = vendor_id or self.vendor_id
         return self._db.get_vendor_stats(vendor, days)
 
+    def _record_event(
+        self,
+        session_id: str,
+        vendor_id: str,
+        event_type: str,
+        event_name: str,
+        event_data: dict[str, Any],
+    ) -> None:
+        """Record an event directly or through the background writer.
+
+        Args:
+            session_id: The session ID.
+            vendor_id: Vendor identifier.
+            event_type: Type of event (tool_call, message, error).
+            event_name: Event name.
+            event_data: Event data dictionary.
+        """
+        if self._writer is not None:
+            self._writer.submit(
+                EventRecord(session_id, vendor_id, event_type, event_name, event_data)
+            )
+            return
+
+        self._db.record_event(
+            session_id=session_id,
+            vendor_id=vendor_id,
+            event_type=event_type,
+            event_name=event_name,
+            event_data=event_data,
+        )
+
     def _redact_credentials(self, data: dict[str, Any]) -> dict[str, Any]:
         """Redact credentials from a dictionary.
 
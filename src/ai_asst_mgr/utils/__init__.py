@@ -3,6 +3,21 @@
 This package provides common utility functions used across the application.
 """
 
+from ai_asst_mgr.utils.archive import (
+    ArchiveStats,
+    ExtractedArchive,
+    extract_tar_archive,
+    scan_tar_archive,
+    write_tar_archive,
+)
+from ai_asst_mgr.utils.archive_index import ArchiveIndex, index_path_for
+from ai_asst_mgr.utils.clone_cache import CloneCache
+from ai_asst_mgr.utils.compression import CompressionSettings, available_codecs
+from ai_asst_mgr.utils.exclusions import (
+    ExclusionReport,
+    ExclusionRules,
+    carry_over_excluded,
+)
 from ai_asst_mgr.utils.git import (
     GitError,
     GitNotFoundError,
@@ -12,8 +27,10 @@ from ai_asst_mgr.utils.git import (
     is_command_available,
     is_git_installed,
     validate_git_branch,
+    validate_git_path,
     validate_git_url,
 )
+from ai_asst_mgr.utils.repo_discovery import DEFAULT_PRUNE_DIRS, RepoDiscovery
 from ai_asst_mgr.utils.tarfile_safe import (
     TarfileSecurityError,
     get_safe_members,
@@ -22,21 +39,45 @@ from ai_asst_mgr.utils.tarfile_safe import (
     unpack_members_securely,
     unpack_tar_securely,
 )
+from ai_asst_mgr.utils.tree_apply import ApplyResult, apply_tree_diff
+from ai_asst_mgr.utils.tree_index import HashCache, TreeDiff, TreeSnapshot, diff_trees
 
 __all__ = [
+    "DEFAULT_PRUNE_DIRS",
+    "ApplyResult",
+    "ArchiveIndex",
+    "ArchiveStats",
+    "CloneCache",
+    "CompressionSettings",
+    "ExclusionReport",
+    "ExclusionRules",
+    "ExtractedArchive",
     "GitError",
     "GitNotFoundError",
     "GitValidationError",
+    "HashCache",
+    "RepoDiscovery",
     "TarfileSecurityError",
+    "TreeDiff",
+    "TreeSnapshot",
+    "apply_tree_diff",
+    "available_codecs",
+    "carry_over_excluded",
+    "diff_trees",
+    "extract_tar_archive",
     "find_git_executable",
     "get_safe_members",
     "git_clone",
+    "index_path_for",
     "is_command_available",
     "is_git_installed",
     "is_member_safe",
     "is_path_safe",
+    "scan_tar_archive",
     "unpack_members_securely",
     "unpack_tar_securely",
     "validate_git_branch",
+    "validate_git_path",
     "validate_git_url",
+    "write_tar_archive",
 ]
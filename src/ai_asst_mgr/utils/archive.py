@@ -0,0 +1,318 @@
+"""Single-pass backup archive creation and scanning.
+
+Backups used to be written by ``tarfile`` and then read back twice: once to
+compute the SHA256 checksum and once (fully decompressed) to count files. The
+helpers here capture the checksum, compressed size and file count while the
+archive bytes stream through, so each archive is written or read exactly once.
+
+The pipeline is ``tar writer -> block compressor -> hashing tee -> file``. The
+tee hashes the compressed bytes, so the checksum is identical to hashing the
+finished file and stays compatible with existing manifests. Member offsets and
+block positions are captured on the way through as well and saved as the
+archive's sidecar index (see archive_index). Restores run the same pipeline in
+reverse, hashing the archive while its members are extracted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import lzma
+import tarfile
+import zlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from ai_asst_mgr.utils.archive_index import ArchiveIndex, IndexedMember, index_path_for
+from ai_asst_mgr.utils.compression import (
+    BlockCompressor,
+    CompressionSettings,
+    detect_codec,
+    open_decompressed,
+)
+from ai_asst_mgr.utils.extraction import DEFAULT_EXTRACT_WORKERS, ParallelExtractor
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import BinaryIO
+
+    from ai_asst_mgr.utils.exclusions import ExclusionRules
+
+# Read size used when draining an archive after its last tar member
+_READ_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ArchiveStats:
+    """Facts about a backup archive gathered in a single pass.
+
+    Attributes:
+        path: Path to the archive file.
+        checksum: SHA256 hex digest of the archive file.
+        size_bytes: Size of the archive file in bytes.
+        file_count: Number of regular files in the archive.
+        member_count: Number of tar members (files, directories, links).
+    """
+
+    path: Path
+    checksum: str
+    size_bytes: int
+    file_count: int
+    member_count: int
+
+
+@dataclass(frozen=True)
+class ExtractedArchive:
+    """Result of extracting a backup archive in a single pass.
+
+    Attributes:
+        stats: Checksum and size of the archive, with counts of the members
+            that were extracted.
+        root_name: Top-level directory of the archive's members.
+        pax_headers: The archive's PAX global header (e.g. exclusion rules).
+    """
+
+    stats: ArchiveStats
+    root_name: str
+    pax_headers: dict[str, str]
+
+
+class _HashingWriter:
+    """Write-only file wrapper that hashes and counts bytes on the way through."""
+
+    def __init__(self, raw: BinaryIO) -> None:
+        self._raw = raw
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self.sha256.update(data)
+        self.size += len(data)
+        return self._raw.write(data)
+
+    def flush(self) -> None:
+        self._raw.flush()
+
+
+class _HashingReader:
+    """Read-only file wrapper that hashes and counts bytes as they are consumed."""
+
+    def __init__(self, raw: BinaryIO) -> None:
+        self._raw = raw
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._raw.read(size)
+        self.sha256.update(data)
+        self.size += len(data)
+        return data
+
+    def close(self) -> None:
+        """Leave the underlying file open; its owner closes it."""
+
+    def drain(self) -> None:
+        """Consume (and hash) whatever tarfile left unread, such as end padding."""
+        while self.read(_READ_CHUNK_SIZE):
+            pass
+
+
+def write_tar_archive(
+    source_dir: Path,
+    archive_path: Path,
+    arcname: str,
+    compression: CompressionSettings | None = None,
+    exclusions: ExclusionRules | None = None,
+) -> ArchiveStats:
+    """Archive and compress a directory, collecting its stats in the same pass.
+
+    The archive is written to a temporary file next to ``archive_path`` and
+    renamed into place once complete, so a failed backup never leaves a
+    truncated archive behind. Its member index is saved alongside it as
+    ``<archive>.idx`` for random-access listing and extraction. Excluded paths
+    are skipped without being read (excluded directories are not descended
+    into), and the rules are recorded in the archive's PAX global header for
+    restore.
+
+    Args:
+        source_dir: Directory to archive.
+        archive_path: Destination archive path.
+        arcname: Name of the top-level directory inside the archive.
+        compression: Codec settings (defaults to multithreaded gzip).
+        exclusions: Paths to leave out of the archive.
+
+    Returns:
+        ArchiveStats for the finished archive.
+
+    Raises:
+        OSError: If the source cannot be read or the archive cannot be written.
+        tarfile.TarError: If tar encoding fails.
+    """
+    file_count = 0
+    member_count = 0
+    # (header, stream offset) of each member; the filter runs just before
+    # tarfile writes the member's headers, so tar.offset is where they start
+    starts: list[tuple[tarfile.TarInfo, int]] = []
+
+    def count(member: tarfile.TarInfo) -> tarfile.TarInfo | None:
+        nonlocal file_count, member_count
+        rel_path = member.name.partition("/")[2]
+        if (
+            exclusions
+            and rel_path
+            and exclusions.match(rel_path, is_dir=member.isdir(), size=member.size)
+        ):
+            return None
+        member_count += 1
+        if member.isfile():
+            file_count += 1
+        starts.append((member, tar.offset))
+        return member
+
+    settings = compression or CompressionSettings()
+    pax_headers = exclusions.to_pax_headers() if exclusions else {}
+    partial_path = archive_path.with_name(f"{archive_path.name}.partial")
+    try:
+        with partial_path.open("wb") as raw:
+            tee = _HashingWriter(raw)
+            with (
+                BlockCompressor(tee, settings) as compressor,  # type: ignore[arg-type]
+                tarfile.open(  # type: ignore[call-overload]
+                    fileobj=compressor, mode="w|", pax_headers=pax_headers or None
+                ) as tar,
+            ):
+                tar.add(source_dir, arcname=arcname, filter=count)
+                end = tar.offset
+        ends = [offset for _, offset in starts[1:]] + [end]
+        ArchiveIndex(
+            archive_path=archive_path,
+            codec=settings.codec,
+            checksum=tee.sha256.hexdigest(),
+            size_bytes=tee.size,
+            blocks=compressor.blocks,
+            members=[
+                IndexedMember.from_tarinfo(info, start, stop)
+                for (info, start), stop in zip(starts, ends, strict=True)
+            ],
+            pax_headers=pax_headers,
+        ).save()
+        partial_path.replace(archive_path)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        index_path_for(archive_path).unlink(missing_ok=True)
+        raise
+
+    return ArchiveStats(
+        path=archive_path,
+        checksum=tee.sha256.hexdigest(),
+        size_bytes=tee.size,
+        file_count=file_count,
+        member_count=member_count,
+    )
+
+
+def scan_tar_archive(archive_path: Path) -> ArchiveStats:
+    """Checksum and count an existing archive in one sequential read.
+
+    Used for archives that were not produced by write_tar_archive. The file is
+    decompressed as a stream while its raw bytes are hashed, instead of
+    reading it once for the checksum and again for the member list.
+
+    Args:
+        archive_path: Archive to scan (any compression tarfile understands).
+
+    Returns:
+        ArchiveStats for the archive.
+
+    Raises:
+        OSError: If the archive cannot be read.
+        tarfile.TarError: If the archive is not a valid tar file.
+    """
+    file_count = 0
+    member_count = 0
+    codec = detect_codec(archive_path)
+    with archive_path.open("rb") as raw:
+        tee = _HashingReader(raw)
+        decompressed = open_decompressed(tee, codec)  # type: ignore[arg-type]
+        try:
+            with tarfile.open(fileobj=decompressed, mode="r|") as tar:
+                for member in tar:
+                    member_count += 1
+                    if member.isfile():
+                        file_count += 1
+        except (EOFError, OSError, lzma.LZMAError, zlib.error) as e:
+            # Corrupt or truncated compressed data, reported like tarfile does
+            msg = f"Invalid compressed data: {e}"
+            raise tarfile.ReadError(msg) from e
+        finally:
+            decompressed.close()
+        tee.drain()
+
+    return ArchiveStats(
+        path=archive_path,
+        checksum=tee.sha256.hexdigest(),
+        size_bytes=tee.size,
+        file_count=file_count,
+        member_count=member_count,
+    )
+
+
+def extract_tar_archive(
+    archive_path: Path, dest_dir: Path, max_workers: int = DEFAULT_EXTRACT_WORKERS
+) -> ExtractedArchive:
+    """Extract an archive while checksumming and counting it in the same read.
+
+    Files are written by a ParallelExtractor thread pool while the archive is
+    decompressed. Members that fail is_member_safe() (absolute paths, ``..``
+    traversal, links escaping ``dest_dir``) are skipped, as
+    unpack_tar_securely() does. The caller should compare the returned
+    checksum with the recorded one before using anything written to
+    ``dest_dir``.
+
+    Args:
+        archive_path: Archive to extract (any codec detect_codec() recognises).
+        dest_dir: Directory to extract into.
+        max_workers: Number of threads writing files.
+
+    Returns:
+        ExtractedArchive describing the archive and what was extracted.
+
+    Raises:
+        OSError: If the archive cannot be read or the files cannot be written.
+        tarfile.TarError: If the archive is not a valid tar file.
+    """
+    file_count = 0
+    member_count = 0
+    root_name = ""
+    codec = detect_codec(archive_path)
+    with archive_path.open("rb") as raw:
+        tee = _HashingReader(raw)
+        decompressed = open_decompressed(tee, codec)  # type: ignore[arg-type]
+        try:
+            with (
+                tarfile.open(fileobj=decompressed, mode="r|") as tar,
+                ParallelExtractor(dest_dir, max_workers) as extractor,
+            ):
+                for member in tar:
+                    if not extractor.extract(tar, member):
+                        continue
+                    root_name = root_name or member.name.split("/")[0]
+                    member_count += 1
+                    if member.isfile():
+                        file_count += 1
+                extractor.finish()
+                pax_headers = dict(tar.pax_headers or {})
+        except (EOFError, lzma.LZMAError, zlib.error) as e:
+            msg = f"Invalid compressed data: {e}"
+            raise tarfile.ReadError(msg) from e
+        finally:
+            decompressed.close()
+        tee.drain()
+
+    stats = ArchiveStats(
+        path=archive_path,
+        checksum=tee.sha256.hexdigest(),
+        size_bytes=tee.size,
+        file_count=file_count,
+        member_count=member_count,
+    )
+    return ExtractedArchive(stats=stats, root_name=root_name, pax_headers=pax_headers)
@@ -0,0 +1,309 @@
+"""Random-access member index for backup archives.
+
+A ``.tar.gz`` has no table of contents: listing it, or pulling one directory
+out of it, means decompressing everything in front of the wanted members.
+write_tar_archive() therefore writes a small sidecar next to each archive
+(``<archive>.idx``, gzip-compressed JSON) recording:
+
+- every tar member's metadata and its byte range in the uncompressed stream;
+- every independently compressed block (see BlockCompressor) with its
+  uncompressed and compressed offsets and a CRC-32 of the compressed bytes.
+
+Listing a backup then reads only the sidecar, and extracting a subset of
+members seeks to and decompresses only the blocks that cover them. The
+archive itself is unchanged and stays readable by ``tar`` and ``tarfile``;
+archives without a usable sidecar fall back to a sequential read.
+"""
+
+from __future__ import annotations
+
+import bisect
+import gzip
+import json
+import lzma
+import tarfile
+import tempfile
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from ai_asst_mgr.utils.compression import CODECS, CompressedBlock, available_codecs
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+    from typing import BinaryIO
+
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 1
+
+# Selected members are staged in memory up to this size, then spill to disk
+_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+
+def index_path_for(archive_path: Path) -> Path:
+    """Get the sidecar index path for an archive.
+
+    Args:
+        archive_path: Path to the backup archive.
+
+    Returns:
+        Path of the archive's member index.
+    """
+    return archive_path.with_name(f"{archive_path.name}{INDEX_SUFFIX}")
+
+
+@dataclass(frozen=True)
+class IndexedMember:
+    """A tar member and its position in the uncompressed archive stream.
+
+    Attributes:
+        name: Member name, including the archive's top-level directory.
+        type: Tar type flag (e.g. "0" for files, "5" for directories).
+        size: Size of the member's data in bytes.
+        mode: Permission bits.
+        mtime: Modification time in seconds.
+        linkname: Link target for symbolic and hard links.
+        start: Offset of the member's first header block.
+        end: Offset just past the member's padded data.
+    """
+
+    name: str
+    type: str
+    size: int
+    mode: int
+    mtime: int
+    linkname: str
+    start: int
+    end: int
+
+    @classmethod
+    def from_tarinfo(cls, info: tarfile.TarInfo, start: int, end: int) -> IndexedMember:
+        """Describe a member written to an archive.
+
+        Args:
+            info: The member's tar header.
+            start: Stream offset where its header starts.
+            end: Stream offset where the next member starts.
+
+        Returns:
+            IndexedMember for the header.
+        """
+        return cls(
+            name=info.name,
+            type=info.type.decode("ascii"),
+            size=info.size,
+            mode=info.mode,
+            mtime=int(info.mtime),
+            linkname=info.linkname,
+            start=start,
+            end=end,
+        )
+
+    def to_tarinfo(self) -> tarfile.TarInfo:
+        """Build a tar header for listing (ownership is not recorded).
+
+        Returns:
+            TarInfo with name, type, size, mode, mtime and link target set.
+        """
+        info = tarfile.TarInfo(self.name)
+        info.type = self.type.encode("ascii")
+        info.size = self.size
+        info.mode = self.mode
+        info.mtime = self.mtime
+        info.linkname = self.linkname
+        return info
+
+
+@dataclass(frozen=True)
+class ArchiveIndex:
+    """Sidecar index of a block-compressed backup archive.
+
+    Attributes:
+        archive_path: The archive this index describes.
+        codec: Codec name the archive's blocks were compressed with.
+        checksum: SHA256 hex digest of the archive, binding the index to it.
+        size_bytes: Size of the archive file in bytes.
+        blocks: Compressed blocks in stream order.
+        members: Tar members in stream order.
+        pax_headers: The archive's PAX global header (e.g. exclusion rules).
+    """
+
+    archive_path: Path
+    codec: str
+    checksum: str
+    size_bytes: int
+    blocks: list[CompressedBlock]
+    members: list[IndexedMember]
+    pax_headers: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, archive_path: Path) -> ArchiveIndex | None:
+        """Read an archive's sidecar index.
+
+        Args:
+            archive_path: Path to the backup archive.
+
+        Returns:
+            The index, or None if it is missing, unreadable, from another
+            format version, uses an unavailable codec, or does not match the
+            archive's current size.
+        """
+        try:
+            with gzip.open(index_path_for(archive_path), "rt", encoding="utf-8") as f:
+                data = json.load(f)
+            archive_size = archive_path.stat().st_size
+        except (OSError, EOFError, ValueError):
+            return None
+
+        try:
+            if data["version"] != INDEX_VERSION or data["size_bytes"] != archive_size:
+                return None
+            if data["codec"] not in available_codecs():
+                return None
+            return cls(
+                archive_path=archive_path,
+                codec=data["codec"],
+                checksum=data["checksum"],
+                size_bytes=data["size_bytes"],
+                blocks=[CompressedBlock(*block) for block in data["blocks"]],
+                members=[IndexedMember(*member) for member in data["members"]],
+                pax_headers=dict(data["pax_headers"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def save(self) -> Path:
+        """Write the index next to its archive, replacing any previous one.
+
+        Returns:
+            Path of the written index.
+
+        Raises:
+            OSError: If the index cannot be written.
+        """
+        data: dict[str, Any] = {
+            "version": INDEX_VERSION,
+            "codec": self.codec,
+            "checksum": self.checksum,
+            "size_bytes": self.size_bytes,
+            "pax_headers": self.pax_headers,
+            "blocks": [
+                [b.offset, b.size, b.compressed_offset, b.compressed_size, b.crc32]
+                for b in self.blocks
+            ],
+            "members": [
+                [m.name, m.type, m.size, m.mode, m.mtime, m.linkname, m.start, m.end]
+                for m in self.members
+            ],
+        }
+        index_path = index_path_for(self.archive_path)
+        partial_path = index_path.with_name(f"{index_path.name}.partial")
+        try:
+            with (
+                partial_path.open("wb") as raw,
+                gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as f,
+            ):
+                f.write(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+            partial_path.replace(index_path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+        return index_path
+
+    def tarinfos(self) -> list[tarfile.TarInfo]:
+        """List the archive's members without opening the archive.
+
+        Returns:
+            TarInfo for every member, in archive order.
+        """
+        return [member.to_tarinfo() for member in self.members]
+
+    @contextmanager
+    def open_members(self, members: Iterable[IndexedMember]) -> Iterator[tarfile.TarFile]:
+        """Open a tar stream holding only the given members.
+
+        Only the blocks covering the members are read and decompressed. Each
+        member's original headers are copied verbatim, so the result can be
+        extracted with the usual secure extraction helpers.
+
+        Args:
+            members: Members of this index to include.
+
+        Yields:
+            TarFile over the selected members, in archive order.
+
+        Raises:
+            tarfile.ReadError: If a block is corrupt or the archive is truncated.
+            OSError: If the archive cannot be read.
+        """
+        reader = _BlockReader(self)
+        with (
+            self.archive_path.open("rb") as raw,
+            tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as spool,
+        ):
+            for start, end in _merge_ranges(members):
+                reader.copy_range(raw, start, end, spool)  # type: ignore[arg-type]
+            # End-of-archive marker, so an empty selection is still a valid tar
+            spool.write(tarfile.NUL * 2 * tarfile.BLOCKSIZE)
+            spool.seek(0)
+            with tarfile.open(fileobj=spool, mode="r:") as tar:
+                yield tar
+
+
+class _BlockReader:
+    """Copies uncompressed byte ranges out of an indexed archive."""
+
+    def __init__(self, index: ArchiveIndex) -> None:
+        self._blocks = index.blocks
+        self._offsets = [block.offset for block in index.blocks]
+        self._decompress = CODECS[index.codec].decompress
+        # Consecutive ranges usually share a block; keep the last one decoded
+        self._cached: tuple[int, bytes] | None = None
+
+    def copy_range(self, raw: BinaryIO, start: int, end: int, out: BinaryIO) -> None:
+        """Write bytes [start, end) of the uncompressed stream to ``out``."""
+        number = max(bisect.bisect_right(self._offsets, start) - 1, 0)
+        while start < end:
+            if number >= len(self._blocks):
+                msg = f"Archive index points past the last block (offset {start})"
+                raise tarfile.ReadError(msg)
+            block = self._blocks[number]
+            data = self._block(raw, number)
+            stop = min(end, block.offset + block.size)
+            out.write(data[start - block.offset : stop - block.offset])
+            start = stop
+            number += 1
+
+    def _block(self, raw: BinaryIO, number: int) -> bytes:
+        """Read, check and decompress one block."""
+        if self._cached is not None and self._cached[0] == number:
+            return self._cached[1]
+        block = self._blocks[number]
+        raw.seek(block.compressed_offset)
+        payload = raw.read(block.compressed_size)
+        if len(payload) != block.compressed_size or zlib.crc32(payload) != block.crc32:
+            msg = f"Archive block {number} is corrupt or truncated"
+            raise tarfile.ReadError(msg)
+        try:
+            data = self._decompress(payload)
+        except (EOFError, OSError, lzma.LZMAError, zlib.error) as e:
+            msg = f"Invalid compressed data in block {number}: {e}"
+            raise tarfile.ReadError(msg) from e
+        if len(data) != block.size:
+            msg = f"Archive block {number} decompressed to an unexpected size"
+            raise tarfile.ReadError(msg)
+        self._cached = (number, data)
+        return data
+
+
+def _merge_ranges(members: Iterable[IndexedMember]) -> list[tuple[int, int]]:
+    """Sort member byte ranges and join adjacent ones."""
+    ranges: list[tuple[int, int]] = []
+    for member in sorted(members, key=lambda m: m.start):
+        if ranges and ranges[-1][1] == member.start:
+            ranges[-1] = (ranges[-1][0], member.end)
+        else:
+            ranges.append((member.start, member.end))
+    return ranges
@@ -0,0 +1,293 @@
+"""Persistent cache of Git repositories used as sync sources.
+
+Syncing used to clone the source repository into a temporary directory for
+every operation: a preview cloned it, the sync that followed cloned it again,
+and syncing all vendors cloned it once per vendor. For a dotfiles repository
+with a long history each of those was a full network transfer.
+
+CloneCache keeps one bare repository per URL under a cache directory. The
+first use fetches the branch; later uses run ``git fetch``, which only
+transfers commits the cache does not have yet.
+
+Fetches are shallow (the branch head only) and blob-filtered: commits and
+trees arrive, file contents do not. Checking out a set of paths first
+fetches the missing contents under those paths in one batch, then writes
+them with ``git checkout`` against a throwaway index, so nothing but the
+objects themselves is left in the cache. Transfer therefore scales with the
+files a vendor syncs rather than with the repository or its history.
+Servers without partial-clone support ignore the filter and send
+everything, which still works.
+
+Within one CloneCache instance each (URL, branch) pair is fetched at most
+once, so a preview followed by a sync, or a sync of every vendor, shares a
+single fetch.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ai_asst_mgr.utils.git import (
+    BLOB_FILTER,
+    GitNotFoundError,
+    GitValidationError,
+    is_git_installed,
+    validate_git_branch,
+    validate_git_path,
+    validate_git_url,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from git import Repo
+
+# Length of the URL hash naming each cached repository
+_KEY_LENGTH = 16
+
+# Remote name recorded in each cached repository
+_REMOTE_NAME = "origin"
+
+
+def cache_key(url: str) -> str:
+    """Get the directory name caching a repository URL.
+
+    Args:
+        url: Repository URL.
+
+    Returns:
+        A short, filesystem-safe hash of the URL.
+    """
+    return hashlib.sha256(url.encode()).hexdigest()[:_KEY_LENGTH]
+
+
+class CloneCache:
+    """Bare-repository cache of sync sources, keyed by URL.
+
+    Example:
+        >>> cache = CloneCache(Path("~/.config/ai-asst-mgr/repo-cache").expanduser())
+        >>> cache.checkout("https://github.com/user/dotfiles.git", Path("/tmp/src"))
+        True
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding one bare repository per URL.
+        """
+        self._cache_dir = cache_dir
+        self._fetched: dict[tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cache_dir(self) -> Path:
+        """Get the cache directory."""
+        return self._cache_dir
+
+    def repo_path(self, url: str) -> Path:
+        """Get the path of the bare repository caching a URL.
+
+        Args:
+            url: Repository URL.
+
+        Returns:
+            Path of the cached repository (which may not exist yet).
+        """
+        return self._cache_dir / f"{cache_key(url)}.git"
+
+    def fetch(self, url: str, branch: str = "main") -> str | None:
+        """Bring a branch of the cached repository up to date.
+
+        The first call for a (URL, branch) pair runs ``git fetch``; later
+        calls on the same instance return the commit fetched then.
+
+        Args:
+            url: Repository URL.
+            branch: Branch to fetch.
+
+        Returns:
+            SHA of the branch's head commit, or None if the fetch failed.
+
+        Raises:
+            GitValidationError: If the URL or branch fails validation.
+            GitNotFoundError: If Git is not installed.
+        """
+        _validate(url, branch)
+        key = (url, branch)
+        with self._lock:
+            if key not in self._fetched:
+                sha = self._fetch(url, branch)
+                if sha is None:
+                    return None
+                self._fetched[key] = sha
+            return self._fetched[key]
+
+    def checkout(
+        self,
+        url: str,
+        dest_dir: Path,
+        branch: str = "main",
+        paths: Sequence[str] | None = None,
+    ) -> bool:
+        """Write the files of a branch into a directory.
+
+        Args:
+            url: Repository URL.
+            dest_dir: Directory to write into; created if needed.
+            branch: Branch to check out.
+            paths: Files and directories, relative to the repository root, to
+                write. None writes the whole tree. Paths missing from the
+                branch are skipped.
+
+        Returns:
+            True if the files were written, False if fetching or checking out failed.
+
+        Raises:
+            GitValidationError: If the URL, branch or a path fails validation.
+            GitNotFoundError: If Git is not installed.
+        """
+        for path in paths or ():
+            if not validate_git_path(path):
+                msg = f"Invalid repository path: {path}"
+                raise GitValidationError(msg)
+        sha = self.fetch(url, branch)
+        if sha is None:
+            return False
+
+        from git.exc import GitCommandError  # noqa: PLC0415
+
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            repo = self._open(url)
+            pathspec = _existing_paths(repo, sha, paths) if paths is not None else ["."]
+            if pathspec:
+                _prefetch(repo, sha, pathspec)
+                _checkout(repo, sha, dest_dir, pathspec)
+        except GitCommandError:
+            return False
+        return True
+
+    def _fetch(self, url: str, branch: str) -> str | None:
+        """Fetch a branch into the cache and return its head commit."""
+        from git.exc import GitCommandError  # noqa: PLC0415
+
+        refspec = f"+refs/heads/{branch}:refs/heads/{branch}"
+        try:
+            repo = self._open(url)
+            try:
+                repo.git.fetch(
+                    _REMOTE_NAME, refspec, "--no-tags", "--depth=1", f"--filter={BLOB_FILTER}"
+                )
+            except GitCommandError:
+                # Some servers (e.g. dumb HTTP) cannot serve shallow fetches
+                repo.git.fetch(_REMOTE_NAME, refspec, "--no-tags")
+            return str(repo.git.rev_parse(f"refs/heads/{branch}^{{commit}}"))
+        except GitCommandError:
+            return None
+
+    def _open(self, url: str) -> Repo:
+        """Open the cached repository for a URL, creating it if needed."""
+        import git  # noqa: PLC0415
+        from git.exc import InvalidGitRepositoryError, NoSuchPathError  # noqa: PLC0415
+
+        path = self.repo_path(url)
+        try:
+            repo = git.Repo(path)
+        except (InvalidGitRepositoryError, NoSuchPathError):
+            # Missing, or damaged beyond use: start the cache over
+            shutil.rmtree(path, ignore_errors=True)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            repo = git.Repo.init(path, bare=True)
+            repo.create_remote(_REMOTE_NAME, url)
+            return repo
+
+        if repo.remote(_REMOTE_NAME).url != url:
+            repo.remote(_REMOTE_NAME).set_url(url)
+        return repo
+
+
+def _validate(url: str, branch: str) -> None:
+    """Validate inputs the same way git_clone() does."""
+    if not validate_git_url(url):
+        msg = f"Invalid Git URL: {url}"
+        raise GitValidationError(msg)
+    if not validate_git_branch(branch):
+        msg = f"Invalid Git branch: {branch}"
+        raise GitValidationError(msg)
+    if not is_git_installed():
+        msg = "Git executable not found in PATH"
+        raise GitNotFoundError(msg)
+
+
+def _existing_paths(repo: Repo, sha: str, paths: Sequence[str]) -> list[str]:
+    """Filter paths down to those present in a commit."""
+    if not paths:
+        return []
+    listing = repo.git.ls_tree("--name-only", "-z", sha, "--", *paths)
+    present = {name for name in listing.split("\0") if name}
+    return [path for path in paths if path.strip("/") in present]
+
+
+def _prefetch(repo: Repo, sha: str, pathspec: Sequence[str]) -> None:
+    """Fetch the file contents under ``pathspec`` that a partial clone lacks.
+
+    Left to itself, Git fetches each missing blob with its own request as the
+    checkout reaches it. This asks for all of them in one fetch, the same way
+    Git's own lazy fetches do. If the server refuses, the checkout still
+    fetches them one at a time.
+    """
+    from git.exc import GitCommandError  # noqa: PLC0415
+
+    missing = {
+        line[1:]
+        for line in repo.git.rev_list("--objects", "--missing=print", sha).splitlines()
+        if line.startswith("?")
+    }
+    if not missing:
+        return
+
+    wanted: list[str] = []
+    for entry in repo.git.ls_tree("-r", "-z", sha, "--", *pathspec).split("\0"):
+        if not entry:
+            continue
+        _mode, kind, oid = entry.split("\t", 1)[0].split(" ")
+        if kind == "blob" and oid in missing:
+            wanted.append(oid)
+    if not wanted:
+        return
+
+    with tempfile.TemporaryFile() as oids:
+        oids.write("".join(f"{oid}\n" for oid in wanted).encode())
+        oids.seek(0)
+        with contextlib.suppress(GitCommandError):
+            repo.git.execute(
+                [
+                    "git",
+                    "-c",
+                    "fetch.negotiationAlgorithm=noop",
+                    "fetch",
+                    _REMOTE_NAME,
+                    "--no-tags",
+                    "--no-write-fetch-head",
+                    "--recurse-submodules=no",
+                    f"--filter={BLOB_FILTER}",
+                    "--stdin",
+                ],
+                istream=oids,
+            )
+
+
+def _checkout(repo: Repo, sha: str, dest_dir: Path, pathspec: Sequence[str]) -> None:
+    """Write files from a commit into a directory using a temporary index."""
+    with tempfile.TemporaryDirectory(prefix="ai-asst-mgr-index-") as index_dir:
+        repo.git.execute(
+            ["git", f"--work-tree={dest_dir}", "checkout", sha, "--", *pathspec],
+            env={"GIT_INDEX_FILE": str(Path(index_dir) / "index")},
+        )
@@ -0,0 +1,343 @@
+"""Pluggable compression codecs for backup archives.
+
+Backups support gzip, xz and bzip2 from the standard library, plus zstd when
+the interpreter provides ``compression.zstd`` (Python 3.14+ built with libzstd).
+
+Compression is done in independent blocks on a thread pool. Each block becomes
+its own gzip member, xz/bzip2 stream or zstd frame; every format allows these
+to be concatenated, so the result is an ordinary ``.tar.gz``/``.tar.xz``/...
+that ``tarfile`` and command-line tools read without knowing about blocks. The
+one-shot compressors release the GIL, so blocks compress in parallel.
+
+Reading needs no codec choice: ``tarfile``'s ``r:*`` mode detects the format
+from the file's magic bytes. ``tarfile``'s stream modes (``r|gz`` and friends)
+stop after the first member, so sequential readers should go through
+open_decompressed() instead.
+
+BlockCompressor records where every block landed (see CompressedBlock), so a
+reader holding that table can seek straight to one block and decompress it on
+its own; archive_index builds its random-access member index on this.
+"""
+
+from __future__ import annotations
+
+import bz2
+import gzip
+import importlib
+import importlib.util
+import lzma
+import os
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+    from typing import BinaryIO
+
+DEFAULT_CODEC = "gz"
+DEFAULT_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Blocks allowed in flight per worker thread, bounding memory use
+_QUEUE_DEPTH_PER_THREAD = 2
+
+
+def _zstd_compress(data: bytes, level: int) -> bytes:
+    """Compress one block with the standard library zstd module."""
+    zstd = importlib.import_module("compression.zstd")
+    result: bytes = zstd.compress(data, level=level)
+    return result
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    """Decompress one block with the standard library zstd module."""
+    zstd = importlib.import_module("compression.zstd")
+    result: bytes = zstd.decompress(data)
+    return result
+
+
+def _zstd_available() -> bool:
+    """Check whether the standard library zstd module can be imported."""
+    try:
+        return importlib.util.find_spec("compression.zstd") is not None
+    except ModuleNotFoundError:
+        return False
+
+
+@dataclass(frozen=True)
+class Codec:
+    """A compression format usable for backup archives.
+
+    Attributes:
+        name: Short name used on the command line (e.g. "gz").
+        extension: Archive file extension, including the tar part.
+        magic: Leading bytes identifying the format.
+        min_level: Lowest accepted compression level.
+        max_level: Highest accepted compression level.
+        default_level: Level used when none is given.
+        compress: One-shot block compressor taking (data, level).
+        decompress: One-shot decompressor for a single block.
+    """
+
+    name: str
+    extension: str
+    magic: bytes
+    min_level: int
+    max_level: int
+    default_level: int
+    compress: Callable[[bytes, int], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+CODECS: dict[str, Codec] = {
+    "gz": Codec(
+        "gz",
+        ".tar.gz",
+        b"\x1f\x8b",
+        1,
+        9,
+        6,
+        lambda data, level: gzip.compress(data, compresslevel=level, mtime=0),
+        gzip.decompress,
+    ),
+    "xz": Codec(
+        "xz",
+        ".tar.xz",
+        b"\xfd7zXZ\x00",
+        0,
+        9,
+        6,
+        lambda data, level: lzma.compress(data, preset=level),
+        lzma.decompress,
+    ),
+    "bz2": Codec("bz2", ".tar.bz2", b"BZh", 1, 9, 9, bz2.compress, bz2.decompress),
+    "zst": Codec(
+        "zst", ".tar.zst", b"\x28\xb5\x2f\xfd", 1, 22, 3, _zstd_compress, _zstd_decompress
+    ),
+}
+
+
+def available_codecs() -> list[str]:
+    """List codec names usable with this interpreter.
+
+    Returns:
+        Codec names, with zstd included only when it can be imported.
+    """
+    return [name for name in CODECS if name != "zst" or _zstd_available()]
+
+
+def detect_codec(path: Path) -> str | None:
+    """Identify an archive's codec from its magic bytes.
+
+    Args:
+        path: Archive to inspect.
+
+    Returns:
+        Codec name, or None for uncompressed or unrecognised files.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with path.open("rb") as f:
+        header = f.read(8)
+    for codec in CODECS.values():
+        if header.startswith(codec.magic):
+            return codec.name
+    return None
+
+
+def open_decompressed(raw: BinaryIO, codec: str | None) -> BinaryIO:
+    """Wrap a compressed file object in a multi-member aware decompressor.
+
+    Args:
+        raw: Readable file object positioned at the start of the data.
+        codec: Codec name from detect_codec(), or None for uncompressed data.
+
+    Returns:
+        Readable file object yielding the decompressed bytes.
+
+    Raises:
+        ValueError: If the codec is not available in this interpreter.
+    """
+    if codec is None:
+        return raw
+    if codec == "gz":
+        return gzip.GzipFile(fileobj=raw, mode="rb")  # type: ignore[return-value]
+    if codec == "xz":
+        return lzma.LZMAFile(raw)  # type: ignore[return-value]
+    if codec == "bz2":
+        return bz2.BZ2File(raw)  # type: ignore[return-value]
+    if codec == "zst" and _zstd_available():
+        zstd = importlib.import_module("compression.zstd")
+        reader: BinaryIO = zstd.ZstdFile(raw)
+        return reader
+    msg = f"Unsupported compression '{codec}'"
+    raise ValueError(msg)
+
+
+@dataclass(frozen=True)
+class CompressionSettings:
+    """How backup archives are compressed.
+
+    Attributes:
+        codec: Codec name from CODECS.
+        level: Compression level, or None for the codec's default.
+        threads: Worker threads for block compression (0 uses all CPUs).
+        block_size: Uncompressed bytes per independently compressed block.
+    """
+
+    codec: str = DEFAULT_CODEC
+    level: int | None = None
+    threads: int = 0
+    block_size: int = DEFAULT_BLOCK_SIZE
+
+    def __post_init__(self) -> None:
+        """Validate the codec and level.
+
+        Raises:
+            ValueError: If the codec is unknown or unavailable, or the level is out of range.
+        """
+        if self.codec not in available_codecs():
+            msg = (
+                f"Unsupported compression '{self.codec}'. "
+                f"Available: {', '.join(available_codecs())}"
+            )
+            raise ValueError(msg)
+        codec = CODECS[self.codec]
+        if self.level is not None and not codec.min_level <= self.level <= codec.max_level:
+            msg = (
+                f"Compression level for {self.codec} must be between "
+                f"{codec.min_level} and {codec.max_level}, got {self.level}"
+            )
+            raise ValueError(msg)
+
+    @property
+    def extension(self) -> str:
+        """Get the archive file extension for this codec."""
+        return CODECS[self.codec].extension
+
+    @property
+    def effective_level(self) -> int:
+        """Get the level that will actually be used."""
+        return self.level if self.level is not None else CODECS[self.codec].default_level
+
+    @property
+    def effective_threads(self) -> int:
+        """Get the number of worker threads that will actually be used."""
+        return self.threads if self.threads > 0 else os.cpu_count() or 1
+
+
+@dataclass(frozen=True)
+class CompressedBlock:
+    """Location of one independently compressed block.
+
+    Attributes:
+        offset: Offset of the block's first byte in the uncompressed stream.
+        size: Uncompressed size of the block.
+        compressed_offset: Offset of the block in the compressed file.
+        compressed_size: Compressed size of the block.
+        crc32: CRC-32 of the compressed bytes, to detect corruption on seek reads.
+    """
+
+    offset: int
+    size: int
+    compressed_offset: int
+    compressed_size: int
+    crc32: int
+
+
+class BlockCompressor:
+    """Write-only file object that compresses fixed-size blocks in parallel.
+
+    Blocks are written to the underlying file in order as they complete. At
+    most ``threads * 2`` blocks are held in memory at once. The position of
+    every written block is appended to ``blocks``.
+    """
+
+    def __init__(self, raw: BinaryIO, settings: CompressionSettings) -> None:
+        """Initialize the compressor.
+
+        Args:
+            raw: Destination for compressed bytes.
+            settings: Codec, level, thread count and block size.
+        """
+        self._raw = raw
+        self._compress = CODECS[settings.codec].compress
+        self._level = settings.effective_level
+        self._block_size = settings.block_size
+        threads = settings.effective_threads
+        self._executor = ThreadPoolExecutor(threads) if threads > 1 else None
+        self._max_pending = threads * _QUEUE_DEPTH_PER_THREAD
+        self._pending: deque[tuple[Future[bytes], int, int]] = deque()
+        self._buffer = bytearray()
+        self._closed = False
+        self._offset = 0
+        self._compressed_offset = 0
+        self.blocks: list[CompressedBlock] = []
+
+    def write(self, data: bytes) -> int:
+        """Buffer data, dispatching each full block for compression.
+
+        Args:
+            data: Uncompressed bytes.
+
+        Returns:
+            Number of bytes accepted.
+        """
+        self._buffer += data
+        while len(self._buffer) >= self._block_size:
+            block = bytes(self._buffer[: self._block_size])
+            del self._buffer[: self._block_size]
+            self._submit(block)
+        return len(data)
+
+    def close(self) -> None:
+        """Compress the final partial block and write all pending output."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self._emit_pending()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> BlockCompressor:
+        """Return self for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the compressor."""
+        self.close()
+
+    def _submit(self, block: bytes) -> None:
+        """Compress a block, writing finished blocks once the queue is full."""
+        offset = self._offset
+        self._offset += len(block)
+        if self._executor is None:
+            self._emit(self._compress(block, self._level), offset, len(block))
+            return
+        future = self._executor.submit(self._compress, block, self._level)
+        self._pending.append((future, offset, len(block)))
+        while len(self._pending) >= self._max_pending:
+            self._emit_pending()
+
+    def _emit_pending(self) -> None:
+        """Wait for the oldest pending block and write it."""
+        future, offset, size = self._pending.popleft()
+        self._emit(future.result(), offset, size)
+
+    def _emit(self, data: bytes, offset: int, size: int) -> None:
+        """Write a compressed block and record where it landed."""
+        self._raw.write(data)
+        self.blocks.append(
+            CompressedBlock(offset, size, self._compressed_offset, len(data), zlib.crc32(data))
+        )
+        self._compressed_offset += len(data)
@@ -0,0 +1,436 @@
+"""Include/exclude rules for vendor backups.
+
+Vendor configuration directories accumulate caches, logs and session
+transcripts that can be far larger than the configuration itself. Rules
+decide which of those paths a backup skips. They come from three places, in
+increasing priority:
+
+1. Vendor defaults (``VendorAdapter.backup_exclusions``), limited to data the
+   vendor regenerates on its own.
+2. A ``.backupignore`` file at the root of the configuration directory.
+3. Patterns given by the user (``backup --exclude``).
+
+Patterns follow the ``.gitignore`` conventions most users already know:
+``*`` and ``?`` match within one path component, ``**`` matches across
+components, a trailing ``/`` only matches directories, a pattern containing a
+``/`` is anchored to the configuration root (otherwise it matches at any
+depth), and a leading ``!`` re-includes something an earlier rule excluded.
+The last matching rule wins. Files above an optional size limit are skipped
+as well.
+
+Archives record the rules they were written with (as a PAX global header), so
+a restore can keep the excluded paths already on disk instead of deleting
+them along with the old configuration.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import stat
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+BACKUPIGNORE_FILENAME = ".backupignore"
+
+SOURCE_DEFAULT = "vendor default"
+SOURCE_BACKUPIGNORE = BACKUPIGNORE_FILENAME
+SOURCE_USER = "--exclude"
+
+# PAX global header key recording the rules an archive was written with
+PAX_HEADER_KEY = "AI_ASST_MGR.exclusions"
+
+
+def _translate(pattern: str) -> str:
+    """Translate a gitignore-style glob into a regular expression body."""
+    parts: list[str] = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and (end := pattern.find("]", i + 2)) != -1:
+            body = pattern[i + 1 : end].replace("\\", "\\\\")
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            parts.append(f"[{body}]")
+            i = end + 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(parts)
+
+
+@dataclass(frozen=True)
+class ExclusionRule:
+    """A single include/exclude pattern.
+
+    Attributes:
+        pattern: The pattern as written, including any leading ``!``.
+        source: Where the rule came from (used in --explain output).
+        negated: Whether the rule re-includes matching paths.
+        dir_only: Whether the rule only matches directories.
+    """
+
+    pattern: str
+    source: str
+    negated: bool = field(init=False)
+    dir_only: bool = field(init=False)
+    _regex: re.Pattern[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Parse the pattern.
+
+        Raises:
+            ValueError: If the pattern is empty.
+        """
+        body = self.pattern.strip()
+        negated = body.startswith("!")
+        body = body.removeprefix("!")
+        dir_only = body.endswith("/")
+        body = body.rstrip("/")
+        if not body:
+            msg = f"Empty exclusion pattern: {self.pattern!r}"
+            raise ValueError(msg)
+
+        anchored = "/" in body
+        regex = _translate(body.lstrip("/"))
+        if not anchored:
+            regex = f"(?:.*/)?{regex}"
+        object.__setattr__(self, "negated", negated)
+        object.__setattr__(self, "dir_only", dir_only)
+        object.__setattr__(self, "_regex", re.compile(regex, re.DOTALL))
+
+    @property
+    def label(self) -> str:
+        """Get a human-readable description used in reports."""
+        return f"{self.pattern} ({self.source})"
+
+    def matches(self, rel_path: str, *, is_dir: bool) -> bool:
+        """Check whether the rule applies to a path.
+
+        Args:
+            rel_path: POSIX path relative to the configuration root.
+            is_dir: Whether the path is a directory.
+
+        Returns:
+            True if the pattern matches the path.
+        """
+        if self.dir_only and not is_dir:
+            return False
+        return self._regex.fullmatch(rel_path) is not None
+
+
+@dataclass
+class RuleSavings:
+    """What a single rule kept out of a backup.
+
+    Attributes:
+        files: Number of regular files skipped.
+        bytes: Total size of the skipped files.
+    """
+
+    files: int = 0
+    bytes: int = 0
+
+
+@dataclass
+class ExclusionReport:
+    """Breakdown of a configuration directory under a set of rules.
+
+    Attributes:
+        included_files: Regular files that would be backed up.
+        included_bytes: Total size of the included files.
+        excluded: Savings per rule label, in the order rules first matched.
+    """
+
+    included_files: int = 0
+    included_bytes: int = 0
+    excluded: dict[str, RuleSavings] = field(default_factory=dict)
+
+    @property
+    def excluded_files(self) -> int:
+        """Get the number of files skipped by all rules."""
+        return sum(savings.files for savings in self.excluded.values())
+
+    @property
+    def excluded_bytes(self) -> int:
+        """Get the number of bytes skipped by all rules."""
+        return sum(savings.bytes for savings in self.excluded.values())
+
+
+class ExclusionRules:
+    """An ordered set of exclusion rules plus an optional file size limit.
+
+    Example:
+        >>> rules = ExclusionRules.for_directory(
+        ...     Path("~/.claude").expanduser(), defaults=["statsig/"], patterns=["projects/"]
+        ... )
+        >>> rules.match("projects", is_dir=True)
+        'projects/ (--exclude)'
+    """
+
+    def __init__(
+        self, rules: Iterable[ExclusionRule] = (), max_file_size: int | None = None
+    ) -> None:
+        """Initialize the rule set.
+
+        Args:
+            rules: Rules in priority order (later rules override earlier ones).
+            max_file_size: Skip regular files larger than this many bytes.
+        """
+        self._rules = tuple(rules)
+        self._max_file_size = max_file_size
+
+    @classmethod
+    def for_directory(
+        cls,
+        config_dir: Path,
+        defaults: Iterable[str] = (),
+        patterns: Iterable[str] = (),
+        max_file_size: int | None = None,
+    ) -> ExclusionRules:
+        """Build the rules for a configuration directory.
+
+        Args:
+            config_dir: Directory whose ``.backupignore`` (if any) is read.
+            defaults: Vendor default patterns.
+            patterns: User patterns, which take precedence over the others.
+            max_file_size: Skip regular files larger than this many bytes.
+
+        Returns:
+            ExclusionRules combining all sources.
+
+        Raises:
+            ValueError: If a user pattern is empty.
+        """
+        rules = [ExclusionRule(pattern, SOURCE_DEFAULT) for pattern in defaults]
+        rules.extend(_read_backupignore(config_dir / BACKUPIGNORE_FILENAME))
+        rules.extend(ExclusionRule(pattern, SOURCE_USER) for pattern in patterns)
+        return cls(rules, max_file_size)
+
+    @classmethod
+    def from_pax_headers(cls, headers: Mapping[str, str]) -> ExclusionRules:
+        """Rebuild the rules recorded in an archive's PAX global header.
+
+        Args:
+            headers: ``TarFile.pax_headers`` of an archive.
+
+        Returns:
+            The recorded rules, or an empty rule set if none were recorded or
+            the record is unreadable.
+        """
+        raw = headers.get(PAX_HEADER_KEY)
+        if not raw:
+            return cls()
+        try:
+            data = json.loads(raw)
+            rules = [ExclusionRule(pattern, source) for pattern, source in data["rules"]]
+            return cls(rules, data.get("max_file_size"))
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            return cls()
+
+    @property
+    def rules(self) -> tuple[ExclusionRule, ...]:
+        """Get the rules in priority order."""
+        return self._rules
+
+    @property
+    def max_file_size(self) -> int | None:
+        """Get the file size limit in bytes, if any."""
+        return self._max_file_size
+
+    @property
+    def size_label(self) -> str:
+        """Get the report label used for files over the size limit."""
+        return f"files over {self._max_file_size} bytes (--max-file-size)"
+
+    def __bool__(self) -> bool:
+        """Return True if the rules can exclude anything."""
+        return bool(self._rules) or self._max_file_size is not None
+
+    def to_pax_headers(self) -> dict[str, str]:
+        """Serialize the rules for an archive's PAX global header.
+
+        Returns:
+            Header mapping, empty when there are no rules.
+        """
+        if not self:
+            return {}
+        data = {
+            "rules": [[rule.pattern, rule.source] for rule in self._rules],
+            "max_file_size": self._max_file_size,
+        }
+        return {PAX_HEADER_KEY: json.dumps(data, separators=(",", ":"))}
+
+    def match(self, rel_path: str, *, is_dir: bool, size: int = 0) -> str | None:
+        """Decide whether a path is excluded.
+
+        Args:
+            rel_path: POSIX path relative to the configuration root.
+            is_dir: Whether the path is a directory.
+            size: File size in bytes (ignored for directories).
+
+        Returns:
+            Label of the rule that excludes the path, or None to include it.
+            Only the path itself is checked; walk() and the archive writer
+            never descend into excluded directories.
+        """
+        for rule in reversed(self._rules):
+            if rule.matches(rel_path, is_dir=is_dir):
+                if rule.negated:
+                    break
+                return rule.label
+        if not is_dir and self._max_file_size is not None and size > self._max_file_size:
+            return self.size_label
+        return None
+
+    def walk(
+        self, root: Path, prefix: str = ""
+    ) -> Iterator[tuple[os.DirEntry[str], str, str | None]]:
+        """Walk a directory tree, deciding each entry along the way.
+
+        Entries are yielded parent-first in sorted order. Excluded directories
+        are yielded (with their rule label) but not descended into, and
+        symlinks are never followed.
+
+        Args:
+            root: Directory to walk.
+            prefix: Path of ``root`` relative to the configuration root, used
+                when walking a single subdirectory.
+
+        Yields:
+            Tuples of (directory entry, POSIX path relative to ``root``,
+            excluding rule label or None).
+
+        Raises:
+            OSError: If a directory cannot be listed.
+        """
+        prefix = f"{prefix.strip('/')}/" if prefix.strip("/") else ""
+        stack = [(root, "")]
+        while stack:
+            directory, rel_dir = stack.pop()
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+            subdirs: list[tuple[Path, str]] = []
+            for entry in entries:
+                rel_path = f"{rel_dir}{entry.name}"
+                is_dir = entry.is_dir(follow_symlinks=False)
+                size = 0
+                if not is_dir and self._max_file_size is not None:
+                    size = entry.stat(follow_symlinks=False).st_size
+                label = self.match(f"{prefix}{rel_path}", is_dir=is_dir, size=size)
+                yield entry, rel_path, label
+                if is_dir and label is None:
+                    subdirs.append((Path(entry.path), f"{rel_path}/"))
+            stack.extend(reversed(subdirs))
+
+    def explain(self, root: Path) -> ExclusionReport:
+        """Measure what a backup of a directory would include and skip.
+
+        Args:
+            root: Configuration directory to measure.
+
+        Returns:
+            ExclusionReport with included totals and savings per rule.
+
+        Raises:
+            OSError: If the directory cannot be read.
+        """
+        report = ExclusionReport()
+        for entry, _, label in self.walk(root):
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if label is None:
+                if entry.is_file(follow_symlinks=False):
+                    report.included_files += 1
+                    report.included_bytes += entry.stat(follow_symlinks=False).st_size
+                continue
+
+            savings = report.excluded.setdefault(label, RuleSavings())
+            if is_dir:
+                files, size = _tree_size(Path(entry.path))
+                savings.files += files
+                savings.bytes += size
+            elif entry.is_file(follow_symlinks=False):
+                savings.files += 1
+                savings.bytes += entry.stat(follow_symlinks=False).st_size
+        return report
+
+
+def carry_over_excluded(
+    current_dir: Path, restored_dir: Path, rules: ExclusionRules, prefix: str = ""
+) -> int:
+    """Move excluded paths from a live directory into a freshly restored one.
+
+    A restore replaces the configuration directory with the backup's copy.
+    Paths the backup deliberately skipped are missing from that copy, so
+    without this step the restore would delete them.
+
+    Args:
+        current_dir: Directory about to be replaced.
+        restored_dir: Extracted backup contents that will replace it.
+        rules: Rules the backup was written with.
+        prefix: Path of ``current_dir`` relative to the configuration root,
+            for restores of a single subdirectory.
+
+    Returns:
+        Number of files and directories moved.
+
+    Raises:
+        OSError: If a path cannot be moved.
+    """
+    if not rules or not current_dir.is_dir():
+        return 0
+
+    moved = 0
+    for entry, rel_path, label in rules.walk(current_dir, prefix):
+        if label is None:
+            continue
+        target = restored_dir / rel_path
+        if target.exists() or target.is_symlink():
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(entry.path, target)
+        moved += 1
+    return moved
+
+
+def _read_backupignore(path: Path) -> list[ExclusionRule]:
+    """Parse a .backupignore file, ignoring blank lines and comments."""
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    return [
+        ExclusionRule(line.strip(), SOURCE_BACKUPIGNORE)
+        for line in lines
+        if line.strip() and not line.lstrip().startswith("#")
+    ]
+
+
+def _tree_size(root: Path) -> tuple[int, int]:
+    """Count regular files and their total size below a directory."""
+    files = 0
+    size = 0
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            st = (Path(dirpath) / name).lstat()
+            if stat.S_ISREG(st.st_mode):
+                files += 1
+                size += st.st_size
+    return files, size
@@ -11,10 +11,9 @@ import shutil
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import git
-from git.exc import GitCommandError, InvalidGitRepositoryError
-
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from git import Repo
 
 
@@ -45,9 +44,16 @@ _GIT_URL_PATTERN = re.compile(
 # Must not start with -, contain .., or end with .lock
 _GIT_BRANCH_PATTERN = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9._\-/]*$")
 
+# Repository path pattern for sparse checkouts: relative, no leading dash
+_GIT_PATH_PATTERN = re.compile(r"^[a-zA-Z0-9._][a-zA-Z0-9._\-/]*$")
+
 # Maximum lengths for input validation (prevent DoS attacks)
 _MAX_URL_LENGTH = 2048
 _MAX_BRANCH_LENGTH = 255
+_MAX_PATH_LENGTH = 1024
+
+# Partial-clone filter that skips file contents until they are checked out
+BLOB_FILTER = "blob:none"
 
 
 def validate_git_url(url: str) -> bool:
@@ -106,6 +112,36 @@ def validate_git_branch(branch: str) -> bool:
     return bool(_GIT_BRANCH_PATTERN.match(branch))
 
 
+def validate_git_path(path: str) -> bool:
+    """Validate a path inside a repository, as used for sparse checkouts.
+
+    Args:
+        path: The repository-relative path to validate.
+
+    Returns:
+        True if the path is valid, False otherwise.
+    """
+    if not path or not isinstance(path, str):
+        return False
+    if len(path) > _MAX_PATH_LENGTH:
+        return False
+    if ".." in path.split("/"):
+        return False
+    return bool(_GIT_PATH_PATTERN.match(path))
+
+
+def sparse_patterns(paths: Sequence[str]) -> list[str]:
+    """Convert repository paths to sparse-checkout patterns anchored at the root.
+
+    Args:
+        paths: Files or directories relative to the repository root.
+
+    Returns:
+        One pattern per path, matching that file or directory only.
+    """
+    return [f"/{path.strip('/')}" for path in paths]
+
+
 def find_git_executable() -> Path | None:
     """Find the Git executable on the system.
 
@@ -127,17 +163,25 @@ def git_clone(
     *,
     depth: int = 1,
     timeout: int = 120,
+    sparse_paths: Sequence[str] | None = None,
 ) -> bool:
     """Clone a Git repository securely using GitPython.
 
     This function validates all inputs before executing the clone.
 
+    With ``sparse_paths``, the clone is blob-filtered and only those paths
+    are checked out, so file contents elsewhere in the repository are never
+    downloaded. If the server or the local Git cannot do a partial or sparse
+    clone, a regular clone is made instead.
+
     Args:
         url: The repository URL (HTTPS, SSH, or file://).
         dest_dir: The destination directory for the clone.
         branch: The branch to clone (default: "main").
         depth: Clone depth for shallow clones (default: 1).
         timeout: Command timeout in seconds (default: 120, unused with GitPython).
+        sparse_paths: Optional files and directories, relative to the
+            repository root, to restrict the checkout to.
 
     Returns:
         True if clone succeeded, False otherwise.
@@ -155,6 +199,11 @@ def git_clone(
         msg = f"Invalid Git branch: {branch}"
         raise GitValidationError(msg)
 
+    for path in sparse_paths or ():
+        if not validate_git_path(path):
+            msg = f"Invalid repository path: {path}"
+            raise GitValidationError(msg)
+
     # Check Git is available
     if not is_git_installed():
         msg = "Git executable not found in PATH"
@@ -167,6 +216,20 @@ def git_clone(
     # Use timeout parameter to suppress unused warning
     _ = timeout
 
+    # GitPython is imported here rather than at module level: it costs tens of
+    # milliseconds and is only needed when a clone actually happens.
+    import git
+    from git.exc import GitCommandError, InvalidGitRepositoryError
+
+    if sparse_paths is not None:
+        try:
+            _sparse_clone(url, dest_dir, branch, depth, sparse_paths)
+        except GitCommandError:
+            # Partial clone or sparse-checkout unsupported: clone everything
+            shutil.rmtree(dest_dir, ignore_errors=True)
+        else:
+            return True
+
     try:
         _repo: Repo = git.Repo.clone_from(
             url,
@@ -180,6 +243,30 @@ def git_clone(
         return True
 
 
+def _sparse_clone(
+    url: str, dest_dir: Path, branch: str, depth: int, sparse_paths: Sequence[str]
+) -> None:
+    """Clone without file contents, then check out only ``sparse_paths``.
+
+    The checkout downloads the blobs it needs in one batch.
+
+    Raises:
+        GitCommandError: If any step fails.
+    """
+    import git
+
+    repo: Repo = git.Repo.clone_from(
+        url,
+        str(dest_dir),
+        branch=branch,
+        depth=depth,
+        filter=BLOB_FILTER,
+        no_checkout=True,
+    )
+    repo.git.sparse_checkout("set", "--no-cone", *sparse_patterns(sparse_paths))
+    repo.git.checkout(branch)
+
+
 def is_git_installed() -> bool:
     """Check if Git is installed on the system.
 
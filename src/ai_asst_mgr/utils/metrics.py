@@ -0,0 +1,494 @@
+"""In-process metrics collection with Prometheus text exposition.
+
+This module provides lightweight counter, gauge, and histogram primitives
+that can be rendered in the Prometheus text format without requiring a
+client library or an external metrics service.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, TypeVar, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Content type for the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Default latency buckets in seconds (1ms to 10s)
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+LabelValues = tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the exposition format.
+
+    Args:
+        value: The sample value.
+
+    Returns:
+        String representation accepted by Prometheus.
+    """
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    """Escape a label value for the exposition format.
+
+    Args:
+        value: Raw label value.
+
+    Returns:
+        Escaped label value.
+    """
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    """Format a label set as ``{name="value",...}``.
+
+    Args:
+        names: Label names.
+        values: Label values, in the same order as names.
+        extra: Optional pre-formatted label pair to append (e.g. ``le="0.1"``).
+
+    Returns:
+        Formatted label set, or an empty string if there are no labels.
+    """
+    pairs = [f'{name}="{_escape_label(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(pairs) + "}"
+
+
+class _Metric(ABC):
+    """Base class for labelled metrics."""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        """Initialize the metric.
+
+        Args:
+            name: Metric name.
+            documentation: Help text shown in the exposition output.
+            labelnames: Names of the labels this metric is partitioned by.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        """Convert a label mapping into an ordered key.
+
+        Args:
+            labels: Label name to value mapping.
+
+        Returns:
+            Tuple of label values ordered by labelnames.
+
+        Raises:
+            ValueError: If the label names do not match the metric definition.
+        """
+        if set(labels) != set(self.labelnames):
+            msg = f"Metric {self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            raise ValueError(msg)
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> list[str]:
+        """Render the metric samples.
+
+        Returns:
+            Lines in the Prometheus text format.
+        """
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        lines.extend(self._samples())
+        return lines
+
+    @abstractmethod
+    def _samples(self) -> list[str]:
+        """Render the sample lines for this metric."""
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Discard all recorded samples."""
+
+
+class Counter(_Metric):
+    """A monotonically increasing counter."""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        """Initialize the counter.
+
+        Args:
+            name: Metric name.
+            documentation: Help text shown in the exposition output.
+            labelnames: Names of the labels this metric is partitioned by.
+        """
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increment the counter.
+
+        Args:
+            amount: Amount to add (must not be negative).
+            **labels: Label values.
+
+        Raises:
+            ValueError: If amount is negative.
+        """
+        if amount < 0:
+            msg = "Counters can only be incremented by non-negative amounts"
+            raise ValueError(msg)
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Get the current counter value.
+
+        Args:
+            **labels: Label values.
+
+        Returns:
+            Current value, or 0 if never incremented.
+        """
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> list[str]:
+        """Render the sample lines for this counter."""
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+    def reset(self) -> None:
+        """Discard all recorded samples."""
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(_Metric):
+    """A value that can go up and down."""
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        """Initialize the gauge.
+
+        Args:
+            name: Metric name.
+            documentation: Help text shown in the exposition output.
+            labelnames: Names of the labels this metric is partitioned by.
+        """
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge to a value.
+
+        Args:
+            value: New value.
+            **labels: Label values.
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increment the gauge.
+
+        Args:
+            amount: Amount to add.
+            **labels: Label values.
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrement the gauge.
+
+        Args:
+            amount: Amount to subtract.
+            **labels: Label values.
+        """
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: str) -> float:
+        """Get the current gauge value.
+
+        Args:
+            **labels: Label values.
+
+        Returns:
+            Current value, or 0 if never set.
+        """
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> list[str]:
+        """Render the sample lines for this gauge."""
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+    def reset(self) -> None:
+        """Discard all recorded samples."""
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram(_Metric):
+    """A cumulative histogram of observed values."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize the histogram.
+
+        Args:
+            name: Metric name.
+            documentation: Help text shown in the exposition output.
+            labelnames: Names of the labels this metric is partitioned by.
+            buckets: Upper bounds of the histogram buckets (+Inf is implicit).
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation.
+
+        Args:
+            value: Observed value.
+            **labels: Label values.
+        """
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = [0] * (len(self.buckets) + 1)
+                self._counts[key] = counts
+                self._sums[key] = 0.0
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            else:
+                counts[-1] += 1
+            self._sums[key] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Time a block of code and observe its duration in seconds.
+
+        Args:
+            **labels: Label values.
+
+        Yields:
+            None.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> int:
+        """Get the number of observations.
+
+        Args:
+            **labels: Label values.
+
+        Returns:
+            Number of observations recorded for the label set.
+        """
+        with self._lock:
+            return sum(self._counts.get(self._key(labels), []))
+
+    def total(self, **labels: str) -> float:
+        """Get the sum of all observations.
+
+        Args:
+            **labels: Label values.
+
+        Returns:
+            Sum of observed values for the label set.
+        """
+        with self._lock:
+            return self._sums.get(self._key(labels), 0.0)
+
+    def _samples(self) -> list[str]:
+        """Render the bucket, sum, and count lines for this histogram."""
+        with self._lock:
+            items = sorted((key, list(counts)) for key, counts in self._counts.items())
+            sums = dict(self._sums)
+        lines: list[str] = []
+        for key, counts in items:
+            cumulative = 0
+            bounds = [*self.buckets, math.inf]
+            for bound, count in zip(bounds, counts, strict=True):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                labels = _format_labels(self.labelnames, key, le)
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(sums[key])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+    def reset(self) -> None:
+        """Discard all recorded samples."""
+        with self._lock:
+            self._counts.clear()
+            self._sums.clear()
+
+
+_M = TypeVar("_M", bound=_Metric)
+
+
+class MetricsRegistry:
+    """Collection of named metrics rendered together."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _M) -> _M:
+        """Register a metric, returning an existing one with the same name.
+
+        Args:
+            metric: Metric to register.
+
+        Returns:
+            The registered metric instance.
+
+        Raises:
+            ValueError: If a different metric type is already registered under the name.
+        """
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is None:
+                self._metrics[metric.name] = metric
+                return metric
+        if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+            msg = f"Metric {metric.name} is already registered with a different definition"
+            raise ValueError(msg)
+        return cast("_M", existing)
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        """Get or create a counter.
+
+        Args:
+            name: Metric name.
+            documentation: Help text.
+            labelnames: Label names.
+
+        Returns:
+            The registered Counter.
+        """
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        """Get or create a gauge.
+
+        Args:
+            name: Metric name.
+            documentation: Help text.
+            labelnames: Label names.
+
+        Returns:
+            The registered Gauge.
+        """
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram.
+
+        Args:
+            name: Metric name.
+            documentation: Help text.
+            labelnames: Label names.
+            buckets: Bucket upper bounds.
+
+        Returns:
+            The registered Histogram.
+        """
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format.
+
+        Returns:
+            Exposition text terminated by a newline.
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Discard samples from every registered metric."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+
+# Process-wide registry shared by the database layer and the web dashboard
+REGISTRY = MetricsRegistry()
@@ -0,0 +1,254 @@
+"""Find git repositories under a directory tree.
+
+``github sync --base`` used to look for repositories by recursing with
+``Path.iterdir()`` and an ``is_dir()`` stat per entry, one directory at a
+time, descending into dependency trees such as ``node_modules`` and virtual
+environments on the way.
+
+RepoDiscovery lists directories with ``os.scandir``, whose entries already
+say whether they are directories, and lists each level of the tree on a
+thread pool. Directories named in a prune list are never entered, and each
+directory is visited once by device and inode, so symlinks that point back
+up the tree cannot cause loops.
+
+A directory's listing only changes when its mtime does, so listings are
+kept in a cache file. A repeated search stats each directory it visits and
+only lists the ones whose mtime changed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+# Version of the discovery cache file format
+REPO_CACHE_FORMAT_VERSION = 1
+
+# Directories scanned per worker task
+_SCAN_CHUNK_SIZE = 128
+
+# Directories that hold dependencies or build output rather than projects
+DEFAULT_PRUNE_DIRS = frozenset(
+    {
+        "__pycache__",
+        "bower_components",
+        "node_modules",
+        "site-packages",
+        "venv",
+    }
+)
+
+
+@dataclass(frozen=True)
+class _Listing:
+    """What a directory contained when it was last listed.
+
+    Attributes:
+        mtime_ns: Modification time of the directory in nanoseconds.
+        is_repo: Whether the directory has a ``.git`` directory.
+        children: Names of subdirectories to search, empty for repositories.
+    """
+
+    mtime_ns: int
+    is_repo: bool
+    children: tuple[str, ...]
+
+
+class RepoDiscovery:
+    """Search directory trees for git repositories.
+
+    Hidden directories and directories in the prune list are skipped, and
+    repositories are not searched for nested repositories. Directory
+    listings are cached by path and reused while the directory's mtime is
+    unchanged; without a cache path they are kept for the object's lifetime.
+    """
+
+    def __init__(
+        self,
+        prune: Iterable[str] = DEFAULT_PRUNE_DIRS,
+        cache_path: Path | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        """Initialize discovery, loading any saved listings.
+
+        Args:
+            prune: Names of directories never to enter.
+            cache_path: JSON file listings are loaded from and saved to.
+            max_workers: Directories to list at the same time (default:
+                based on CPU count).
+        """
+        self._prune = frozenset(prune)
+        self._path = cache_path
+        self._max_workers = max_workers
+        self._listings: dict[str, _Listing] = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        if cache_path is not None:
+            self._listings = _load_listings(cache_path, self._prune)
+
+    def find(self, base_path: Path, max_depth: int = 3) -> list[Path]:
+        """Find git repositories under a base path.
+
+        Args:
+            base_path: Base directory to search.
+            max_depth: Maximum directory depth to search.
+
+        Returns:
+            Sorted paths of git repository roots.
+        """
+        repos: list[Path] = []
+        visited_dirs: set[tuple[int, int]] = set()
+        visited_paths: set[str] = set()
+        level = [str(base_path)]
+
+        with ThreadPoolExecutor(self._max_workers, thread_name_prefix="repo-scan") as executor:
+            for depth in range(max_depth + 1):
+                next_level: list[str] = []
+                for path, scanned in zip(level, self._scan_level(executor, level), strict=True):
+                    if scanned is None:
+                        continue
+                    dir_id, listing, cached = scanned
+                    if dir_id in visited_dirs:
+                        continue
+                    visited_dirs.add(dir_id)
+                    visited_paths.add(path)
+                    self._record(path, listing, cached=cached)
+                    if listing.is_repo:
+                        repos.append(Path(path))
+                    elif depth < max_depth:
+                        next_level.extend(f"{path}{os.sep}{name}" for name in listing.children)
+                if not next_level:
+                    break
+                level = next_level
+
+        self._forget_unvisited(str(base_path), visited_paths)
+        return sorted(repos)
+
+    def save(self) -> None:
+        """Write the cache to its file if it has a path and has changed.
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        if self._path is None or not self._dirty:
+            return
+        payload = {
+            "version": REPO_CACHE_FORMAT_VERSION,
+            "prune": sorted(self._prune),
+            "dirs": {
+                path: [listing.mtime_ns, listing.is_repo, list(listing.children)]
+                for path, listing in sorted(self._listings.items())
+            },
+        }
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self._path.with_name(f"{self._path.name}.partial")
+        partial.write_text(json.dumps(payload, separators=(",", ":")))
+        partial.replace(self._path)
+        self._dirty = False
+
+    def _scan_level(
+        self, executor: ThreadPoolExecutor, level: list[str]
+    ) -> Iterator[tuple[tuple[int, int], _Listing, bool] | None]:
+        """Scan one level of the tree, in order, a chunk of directories per task.
+
+        Handing each directory to the pool separately costs more than a
+        cached directory takes to check.
+        """
+        chunks = [level[i : i + _SCAN_CHUNK_SIZE] for i in range(0, len(level), _SCAN_CHUNK_SIZE)]
+        for results in executor.map(self._scan_chunk, chunks):
+            yield from results
+
+    def _scan_chunk(self, paths: list[str]) -> list[tuple[tuple[int, int], _Listing, bool] | None]:
+        """Scan a chunk of directories on a worker thread."""
+        return [self._scan(path) for path in paths]
+
+    def _scan(self, path: str) -> tuple[tuple[int, int], _Listing, bool] | None:
+        """Get a directory's identity and listing, reusing a cached listing.
+
+        Runs on the worker threads, so it only reads the cache.
+
+        Returns:
+            The directory's (device, inode), its listing and whether the
+            listing came from the cache, or None if it cannot be read.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        dir_id = (stat.st_dev, stat.st_ino)
+        cached = self._listings.get(path)
+        if cached is not None and cached.mtime_ns == stat.st_mtime_ns:
+            return dir_id, cached, True
+
+        is_repo = False
+        children: list[str] = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name == ".git":
+                        is_repo = is_repo or entry.is_dir()
+                    elif (
+                        not entry.name.startswith(".")
+                        and entry.name not in self._prune
+                        and entry.is_dir()
+                    ):
+                        children.append(entry.name)
+        except OSError:
+            return None
+        listing = _Listing(stat.st_mtime_ns, is_repo, () if is_repo else tuple(sorted(children)))
+        return dir_id, listing, False
+
+    def _record(self, path: str, listing: _Listing, *, cached: bool) -> None:
+        """Count a listing as a hit or a miss and keep new listings."""
+        if cached:
+            self.hits += 1
+            return
+        self.misses += 1
+        self._listings[path] = listing
+        self._dirty = True
+
+    def _forget_unvisited(self, base_path: str, visited: set[str]) -> None:
+        """Drop listings under a base path that the last search did not reach."""
+        prefix = base_path.rstrip(os.sep) + os.sep
+        stale = [
+            path
+            for path in self._listings
+            if (path == base_path or path.startswith(prefix)) and path not in visited
+        ]
+        for path in stale:
+            del self._listings[path]
+        self._dirty = self._dirty or bool(stale)
+
+
+def _load_listings(path: Path, prune: frozenset[str]) -> dict[str, _Listing]:
+    """Read saved listings, ignoring a missing, unreadable or outdated file.
+
+    Listings saved with a different prune list are discarded, since they
+    would include or leave out different subdirectories.
+    """
+    try:
+        payload = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != REPO_CACHE_FORMAT_VERSION:
+        return {}
+    if payload.get("prune") != sorted(prune):
+        return {}
+    listings: dict[str, _Listing] = {}
+    for key, entry in (payload.get("dirs") or {}).items():
+        try:
+            mtime_ns, is_repo, children = entry
+            listings[str(key)] = _Listing(
+                int(mtime_ns), bool(is_repo), tuple(str(name) for name in children)
+            )
+        except (TypeError, ValueError):
+            continue
+    return listings
@@ -0,0 +1,136 @@
+"""Bring a directory in line with another by writing only what differs.
+
+Sync used to replace a directory by deleting it and copying the incoming
+tree over it, and otherwise copied every incoming file, identical or not.
+Syncing a configuration that had not changed rewrote every file, and any
+process holding one open saw it replaced.
+
+apply_tree_diff() takes the TreeDiff of the two trees (see
+ai_asst_mgr.utils.tree_index) and performs exactly those changes. Files that
+are the same on both sides are never opened for writing, so their inodes,
+hard links and timestamps are untouched. Each written file is copied to a
+temporary file beside its destination and renamed over it, so readers see
+either the old contents or the new, never a partial file.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from ai_asst_mgr.utils.tree_index import TreeDiff
+
+
+@dataclass
+class ApplyResult:
+    """Counts of the changes made by apply_tree_diff().
+
+    Attributes:
+        added: Files created.
+        modified: Files whose contents were replaced.
+        deleted: Files removed.
+        unchanged: Files left as they were.
+    """
+
+    added: int = 0
+    modified: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+
+
+def install_file(source: Path, dest: Path) -> None:
+    """Copy a file into place atomically, with its permissions and times.
+
+    The contents are written to a temporary file in the destination
+    directory and renamed over ``dest``.
+
+    Args:
+        source: File to copy.
+        dest: Path to create or replace.
+
+    Raises:
+        OSError: If the file cannot be read or written.
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(prefix=f".{dest.name}.", suffix=".sync", dir=dest.parent)
+    temp_path = Path(temp_name)
+    try:
+        with os.fdopen(fd, "wb") as out, source.open("rb") as src:
+            shutil.copyfileobj(src, out)
+        shutil.copystat(source, temp_path)
+        temp_path.replace(dest)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            temp_path.unlink()
+        raise
+
+
+def apply_tree_diff(
+    source_root: Path,
+    dest_root: Path,
+    diff: TreeDiff,
+    *,
+    update_modified: bool = True,
+    delete: bool = False,
+) -> ApplyResult:
+    """Apply a diff between two trees to the destination tree.
+
+    Deletions run first, so a file that is replaced by a directory (or the
+    reverse) is out of the way before anything is written.
+
+    Args:
+        source_root: Root of the incoming tree (the diff's ``new`` side).
+        dest_root: Root of the tree to update (the diff's ``old`` side).
+        diff: Differences between the two trees.
+        update_modified: Whether to overwrite files whose contents differ.
+        delete: Whether to remove files missing from the incoming tree, and
+            directories left empty by doing so.
+
+    Returns:
+        ApplyResult with the exact number of files changed.
+
+    Raises:
+        OSError: If a file cannot be written or removed.
+    """
+    result = ApplyResult(unchanged=len(diff.unchanged))
+    if delete:
+        for rel_path in diff.deleted:
+            (dest_root / rel_path).unlink(missing_ok=True)
+            result.deleted += 1
+        _prune_empty_dirs(dest_root, diff.deleted)
+    else:
+        result.unchanged += len(diff.deleted)
+
+    for rel_path in diff.added:
+        install_file(source_root / rel_path, dest_root / rel_path)
+        result.added += 1
+
+    if update_modified:
+        for rel_path in diff.modified:
+            install_file(source_root / rel_path, dest_root / rel_path)
+            result.modified += 1
+    else:
+        result.unchanged += len(diff.modified)
+    return result
+
+
+def _prune_empty_dirs(root: Path, deleted: Iterable[str]) -> None:
+    """Remove directories below ``root`` that deleting these files emptied."""
+    parents = {(root / rel_path).parent for rel_path in deleted}
+    # Deepest first, so a parent is only checked after its children
+    for directory in sorted(parents, key=lambda p: len(p.parts), reverse=True):
+        current = directory
+        while current != root and root in current.parents:
+            try:
+                current.rmdir()
+            except OSError:
+                break
+            current = current.parent
@@ -0,0 +1,322 @@
+"""Snapshots of directory trees for cheap comparison.
+
+Sync used to compare a checkout with the local configuration one file pair
+at a time: each tree was walked with ``rglob`` (once for additions and again
+for deletions) and every pair present on both sides was read fully into
+memory with ``read_bytes()`` and compared.
+
+TreeSnapshot walks a tree once with ``os.scandir`` and records each file's
+size and modification time, which the directory listing already provides.
+diff_trees() compares two snapshots by path and size, and only hashes files
+whose sizes match. Hashes are computed in fixed-size blocks so memory use
+does not grow with file size.
+
+Local configuration files rarely change between syncs, so their hashes are
+kept in a HashCache. An entry is reused while the file's size and mtime are
+unchanged, so a repeated preview hashes only files that changed since.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+# Version of the hash cache file format
+HASH_CACHE_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class FileState:
+    """Size and modification time of a file, as seen when a tree was scanned.
+
+    Attributes:
+        size: Size in bytes.
+        mtime_ns: Modification time in nanoseconds.
+    """
+
+    size: int
+    mtime_ns: int
+
+
+@dataclass
+class TreeDiff:
+    """Differences between two trees, as sorted relative POSIX paths.
+
+    Attributes:
+        added: Files only in the new tree.
+        modified: Files in both trees with different contents.
+        deleted: Files only in the old tree.
+        unchanged: Files in both trees with the same contents.
+    """
+
+    added: list[str] = field(default_factory=list)
+    modified: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+
+
+def file_digest(path: Path) -> str:
+    """Hash a file's contents without reading it into memory at once.
+
+    Args:
+        path: File to hash.
+
+    Returns:
+        Hex SHA256 of the contents.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+class TreeSnapshot:
+    """Regular files under a directory, keyed by POSIX path relative to it.
+
+    Symlinks to files are recorded as the files they point to; symlinked
+    directories are not descended into.
+    """
+
+    def __init__(self, root: Path, files: dict[str, FileState]) -> None:
+        """Initialize a snapshot.
+
+        Args:
+            root: Directory the paths are relative to.
+            files: File states by relative POSIX path.
+        """
+        self.root = root
+        self.files = files
+
+    @classmethod
+    def scan(cls, root: Path, paths: Iterable[str] | None = None) -> TreeSnapshot:
+        """Walk a directory once and record its files.
+
+        Args:
+            root: Directory to scan. A missing directory gives an empty snapshot.
+            paths: Optional files and directories relative to ``root`` to
+                limit the scan to. Paths that do not exist are skipped.
+
+        Returns:
+            The snapshot.
+        """
+        files: dict[str, FileState] = {}
+        if paths is None:
+            _scan_dir(root, "", files)
+            return cls(root, files)
+
+        for path_spec in paths:
+            rel_path = path_spec.strip("/")
+            path = root / rel_path
+            if path.is_dir():
+                _scan_dir(path, f"{rel_path}/", files)
+            elif path.is_file():
+                st = path.stat()
+                files[rel_path] = FileState(st.st_size, st.st_mtime_ns)
+        return cls(root, files)
+
+    def __contains__(self, rel_path: object) -> bool:
+        """Check whether a relative path is a file in the snapshot."""
+        return rel_path in self.files
+
+    def __len__(self) -> int:
+        """Get the number of files in the snapshot."""
+        return len(self.files)
+
+    def under(self, prefix: str) -> Iterator[str]:
+        """Iterate over the files at or below a relative path, in sorted order.
+
+        Args:
+            prefix: A relative file or directory path.
+
+        Yields:
+            Relative paths of the matching files.
+        """
+        prefix = prefix.strip("/")
+        dir_prefix = f"{prefix}/"
+        yield from sorted(
+            rel_path
+            for rel_path in self.files
+            if rel_path == prefix or rel_path.startswith(dir_prefix)
+        )
+
+
+def _scan_dir(directory: Path, rel_prefix: str, files: dict[str, FileState]) -> None:
+    """Record every file below a directory, depth first, without recursion."""
+    stack = [(directory, rel_prefix)]
+    while stack:
+        current, rel_dir = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        for entry in entries:
+            rel_path = f"{rel_dir}{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                stack.append((Path(entry.path), f"{rel_path}/"))
+            elif entry.is_file():
+                st = entry.stat()
+                files[rel_path] = FileState(st.st_size, st.st_mtime_ns)
+
+
+class HashCache:
+    """File hashes that stay valid while a file's size and mtime are unchanged.
+
+    Entries are keyed by absolute path, so snapshots rooted at a directory
+    and at one of its subdirectories share them. The cache is saved as a
+    JSON file; without a path it lives for one run only.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize the cache, loading any saved entries.
+
+        Args:
+            path: JSON file the cache is loaded from and saved to.
+        """
+        self._path = path
+        self._entries: dict[str, tuple[int, int, str]] = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        if path is not None:
+            self._entries = _load_entries(path)
+
+    def digest(self, snapshot: TreeSnapshot, rel_path: str) -> str:
+        """Get the hash of a file in a snapshot, reading it only if it changed.
+
+        Args:
+            snapshot: Snapshot the file was recorded in.
+            rel_path: Path of the file relative to the snapshot root.
+
+        Returns:
+            Hex SHA256 of the file contents.
+
+        Raises:
+            OSError: If the file has to be hashed and cannot be read.
+        """
+        state = snapshot.files[rel_path]
+        path = snapshot.root / rel_path
+        key = str(path)
+        cached = self._entries.get(key)
+        if cached is not None and cached[:2] == (state.size, state.mtime_ns):
+            self.hits += 1
+            return cached[2]
+
+        self.misses += 1
+        digest = file_digest(path)
+        self._entries[key] = (state.size, state.mtime_ns, digest)
+        self._dirty = True
+        return digest
+
+    def retain(self, snapshot: TreeSnapshot) -> None:
+        """Forget entries for files that are not in a snapshot.
+
+        Args:
+            snapshot: Snapshot of every file whose entry should be kept.
+        """
+        keep = {str(snapshot.root / rel_path) for rel_path in snapshot.files}
+        stale = [key for key in self._entries if key not in keep]
+        for key in stale:
+            del self._entries[key]
+        self._dirty = self._dirty or bool(stale)
+
+    def save(self) -> None:
+        """Write the cache to its file if it has a path and has changed.
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        if self._path is None or not self._dirty:
+            return
+        payload = {
+            "version": HASH_CACHE_FORMAT_VERSION,
+            "entries": {key: list(entry) for key, entry in sorted(self._entries.items())},
+        }
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self._path.with_name(f"{self._path.name}.partial")
+        partial.write_text(json.dumps(payload, separators=(",", ":")))
+        partial.replace(self._path)
+        self._dirty = False
+
+
+def _load_entries(path: Path) -> dict[str, tuple[int, int, str]]:
+    """Read saved cache entries, ignoring a missing or unreadable file."""
+    try:
+        payload = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != HASH_CACHE_FORMAT_VERSION:
+        return {}
+    entries: dict[str, tuple[int, int, str]] = {}
+    for key, entry in (payload.get("entries") or {}).items():
+        try:
+            size, mtime_ns, digest = entry
+            entries[str(key)] = (int(size), int(mtime_ns), str(digest))
+        except (TypeError, ValueError):
+            continue
+    return entries
+
+
+def files_match(
+    old: TreeSnapshot,
+    new: TreeSnapshot,
+    rel_path: str,
+    old_hashes: HashCache | None = None,
+) -> bool:
+    """Check whether a file present in both snapshots has the same contents.
+
+    Sizes are compared first; files are only hashed when the sizes match.
+
+    Args:
+        old: Snapshot of the tree being compared against (e.g. local config).
+        new: Snapshot of the incoming tree (e.g. a checkout).
+        rel_path: Relative path present in both snapshots.
+        old_hashes: Optional cache for hashes of files in ``old``.
+
+    Returns:
+        True if the contents are identical.
+    """
+    if old.files[rel_path].size != new.files[rel_path].size:
+        return False
+    try:
+        old_digest = (
+            old_hashes.digest(old, rel_path)
+            if old_hashes is not None
+            else file_digest(old.root / rel_path)
+        )
+        return old_digest == file_digest(new.root / rel_path)
+    except OSError:
+        return False
+
+
+def diff_trees(
+    old: TreeSnapshot, new: TreeSnapshot, old_hashes: HashCache | None = None
+) -> TreeDiff:
+    """Compare two snapshots by relative path.
+
+    Args:
+        old: Snapshot of the tree being updated (e.g. local config).
+        new: Snapshot of the incoming tree (e.g. a checkout).
+        old_hashes: Optional cache for hashes of files in ``old``.
+
+    Returns:
+        TreeDiff of the changes that would turn ``old`` into ``new``.
+    """
+    diff = TreeDiff()
+    for rel_path in sorted(new.files):
+        if rel_path not in old.files:
+            diff.added.append(rel_path)
+        elif files_match(old, new, rel_path, old_hashes):
+            diff.unchanged.append(rel_path)
+        else:
+            diff.modified.append(rel_path)
+    diff.deleted = sorted(rel_path for rel_path in old.files if rel_path not in new.files)
+    return diff
@@ -6,22 +6,42 @@ templates, static files, and route handlers.
 
 from __future__ import annotations
 
+import time
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
 from fastapi import FastAPI, Request
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
+from ai_asst_mgr.utils.metrics import REGISTRY
 from ai_asst_mgr.web.routes.api import router as api_router
+from ai_asst_mgr.web.routes.metrics import router as metrics_router
 from ai_asst_mgr.web.routes.pages import router as pages_router
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from fastapi import Response
+
 # Module paths
 WEB_DIR = Path(__file__).parent
 TEMPLATES_DIR = WEB_DIR / "templates"
 STATIC_DIR = WEB_DIR / "static"
 
+# Request metrics exported from /metrics
+_REQUEST_DURATION = REGISTRY.histogram(
+    "ai_asst_mgr_http_request_duration_seconds",
+    "Latency of dashboard HTTP requests in seconds.",
+    ("method", "route"),
+)
+_REQUESTS_TOTAL = REGISTRY.counter(
+    "ai_asst_mgr_http_requests_total",
+    "Dashboard HTTP requests by response status.",
+    ("method", "route", "status"),
+)
+
 
 class AppState:
     """Application state container for shared resources."""
@@ -50,16 +70,61 @@ def create_app() -> FastAPI:
     if STATIC_DIR.exists():
         app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 
-    # Register error handlers
+    # Register error handlers and request timing
     _register_error_handlers(app)
+    _register_timing_middleware(app)
 
     # Register routes
     app.include_router(pages_router)
     app.include_router(api_router, prefix="/api")
+    app.include_router(metrics_router)
 
     return app
 
 
+def _route_label(request: Request) -> str:
+    """Get a low-cardinality label for the route that served a request.
+
+    Uses the route's path template (e.g. ``/api/sessions/{session_id}``)
+    so that path parameters do not create a new time series per value.
+
+    Args:
+        request: The incoming request.
+
+    Returns:
+        The route path template, or ``unmatched`` if no route handled it.
+    """
+    route = request.scope.get("route")
+    path = getattr(route, "path", None)
+    return path if isinstance(path, str) else "unmatched"
+
+
+def _register_timing_middleware(app: FastAPI) -> None:
+    """Register middleware that records request latency and status.
+
+    Args:
+        app: The FastAPI application instance.
+    """
+
+    @app.middleware("http")
+    async def timing_middleware(
+        request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        """Time each request and record it in the metrics registry."""
+        start = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+        finally:
+            route = _route_label(request)
+            _REQUEST_DURATION.observe(
+                time.perf_counter() - start, method=request.method, route=route
+            )
+            _REQUESTS_TOTAL.inc(method=request.method, route=route, status=str(status))
+        return response
+
+
 def _register_error_handlers(app: FastAPI) -> None:
     """Register custom error handlers.
 
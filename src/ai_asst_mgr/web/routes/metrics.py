@@ -0,0 +1,24 @@
+"""Prometheus metrics route for the web dashboard.
+
+This module exposes request timings and database instrumentation
+collected in-process, in the Prometheus text exposition format.
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ai_asst_mgr.utils.metrics import PROMETHEUS_CONTENT_TYPE, REGISTRY
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics() -> PlainTextResponse:
+    """Export collected metrics.
+
+    Returns:
+        Plain text response in the Prometheus exposition format.
+    """
+    return PlainTextResponse(REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -2,19 +2,25 @@
 
 import json
 import tarfile
+import threading
+import time
+from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
 from ai_asst_mgr.adapters.base import VendorInfo
+from ai_asst_mgr.adapters.claude import ClaudeAdapter
 from ai_asst_mgr.operations.backup import (
     BackupManager,
-    BackupMetadata,
     BackupResult,
     BackupSummary,
 )
+from ai_asst_mgr.operations.backup_catalog import BackupMetadata
+from ai_asst_mgr.utils.compression import CompressionSettings
+from ai_asst_mgr.utils.exclusions import RuleSavings
 
 
 @pytest.fixture
@@ -61,6 +67,33 @@ def mock_adapter(tmp_path: Path) -> Mock:
     return adapter
 
 
+def _make_adapter(
+    tmp_path: Path, vendor_id: str, before_backup: Callable[[], object] | None = None
+) -> Mock:
+    """Create a mock adapter with its own config directory."""
+    config_dir = tmp_path / f".{vendor_id}"
+    config_dir.mkdir()
+    (config_dir / "settings.json").write_text(f'{{"vendor": "{vendor_id}"}}')
+
+    adapter = Mock()
+    adapter.info = Mock(spec=VendorInfo)
+    adapter.info.vendor_id = vendor_id
+    adapter.info.name = vendor_id.capitalize()
+    adapter.info.config_dir = config_dir
+    adapter.is_installed.return_value = True
+
+    def backup(dest_dir: Path) -> Path:
+        if before_backup:
+            before_backup()
+        backup_path = dest_dir / f"{vendor_id}_backup.tar.gz"
+        with tarfile.open(backup_path, "w:gz") as tar:
+            tar.add(config_dir, arcname=vendor_id)
+        return backup_path
+
+    adapter.backup.side_effect = backup
+    return adapter
+
+
 class TestBackupMetadata:
     """Tests for BackupMetadata dataclass."""
 
@@ -171,6 +204,55 @@ class TestBackupVendor:
         assert result.metadata.backup_path.exists()
         assert result.error is None
 
+    def test_backup_vendor_metadata_matches_archive(
+        self, backup_manager: BackupManager, mock_adapter: Mock
+    ) -> None:
+        """Test metadata from an unknown adapter is gathered by scanning the archive."""
+        result = backup_manager.backup_vendor(mock_adapter)
+
+        assert result.metadata is not None
+        backup_path = result.metadata.backup_path
+        assert result.metadata.checksum == backup_manager._calculate_checksum(backup_path)
+        assert result.metadata.size_bytes == backup_path.stat().st_size
+        assert result.metadata.file_count == 2
+
+    def test_backup_vendor_uses_streamed_stats(
+        self, backup_manager: BackupManager, mock_adapter: Mock
+    ) -> None:
+        """Test archives written by built-in adapters are not read back."""
+        adapter = ClaudeAdapter()
+        adapter._config_dir = mock_adapter.info.config_dir
+        adapter._settings_file = adapter._config_dir / "settings.json"
+
+        with patch("ai_asst_mgr.operations.backup.scan_tar_archive") as mock_scan:
+            result = backup_manager.backup_vendor(adapter)
+
+        mock_scan.assert_not_called()
+        assert result.success is True
+        assert result.metadata is not None
+        backup_path = result.metadata.backup_path
+        assert result.metadata.checksum == backup_manager._calculate_checksum(backup_path)
+        assert result.metadata.file_count == 2
+        assert backup_manager.verify_backup(backup_path)[0] is True
+
+    def test_backup_vendor_with_compression(
+        self, temp_backup_dir: Path, mock_adapter: Mock
+    ) -> None:
+        """Test the configured codec is passed through to the adapter."""
+        manager = BackupManager(temp_backup_dir, compression=CompressionSettings("xz", 1))
+        adapter = ClaudeAdapter()
+        adapter._config_dir = mock_adapter.info.config_dir
+        adapter._settings_file = adapter._config_dir / "settings.json"
+
+        result = manager.backup_vendor(adapter)
+
+        assert result.success is True
+        assert result.metadata is not None
+        backup_path = result.metadata.backup_path
+        assert backup_path.name.endswith(".tar.xz")
+        assert result.metadata.file_count == 2
+        assert manager.verify_backup(backup_path) == (True, "Backup valid (4 files, xz)")
+
     def test_backup_vendor_not_installed(
         self, backup_manager: BackupManager, mock_adapter: Mock
     ) -> None:
@@ -252,6 +334,54 @@ class TestBackupAllVendors:
         assert summary.successful == 1
         assert summary.failed == 1
 
+    def test_backup_all_vendors_parallel(
+        self, backup_manager: BackupManager, tmp_path: Path
+    ) -> None:
+        """Test vendors run concurrently and results keep the input order."""
+        vendor_ids = ["claude", "gemini", "openai"]
+        barrier = threading.Barrier(len(vendor_ids), timeout=5)
+        adapters = {
+            vendor_id: _make_adapter(tmp_path, vendor_id, before_backup=barrier.wait)
+            for vendor_id in vendor_ids
+        }
+        messages: list[str] = []
+
+        # The barrier only releases if all three backups are in flight at once
+        summary = backup_manager.backup_all_vendors(
+            adapters, progress_callback=messages.append, max_workers=3
+        )
+
+        assert summary.successful == 3
+        assert list(summary.results) == vendor_ids
+        assert summary.total_size_bytes == sum(
+            r.metadata.size_bytes for r in summary.results.values() if r.metadata
+        )
+        for vendor_id in vendor_ids:
+            assert f"[{vendor_id}] Backup complete" in " ".join(messages)
+
+    def test_backup_all_vendors_parallel_serializes_callback(
+        self, backup_manager: BackupManager, tmp_path: Path
+    ) -> None:
+        """Test the progress callback is never entered by two threads at once."""
+        adapters = {v: _make_adapter(tmp_path, v) for v in ("claude", "gemini", "openai")}
+        active = 0
+        overlaps = 0
+
+        def callback(_msg: str) -> None:
+            nonlocal active, overlaps
+            active += 1
+            if active > 1:
+                overlaps += 1
+            time.sleep(0.001)
+            active -= 1
+
+        summary = backup_manager.backup_all_vendors(
+            adapters, progress_callback=callback, max_workers=3
+        )
+
+        assert summary.successful == 3
+        assert overlaps == 0
+
 
 class TestListBackups:
     """Tests for list_backups method."""
@@ -287,17 +417,29 @@ class TestListBackups:
         assert len(gemini_backups) == 0
 
     def test_list_backups_sorted_by_timestamp(
-        self, backup_manager: BackupManager, mock_adapter: Mock
+        self, backup_manager: BackupManager, mock_adapter: Mock, tmp_path: Path
     ) -> None:
         """Test list_backups returns newest first."""
         backup_manager.backup_vendor(mock_adapter)
-        backup_manager.backup_vendor(mock_adapter)
+        backup_manager.backup_vendor(_make_adapter(tmp_path, "gemini"))
 
         backups = backup_manager.list_backups()
 
-        assert len(backups) == 2
+        assert [b.vendor_id for b in backups] == ["gemini", "claude"]
         assert backups[0].timestamp >= backups[1].timestamp
 
+    def test_same_path_recorded_once(
+        self, backup_manager: BackupManager, mock_adapter: Mock
+    ) -> None:
+        """Test a backup overwriting an archive of the same name replaces its entry."""
+        first = backup_manager.backup_vendor(mock_adapter)
+        assert first.metadata is not None
+        mock_adapter.backup.side_effect = lambda _: first.metadata.backup_path
+
+        backup_manager.backup_vendor(mock_adapter)
+
+        assert len(backup_manager.list_backups("claude")) == 1
+
 
 class TestGetLatestBackup:
     """Tests for get_latest_backup method."""
@@ -370,6 +512,22 @@ class TestDeleteBackup:
         assert deleted is True
         assert not backup_path.exists()
 
+    def test_delete_backup_removes_index(
+        self, backup_manager: BackupManager, mock_adapter: Mock
+    ) -> None:
+        """Test delete_backup also removes the archive's member index."""
+        adapter = ClaudeAdapter()
+        adapter._config_dir = mock_adapter.info.config_dir
+        adapter._settings_file = adapter._config_dir / "settings.json"
+        result = backup_manager.backup_vendor(adapter)
+        assert result.metadata is not None
+        backup_path = result.metadata.backup_path
+        assert backup_manager.load_archive_index(backup_path) is not None
+
+        backup_manager.delete_backup(backup_path)
+
+        assert list(backup_path.parent.glob(f"{backup_path.name}*")) == []
+
     def test_delete_backup_not_found(self, backup_manager: BackupManager, tmp_path: Path) -> None:
         """Test delete_backup returns False for missing file."""
         fake_path = tmp_path / "nonexistent.tar.gz"
@@ -425,6 +583,156 @@ class TestRetentionPolicy:
         # Should only keep 2 due to retention policy
         assert len(backups) == 2
 
+    def test_retention_removes_expired_entries_at_once(self, tmp_path: Path) -> None:
+        """Test expired backups are dropped from the catalog in a single call."""
+        manager = BackupManager(tmp_path / "backups", retention_count=1)
+        manager.backup_vendor(_make_adapter(tmp_path, "claude"))
+        current = manager.list_backups("claude")[0]
+        older = [
+            BackupMetadata(
+                vendor_id="claude",
+                timestamp=datetime(2024, 1, day, tzinfo=UTC),
+                backup_path=current.backup_path.with_name(f"old{day}.tar.gz"),
+                size_bytes=1,
+                checksum="x",
+                file_count=1,
+                config_dir=current.config_dir,
+            )
+            for day in (1, 2)
+        ]
+        for entry in older:
+            entry.backup_path.write_bytes(b"old")
+        manager.catalog.add_many(older)
+
+        with patch.object(manager.catalog, "remove", wraps=manager.catalog.remove) as remove:
+            manager._apply_retention_policy("claude")
+
+        remove.assert_called_once()
+        assert [b.backup_path for b in manager.list_backups("claude")] == [current.backup_path]
+        assert not any(entry.backup_path.exists() for entry in older)
+
+
+class TestBackupExclusions:
+    """Tests for exclusion rules in BackupManager."""
+
+    def test_adapter_called_without_exclusions_by_default(
+        self, backup_manager: BackupManager, mock_adapter: Mock
+    ) -> None:
+        """Test adapters apply their own defaults unless the manager adds rules."""
+        backup_manager.backup_vendor(mock_adapter)
+
+        mock_adapter.backup.assert_called_once_with(backup_manager.backup_dir / "claude")
+
+    def test_exclude_patterns_applied(self, temp_backup_dir: Path, mock_adapter: Mock) -> None:
+        """Test manager patterns and size limits reach the archive."""
+        config_dir = mock_adapter.info.config_dir
+        (config_dir / "projects").mkdir()
+        (config_dir / "projects" / "session.jsonl").write_text("x" * 10_000)
+        (config_dir / "big.bin").write_bytes(b"x" * 2_000)
+        manager = BackupManager(temp_backup_dir, exclude=["projects/"], max_file_size=1_000)
+        adapter = ClaudeAdapter()
+        adapter._config_dir = config_dir
+        adapter._settings_file = config_dir / "settings.json"
+
+        result = manager.backup_vendor(adapter)
+
+        assert result.metadata is not None
+        with tarfile.open(result.metadata.backup_path, "r:*") as tar:
+            names = tar.getnames()
+        assert "claude/settings.json" in names
+        assert not any("projects" in n or "big.bin" in n for n in names)
+
+    def test_explain_backup(self, temp_backup_dir: Path, mock_adapter: Mock) -> None:
+        """Test explain_backup reports savings without writing anything."""
+        config_dir = mock_adapter.info.config_dir
+        (config_dir / "cache.log").write_text("x" * 500)
+        manager = BackupManager(temp_backup_dir / "new", exclude=["*.log"])
+
+        report = manager.explain_backup(mock_adapter)
+
+        assert report.included_files == 2
+        assert report.excluded == {"*.log (--exclude)": RuleSavings(files=1, bytes=500)}
+        assert not (temp_backup_dir / "new").exists()
+
+    def test_incremental_snapshot_honors_exclusions(
+        self, temp_backup_dir: Path, mock_adapter: Mock
+    ) -> None:
+        """Test snapshots skip excluded files too."""
+        (mock_adapter.info.config_dir / "cache.log").write_text("x" * 500)
+        manager = BackupManager(temp_backup_dir, incremental=True, exclude=["*.log"])
+
+        result = manager.backup_vendor(mock_adapter)
+
+        assert result.metadata is not None
+        assert result.metadata.file_count == 2
+
+
+class TestIncrementalBackups:
+    """Tests for deduplicated snapshot backups."""
+
+    @pytest.fixture
+    def incremental_manager(self, temp_backup_dir: Path) -> BackupManager:
+        """Create a BackupManager that stores snapshots."""
+        return BackupManager(temp_backup_dir, retention_count=2, incremental=True)
+
+    def test_snapshot_backup_does_not_call_adapter_backup(
+        self, incremental_manager: BackupManager, mock_adapter: Mock
+    ) -> None:
+        """Test incremental backups snapshot the config dir directly."""
+        result = incremental_manager.backup_vendor(mock_adapter)
+
+        assert result.success is True
+        assert result.metadata is not None
+        assert result.metadata.backup_path.name.endswith(".snapshot.json")
+        assert result.metadata.file_count == 2
+        mock_adapter.backup.assert_not_called()
+        assert incremental_manager.verify_backup(result.metadata.backup_path)[0] is True
+
+    def test_unchanged_snapshot_stores_nothing(
+        self, incremental_manager: BackupManager, mock_adapter: Mock
+    ) -> None:
+        """Test a second snapshot of unchanged files adds no chunk data."""
+        first = incremental_manager.backup_vendor(mock_adapter)
+        second = incremental_manager.backup_vendor(mock_adapter)
+
+        assert first.metadata is not None
+        assert second.metadata is not None
+        assert first.metadata.size_bytes > 0
+        assert second.metadata.size_bytes == 0
+        assert len(incremental_manager.list_backups("claude")) == 2
+
+    def test_retention_collects_garbage(
+        self, incremental_manager: BackupManager, mock_adapter: Mock
+    ) -> None:
+        """Test chunks only referenced by expired snapshots are removed."""
+        settings = mock_adapter.info.config_dir / "settings.json"
+        store_objects = incremental_manager.backup_dir / "claude" / ".store" / "objects"
+        for version in range(3):
+            settings.write_text(f'{{"version": {version}}}')
+            incremental_manager.backup_vendor(mock_adapter)
+
+        backups = incremental_manager.list_backups("claude")
+        chunk_files = [p for p in store_objects.rglob("*") if p.is_file()]
+
+        assert len(backups) == 2
+        # agents file shared by all snapshots + one settings chunk per live snapshot
+        assert len(chunk_files) == 3
+        assert all(incremental_manager.verify_backup(b.backup_path)[0] for b in backups)
+
+    def test_verify_detects_modified_manifest(
+        self, incremental_manager: BackupManager, mock_adapter: Mock
+    ) -> None:
+        """Test a tampered snapshot manifest fails checksum verification."""
+        result = incremental_manager.backup_vendor(mock_adapter)
+        assert result.metadata is not None
+        manifest = result.metadata.backup_path
+        manifest.write_text(manifest.read_text().replace("settings.json", "settings.jsoN"))
+
+        is_valid, message = incremental_manager.verify_backup(manifest)
+
+        assert is_valid is False
+        assert "Checksum mismatch" in message
+
 
 class TestBackupEdgeCases:
     """Additional edge case tests for BackupManager."""
@@ -551,22 +859,6 @@ class TestBackupEdgeCases:
         assert is_valid is False
         assert "error" in message.lower() or "invalid" in message.lower()
 
-    def test_count_files_tar_error(self, backup_manager: BackupManager, tmp_path: Path) -> None:
-        """Test _count_files_in_archive handles TarError gracefully."""
-        corrupt_archive = tmp_path / "corrupt.tar.gz"
-        corrupt_archive.write_bytes(b"not a tar file at all")
-
-        count = backup_manager._count_files_in_archive(corrupt_archive)
-        assert count == 0
-
-    def test_load_manifest_non_dict(self, backup_manager: BackupManager, tmp_path: Path) -> None:
-        """Test _load_manifest handles non-dict JSON gracefully."""
-        manifest_path = tmp_path / "manifest.json"
-        manifest_path.write_text("[]")  # JSON array instead of dict
-
-        result = backup_manager._load_manifest(manifest_path)
-        assert result == {"backups": []}
-
     def test_get_stored_checksum_no_match(
         self, backup_manager: BackupManager, mock_adapter: Mock, tmp_path: Path
     ) -> None:
@@ -595,24 +887,49 @@ class TestBackupEdgeCases:
         checksum = backup_manager._get_stored_checksum(backup_path)
         assert checksum is None
 
-    def test_remove_from_manifest_nonexistent(
-        self, backup_manager: BackupManager, tmp_path: Path
-    ) -> None:
-        """Test _remove_from_manifest handles nonexistent manifest gracefully."""
-        backup_path = tmp_path / "nonexistent.tar.gz"
-        # Should not raise exception
-        backup_manager._remove_from_manifest("claude", backup_path)
 
-    def test_remove_from_manifest_corrupt(
-        self, backup_manager: BackupManager, tmp_path: Path
-    ) -> None:
-        """Test _remove_from_manifest handles corrupt manifest gracefully."""
+class TestLegacyManifestImport:
+    """Tests for importing pre-catalog JSON manifests."""
+
+    def test_manifest_imported_once(self, backup_manager: BackupManager) -> None:
+        """Test manifest entries move into the catalog and the manifest is retired."""
         vendor_dir = backup_manager.backup_dir / "claude"
         vendor_dir.mkdir(parents=True)
-
+        backup_path = vendor_dir / "claude_backup_20250101_000000.tar.gz"
+        backup_path.write_bytes(b"archive")
         manifest_path = vendor_dir / "backup_manifest.json"
-        manifest_path.write_text("{invalid json")
+        manifest_path.write_text(
+            json.dumps(
+                {
+                    "vendor_id": "claude",
+                    "backups": [
+                        {
+                            "vendor_id": "claude",
+                            "timestamp": "2025-01-01T00:00:00+00:00",
+                            "backup_path": str(backup_path),
+                            "size_bytes": 7,
+                            "checksum": "abc123",
+                            "file_count": 1,
+                            "config_dir": "/test/path",
+                        }
+                    ],
+                }
+            )
+        )
 
-        backup_path = vendor_dir / "backup.tar.gz"
-        # Should not raise exception
-        backup_manager._remove_from_manifest("claude", backup_path)
+        backups = backup_manager.list_backups("claude")
+
+        assert [b.backup_path for b in backups] == [backup_path]
+        assert backup_manager._get_stored_checksum(backup_path) == "abc123"
+        assert not manifest_path.exists()
+        assert manifest_path.with_name("backup_manifest.json.migrated").exists()
+        assert BackupManager(backup_manager.backup_dir).list_backups() == backups
+
+    def test_non_dict_manifest_retired_without_entries(self, backup_manager: BackupManager) -> None:
+        """Test a manifest that is valid JSON but not an object imports nothing."""
+        vendor_dir = backup_manager.backup_dir / "claude"
+        vendor_dir.mkdir(parents=True)
+        (vendor_dir / "backup_manifest.json").write_text("[]")
+
+        assert backup_manager.list_backups() == []
+        assert (vendor_dir / "backup_manifest.json.migrated").exists()
@@ -0,0 +1,83 @@
+"""Unit tests for the SQLite backup catalog."""
+
+from datetime import UTC, datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from ai_asst_mgr.operations.backup_catalog import BackupCatalog, BackupMetadata
+
+
+@pytest.fixture
+def catalog(tmp_path: Path) -> BackupCatalog:
+    """Create a catalog in a per-test directory."""
+    return BackupCatalog(tmp_path / "backups" / "backup_catalog.db")
+
+
+def _metadata(vendor_id: str, hours: int, name: str | None = None) -> BackupMetadata:
+    """Build metadata for a backup taken ``hours`` after a fixed start."""
+    return BackupMetadata(
+        vendor_id=vendor_id,
+        timestamp=datetime(2025, 1, 1, tzinfo=UTC) + timedelta(hours=hours),
+        backup_path=Path(f"/backups/{vendor_id}/{name or f'{vendor_id}_{hours:03d}'}.tar.gz"),
+        size_bytes=100 + hours,
+        checksum=f"sum{hours}",
+        file_count=hours,
+        config_dir=f"/home/user/.{vendor_id}",
+    )
+
+
+class TestBackupCatalog:
+    """Tests for BackupCatalog."""
+
+    def test_reads_do_not_create_file(self, catalog: BackupCatalog) -> None:
+        """Queries on a catalog that was never written return nothing."""
+        assert catalog.backups() == []
+        assert catalog.latest("claude") is None
+        assert catalog.expired("claude", 0) == []
+        assert catalog.checksum(Path("/backups/x.tar.gz")) is None
+        assert catalog.remove([Path("/backups/x.tar.gz")]) == 0
+        assert not catalog.db_path.exists()
+
+    def test_round_trip_and_ordering(self, catalog: BackupCatalog) -> None:
+        """Entries come back intact, newest first, optionally per vendor."""
+        entries = [_metadata("claude", 1), _metadata("gemini", 3), _metadata("claude", 2)]
+
+        assert catalog.add_many(entries) == 3
+
+        assert [b.file_count for b in catalog.backups()] == [3, 2, 1]
+        assert catalog.backups("claude") == [entries[2], entries[0]]
+        assert catalog.latest("claude") == entries[2]
+        assert catalog.checksum(entries[1].backup_path) == "sum3"
+
+    def test_timestamps_with_other_offsets_sort_chronologically(
+        self, catalog: BackupCatalog
+    ) -> None:
+        """Timestamps are normalized to UTC so text order matches time order."""
+        earlier = _metadata("claude", 5)
+        later = _metadata("claude", 0, "later")
+        later.timestamp = datetime(2025, 1, 1, 6, tzinfo=timezone(timedelta(hours=2)))
+        catalog.add_many([later, earlier])
+
+        assert catalog.latest("claude") == earlier
+
+    def test_expired_and_bulk_remove(self, catalog: BackupCatalog) -> None:
+        """Retention lists everything beyond the newest N and removes it at once."""
+        catalog.add_many(_metadata("claude", hours) for hours in range(5))
+        catalog.add(_metadata("gemini", 10))
+
+        expired = catalog.expired("claude", 2)
+
+        assert [b.file_count for b in expired] == [2, 1, 0]
+        assert catalog.remove(b.backup_path for b in expired) == 3
+        assert [b.file_count for b in catalog.backups()] == [10, 4, 3]
+
+    def test_add_replaces_same_path(self, catalog: BackupCatalog) -> None:
+        """Recording a path twice keeps only the newest metadata."""
+        first = _metadata("claude", 1, "same")
+        second = _metadata("claude", 2, "same")
+
+        catalog.add(first)
+        catalog.add(second)
+
+        assert catalog.backups() == [second]
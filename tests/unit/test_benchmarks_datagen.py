@@ -0,0 +1,148 @@
+"""Unit tests for the benchmark synthetic data generator."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from ai_asst_mgr.database import DatabaseManager
+from ai_asst_mgr.database.sync import parse_history_file
+from ai_asst_mgr.database.sync_gemini import find_session_files, sync_gemini_history_to_db
+from ai_asst_mgr.operations.github_parser import detect_vendor_attribution
+from benchmarks.datagen import (
+    SCALES,
+    main,
+    parse_scale,
+    populate_database,
+    synthetic_commits,
+    write_config_tree,
+    write_gemini_tree,
+    write_history_jsonl,
+)
+
+ANCHOR = datetime(2026, 1, 15, tzinfo=UTC)
+
+
+def _dump(db_path: Path) -> list[tuple[object, ...]]:
+    """Return all generated rows, excluding autogenerated created_at columns."""
+    with sqlite3.connect(db_path) as conn:
+        sessions = conn.execute(
+            "SELECT session_id, vendor_id, start_time, tool_calls_count FROM sessions ORDER BY id"
+        ).fetchall()
+        events = conn.execute(
+            "SELECT session_id, event_type, event_name, timestamp FROM events ORDER BY id"
+        ).fetchall()
+        commits = conn.execute("SELECT sha, message FROM github_commits ORDER BY id").fetchall()
+    return sessions + events + commits
+
+
+class TestParseScale:
+    """Tests for parse_scale."""
+
+    @pytest.mark.parametrize(("value", "expected"), list(SCALES.items()))
+    def test_named_scales(self, value: str, expected: int) -> None:
+        """Named scales map to their session counts."""
+        assert parse_scale(value) == expected
+
+    def test_integer_with_underscores(self) -> None:
+        """Plain integers are accepted, with optional digit separators."""
+        assert parse_scale("250_000") == 250_000
+
+    @pytest.mark.parametrize("value", ["huge", "-5"])
+    def test_invalid(self, value: str) -> None:
+        """Unknown names and negative numbers are rejected."""
+        with pytest.raises(ValueError, match="cale"):
+            parse_scale(value)
+
+
+class TestPopulateDatabase:
+    """Tests for populate_database."""
+
+    def test_counts_match_database(self, tmp_path: Path) -> None:
+        """Reported stats match the rows actually written."""
+        db_path = tmp_path / "bench.db"
+        stats = populate_database(db_path, sessions=200, commits=30, anchor=ANCHOR, batch_size=64)
+
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] == 200
+            assert conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == stats.events
+            assert conn.execute("SELECT COUNT(*) FROM github_commits").fetchone()[0] == 30
+        assert stats.sessions == 200
+        assert stats.commits == 30
+
+    def test_deterministic(self, tmp_path: Path) -> None:
+        """The same seed and anchor produce identical data."""
+        populate_database(tmp_path / "a.db", sessions=50, seed=7, anchor=ANCHOR)
+        populate_database(tmp_path / "b.db", sessions=50, seed=7, anchor=ANCHOR)
+        populate_database(tmp_path / "c.db", sessions=50, seed=8, anchor=ANCHOR)
+
+        assert _dump(tmp_path / "a.db") == _dump(tmp_path / "b.db")
+        assert _dump(tmp_path / "a.db") != _dump(tmp_path / "c.db")
+
+    def test_queryable_by_database_manager(self, tmp_path: Path) -> None:
+        """Generated data falls inside DatabaseManager query windows."""
+        db_path = tmp_path / "bench.db"
+        populate_database(db_path, sessions=300, days=7)
+
+        summary = DatabaseManager(db_path).get_vendor_stats_summary(days=30)
+
+        assert sum(s.total_sessions for s in summary) == 300
+
+    def test_synthetic_commits_match_attribution(self) -> None:
+        """Generated commits are unique and their vendors agree with attribution."""
+        commits = list(synthetic_commits(200, anchor=ANCHOR))
+
+        assert len({c.sha for c in commits}) == 200
+        assert all(detect_vendor_attribution(c.message) == c.vendor_id for c in commits)
+        assert any(c.vendor_id for c in commits)
+
+
+class TestFileGenerators:
+    """Tests for the history, Gemini and config tree writers."""
+
+    def test_history_jsonl_parses(self, tmp_path: Path) -> None:
+        """history.jsonl output is readable by the Claude sync parser."""
+        path = tmp_path / "history.jsonl"
+        lines = write_history_jsonl(path, sessions=20, anchor=ANCHOR)
+
+        entries = parse_history_file(path)
+        assert len(entries) == lines
+        assert len({e.session_id for e in entries}) == 20
+
+    def test_gemini_tree_imports(self, tmp_path: Path) -> None:
+        """Gemini session files are found and imported by the Gemini sync."""
+        base_dir = tmp_path / "gemini"
+        write_gemini_tree(base_dir, sessions=6, projects=2, anchor=ANCHOR)
+        db = DatabaseManager(tmp_path / "sessions.db")
+        db.initialize()
+
+        assert len(find_session_files(base_dir)) == 6
+        result = sync_gemini_history_to_db(db, base_dir, full_sync=True)
+        assert result.sessions_imported == 6
+        assert not result.errors
+
+    def test_config_tree(self, tmp_path: Path) -> None:
+        """Config tree has settings.json plus the requested number of files."""
+        root = tmp_path / ".claude"
+        total = write_config_tree(root, files=25, file_size=512)
+
+        files = [p for p in root.rglob("*") if p.is_file()]
+        assert len(files) == 26
+        assert total == sum(p.stat().st_size for p in files)
+        assert json.loads((root / "settings.json").read_text())
+
+
+class TestMain:
+    """Tests for the datagen command-line entry point."""
+
+    def test_db_command(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """The db subcommand creates a database and reports counts."""
+        output = tmp_path / "cli.db"
+
+        assert main(["db", str(output), "--scale", "25"]) == 0
+        assert output.exists()
+        assert "25 sessions" in capsys.readouterr().out
@@ -185,7 +185,8 @@ def test_restore(adapter_with_temp_dir: ClaudeAdapter, tmp_path: Path) -> None:
     test_file.write_text("# Modified")
 
     # Restore
-    adapter_with_temp_dir.restore(backup_file)
+    with pytest.deprecated_call():
+        adapter_with_temp_dir.restore(backup_file)
 
     # Verify restoration
     assert test_file.read_text() == "# Original"
@@ -41,6 +41,7 @@ from ai_asst_mgr.cli import (
     app,
 )
 from ai_asst_mgr.coaches import ClaudeCoach, CodexCoach, GeminiCoach, Priority
+from ai_asst_mgr.database import DatabaseManager
 
 runner = CliRunner()
 
@@ -1858,6 +1859,156 @@ class TestBackupCommand:
         assert "vendor" in result.stdout.lower()
         assert "backup" in result.stdout.lower()
 
+    def test_backup_incremental_flag(self) -> None:
+        """Test --incremental creates a snapshot-mode backup manager."""
+        with (
+            patch("ai_asst_mgr.cli._get_backup_manager") as mock_get_manager,
+            patch("ai_asst_mgr.cli.VendorRegistry") as mock_registry,
+        ):
+            mock_registry.return_value.get_installed_vendors.return_value = {}
+
+            result = runner.invoke(app, ["backup", "--incremental"])
+
+            assert result.exit_code == 0
+            assert mock_get_manager.call_args.kwargs["incremental"] is True
+            assert mock_get_manager.call_args.kwargs["compression"] is None
+
+    def test_backup_compression_options(self) -> None:
+        """Test --compression and --level build compression settings."""
+        from ai_asst_mgr.utils.compression import CompressionSettings
+
+        with (
+            patch("ai_asst_mgr.cli._get_backup_manager") as mock_get_manager,
+            patch("ai_asst_mgr.cli.VendorRegistry") as mock_registry,
+        ):
+            mock_registry.return_value.get_installed_vendors.return_value = {}
+
+            result = runner.invoke(app, ["backup", "--compression", "xz", "--level", "3"])
+
+            assert result.exit_code == 0
+            assert mock_get_manager.call_args.kwargs["compression"] == CompressionSettings("xz", 3)
+
+    @pytest.mark.parametrize(("argv", "workers"), [([], 2), (["--jobs", "1"], 1)])
+    def test_backup_all_jobs(self, argv: list[str], workers: int) -> None:
+        """Test all-vendor backups run every vendor at once unless --jobs is given."""
+        with (
+            patch("ai_asst_mgr.cli._get_backup_manager") as mock_get_manager,
+            patch("ai_asst_mgr.cli.VendorRegistry") as mock_registry,
+        ):
+            installed = {"claude": MagicMock(), "gemini": MagicMock()}
+            mock_registry.return_value.get_installed_vendors.return_value = installed
+            mock_manager = mock_get_manager.return_value
+            mock_manager.backup_all_vendors.return_value = MagicMock(
+                results={}, successful=2, total_vendors=2, total_size_bytes=0
+            )
+
+            result = runner.invoke(app, ["backup", *argv])
+
+            assert result.exit_code == 0
+            assert mock_manager.backup_all_vendors.call_args.kwargs["max_workers"] == workers
+
+    def test_backup_database(self, tmp_path: Path) -> None:
+        """Test --database backs up the given database instead of vendors."""
+        db_path = tmp_path / "sessions.db"
+        with (
+            patch("ai_asst_mgr.cli._get_backup_manager") as mock_get_manager,
+            patch("ai_asst_mgr.cli.VendorRegistry") as mock_registry,
+        ):
+            mock_manager = mock_get_manager.return_value
+            mock_manager.backup_database.return_value = MagicMock(
+                success=True,
+                metadata=MagicMock(backup_path=tmp_path / "database.tar.gz", size_bytes=1024),
+            )
+
+            result = runner.invoke(app, ["backup", "--database", "--db-path", str(db_path)])
+
+            assert result.exit_code == 0
+            assert "Database backup created" in result.stdout
+            assert mock_manager.backup_database.call_args.args[0] == db_path
+            mock_registry.return_value.get_installed_vendors.assert_not_called()
+
+    def test_backup_database_failure(self, tmp_path: Path) -> None:
+        """Test a failed database backup exits non-zero."""
+        with patch("ai_asst_mgr.cli._get_backup_manager") as mock_get_manager:
+            mock_get_manager.return_value.backup_database.return_value = MagicMock(
+                success=False, metadata=None, error="Database not found"
+            )
+
+            result = runner.invoke(
+                app, ["backup", "--database", "--db-path", str(tmp_path / "missing.db")]
+            )
+
+            assert result.exit_code == 1
+            assert "Database not found" in result.stdout
+
+    def test_backup_dry_run_explain(self, tmp_path: Path) -> None:
+        """Test --dry-run --explain reports savings per rule without backing up."""
+        from ai_asst_mgr.adapters.claude import ClaudeAdapter
+
+        config_dir = tmp_path / ".claude"
+        (config_dir / "projects").mkdir(parents=True)
+        (config_dir / "settings.json").write_text("{}")
+        (config_dir / "projects" / "session.jsonl").write_bytes(b"x" * 4096)
+        adapter = ClaudeAdapter()
+        adapter._config_dir = config_dir
+
+        with (
+            patch("ai_asst_mgr.cli.VendorRegistry") as mock_registry,
+            patch("ai_asst_mgr.operations.backup.BackupManager.backup_vendor") as mock_backup,
+        ):
+            mock_registry.return_value.get_vendor.return_value = adapter
+
+            result = runner.invoke(
+                app,
+                [
+                    "backup",
+                    "--vendor",
+                    "claude",
+                    "--backup-dir",
+                    str(tmp_path / "backups"),
+                    "--exclude",
+                    "projects/",
+                    "--dry-run",
+                    "--explain",
+                ],
+            )
+
+        assert result.exit_code == 0
+        assert "Backup Dry Run" in result.stdout
+        assert "projects/ (--exclude)" in result.stdout
+        assert "4.0 KB" in result.stdout
+        mock_backup.assert_not_called()
+        assert not (tmp_path / "backups").exists()
+
+    def test_backup_invalid_max_file_size(self) -> None:
+        """Test an unparseable --max-file-size exits with an error."""
+        with patch("ai_asst_mgr.cli._get_backup_manager") as mock_get_manager:
+            result = runner.invoke(app, ["backup", "--max-file-size", "lots"])
+
+        assert result.exit_code == 1
+        assert "Invalid size 'lots'" in result.stdout
+        mock_get_manager.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("512", 512), ("500K", 512_000), ("1.5M", 1_572_864), ("2GB", 2**31)],
+    )
+    def test_parse_size(self, value: str, expected: int) -> None:
+        """Test size strings accept K/M/G suffixes and fractions."""
+        assert cli._parse_size(value) == expected
+
+    def test_backup_invalid_compression(self) -> None:
+        """Test an unknown codec or out-of-range level exits with an error."""
+        with patch("ai_asst_mgr.cli._get_backup_manager") as mock_get_manager:
+            unknown = runner.invoke(app, ["backup", "--compression", "rar"])
+            bad_level = runner.invoke(app, ["backup", "--compression", "gz", "--level", "42"])
+
+        assert unknown.exit_code == 1
+        assert "Unsupported compression" in unknown.stdout
+        assert bad_level.exit_code == 1
+        assert "between 1 and 9" in bad_level.stdout
+        mock_get_manager.assert_not_called()
+
     def test_backup_list_empty(self) -> None:
         """Test backup list with no backups."""
         with (
@@ -4046,7 +4197,7 @@ class TestDatabaseCommands:
         db_path.touch()
 
         with patch("ai_asst_mgr.cli.DEFAULT_DB_PATH", db_path):
-            with patch("ai_asst_mgr.cli.DatabaseManager") as mock_db:
+            with patch("ai_asst_mgr.database.DatabaseManager") as mock_db:
                 result = runner.invoke(app, ["db", "init", "--force"])
                 assert result.exit_code == 0
                 assert "Deleted existing database" in result.stdout
@@ -4058,7 +4209,7 @@ class TestDatabaseCommands:
         db_path = tmp_path / "sessions.db"
 
         with patch("ai_asst_mgr.cli.DEFAULT_DB_PATH", db_path):
-            with patch("ai_asst_mgr.cli.DatabaseManager") as mock_db:
+            with patch("ai_asst_mgr.database.DatabaseManager") as mock_db:
                 result = runner.invoke(app, ["db", "init"])
                 assert result.exit_code == 0
                 assert "initialized successfully" in result.stdout
@@ -4079,8 +4230,8 @@ class TestDatabaseCommands:
         db_path.touch()
 
         with patch("ai_asst_mgr.cli.DEFAULT_DB_PATH", db_path):
-            with patch("ai_asst_mgr.cli.DatabaseManager"):
-                with patch("ai_asst_mgr.cli.sync_history_to_db") as mock_sync:
+            with patch("ai_asst_mgr.database.DatabaseManager"):
+                with patch("ai_asst_mgr.database.sync.sync_history_to_db") as mock_sync:
                     from dataclasses import dataclass
 
                     @dataclass
@@ -4103,8 +4254,8 @@ class TestDatabaseCommands:
         db_path.touch()
 
         with patch("ai_asst_mgr.cli.DEFAULT_DB_PATH", db_path):
-            with patch("ai_asst_mgr.cli.DatabaseManager"):
-                with patch("ai_asst_mgr.cli.sync_history_to_db") as mock_sync:
+            with patch("ai_asst_mgr.database.DatabaseManager"):
+                with patch("ai_asst_mgr.database.sync.sync_history_to_db") as mock_sync:
                     from dataclasses import dataclass
 
                     @dataclass
@@ -4128,8 +4279,10 @@ class TestDatabaseCommands:
         db_path.touch()
     
         with patch("ai_asst_mgr.cli.DEFAULT_DB_PATH", db_path):
-            with patch("ai_asst_mgr.cli.DatabaseManager"):
-                with patch("ai_asst_mgr.cli.sync_gemini_history_to_db") as mock_sync:
+            with patch("ai_asst_mgr.database.DatabaseManager"):
+                with patch(
+                    "ai_asst_mgr.database.sync_gemini.sync_gemini_history_to_db"
+                ) as mock_sync:
                     from ai_asst_mgr.database.sync_gemini import GeminiSyncResult
     
                     mock_sync.return_value = GeminiSyncResult(
@@ -4154,8 +4307,10 @@ class TestDatabaseCommands:
         db_path.touch()
     
         with patch("ai_asst_mgr.cli.DEFAULT_DB_PATH", db_path):
-            with patch("ai_asst_mgr.cli.DatabaseManager"):
-                with patch("ai_asst_mgr.cli.sync_gemini_history_to_db") as mock_sync:
+            with patch("ai_asst_mgr.database.DatabaseManager"):
+                with patch(
+                    "ai_asst_mgr.database.sync_gemini.sync_gemini_history_to_db"
+                ) as mock_sync:
                     from ai_asst_mgr.database.sync_gemini import GeminiSyncResult
     
                     mock_sync.return_value = GeminiSyncResult(
@@ -4197,8 +4352,8 @@ class TestDatabaseCommands:
         db_path.touch()
 
         with patch("ai_asst_mgr.cli.DEFAULT_DB_PATH", db_path):
-            with patch("ai_asst_mgr.cli.DatabaseManager"):
-                with patch("ai_asst_mgr.cli.get_sync_status") as mock_status:
+            with patch("ai_asst_mgr.database.DatabaseManager"):
+                with patch("ai_asst_mgr.database.sync.get_sync_status") as mock_status:
                     mock_status.return_value = {
                         "database_sessions": 10,
                         "database_events": 50,
@@ -4214,6 +4369,36 @@ class TestDatabaseCommands:
                     assert "50" in result.stdout
 
 
+class TestProfileSqlOption:
+    """Tests for the global --profile-sql option."""
+
+    def test_profile_sql_prints_summary(self, tmp_path: Path) -> None:
+        """Test --profile-sql prints the statement summary on exit."""
+        from ai_asst_mgr.database.profiling import disable_sql_profiling
+
+        db_path = tmp_path / "sessions.db"
+        DatabaseManager(db_path).initialize()
+
+        try:
+            with patch("ai_asst_mgr.cli.DEFAULT_DB_PATH", db_path):
+                result = runner.invoke(app, ["--profile-sql", "db", "status"])
+        finally:
+            disable_sql_profiling()
+
+        assert result.exit_code == 0
+        assert "SQL Profile" in result.output
+
+    def test_without_profile_sql_no_summary(self, tmp_path: Path) -> None:
+        """Test no summary is printed when profiling is off."""
+        db_path = tmp_path / "sessions.db"
+        DatabaseManager(db_path).initialize()
+
+        with patch("ai_asst_mgr.cli.DEFAULT_DB_PATH", db_path):
+            result = runner.invoke(app, ["db", "status"])
+
+        assert "SQL Profile" not in result.output
+
+
 class TestGitHubCommands:
     """Tests for GitHub activity tracking commands."""
 
@@ -4237,7 +4422,7 @@ class TestGitHubCommands:
         """Test _resolve_github_repos when no git repos found."""
         from ai_asst_mgr.cli import _resolve_github_repos
 
-        with patch("ai_asst_mgr.cli.find_git_repos", return_value=[]):
+        with patch("ai_asst_mgr.operations.github_parser.find_git_repos", return_value=[]):
             with pytest.raises(typer.Exit) as exc_info:
                 _resolve_github_repos(None, tmp_path)
             assert exc_info.value.exit_code == 0
@@ -4249,7 +4434,9 @@ class TestGitHubCommands:
         repo1 = tmp_path / "repo1"
         repo2 = tmp_path / "repo2"
 
-        with patch("ai_asst_mgr.cli.find_git_repos", return_value=[repo1, repo2]):
+        with patch(
+            "ai_asst_mgr.operations.github_parser.find_git_repos", return_value=[repo1, repo2]
+        ):
             result = _resolve_github_repos(None, tmp_path)
             assert result == [repo1, repo2]
 
@@ -4271,10 +4458,11 @@ class TestGitHubCommands:
         repo_path.mkdir()
 
         with patch("ai_asst_mgr.cli.DEFAULT_DB_PATH", db_path):
-            with patch("ai_asst_mgr.cli.DatabaseManager"):
-                with patch("ai_asst_mgr.cli.GitLogParser") as mock_parser:
+            with patch("ai_asst_mgr.database.DatabaseManager"):
+                with patch("ai_asst_mgr.operations.github_parser.GitLogParser") as mock_parser:
                     with patch("ai_asst_mgr.cli._resolve_github_repos", return_value=[repo_path]):
-                        mock_parser.return_value.parse_repo.side_effect = ValueError("Parse error")
+                        parser = mock_parser.return_value
+                        parser.read_ref_tips.side_effect = ValueError("Parse error")
 
                         result = runner.invoke(app, ["github", "sync"])
                         assert result.exit_code == 0
@@ -4290,19 +4478,24 @@ class TestGitHubCommands:
         repo_path.mkdir()
 
         with patch("ai_asst_mgr.cli.DEFAULT_DB_PATH", db_path):
-            with patch("ai_asst_mgr.cli.DatabaseManager") as mock_db:
-                with patch("ai_asst_mgr.cli.GitLogParser") as mock_parser:
+            with patch("ai_asst_mgr.database.DatabaseManager") as mock_db:
+                with patch("ai_asst_mgr.operations.github_parser.GitLogParser") as mock_parser:
                     with patch("ai_asst_mgr.cli._resolve_github_repos", return_value=[repo_path]):
-                        from dataclasses import dataclass
+                        from dataclasses import dataclass, field
+                        from datetime import UTC, datetime
 
                         @dataclass
                         class Commit:
                             vendor_id: str | None = None
-
-                        mock_parser.return_value.parse_repo.return_value = [
-                            Commit(vendor_id="claude"),
-                            Commit(vendor_id=None),
-                        ]
+                            sha: str = "abc123"
+                            committed_at: datetime = field(
+                                default_factory=lambda: datetime(2024, 1, 1, tzinfo=UTC)
+                            )
+
+                        commits = [Commit(vendor_id="claude"), Commit(vendor_id=None)]
+                        parser = mock_parser.return_value
+                        parser.read_ref_tips.return_value = {"HEAD": "abc123"}
+                        parser.iter_new_commits.return_value = (c for c in commits)
                         mock_db.return_value.record_github_commit.return_value = True
 
                         result = runner.invoke(app, ["github", "sync"])
@@ -4324,7 +4517,7 @@ class TestGitHubCommands:
         db_path.touch()
 
         with patch("ai_asst_mgr.cli.DEFAULT_DB_PATH", db_path):
-            with patch("ai_asst_mgr.cli.DatabaseManager") as mock_db:
+            with patch("ai_asst_mgr.database.DatabaseManager") as mock_db:
                 from dataclasses import dataclass
 
                 @dataclass
@@ -4351,7 +4544,7 @@ class TestGitHubCommands:
         db_path.touch()
 
         with patch("ai_asst_mgr.cli.DEFAULT_DB_PATH", db_path):
-            with patch("ai_asst_mgr.cli.DatabaseManager") as mock_db:
+            with patch("ai_asst_mgr.database.DatabaseManager") as mock_db:
                 from dataclasses import dataclass
 
                 @dataclass
@@ -4389,7 +4582,7 @@ class TestGitHubCommands:
         db_path.touch()
 
         with patch("ai_asst_mgr.cli.DEFAULT_DB_PATH", db_path):
-            with patch("ai_asst_mgr.cli.DatabaseManager") as mock_db:
+            with patch("ai_asst_mgr.database.DatabaseManager") as mock_db:
                 mock_db.return_value.get_github_commits.return_value = []
 
                 result = runner.invoke(app, ["github", "list"])
@@ -4402,7 +4595,7 @@ class TestGitHubCommands:
         db_path.touch()
 
         with patch("ai_asst_mgr.cli.DEFAULT_DB_PATH", db_path):
-            with patch("ai_asst_mgr.cli.DatabaseManager") as mock_db:
+            with patch("ai_asst_mgr.database.DatabaseManager") as mock_db:
                 from dataclasses import dataclass
 
                 @dataclass
@@ -4439,7 +4632,7 @@ class TestGitHubCommands:
         db_path.touch()
 
         with patch("ai_asst_mgr.cli.DEFAULT_DB_PATH", db_path):
-            with patch("ai_asst_mgr.cli.DatabaseManager") as mock_db:
+            with patch("ai_asst_mgr.database.DatabaseManager") as mock_db:
                 mock_db.return_value.get_github_repo_stats.return_value = []
 
                 result = runner.invoke(app, ["github", "repos"])
@@ -4452,7 +4645,7 @@ class TestGitHubCommands:
         db_path.touch()
 
         with patch("ai_asst_mgr.cli.DEFAULT_DB_PATH", db_path):
-            with patch("ai_asst_mgr.cli.DatabaseManager") as mock_db:
+            with patch("ai_asst_mgr.database.DatabaseManager") as mock_db:
                 mock_db.return_value.get_github_repo_stats.return_value = [
                     {
                         "repo": "test-repo",
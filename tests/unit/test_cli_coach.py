@@ -50,9 +50,9 @@ def mock_coaches() -> MagicMock:
 class TestCoachCommand:
     """Tests for coach CLI command."""
 
-    @patch("ai_asst_mgr.cli.ClaudeCoach")
-    @patch("ai_asst_mgr.cli.GeminiCoach")
-    @patch("ai_asst_mgr.cli.CodexCoach")
+    @patch("ai_asst_mgr.coaches.ClaudeCoach")
+    @patch("ai_asst_mgr.coaches.GeminiCoach")
+    @patch("ai_asst_mgr.coaches.CodexCoach")
     def test_coach_all_vendors(
         self,
         mock_codex: MagicMock,
@@ -71,7 +71,7 @@ class TestCoachCommand:
         # Should show Claude Code, Gemini CLI, OpenAI Codex
         assert "Claude Code" in result.output or mock_claude.called
 
-    @patch("ai_asst_mgr.cli.ClaudeCoach")
+    @patch("ai_asst_mgr.coaches.ClaudeCoach")
     def test_coach_specific_vendor(self, mock_claude: MagicMock, mock_coaches: MagicMock) -> None:
         """Test coach command with --vendor option."""
         mock_claude.return_value = mock_coaches
@@ -88,9 +88,9 @@ class TestCoachCommand:
         assert result.exit_code == 1
         assert "Unknown vendor" in result.output
 
-    @patch("ai_asst_mgr.cli.ClaudeCoach")
-    @patch("ai_asst_mgr.cli.GeminiCoach")
-    @patch("ai_asst_mgr.cli.CodexCoach")
+    @patch("ai_asst_mgr.coaches.ClaudeCoach")
+    @patch("ai_asst_mgr.coaches.GeminiCoach")
+    @patch("ai_asst_mgr.coaches.CodexCoach")
     def test_coach_compare_mode(
         self,
         mock_codex: MagicMock,
@@ -108,7 +108,7 @@ class TestCoachCommand:
         assert result.exit_code == 0
         assert "Cross-Vendor Comparison" in result.output
 
-    @patch("ai_asst_mgr.cli.ClaudeCoach")
+    @patch("ai_asst_mgr.coaches.ClaudeCoach")
     def test_coach_export_json(self, mock_claude: MagicMock, mock_coaches: MagicMock) -> None:
         """Test coach command with --export json."""
         mock_claude.return_value = mock_coaches
@@ -118,7 +118,7 @@ class TestCoachCommand:
         assert result.exit_code == 0
         mock_coaches.export_report.assert_called()
 
-    @patch("ai_asst_mgr.cli.ClaudeCoach")
+    @patch("ai_asst_mgr.coaches.ClaudeCoach")
     def test_coach_export_markdown(self, mock_claude: MagicMock, mock_coaches: MagicMock) -> None:
         """Test coach command with --export markdown."""
         mock_claude.return_value = mock_coaches
@@ -128,7 +128,7 @@ class TestCoachCommand:
         assert result.exit_code == 0
         mock_coaches.export_report.assert_called()
 
-    @patch("ai_asst_mgr.cli.ClaudeCoach")
+    @patch("ai_asst_mgr.coaches.ClaudeCoach")
     def test_coach_export_with_output_path(
         self, mock_claude: MagicMock, mock_coaches: MagicMock, tmp_path: Path
     ) -> None:
@@ -152,7 +152,7 @@ class TestCoachCommand:
         assert result.exit_code == 0
         mock_coaches.export_report.assert_called_with(output_path, format="json")
 
-    @patch("ai_asst_mgr.cli.ClaudeCoach")
+    @patch("ai_asst_mgr.coaches.ClaudeCoach")
     def test_coach_weekly_report(self, mock_claude: MagicMock, mock_coaches: MagicMock) -> None:
         """Test coach command with --report weekly."""
         mock_claude.return_value = mock_coaches
@@ -163,7 +163,7 @@ class TestCoachCommand:
         # Should call analyze with default 7 days
         mock_coaches.analyze.assert_called_with(period_days=7)
 
-    @patch("ai_asst_mgr.cli.ClaudeCoach")
+    @patch("ai_asst_mgr.coaches.ClaudeCoach")
     def test_coach_monthly_report(self, mock_claude: MagicMock, mock_coaches: MagicMock) -> None:
         """Test coach command with --report monthly."""
         mock_claude.return_value = mock_coaches
@@ -177,7 +177,7 @@ class TestCoachCommand:
 class TestCoachHelpers:
     """Tests for coach helper functions."""
 
-    @patch("ai_asst_mgr.cli.ClaudeCoach")
+    @patch("ai_asst_mgr.coaches.ClaudeCoach")
     def test_display_insights_shows_table(
         self, mock_claude: MagicMock, mock_coaches: MagicMock
     ) -> None:
@@ -189,7 +189,7 @@ class TestCoachHelpers:
         assert result.exit_code == 0
         assert "Insights" in result.output
 
-    @patch("ai_asst_mgr.cli.ClaudeCoach")
+    @patch("ai_asst_mgr.coaches.ClaudeCoach")
     def test_display_recommendations_shows_panels(
         self, mock_claude: MagicMock, mock_coaches: MagicMock
     ) -> None:
@@ -201,7 +201,7 @@ class TestCoachHelpers:
         assert result.exit_code == 0
         assert "Recommendations" in result.output
 
-    @patch("ai_asst_mgr.cli.ClaudeCoach")
+    @patch("ai_asst_mgr.coaches.ClaudeCoach")
     def test_display_stats_shows_grid(
         self, mock_claude: MagicMock, mock_coaches: MagicMock
     ) -> None:
@@ -213,7 +213,7 @@ class TestCoachHelpers:
         assert result.exit_code == 0
         assert "Statistics" in result.output
 
-    @patch("ai_asst_mgr.cli.ClaudeCoach")
+    @patch("ai_asst_mgr.coaches.ClaudeCoach")
     def test_no_recommendations_shows_good_message(
         self, mock_claude: MagicMock, mock_coaches: MagicMock
     ) -> None:
@@ -226,7 +226,7 @@ class TestCoachHelpers:
         assert result.exit_code == 0
         assert "looks good" in result.output
 
-    @patch("ai_asst_mgr.cli.ClaudeCoach")
+    @patch("ai_asst_mgr.coaches.ClaudeCoach")
     def test_no_insights_shows_message(
         self, mock_claude: MagicMock, mock_coaches: MagicMock
     ) -> None:
@@ -243,7 +243,7 @@ class TestCoachHelpers:
 class TestCoachExportErrors:
     """Tests for coach export error handling."""
 
-    @patch("ai_asst_mgr.cli.ClaudeCoach")
+    @patch("ai_asst_mgr.coaches.ClaudeCoach")
     def test_export_error_shows_message(
         self, mock_claude: MagicMock, mock_coaches: MagicMock
     ) -> None:
@@ -256,7 +256,7 @@ class TestCoachExportErrors:
         assert result.exit_code == 0  # Command succeeds, export fails gracefully
         assert "Export failed" in result.output
 
-    @patch("ai_asst_mgr.cli.ClaudeCoach")
+    @patch("ai_asst_mgr.coaches.ClaudeCoach")
     def test_export_value_error_shows_message(
         self, mock_claude: MagicMock, mock_coaches: MagicMock
     ) -> None:
@@ -2,20 +2,29 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from typer.testing import CliRunner
 
 from ai_asst_mgr.cli import (
+    DEFAULT_REPO_CACHE_PATH,
     _categorize_init_result,
     _format_size_bytes,
     app,
 )
+from ai_asst_mgr.database import GitHubSyncState
 
 runner = CliRunner()
 
 
+def _stream(parser: MagicMock, commits: list[MagicMock], tips: dict[str, str]) -> None:
+    """Make a mocked GitLogParser report these ref tips and new commits."""
+    parser.read_ref_tips.return_value = tips
+    parser.iter_new_commits.side_effect = lambda *_args: (c for c in commits)
+
+
 # =============================================================================
 # GitHub CLI Commands Tests
 # =============================================================================
@@ -42,20 +51,20 @@ class TestGitHubSyncCommand:
         """Test github sync uses current directory by default."""
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
-            patch("ai_asst_mgr.cli.GitLogParser") as mock_parser,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.operations.github_parser.GitLogParser") as mock_parser,
             patch("ai_asst_mgr.cli.Path.cwd") as mock_cwd,
         ):
             mock_db_path.exists.return_value = True
             mock_cwd.return_value = Path("/current/dir")
 
             mock_parser_instance = MagicMock()
-            mock_parser_instance.parse_repo.return_value = []
+            _stream(mock_parser_instance, [], {})
             mock_parser.return_value = mock_parser_instance
 
             result = runner.invoke(app, ["github", "sync"])
             assert result.exit_code == 0
-            mock_parser_instance.parse_repo.assert_called_once()
+            mock_parser_instance.read_ref_tips.assert_called_once()
 
     def test_github_sync_specific_repo(self, tmp_path: Path) -> None:
         """Test github sync with specific repository path."""
@@ -64,13 +73,13 @@ class TestGitHubSyncCommand:
 
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
-            patch("ai_asst_mgr.cli.GitLogParser") as mock_parser,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.operations.github_parser.GitLogParser") as mock_parser,
         ):
             mock_db_path.exists.return_value = True
 
             mock_parser_instance = MagicMock()
-            mock_parser_instance.parse_repo.return_value = []
+            _stream(mock_parser_instance, [], {})
             mock_parser.return_value = mock_parser_instance
 
             result = runner.invoke(app, ["github", "sync", "--repo", str(repo_path)])
@@ -98,7 +107,7 @@ class TestGitHubSyncCommand:
         """Test github sync with base path containing no git repos."""
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.find_git_repos") as mock_find,
+            patch("ai_asst_mgr.operations.github_parser.find_git_repos") as mock_find,
         ):
             mock_db_path.exists.return_value = True
             mock_find.return_value = []
@@ -114,21 +123,40 @@ class TestGitHubSyncCommand:
 
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.find_git_repos") as mock_find,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
-            patch("ai_asst_mgr.cli.GitLogParser") as mock_parser,
+            patch("ai_asst_mgr.operations.github_parser.find_git_repos") as mock_find,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.operations.github_parser.GitLogParser") as mock_parser,
         ):
             mock_db_path.exists.return_value = True
             mock_find.return_value = [repo1, repo2]
 
             mock_parser_instance = MagicMock()
-            mock_parser_instance.parse_repo.return_value = []
+            _stream(mock_parser_instance, [], {})
             mock_parser.return_value = mock_parser_instance
 
             result = runner.invoke(app, ["github", "sync", "--base", str(tmp_path)])
             assert result.exit_code == 0
             assert "Found 2 repositories" in result.stdout
 
+    def test_github_sync_base_path_prune(self, tmp_path: Path) -> None:
+        """Test github sync --prune adds to the default prune list."""
+        with (
+            patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
+            patch("ai_asst_mgr.operations.github_parser.find_git_repos") as mock_find,
+        ):
+            mock_db_path.exists.return_value = True
+            mock_find.return_value = []
+
+            result = runner.invoke(
+                app, ["github", "sync", "--base", str(tmp_path), "--prune", "build", "-j", "2"]
+            )
+
+            assert result.exit_code == 0
+            kwargs = mock_find.call_args.kwargs
+            assert {"build", "node_modules"} <= kwargs["prune"]
+            assert kwargs["cache_path"] == DEFAULT_REPO_CACHE_PATH
+            assert kwargs["max_workers"] == 2
+
     def test_github_sync_records_commits(self, tmp_path: Path) -> None:
         """Test github sync records commits to database."""
         repo_path = tmp_path / "test-repo"
@@ -136,19 +164,21 @@ class TestGitHubSyncCommand:
 
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
-            patch("ai_asst_mgr.cli.GitLogParser") as mock_parser,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.operations.github_parser.GitLogParser") as mock_parser,
         ):
             mock_db_path.exists.return_value = True
 
             # Mock commits
             mock_commit1 = MagicMock()
             mock_commit1.vendor_id = "claude"
+            mock_commit1.committed_at = datetime(2024, 1, 2, tzinfo=UTC)
             mock_commit2 = MagicMock()
             mock_commit2.vendor_id = None
+            mock_commit2.committed_at = datetime(2024, 1, 1, tzinfo=UTC)
 
             mock_parser_instance = MagicMock()
-            mock_parser_instance.parse_repo.return_value = [mock_commit1, mock_commit2]
+            _stream(mock_parser_instance, [mock_commit1, mock_commit2], {"HEAD": "abc123"})
             mock_parser.return_value = mock_parser_instance
 
             mock_db = MagicMock()
@@ -160,6 +190,69 @@ class TestGitHubSyncCommand:
             assert "Commits synced: 2" in result.stdout or "2" in result.stdout
             assert "AI-attributed:  1" in result.stdout or "1" in result.stdout
 
+    def test_github_sync_skips_unchanged_repos(self, tmp_path: Path) -> None:
+        """Saved ref tips are passed to the parser and unchanged repos record nothing."""
+        repo_path = tmp_path / "test-repo"
+        repo_path.mkdir()
+        tips = {"HEAD": "abc123", "refs/heads/main": "abc123"}
+
+        with (
+            patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.operations.github_parser.GitLogParser") as mock_parser,
+        ):
+            mock_db_path.exists.return_value = True
+            mock_db = MagicMock()
+            mock_db.get_github_sync_states.return_value = {
+                str(repo_path.resolve()): GitHubSyncState(str(repo_path.resolve()), tips)
+            }
+            mock_db_mgr.return_value = mock_db
+
+            mock_parser_instance = MagicMock()
+            _stream(mock_parser_instance, [], tips)
+            mock_parser.return_value = mock_parser_instance
+
+            result = runner.invoke(app, ["github", "sync", "--repo", str(repo_path)])
+
+            assert result.exit_code == 0
+            assert "1 unchanged" in result.stdout
+            mock_parser_instance.iter_new_commits.assert_not_called()
+            mock_db.record_github_commit.assert_not_called()
+            mock_db.record_github_sync_states.assert_not_called()
+
+    def test_github_sync_saves_state_and_full_ignores_it(self, tmp_path: Path) -> None:
+        """New ref tips are saved, and --full scans without the saved ones."""
+        repo_path = tmp_path / "test-repo"
+        repo_path.mkdir()
+        commit = MagicMock()
+        commit.sha = "def456"
+        commit.vendor_id = None
+        commit.committed_at = datetime(2024, 1, 1, tzinfo=UTC)
+
+        with (
+            patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.operations.github_parser.GitLogParser") as mock_parser,
+        ):
+            mock_db_path.exists.return_value = True
+            mock_db = MagicMock()
+            mock_db.record_github_commit.return_value = True
+            mock_db_mgr.return_value = mock_db
+
+            mock_parser_instance = MagicMock()
+            _stream(mock_parser_instance, [commit], {"HEAD": "def456"})
+            mock_parser.return_value = mock_parser_instance
+
+            result = runner.invoke(app, ["github", "sync", "--repo", str(repo_path), "--full"])
+
+            assert result.exit_code == 0
+            mock_db.get_github_sync_states.assert_not_called()
+            assert mock_parser_instance.iter_new_commits.call_args[0][2] is None
+            (saved,) = mock_db.record_github_sync_states.call_args[0][0]
+            assert saved.repo_path == str(repo_path.resolve())
+            assert saved.ref_tips == {"HEAD": "def456"}
+            assert saved.last_sha == "def456"
+
     def test_github_sync_handles_errors(self, tmp_path: Path) -> None:
         """Test github sync handles parsing errors gracefully."""
         repo_path = tmp_path / "test-repo"
@@ -167,13 +260,13 @@ class TestGitHubSyncCommand:
 
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
-            patch("ai_asst_mgr.cli.GitLogParser") as mock_parser,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.operations.github_parser.GitLogParser") as mock_parser,
         ):
             mock_db_path.exists.return_value = True
 
             mock_parser_instance = MagicMock()
-            mock_parser_instance.parse_repo.side_effect = ValueError("Git error")
+            mock_parser_instance.read_ref_tips.side_effect = ValueError("Git error")
             mock_parser.return_value = mock_parser_instance
 
             result = runner.invoke(app, ["github", "sync", "--repo", str(repo_path)])
@@ -187,13 +280,13 @@ class TestGitHubSyncCommand:
 
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
-            patch("ai_asst_mgr.cli.GitLogParser") as mock_parser,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.operations.github_parser.GitLogParser") as mock_parser,
         ):
             mock_db_path.exists.return_value = True
 
             mock_parser_instance = MagicMock()
-            mock_parser_instance.parse_repo.return_value = []
+            _stream(mock_parser_instance, [], {})
             mock_parser.return_value = mock_parser_instance
 
             result = runner.invoke(
@@ -201,8 +294,8 @@ class TestGitHubSyncCommand:
             )
             assert result.exit_code == 0
             # Verify limit was passed
-            call_args = mock_parser_instance.parse_repo.call_args
-            assert call_args[1]["limit"] == 50
+            call_args = mock_parser_instance.iter_new_commits.call_args
+            assert call_args[0][3] == 50
 
     def test_github_sync_handles_os_error(self, tmp_path: Path) -> None:
         """Test github sync handles OS errors gracefully."""
@@ -211,19 +304,56 @@ class TestGitHubSyncCommand:
 
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
-            patch("ai_asst_mgr.cli.GitLogParser") as mock_parser,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.operations.github_parser.GitLogParser") as mock_parser,
         ):
             mock_db_path.exists.return_value = True
 
             mock_parser_instance = MagicMock()
-            mock_parser_instance.parse_repo.side_effect = OSError("Permission denied")
+            mock_parser_instance.read_ref_tips.side_effect = OSError("Permission denied")
             mock_parser.return_value = mock_parser_instance
 
             result = runner.invoke(app, ["github", "sync", "--repo", str(repo_path)])
             # Should complete but show errors
             assert "error" in result.stdout.lower()
 
+    def test_github_sync_user_rules(self, tmp_path: Path) -> None:
+        """A --rules file puts the user's rules ahead of the built-in ones."""
+        repo_path = tmp_path / "test-repo"
+        repo_path.mkdir()
+        rules_path = tmp_path / "rules.json"
+        rules_path.write_text('{"rules": [{"vendor": "gemini", "pattern": "Assisted-by: Claude"}]}')
+
+        with (
+            patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
+            patch("ai_asst_mgr.database.DatabaseManager"),
+            patch("ai_asst_mgr.operations.github_parser.GitLogParser") as mock_parser,
+        ):
+            mock_db_path.exists.return_value = True
+            _stream(mock_parser.return_value, [], {})
+
+            result = runner.invoke(
+                app, ["github", "sync", "--repo", str(repo_path), "--rules", str(rules_path)]
+            )
+
+            assert result.exit_code == 0
+            (matcher,) = mock_parser.call_args[0]
+            assert matcher.detect("Assisted-by: Claude")[0] == "gemini"
+            assert matcher.detect("Generated by Claude")[0] == "claude"
+
+    def test_github_sync_invalid_rules_exits(self, tmp_path: Path) -> None:
+        """A malformed rules file is reported before anything is synced."""
+        rules_path = tmp_path / "rules.json"
+        rules_path.write_text('{"rules": [{"vendor": "x", "pattern": "(unclosed"}]}')
+
+        with patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path:
+            mock_db_path.exists.return_value = True
+
+            result = runner.invoke(app, ["github", "sync", "--rules", str(rules_path)])
+
+            assert result.exit_code == 1
+            assert "Could not load attribution rules" in result.stdout
+
 
 class TestGitHubStatsCommand:
     """Tests for the github stats command."""
@@ -246,7 +376,7 @@ class TestGitHubStatsCommand:
         """Test github stats with no commits tracked."""
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
         ):
             mock_db_path.exists.return_value = True
 
@@ -264,7 +394,7 @@ class TestGitHubStatsCommand:
         """Test github stats displays commit statistics."""
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
         ):
             mock_db_path.exists.return_value = True
 
@@ -291,7 +421,7 @@ class TestGitHubStatsCommand:
         """Test github stats when first/last commit are None."""
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
         ):
             mock_db_path.exists.return_value = True
 
@@ -335,7 +465,7 @@ class TestGitHubListCommand:
         """Test github list with no commits found."""
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
         ):
             mock_db_path.exists.return_value = True
 
@@ -351,7 +481,7 @@ class TestGitHubListCommand:
         """Test github list displays commit table."""
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
         ):
             mock_db_path.exists.return_value = True
 
@@ -384,7 +514,7 @@ class TestGitHubListCommand:
         """Test github list with vendor filter."""
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
         ):
             mock_db_path.exists.return_value = True
 
@@ -402,7 +532,7 @@ class TestGitHubListCommand:
         """Test github list with repo filter."""
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
         ):
             mock_db_path.exists.return_value = True
 
@@ -419,7 +549,7 @@ class TestGitHubListCommand:
         """Test github list with custom limit."""
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
         ):
             mock_db_path.exists.return_value = True
 
@@ -436,7 +566,7 @@ class TestGitHubListCommand:
         """Test github list displays different vendor badges."""
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
         ):
             mock_db_path.exists.return_value = True
 
@@ -465,7 +595,7 @@ class TestGitHubListCommand:
         """Test github list truncates long commit messages."""
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
         ):
             mock_db_path.exists.return_value = True
 
@@ -489,7 +619,7 @@ class TestGitHubListCommand:
         """Test github list truncates long repository names."""
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
         ):
             mock_db_path.exists.return_value = True
 
@@ -531,7 +661,7 @@ class TestGitHubReposCommand:
         """Test github repos with no repositories tracked."""
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
         ):
             mock_db_path.exists.return_value = True
 
@@ -547,7 +677,7 @@ class TestGitHubReposCommand:
         """Test github repos displays repository statistics."""
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
         ):
             mock_db_path.exists.return_value = True
 
@@ -573,7 +703,7 @@ class TestGitHubReposCommand:
         """Test github repos truncates long repository names."""
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
         ):
             mock_db_path.exists.return_value = True
 
@@ -598,7 +728,7 @@ class TestGitHubReposCommand:
         """Test github repos handles repos with zero commits."""
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
         ):
             mock_db_path.exists.return_value = True
 
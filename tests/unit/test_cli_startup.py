@@ -0,0 +1,107 @@
+"""Startup-time tests for the CLI entry point.
+
+The CLI is invoked from hooks and cron jobs, so cold start matters. These tests
+run a fresh interpreter with ``-X importtime`` and check that heavy modules are
+only imported by the commands that need them.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Cumulative import time budget for ``import ai_asst_mgr.cli``. Measured at
+# roughly 200ms (including -X importtime overhead); the headroom absorbs slow
+# CI machines while still catching an eagerly imported web or git stack.
+IMPORT_TIME_BUDGET_MS = 500
+
+# Modules that must not be loaded just to parse arguments or show status.
+LAZY_MODULES = (
+    "uvicorn",
+    "fastapi",
+    "jinja2",
+    "git",
+    "ai_asst_mgr.web",
+    "ai_asst_mgr.database",
+    "ai_asst_mgr.coaches",
+    "ai_asst_mgr.audit",
+    "ai_asst_mgr.operations",
+    "ai_asst_mgr.capabilities",
+)
+
+
+def _run_with_importtime(code: str, home: Path) -> dict[str, int]:
+    """Run code in a fresh interpreter and parse its -X importtime report.
+
+    Args:
+        code: Python source passed to ``python -c``.
+        home: Directory used as HOME so commands never touch real user config.
+
+    Returns:
+        Mapping of imported module name to cumulative import time in microseconds.
+    """
+    env = {
+        **os.environ,
+        "HOME": str(home),
+        "PYTHONPATH": os.pathsep.join(sys.path),
+    }
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+
+    timings: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+def _loaded_lazy_modules(timings: dict[str, int]) -> list[str]:
+    """Return the LAZY_MODULES (or their submodules) present in an import report."""
+    return sorted(
+        name
+        for name in timings
+        if any(name == lazy or name.startswith(f"{lazy}.") for lazy in LAZY_MODULES)
+    )
+
+
+class TestCliStartup:
+    """Tests for CLI cold-start behaviour."""
+
+    def test_import_does_not_load_heavy_modules(self, tmp_path: Path) -> None:
+        """Importing the CLI module leaves command-specific modules unloaded."""
+        timings = _run_with_importtime("import ai_asst_mgr.cli", tmp_path)
+
+        assert "ai_asst_mgr.cli" in timings
+        assert _loaded_lazy_modules(timings) == []
+
+    @pytest.mark.parametrize("argv", [["--help"], ["status"]])
+    def test_light_commands_do_not_load_heavy_modules(
+        self, argv: list[str], tmp_path: Path
+    ) -> None:
+        """Help and status run without importing the database or web stack."""
+        code = f"from ai_asst_mgr.cli import app\napp({argv!r}, standalone_mode=False)"
+
+        timings = _run_with_importtime(code, tmp_path)
+
+        assert _loaded_lazy_modules(timings) == []
+
+    def test_import_time_within_budget(self, tmp_path: Path) -> None:
+        """Importing the CLI stays under the cold-start budget (best of three)."""
+        best_us = min(
+            _run_with_importtime("import ai_asst_mgr.cli", tmp_path)["ai_asst_mgr.cli"]
+            for _ in range(3)
+        )
+
+        assert best_us / 1000 < IMPORT_TIME_BUDGET_MS
@@ -5,10 +5,11 @@ from __future__ import annotations
 import sqlite3
 import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
-from ai_asst_mgr.database.manager import DatabaseManager, WeeklyReview
+from ai_asst_mgr.database.manager import DatabaseManager, EventRecord, WeeklyReview
 from ai_asst_mgr.database.migrations import MigrationManager, migrate_from_claude_sessions
 from ai_asst_mgr.database.schema import (
     SCHEMA_VERSION,
@@ -16,6 +17,9 @@ from ai_asst_mgr.database.schema import (
     create_schema_sql,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 class TestSchemaSQL:
     """Tests for schema SQL generation."""
@@ -41,6 +45,7 @@ class TestSchemaSQL:
             "coaching_insights",
             "capabilities",
             "github_commits",
+            "github_sync_state",
         ]
         for table in expected_tables:
             assert f"CREATE TABLE IF NOT EXISTS {table}" in sql
@@ -457,6 +462,28 @@ class TestDatabaseManager:
             row = cursor.fetchone()
             assert row is not None
 
+    def test_record_events_bulk(self, db_manager: DatabaseManager) -> None:
+        """Verify record_events inserts all events, keeping explicit timestamps."""
+        events = [
+            EventRecord("sess-1", "claude", "tool_call", "Read", {"file": "a.py"}),
+            EventRecord("sess-1", "claude", "message", "user", timestamp="2025-01-01 10:00:00"),
+        ]
+
+        assert db_manager.record_events(events) == 2
+
+        with sqlite3.connect(db_manager.db_path) as conn:
+            rows = conn.execute(
+                "SELECT event_name, event_data, timestamp FROM events ORDER BY id"
+            ).fetchall()
+        assert rows[0][0] == "Read"
+        assert rows[0][1] == '{"file": "a.py"}'
+        assert rows[0][2] is not None
+        assert rows[1][1:] == (None, "2025-01-01 10:00:00")
+
+    def test_record_events_empty(self, db_manager: DatabaseManager) -> None:
+        """Verify record_events with no events is a no-op."""
+        assert db_manager.record_events([]) == 0
+
     def test_get_vendor_stats_returns_none_for_no_data(self, db_manager: DatabaseManager) -> None:
         """Verify get_vendor_stats returns None when no sessions exist."""
         result = db_manager.get_vendor_stats("claude")
@@ -588,6 +615,57 @@ class TestDatabaseManager:
         assert "gemini" in vendor_ids
 
 
+class TestDatabaseManagerMetrics:
+    """Tests for DatabaseManager metrics instrumentation."""
+
+    @pytest.fixture
+    def db_manager(self, tmp_path: Path) -> DatabaseManager:
+        """Create a DatabaseManager with temporary database."""
+        manager = DatabaseManager(tmp_path / "test.db")
+        manager.initialize()
+        return manager
+
+    def test_operation_latency_is_recorded(self, db_manager: DatabaseManager) -> None:
+        """Verify each public operation observes its latency."""
+        from ai_asst_mgr.database.manager import _QUERY_DURATION
+
+        before = _QUERY_DURATION.count(method="get_week_stats")
+        db_manager.get_week_stats()
+        assert _QUERY_DURATION.count(method="get_week_stats") == before + 1
+
+    def test_rows_are_counted_per_operation(self, db_manager: DatabaseManager) -> None:
+        """Verify fetched rows are attributed to the running operation."""
+        from ai_asst_mgr.database.manager import _ROWS_RETURNED
+
+        db_manager.record_session("sess-1", "claude")
+        db_manager.record_session("sess-2", "gemini")
+
+        before = _ROWS_RETURNED.value(method="get_vendor_stats_summary")
+        stats = db_manager.get_vendor_stats_summary()
+        assert len(stats) == 2
+        assert _ROWS_RETURNED.value(method="get_vendor_stats_summary") == before + 2
+
+    def test_connections_are_tracked(self, db_manager: DatabaseManager) -> None:
+        """Verify open connections are released after each operation."""
+        from ai_asst_mgr.database.manager import _CONNECTIONS_OPEN, _CONNECTIONS_OPENED
+
+        opened = _CONNECTIONS_OPENED.value()
+        with db_manager._connection():
+            assert _CONNECTIONS_OPEN.value() >= 1
+        assert _CONNECTIONS_OPENED.value() == opened + 1
+        assert _CONNECTIONS_OPEN.value() == 0
+
+    def test_sqlite_errors_are_counted(self, db_manager: DatabaseManager) -> None:
+        """Verify operations that raise SQLite errors are counted."""
+        from ai_asst_mgr.database.manager import _QUERY_ERRORS
+
+        db_manager.record_session("sess-1", "claude")
+        before = _QUERY_ERRORS.value(method="record_session")
+        with pytest.raises(sqlite3.IntegrityError):
+            db_manager.record_session("sess-1", "claude")
+        assert _QUERY_ERRORS.value(method="record_session") == before + 1
+
+
 class TestMigrationManager:
     """Tests for MigrationManager class."""
 
@@ -1006,6 +1084,67 @@ class TestGitHubDatabaseMethods:
         assert record.message == "updated message"
         assert record.vendor_id == "claude"
 
+    def test_record_github_commits_bulk_counts(self, db_with_schema: DatabaseManager) -> None:
+        """Bulk upsert dedupes by SHA, keeps existing rows' ids and reports counts."""
+        from datetime import UTC, datetime
+
+        from ai_asst_mgr.operations.github_parser import GitHubCommit
+
+        def commit(sha: str, message: str) -> GitHubCommit:
+            return GitHubCommit(
+                sha=sha,
+                repo="user/repo",
+                branch="main",
+                message=message,
+                author_name="Test",
+                author_email="test@test.com",
+                vendor_id=None,
+                committed_at=datetime(2024, 1, 15, tzinfo=UTC),
+            )
+
+        first = db_with_schema.record_github_commits_bulk(
+            (commit(f"sha{i}", "old") for i in range(5)), batch_size=2
+        )
+        old_id = db_with_schema.get_github_commit_by_sha("sha1").id  # type: ignore[union-attr]
+        second = db_with_schema.record_github_commits_bulk(
+            [commit("sha1", "new"), commit("sha9", "x"), commit("sha1", "newest")]
+        )
+
+        assert (first.inserted, first.updated) == (5, 0)
+        assert (second.inserted, second.updated, second.total) == (1, 1, 2)
+        record = db_with_schema.get_github_commit_by_sha("sha1")
+        assert record is not None
+        assert record.message == "newest"
+        assert record.id == old_id
+        assert db_with_schema.get_github_stats().total_commits == 6
+
+    def test_record_github_commits_bulk_all_or_nothing(
+        self, db_with_schema: DatabaseManager
+    ) -> None:
+        """A failure part way through writes none of the commits."""
+        from datetime import UTC, datetime
+
+        from ai_asst_mgr.operations.github_parser import GitHubCommit
+
+        def commits() -> Iterator[GitHubCommit]:
+            yield GitHubCommit(
+                sha="good",
+                repo="r",
+                branch=None,
+                message="m",
+                author_name=None,
+                author_email=None,
+                vendor_id=None,
+                committed_at=datetime(2024, 1, 1, tzinfo=UTC),
+            )
+            msg = "source failed"
+            raise RuntimeError(msg)
+
+        with pytest.raises(RuntimeError, match="source failed"):
+            db_with_schema.record_github_commits_bulk(commits(), batch_size=1)
+
+        assert db_with_schema.get_github_commit_by_sha("good") is None
+
     def test_get_github_stats_empty(self, db_with_schema: DatabaseManager) -> None:
         """Test get_github_stats with no commits."""
         stats = db_with_schema.get_github_stats()
@@ -1274,6 +1413,33 @@ class TestGitHubDatabaseMethods:
         result = db_with_schema.record_github_commit(commit)
         assert result is False
 
+    def test_github_sync_states_round_trip(self, db_with_schema: DatabaseManager) -> None:
+        """Sync states are saved in one call, replaced by path and read back."""
+        from ai_asst_mgr.database.manager import GitHubSyncState
+
+        first = GitHubSyncState("/repos/a", {"HEAD": "abc", "refs/heads/main": "abc"}, "abc")
+        other = GitHubSyncState("/repos/b", {})
+        assert db_with_schema.record_github_sync_states([first, other]) is True
+        updated = GitHubSyncState("/repos/a", {"HEAD": "def"}, "def", "2024-01-01T00:00:00+00:00")
+        assert db_with_schema.record_github_sync_states([updated]) is True
+
+        states = db_with_schema.get_github_sync_states()
+
+        assert states == {"/repos/a": updated, "/repos/b": other}
+
+    def test_github_sync_states_old_schema(self, tmp_path: Path) -> None:
+        """A database without the state table reads as empty and gains it on save."""
+        from ai_asst_mgr.database.manager import GitHubSyncState
+
+        db_path = tmp_path / "old_schema.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("CREATE TABLE dummy (id INTEGER)")
+        manager = DatabaseManager(db_path)
+
+        assert manager.get_github_sync_states() == {}
+        assert manager.record_github_sync_states([GitHubSyncState("/r", {"HEAD": "a"})])
+        assert list(manager.get_github_sync_states()) == ["/r"]
+
     def test_get_github_commits_table_not_exists(self) -> None:
         """Test get_github_commits returns empty list when table doesn't exist."""
         with tempfile.TemporaryDirectory() as temp_dir:
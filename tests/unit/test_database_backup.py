@@ -0,0 +1,210 @@
+"""Unit tests for online backups of the sessions database."""
+
+import os
+import sqlite3
+import tarfile
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ai_asst_mgr.operations.backup import BackupManager
+from ai_asst_mgr.operations.database_backup import (
+    DATABASE_BACKUP_ID,
+    check_integrity,
+    copy_database,
+)
+from ai_asst_mgr.operations.snapshot import is_snapshot
+from ai_asst_mgr.utils.compression import CompressionSettings
+
+
+def _populate(db_path: Path, rows: int, start: int = 0) -> None:
+    """Insert rows of incompressible data into a WAL-mode database."""
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS sessions (id INTEGER PRIMARY KEY, data BLOB)")
+        with conn:
+            conn.executemany(
+                "INSERT INTO sessions (id, data) VALUES (?, ?)",
+                [(i, os.urandom(2000)) for i in range(start, start + rows)],
+            )
+    finally:
+        conn.close()
+
+
+def _row_count(db_path: Path) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        return int(conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0])
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def sessions_db(tmp_path: Path) -> Path:
+    """Create a sessions database spanning a few hundred pages."""
+    db_path = tmp_path / "data" / "sessions.db"
+    db_path.parent.mkdir()
+    _populate(db_path, 200)
+    return db_path
+
+
+class TestCopyDatabase:
+    """Tests for copy_database."""
+
+    def test_copies_committed_wal_data(self, sessions_db: Path, tmp_path: Path) -> None:
+        """Rows still in the WAL are included and the copy is a single file."""
+        dest = tmp_path / "copy.db"
+        pages: list[tuple[int, int]] = []
+
+        stats = copy_database(
+            sessions_db,
+            dest,
+            pages_per_step=16,
+            step_delay=0,
+            progress_callback=lambda done, total: pages.append((done, total)),
+        )
+
+        assert _row_count(dest) == 200
+        assert stats.steps > 1
+        assert stats.size_bytes == dest.stat().st_size
+        assert pages[-1] == (stats.page_count, stats.page_count)
+        assert not dest.with_name("copy.db-wal").exists()
+
+    def test_consistent_while_writer_commits(self, sessions_db: Path, tmp_path: Path) -> None:
+        """A copy taken during concurrent writes holds a whole number of transactions."""
+        stop = threading.Event()
+
+        def write() -> None:
+            batch = 1000
+            while not stop.is_set():
+                _populate(sessions_db, 10, start=batch)
+                batch += 10
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            stats = copy_database(sessions_db, tmp_path / "copy.db", pages_per_step=8)
+        finally:
+            stop.set()
+            writer.join()
+
+        assert check_integrity(stats.path)[0]
+        assert _row_count(stats.path) % 10 == 0
+
+    def test_missing_source(self, tmp_path: Path) -> None:
+        """A missing database raises FileNotFoundError without creating it."""
+        source = tmp_path / "missing.db"
+
+        with pytest.raises(FileNotFoundError):
+            copy_database(source, tmp_path / "copy.db")
+        assert not source.exists()
+
+
+class TestCheckIntegrity:
+    """Tests for check_integrity."""
+
+    def test_valid_database(self, sessions_db: Path) -> None:
+        """A healthy database passes."""
+        is_valid, message = check_integrity(sessions_db)
+
+        assert is_valid
+        assert "ok" in message
+
+    def test_corrupt_database(self, sessions_db: Path, tmp_path: Path) -> None:
+        """Damaged pages are reported."""
+        copy = copy_database(sessions_db, tmp_path / "copy.db").path
+        data = bytearray(copy.read_bytes())
+        # Scribble over the b-tree pages past the schema page
+        data[copy.stat().st_size // 2 : copy.stat().st_size // 2 + 4096] = b"\xff" * 4096
+        copy.write_bytes(bytes(data))
+
+        is_valid, _ = check_integrity(copy)
+
+        assert not is_valid
+
+    def test_not_a_database(self, tmp_path: Path) -> None:
+        """Files that are not SQLite databases fail."""
+        path = tmp_path / "notes.txt"
+        path.write_bytes(b"x" * 4096)
+
+        is_valid, message = check_integrity(path)
+
+        assert not is_valid
+        assert "Not a valid SQLite database" in message
+
+
+class TestBackupDatabase:
+    """Tests for BackupManager.backup_database."""
+
+    @pytest.mark.parametrize("codec", ["gz", "xz"])
+    def test_archive_round_trip(self, sessions_db: Path, tmp_path: Path, codec: str) -> None:
+        """Full database backups are catalogued archives that verify."""
+        manager = BackupManager(tmp_path / "backups", compression=CompressionSettings(codec))
+
+        result = manager.backup_database(sessions_db)
+
+        assert result.success, result.error
+        assert result.metadata is not None
+        backup_path = result.metadata.backup_path
+        assert backup_path.parent == tmp_path / "backups" / DATABASE_BACKUP_ID
+        with tarfile.open(backup_path, "r:*") as tar:
+            assert tar.getnames() == [DATABASE_BACKUP_ID, f"{DATABASE_BACKUP_ID}/sessions.db"]
+        assert manager.list_backups(DATABASE_BACKUP_ID) == [result.metadata]
+        is_valid, message = manager.verify_backup(backup_path)
+        assert is_valid, message
+        assert "integrity ok" in message
+        assert not list((tmp_path / "backups" / DATABASE_BACKUP_ID).glob(".staging-*"))
+
+    def test_incremental_stores_changed_pages_only(self, sessions_db: Path, tmp_path: Path) -> None:
+        """A second snapshot after a small change stores a fraction of the database."""
+        manager = BackupManager(tmp_path / "backups", incremental=True)
+        first = manager.backup_database(sessions_db)
+        _populate(sessions_db, 2, start=5000)
+
+        second = manager.backup_database(sessions_db)
+
+        assert first.success, first.error
+        assert second.success, second.error
+        assert first.metadata is not None
+        assert second.metadata is not None
+        assert is_snapshot(second.metadata.backup_path)
+        assert second.metadata.size_bytes < first.metadata.size_bytes / 2
+        is_valid, message = manager.verify_backup(second.metadata.backup_path)
+        assert is_valid, message
+        assert "integrity ok" in message
+
+    def test_verify_runs_integrity_check(self, sessions_db: Path, tmp_path: Path) -> None:
+        """Verification fails when the reassembled database fails its integrity check."""
+        manager = BackupManager(tmp_path / "backups", incremental=True)
+        result = manager.backup_database(sessions_db)
+        assert result.metadata is not None
+
+        with patch(
+            "ai_asst_mgr.operations.backup.check_integrity",
+            return_value=(False, "Database integrity check failed: bad page"),
+        ):
+            is_valid, message = manager.verify_backup(result.metadata.backup_path)
+
+        assert not is_valid
+        assert "bad page" in message
+
+    def test_missing_database(self, tmp_path: Path) -> None:
+        """Backing up a database that does not exist fails cleanly."""
+        manager = BackupManager(tmp_path / "backups")
+
+        result = manager.backup_database(tmp_path / "missing.db")
+
+        assert not result.success
+        assert "Database not found" in (result.error or "")
+
+    def test_retention_applies(self, sessions_db: Path, tmp_path: Path) -> None:
+        """Database backups are pruned by the manager's retention count."""
+        manager = BackupManager(tmp_path / "backups", retention_count=1, incremental=True)
+
+        for _ in range(3):
+            assert manager.backup_database(sessions_db).success
+
+        assert len(manager.list_backups(DATABASE_BACKUP_ID)) == 1
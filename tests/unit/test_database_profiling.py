@@ -0,0 +1,225 @@
+"""Tests for SQL profiling and the slow-query log."""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from ai_asst_mgr.database.manager import DatabaseManager
+from ai_asst_mgr.database.profiling import (
+    ENV_PROFILE_SQL,
+    ENV_SLOW_QUERY_MS,
+    ProfilingConnection,
+    ProfilingCursor,
+    QueryProfiler,
+    QueryRecord,
+    connect,
+    disable_sql_profiling,
+    enable_sql_profiling,
+    get_active_profiler,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_profiling():
+    """Ensure process-wide profiling does not leak between tests."""
+    disable_sql_profiling()
+    yield
+    disable_sql_profiling()
+
+
+@pytest.fixture
+def profiler() -> QueryProfiler:
+    """Create a profiler that treats every statement as fast."""
+    return QueryProfiler(slow_threshold_ms=10_000)
+
+
+@pytest.fixture
+def db_manager(tmp_path: Path, profiler: QueryProfiler) -> DatabaseManager:
+    """Create an initialized DatabaseManager using the profiler."""
+    manager = DatabaseManager(tmp_path / "test.db", profiler=profiler)
+    manager.initialize()
+    return manager
+
+
+class TestQueryProfiler:
+    """Tests for QueryProfiler aggregation."""
+
+    def test_record_aggregates_by_statement(self, profiler: QueryProfiler) -> None:
+        """Verify summaries aggregate calls, time, and rows."""
+        profiler.record(QueryRecord("SELECT 1", duration_ms=2.0, rows=1))
+        profiler.record(QueryRecord("SELECT 1", duration_ms=4.0, rows=1))
+        profiler.record(QueryRecord("SELECT 2", duration_ms=1.0, rows=0))
+
+        summaries = profiler.summaries()
+
+        assert summaries[0].statement == "SELECT 1"
+        assert summaries[0].calls == 2
+        assert summaries[0].total_ms == 6.0
+        assert summaries[0].max_ms == 4.0
+        assert summaries[0].avg_ms == 3.0
+        assert summaries[0].rows == 2
+
+    def test_hooks_receive_records(self, profiler: QueryProfiler) -> None:
+        """Verify registered hooks are called for each record."""
+        seen: list[QueryRecord] = []
+        profiler.add_hook(seen.append)
+
+        profiler.record(QueryRecord("SELECT 1", duration_ms=1.0, rows=1))
+
+        assert [r.statement for r in seen] == ["SELECT 1"]
+
+    def test_failing_hook_does_not_break_recording(self, profiler: QueryProfiler) -> None:
+        """Verify a raising hook is logged and ignored."""
+
+        def bad_hook(_record: QueryRecord) -> None:
+            raise RuntimeError
+
+        profiler.add_hook(bad_hook)
+        profiler.record(QueryRecord("SELECT 1", duration_ms=1.0, rows=1))
+
+        assert len(profiler.records) == 1
+
+    def test_reset_clears_records(self, profiler: QueryProfiler) -> None:
+        """Verify reset discards records and summaries."""
+        profiler.record(QueryRecord("SELECT 1", duration_ms=1.0, rows=1))
+        profiler.reset()
+
+        assert not profiler.records
+        assert profiler.summaries() == []
+
+
+class TestProfilingConnection:
+    """Tests for statement timing through DatabaseManager."""
+
+    def test_statements_are_recorded_with_rows(
+        self, db_manager: DatabaseManager, profiler: QueryProfiler
+    ) -> None:
+        """Verify SELECT rows and DML affected rows are recorded."""
+        db_manager.record_session("sess-1", "claude")
+        db_manager.record_session("sess-2", "gemini")
+        profiler.reset()
+
+        db_manager.get_vendor_stats_summary()
+
+        [record] = profiler.records
+        assert record.statement.startswith("SELECT vendor_id, COUNT(*) as total_sessions")
+        assert record.rows == 2
+        assert record.duration_ms >= 0
+        assert not record.slow
+
+    def test_dml_rows_use_rowcount(
+        self, db_manager: DatabaseManager, profiler: QueryProfiler
+    ) -> None:
+        """Verify INSERT records report affected rows."""
+        db_manager.record_session("sess-1", "claude")
+
+        [record] = profiler.records
+        assert record.statement.startswith("INSERT INTO sessions")
+        assert record.rows == 1
+
+    def test_partially_fetched_cursors_are_reported(
+        self, db_manager: DatabaseManager, profiler: QueryProfiler
+    ) -> None:
+        """Verify statements read with fetchone() are reported on close."""
+        db_manager.get_week_stats()
+
+        assert len(profiler.records) == 2
+
+    def test_iteration_is_profiled(self, tmp_path: Path, profiler: QueryProfiler) -> None:
+        """Verify iterating a cursor counts rows."""
+        conn = connect(tmp_path / "iter.db", profiler)
+        assert isinstance(conn, ProfilingConnection)
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.executemany("INSERT INTO t VALUES (?)", [(1,), (2,), (3,)])
+        rows = list(conn.execute("SELECT x FROM t"))
+        conn.close()
+
+        assert len(rows) == 3
+        assert profiler.records[-1].rows == 3
+        assert profiler.records[-2].rows == 3
+
+    def test_slow_queries_are_logged_with_plan(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Verify slow SELECTs are logged with EXPLAIN QUERY PLAN output."""
+        profiler = QueryProfiler(slow_threshold_ms=0.0, explain=True)
+        manager = DatabaseManager(tmp_path / "slow.db", profiler=profiler)
+        manager.initialize()
+
+        with caplog.at_level(logging.WARNING, logger="ai_asst_mgr.database.slow_query"):
+            manager.get_vendor_stats("claude")
+
+        [record] = profiler.slow_queries()
+        assert record.plan
+        assert any("sessions" in line for line in record.plan)
+        assert "plan:" in caplog.text
+
+    def test_unattached_connection_uses_plain_cursors(self, tmp_path: Path) -> None:
+        """Verify a ProfilingConnection works before a profiler is attached."""
+        conn = sqlite3.connect(tmp_path / "unattached.db", factory=ProfilingConnection)
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.executemany("INSERT INTO t VALUES (?)", [(1,), (2,)])
+        cursor = conn.execute("SELECT x FROM t")
+
+        assert not isinstance(cursor, ProfilingCursor)
+        assert cursor.fetchone() == (1,)
+        conn.close()
+
+    def test_plain_connection_without_profiler(self, tmp_path: Path) -> None:
+        """Verify no profiling wrapper is used when profiling is off."""
+        conn = connect(tmp_path / "plain.db", None)
+        assert not isinstance(conn, ProfilingConnection)
+        conn.close()
+
+
+class TestProcessWideProfiling:
+    """Tests for enabling profiling via API and environment."""
+
+    def test_enable_applies_to_new_managers(self, tmp_path: Path) -> None:
+        """Verify managers without an explicit profiler use the active one."""
+        profiler = enable_sql_profiling(10_000)
+        manager = DatabaseManager(tmp_path / "test.db")
+        manager.initialize()
+
+        manager.get_tool_stats()
+
+        assert get_active_profiler() is profiler
+        assert profiler.records
+
+    def test_slow_query_log_file(self, tmp_path: Path) -> None:
+        """Verify slow queries are appended to the configured log file."""
+        log_path = tmp_path / "logs" / "slow.log"
+        enable_sql_profiling(0.0, log_path=log_path)
+        manager = DatabaseManager(tmp_path / "test.db")
+        manager.initialize()
+
+        manager.get_tool_stats()
+        disable_sql_profiling()
+
+        assert "SELECT event_name, COUNT(*) as count" in log_path.read_text()
+
+    def test_environment_enables_profiling(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify AI_ASST_MGR_PROFILE_SQL configures the active profiler."""
+        from ai_asst_mgr.database import profiling
+
+        monkeypatch.setattr(profiling._state, "configured", False)
+        monkeypatch.setenv(ENV_PROFILE_SQL, "1")
+        monkeypatch.setenv(ENV_SLOW_QUERY_MS, "250")
+
+        profiler = get_active_profiler()
+
+        assert profiler is not None
+        assert profiler.slow_threshold_ms == 250
+
+    def test_environment_unset_disables_profiling(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify profiling stays off without the environment variable."""
+        from ai_asst_mgr.database import profiling
+
+        monkeypatch.setattr(profiling._state, "configured", False)
+        monkeypatch.delenv(ENV_PROFILE_SQL, raising=False)
+
+        assert get_active_profiler() is None
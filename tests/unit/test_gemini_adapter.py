@@ -254,6 +254,17 @@ def test_backup(adapter_with_temp_dir: GeminiAdapter, tmp_path: Path) -> None:
     assert "gemini_backup_" in backup_file.name
 
 
+def test_backup_keeps_chat_history(adapter_with_temp_dir: GeminiAdapter, tmp_path: Path) -> None:
+    """Test backup includes the chat history kept under tmp/."""
+    chats = adapter_with_temp_dir._config_dir / "tmp" / "abc123" / "chats"
+    chats.mkdir(parents=True)
+    (chats / "session-1.json").write_text("{}")
+
+    backup_file = adapter_with_temp_dir.backup(tmp_path / "backups")
+
+    with tarfile.open(backup_file, "r:*") as tar:
+        assert "gemini/tmp/abc123/chats/session-1.json" in tar.getnames()
+
 def test_restore(adapter_with_temp_dir: GeminiAdapter, tmp_path: Path) -> None:
     """Test restore extracts backup."""
     # Create backup
@@ -265,7 +276,8 @@ def test_restore(adapter_with_temp_dir: GeminiAdapter, tmp_path: Path) -> None:
     adapter_with_temp_dir.set_config("api_key", "modified-key")
 
     # Restore
-    adapter_with_temp_dir.restore(backup_file)
+    with pytest.deprecated_call():
+        adapter_with_temp_dir.restore(backup_file)
 
     # Verify restored
     settings = adapter_with_temp_dir._load_settings()
@@ -917,7 +917,7 @@ class TestGitHubAttributionCommand:
         """Test attribution summary display."""
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
         ):
             mock_db_path.exists.return_value = True
 
@@ -953,7 +953,7 @@ class TestGitHubAttributionCommand:
         """Test attribution for specific PR."""
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH") as mock_db_path,
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
         ):
             mock_db_path.exists.return_value = True
 
@@ -1000,7 +1000,7 @@ class TestGitHubActivityCommand:
 
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH", db_path),
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
         ):
             # Create database file
             db_path.touch()
@@ -1047,7 +1047,7 @@ class TestGitHubActivityCommand:
 
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH", db_path),
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
         ):
             # Create database file
             db_path.touch()
@@ -1077,7 +1077,7 @@ class TestGitHubActivityCommand:
 
         with (
             patch("ai_asst_mgr.cli.DEFAULT_DB_PATH", db_path),
-            patch("ai_asst_mgr.cli.DatabaseManager") as mock_db_mgr,
+            patch("ai_asst_mgr.database.DatabaseManager") as mock_db_mgr,
         ):
             # Create database file
             db_path.touch()
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import io
+import json
+import os
 import subprocess
 import tempfile
+import time
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -11,20 +15,37 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from ai_asst_mgr.operations.github_parser import (
+    DEFAULT_MATCHER,
+    DEFAULT_SIGNATURE_RULES,
     VENDOR_EMAIL_DOMAINS,
     VENDOR_SIGNATURES,
     Attribution,
+    AttributionMatcher,
     GitHubCommit,
     GitLogParser,
+    SignatureRule,
+    _iter_log_records,
     create_attribution,
     detect_pr_attribution,
     detect_vendor_attribution,
     detect_vendor_attribution_detailed,
     find_git_repos,
+    load_signature_rules,
     parse_git_log,
 )
 
 
+def _fields(
+    sha: str,
+    *,
+    date: str = "2024-01-15T10:30:00+00:00",
+    subject: str = "feat: test",
+    body: str = "Body\n",
+) -> list[str]:
+    """Build the fields of one ``git log -z`` record."""
+    return [sha, "John Doe", "john@example.com", date, "HEAD -> main", subject, body]
+
+
 class TestGitHubCommit:
     """Tests for GitHubCommit dataclass."""
 
@@ -184,12 +205,13 @@ class TestGitLogParser:
         cmd = parser._build_git_log_command(None, None, None, 100)
         assert "-100" in cmd
 
-    def test_build_git_log_command_respects_max_limit(self) -> None:
-        """Test git log command respects MAX_COMMITS limit."""
+    def test_build_git_log_command_not_capped(self) -> None:
+        """Test git log command streams NUL-terminated records without a cap."""
         parser = GitLogParser()
         cmd = parser._build_git_log_command(None, None, None, 999999)
-        # Should be capped at MAX_COMMITS
-        assert f"-{parser.MAX_COMMITS}" in cmd
+        assert "-z" in cmd
+        assert cmd[-1] == "-999999"
+        assert parser._build_git_log_command(None, None, None, None) == cmd[:-1]
 
     def test_extract_branch_from_refs_head(self) -> None:
         """Test extracting branch from HEAD refs."""
@@ -231,92 +253,59 @@ class TestGitLogParser:
         refs = "tag: v1.0.0, grafted"
         assert parser._extract_branch_from_refs(refs) is None
 
-    def test_parse_commit_block_valid(self) -> None:
-        """Test parsing a valid commit block."""
+    def test_commit_from_fields_valid(self) -> None:
+        """Test building a commit from a valid record."""
         parser = GitLogParser()
-        block = (
-            "abc123|John Doe|john@example.com|2024-01-15T10:30:00+00:00|"
-            "feat: add feature|HEAD -> main\n\nCommit body here"
-        )
-        commit = parser._parse_commit_block(block, "test/repo")
+        fields = _fields("abc123", subject="feat: add feature", body="Commit body here\n")
+        commit = parser._commit_from_fields(fields, "test/repo")
         assert commit is not None
         assert commit.sha == "abc123"
         assert commit.author_name == "John Doe"
         assert commit.author_email == "john@example.com"
         assert commit.branch == "main"
+        assert commit.message == "feat: add feature\n\nCommit body here"
 
-    def test_parse_commit_block_with_claude_signature(self) -> None:
-        """Test parsing commit with Claude signature."""
+    def test_commit_from_fields_with_claude_signature(self) -> None:
+        """Test building a commit with a Claude signature."""
         parser = GitLogParser()
-        block = (
-            "abc123|John|john@test.com|2024-01-15T10:30:00+00:00|feat: add feature|"
-            "\n\nGenerated with [Claude Code]"
-        )
-        commit = parser._parse_commit_block(block, "test/repo")
+        fields = _fields("abc123", body="Generated with [Claude Code]\n")
+        commit = parser._commit_from_fields(fields, "test/repo")
         assert commit is not None
         assert commit.vendor_id == "claude"
 
-    def test_parse_commit_block_invalid_format(self) -> None:
-        """Test parsing invalid commit block returns None."""
+    def test_commit_from_fields_wrong_field_count(self) -> None:
+        """Test a record with the wrong number of fields returns None."""
         parser = GitLogParser()
-        block = "invalid|data"  # Too few parts
-        assert parser._parse_commit_block(block, "test/repo") is None
+        assert parser._commit_from_fields(["invalid", "data"], "test/repo") is None
+        assert parser._commit_from_fields([], "test/repo") is None
 
-    def test_parse_commit_block_empty(self) -> None:
-        """Test parsing empty commit block returns None."""
+    def test_commit_from_fields_with_naive_datetime(self) -> None:
+        """Test a naive date gets the UTC timezone."""
         parser = GitLogParser()
-        assert parser._parse_commit_block("", "test/repo") is None
+        commit = parser._commit_from_fields(
+            _fields("abc123", date="2024-01-15T10:30:00"), "test/repo"
+        )
+        assert commit is not None
+        assert commit.committed_at.tzinfo == UTC
 
-    def test_parse_commit_block_empty_lines_list(self) -> None:
-        """Test parsing commit block with whitespace-only content."""
+    def test_commit_from_fields_invalid_date(self) -> None:
+        """Test a record with a malformed date is skipped."""
         parser = GitLogParser()
-        # Test with various inputs that result in empty or invalid lines
-        # Note: str.split('\n') never returns an empty list, but we test edge cases
-        assert parser._parse_commit_block("\n\n\n", "test/repo") is None
+        fields = _fields("abc123", date="invalid-date-format")
+        assert parser._commit_from_fields(fields, "test/repo") is None
+
+    def test_iter_log_records_splits_across_reads(self) -> None:
+        """Test records are reassembled however the output is chunked."""
+        records = [
+            _fields("abc123", body="Line one|with a pipe\n---COMMIT_END---\n\nLine three\n"),
+            _fields("def456", subject="fix: ünïcode", body=""),
+        ]
+        output = "".join(f"{field}\0" for record in records for field in record).encode()
 
-    def test_parse_commit_block_with_naive_datetime(self) -> None:
-        """Test parsing commit with naive datetime adds UTC timezone."""
-        parser = GitLogParser()
-        # Use a naive datetime format (no timezone info)
-        block = "abc123|John|john@test.com|2024-01-15T10:30:00|feat: test|\n\nBody"
-        commit = parser._parse_commit_block(block, "test/repo")
-        assert commit is not None
-        assert commit.committed_at.tzinfo == UTC
+        with patch("ai_asst_mgr.operations.github_parser._LOG_READ_SIZE", 5):
+            parsed = list(_iter_log_records(io.BytesIO(output)))
 
-    def test_parse_git_log_output_skips_malformed_commits(self) -> None:
-        """Test _parse_git_log_output skips malformed commits."""
-        parser = GitLogParser()
-        # Mix of valid and invalid commits
-        output = """abc123|John|john@test.com|2024-01-15T10:30:00+00:00|feat: valid|
-Body
----COMMIT_END---
-invalid|only|three|parts
----COMMIT_END---
-def456|Jane|jane@test.com|2024-01-16T11:00:00+00:00|fix: another valid|
-Body2
----COMMIT_END---"""
-        commits = parser._parse_git_log_output(output, "test/repo")
-        # Should only get the 2 valid commits
-        assert len(commits) == 2
-        assert commits[0].sha == "abc123"
-        assert commits[1].sha == "def456"
-
-    def test_parse_git_log_output_handles_exception_in_parse(self) -> None:
-        """Test _parse_git_log_output handles ValueError/IndexError exceptions."""
-        parser = GitLogParser()
-
-        # Create a commit block that will cause an exception during parsing
-        # Use an invalid date format to trigger ValueError
-        output = """abc123|John|john@test.com|invalid-date-format|feat: test|
-Body
----COMMIT_END---
-def456|Jane|jane@test.com|2024-01-16T11:00:00+00:00|fix: valid|
-Body2
----COMMIT_END---"""
-        commits = parser._parse_git_log_output(output, "test/repo")
-        # Should only get the 1 valid commit, skip the one with invalid date
-        assert len(commits) == 1
-        assert commits[0].sha == "def456"
+        assert parsed == records
 
     @patch("subprocess.run")
     def test_is_git_repo_true(self, mock_run: MagicMock) -> None:
@@ -363,27 +352,24 @@ Body2
         with pytest.raises(ValueError, match="Not a git repository"):
             parser.parse_repo(Path("/fake/not-repo"))
 
-    @patch("subprocess.run")
+    @patch("subprocess.Popen")
     @patch.object(GitLogParser, "_is_git_repo", return_value=True)
     @patch.object(GitLogParser, "_get_repo_name", return_value="test/repo")
     def test_parse_repo_returns_commits(
         self,
         mock_name: MagicMock,
         mock_is_git: MagicMock,
-        mock_run: MagicMock,
+        mock_popen: MagicMock,
     ) -> None:
         """Test parse_repo returns parsed commits."""
-        mock_run.return_value = MagicMock(
-            stdout=(
-                "abc123|John|john@test.com|2024-01-15T10:30:00+00:00|"
-                "feat: test|HEAD -> main\n\nBody\n---COMMIT_END---\n"
-            ),
-            returncode=0,
-        )
+        proc = mock_popen.return_value.__enter__.return_value
+        proc.stdout = io.BytesIO("".join(f"{f}\0" for f in _fields("abc123")).encode())
+        proc.returncode = 0
         parser = GitLogParser()
         commits = parser.parse_repo(Path("/fake/repo"))
         assert len(commits) == 1
         assert commits[0].sha == "abc123"
+        assert f"-{parser.MAX_COMMITS}" in mock_popen.call_args[0][0]
 
     @patch.object(GitLogParser, "parse_repo")
     def test_parse_multiple_repos_combines_results(self, mock_parse: MagicMock) -> None:
@@ -538,19 +524,18 @@ class TestFindGitRepos:
             # Create an accessible repo
             (base / "accessible" / ".git").mkdir(parents=True)
 
-            # Create a directory that will raise PermissionError when iterdir() is called
+            # Create a directory that will raise PermissionError when listed
             restricted = base / "restricted"
             restricted.mkdir()
 
-            # Mock iterdir to raise PermissionError for the restricted directory
-            original_iterdir = Path.iterdir
+            original_scandir = os.scandir
 
-            def mock_iterdir(self: Path) -> object:
-                if self == restricted:
+            def mock_scandir(path: str) -> object:
+                if path == str(restricted):
                     raise PermissionError("Permission denied")
-                return original_iterdir(self)
+                return original_scandir(path)
 
-            with patch.object(Path, "iterdir", mock_iterdir):
+            with patch("ai_asst_mgr.utils.repo_discovery.os.scandir", mock_scandir):
                 repos = find_git_repos(base)
                 repo_names = [r.name for r in repos]
                 # Should still find the accessible repo
@@ -558,6 +543,16 @@ class TestFindGitRepos:
                 # Should not crash on permission error
                 assert len(repos) >= 1
 
+    def test_find_git_repos_saves_cache(self, tmp_path: Path) -> None:
+        """Test find_git_repos writes its directory listings to a cache file."""
+        (tmp_path / "base" / "repo1" / ".git").mkdir(parents=True)
+        cache = tmp_path / "repos.json"
+
+        repos = find_git_repos(tmp_path / "base", cache_path=cache)
+
+        assert repos == [tmp_path / "base" / "repo1"]
+        assert str(tmp_path / "base" / "repo1") in cache.read_text()
+
 
 class TestGitLogParserIntegration:
     """Integration tests using actual git commands (if available)."""
@@ -655,6 +650,270 @@ class TestGitLogParserIntegration:
         assert commits[0].is_ai_attributed is True
 
 
+class TestIncrementalScan:
+    """Tests for GitLogParser.scan_repo high-water marks, against real repositories."""
+
+    @staticmethod
+    def _git(repo: Path, *args: str) -> str:
+        result = subprocess.run(
+            ["git", "-c", "user.name=Test", "-c", "user.email=t@example.com", *args],
+            cwd=repo,
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=10,
+        )
+        return result.stdout.strip()
+
+    @pytest.fixture
+    def repo(self, tmp_path: Path) -> Path:
+        """Create a repository with one commit on main."""
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        self._git(repo, "init", "-q", "-b", "main")
+        self._git(repo, "commit", "-q", "--allow-empty", "-m", "first")
+        return repo
+
+    def test_read_ref_tips(self, repo: Path) -> None:
+        """HEAD and branches are read; an empty repo has none; a plain dir is rejected."""
+        head = self._git(repo, "rev-parse", "HEAD")
+        parser = GitLogParser()
+
+        assert parser.read_ref_tips(repo) == {"HEAD": head, "refs/heads/main": head}
+
+        empty = repo.parent / "empty"
+        empty.mkdir()
+        self._git(empty, "init", "-q")
+        assert parser.read_ref_tips(empty) == {}
+
+        plain = repo.parent / "plain"
+        plain.mkdir()
+        with pytest.raises(ValueError, match="Not a git repository"):
+            parser.read_ref_tips(plain)
+
+    def test_only_new_commits_across_branches(self, repo: Path) -> None:
+        """A rescan reads commits added since, on any branch, and nothing else."""
+        parser = GitLogParser()
+        first = parser.scan_repo(repo)
+        self._git(repo, "commit", "-q", "--allow-empty", "-m", "second")
+        self._git(repo, "checkout", "-q", "-b", "feature")
+        self._git(repo, "commit", "-q", "--allow-empty", "-m", "on feature")
+        self._git(repo, "checkout", "-q", "main")
+
+        second = parser.scan_repo(repo, first.ref_tips)
+
+        assert [c.message for c in first.commits] == ["first"]
+        assert sorted(c.message for c in second.commits) == ["on feature", "second"]
+        assert second.ref_tips["refs/heads/feature"] != second.ref_tips["refs/heads/main"]
+        assert second.newest_commit is not None
+
+    def test_unchanged_repo_skips_git_log(self, repo: Path) -> None:
+        """If no ref moved, git log is not run."""
+        parser = GitLogParser()
+        tips = parser.scan_repo(repo).ref_tips
+
+        with patch.object(parser, "_build_git_log_command") as build:
+            scan = parser.scan_repo(repo, tips)
+
+        assert scan.changed is False
+        assert scan.commits == []
+        build.assert_not_called()
+
+    def test_missing_known_tip_ignored(self, repo: Path) -> None:
+        """A recorded tip that no longer exists does not break the scan."""
+        parser = GitLogParser()
+
+        scan = parser.scan_repo(repo, {"refs/heads/gone": "f" * 40})
+
+        assert [c.message for c in scan.commits] == ["first"]
+
+
+class TestIterCommits:
+    """Tests for streaming commits from git log, against real repositories."""
+
+    _git = staticmethod(TestIncrementalScan._git)
+
+    @pytest.fixture
+    def repo(self, tmp_path: Path) -> Path:
+        """Create a repository with three commits."""
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        self._git(repo, "init", "-q", "-b", "main")
+        for message in ("first", "second", "third"):
+            self._git(repo, "commit", "-q", "--allow-empty", "-m", message)
+        return repo
+
+    def test_messages_round_trip(self, repo: Path) -> None:
+        """Bodies with blank lines, pipes and the old delimiter are kept intact."""
+        message = "feat: tricky\n\nkey|value\n---COMMIT_END---\n\nGenerated with [Claude Code]"
+        self._git(repo, "commit", "-q", "--allow-empty", "-m", message)
+
+        newest = next(GitLogParser().iter_commits(repo))
+
+        assert newest.message == message
+        assert newest.vendor_id == "claude"
+        assert newest.branch == "main"
+
+    def test_no_commit_cap(self, repo: Path) -> None:
+        """Streaming reads the whole history; only the list API is capped."""
+        parser = GitLogParser()
+
+        with patch.object(GitLogParser, "MAX_COMMITS", 2):
+            listed = parser.parse_repo(repo)
+            streamed = list(parser.iter_commits(repo))
+
+        assert len(listed) == 2
+        assert [c.message for c in streamed] == ["third", "second", "first"]
+
+    def test_exclude_and_limit(self, repo: Path) -> None:
+        """Excluded history is left out and the limit applies to what remains."""
+        first = self._git(repo, "rev-list", "--max-parents=0", "HEAD")
+        parser = GitLogParser()
+
+        commits = list(parser.iter_commits(repo, ["HEAD"], exclude=[first]))
+        limited = list(parser.iter_commits(repo, limit=1))
+
+        assert [c.message for c in commits] == ["third", "second"]
+        assert [c.message for c in limited] == ["third"]
+
+    def test_closing_early_stops_git(self, repo: Path) -> None:
+        """Abandoning the iteration kills and reaps the git process."""
+        processes: list[subprocess.Popen[bytes]] = []
+        real_popen = subprocess.Popen
+
+        def spy(*args: object, **kwargs: object) -> subprocess.Popen[bytes]:
+            proc = real_popen(*args, **kwargs)  # type: ignore[call-overload]
+            processes.append(proc)
+            return proc
+
+        commits = GitLogParser().iter_commits(repo)
+        with patch("subprocess.Popen", spy):
+            next(commits)
+        commits.close()
+
+        git_log = [p for p in processes if p.args[1] == "log"]  # type: ignore[index]
+        assert len(git_log) == 1
+        assert git_log[0].returncode is not None
+
+    def test_stalled_git_killed(self, repo: Path) -> None:
+        """A git log that stops producing output is killed after LOG_TIMEOUT."""
+        parser = GitLogParser()
+
+        with (
+            patch.object(parser, "_build_git_log_command", return_value=["sleep", "30"]),
+            patch.object(GitLogParser, "LOG_TIMEOUT", 0.2),
+            pytest.raises(subprocess.TimeoutExpired),
+        ):
+            list(parser.iter_commits(repo))
+
+    def test_slow_consumer_not_timed_out(self, repo: Path) -> None:
+        """Time spent between commits by the caller does not count against git."""
+        parser = GitLogParser()
+        messages = []
+
+        with patch.object(GitLogParser, "LOG_TIMEOUT", 0.2):
+            for commit in parser.iter_commits(repo):
+                time.sleep(0.15)
+                messages.append(commit.message)
+
+        assert messages == ["third", "second", "first"]
+
+    def test_git_error_raised(self, tmp_path: Path) -> None:
+        """A failing git log raises CalledProcessError with git's message."""
+        with pytest.raises(subprocess.CalledProcessError) as excinfo:
+            list(GitLogParser().iter_commits(tmp_path))
+
+        assert b"not a git repository" in excinfo.value.stderr.lower()
+
+
+class TestAttributionMatcher:
+    """Tests for AttributionMatcher and user-defined signature rules."""
+
+    def test_priority_across_overlapping_matches(self) -> None:
+        """A co-author trailer wins even inside a lower-priority signature."""
+        assert DEFAULT_MATCHER.detect("🤖 Co-Authored-By: Claude") == (
+            "claude",
+            0.95,
+            "co_author",
+        )
+        assert DEFAULT_MATCHER.detect("via openai.com\n\nCo-Authored-By: Gemini")[0] == "gemini"
+
+    def test_user_rules_take_priority(self) -> None:
+        """Rules given first win, and rules without a keyword search every text."""
+        matcher = AttributionMatcher(
+            [
+                SignatureRule("gemini", r"Assisted-by: \w+", None, 0.9, "trailer"),
+                *DEFAULT_SIGNATURE_RULES,
+            ]
+        )
+
+        assert matcher.detect("Assisted-by: Claude") == ("gemini", 0.9, "trailer")
+        assert matcher.detect("Generated by Claude") == ("claude", 1.0, "signature")
+
+    def test_keyword_gates_pattern(self) -> None:
+        """A pattern is only searched when its keyword is present."""
+        matcher = AttributionMatcher([SignatureRule("claude", r"bot", "robot")])
+
+        assert matcher.detect("a bot wrote this")[0] is None
+        assert matcher.detect("a ROBOT wrote this")[0] == "claude"
+
+    def test_email_domain_fallback(self) -> None:
+        """Email domains are checked only when no rule matches."""
+        matcher = AttributionMatcher([], {"openai": ["OpenAI.com"]})
+
+        assert matcher.detect("plain", "dev@openai.com") == ("openai", 0.8, "email_domain")
+        assert matcher.detect("plain", "dev@example.com") == (None, 0.0, "none")
+
+    def test_invalid_pattern_rejected(self) -> None:
+        """A rule with an invalid regular expression fails when the matcher is built."""
+        with pytest.raises(ValueError, match="Invalid pattern for claude"):
+            AttributionMatcher([SignatureRule("claude", "(unclosed")])
+
+    def test_load_signature_rules(self, tmp_path: Path) -> None:
+        """Rules are read from JSON with defaults for optional fields."""
+        path = tmp_path / "rules.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "rules": [
+                        {"vendor": "claude", "pattern": "Assisted-by: Claude", "keyword": "claude"},
+                        {"vendor": "openai", "pattern": "o3", "confidence": 0.5, "method": "model"},
+                    ]
+                }
+            )
+        )
+
+        assert load_signature_rules(path) == [
+            SignatureRule("claude", "Assisted-by: Claude", "claude"),
+            SignatureRule("openai", "o3", None, 0.5, "model"),
+        ]
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            "[]",
+            '{"rules": [{"pattern": "x"}]}',
+            '{"rules": [{"vendor": "claude", "pattern": "x", "confidence": 2}]}',
+            "{not json",
+        ],
+    )
+    def test_load_signature_rules_malformed(self, tmp_path: Path, payload: str) -> None:
+        """Malformed rule files raise ValueError."""
+        path = tmp_path / "rules.json"
+        path.write_text(payload)
+
+        with pytest.raises(ValueError, match=r"rules\.json: "):
+            load_signature_rules(path)
+
+    def test_parser_uses_matcher(self) -> None:
+        """GitLogParser attributes commits with the matcher it was given."""
+        matcher = AttributionMatcher([SignatureRule("gemini", "Assisted-by: Gemini", "gemini")])
+        fields = _fields("abc123", body="Assisted-by: Gemini\n")
+
+        assert GitLogParser(matcher)._commit_from_fields(fields, "r").vendor_id == "gemini"  # type: ignore[union-attr]
+        assert GitLogParser()._commit_from_fields(fields, "r").vendor_id is None  # type: ignore[union-attr]
+
+
 class TestDetectVendorAttributionDetailed:
     """Tests for detect_vendor_attribution_detailed function."""
 
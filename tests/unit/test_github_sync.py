@@ -0,0 +1,143 @@
+"""Tests for syncing commits from many repositories."""
+
+from __future__ import annotations
+
+import sqlite3
+import subprocess
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ai_asst_mgr.database.manager import DatabaseManager
+from ai_asst_mgr.database.schema import SchemaManager
+from ai_asst_mgr.operations.github_parser import GitHubCommit
+from ai_asst_mgr.operations.github_sync import GitHubSyncManager, RepoSyncResult
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=t@example.com", *args],
+        cwd=repo,
+        capture_output=True,
+        check=True,
+        timeout=10,
+    )
+
+
+def _commit(sha: str, vendor_id: str | None = None) -> GitHubCommit:
+    return GitHubCommit(
+        sha=sha,
+        repo="user/repo",
+        branch="main",
+        message=f"commit {sha}",
+        author_name="Test",
+        author_email="t@example.com",
+        vendor_id=vendor_id,
+        committed_at=datetime(2024, 1, 1, tzinfo=UTC),
+    )
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> DatabaseManager:
+    """Create a database with the full schema."""
+    db_path = tmp_path / "sessions.db"
+    SchemaManager(db_path).initialize()
+    return DatabaseManager(db_path)
+
+
+@pytest.fixture
+def repos(tmp_path: Path) -> list[Path]:
+    """Create three repositories with two commits each."""
+    paths = []
+    for i in range(3):
+        repo = tmp_path / f"repo{i}"
+        repo.mkdir()
+        _git(repo, "init", "-q", "-b", "main")
+        _git(repo, "commit", "-q", "--allow-empty", "-m", f"first in {i}")
+        _git(repo, "commit", "-q", "--allow-empty", "-m", f"second in {i}\n\nGenerated by Claude")
+        paths.append(repo)
+    return paths
+
+
+class TestGitHubSyncManager:
+    """Tests for GitHubSyncManager."""
+
+    def test_sync_then_resync_unchanged(self, db: DatabaseManager, repos: list[Path]) -> None:
+        """Commits and ref tips are recorded; a second sync skips every repository."""
+        manager = GitHubSyncManager(db)
+        seen: list[RepoSyncResult] = []
+
+        first = manager.sync_repos(repos, max_workers=3, progress_callback=seen.append)
+        second = manager.sync_repos(repos, max_workers=3)
+
+        assert (first.total_commits, first.ai_commits, first.errors) == (6, 3, [])
+        assert len(seen) == 3
+        assert all(r.duration_seconds > 0 for r in first.results)
+        assert len(db.get_github_commits(limit=100)) == 6
+        assert set(db.get_github_sync_states()) == {str(r.resolve()) for r in repos}
+        assert (second.total_commits, second.unchanged) == (0, 3)
+
+    def test_new_commits_only(self, db: DatabaseManager, repos: list[Path]) -> None:
+        """After a repository changes only its new commit is written."""
+        manager = GitHubSyncManager(db)
+        manager.sync_repos(repos)
+        _git(repos[1], "commit", "-q", "--allow-empty", "-m", "third")
+
+        with patch.object(
+            db, "record_github_commits_bulk", wraps=db.record_github_commits_bulk
+        ) as write:
+            summary = manager.sync_repos(repos)
+
+        assert (summary.total_commits, summary.unchanged) == (1, 2)
+        assert [c.message for c in write.call_args[0][0]] == ["third"]
+
+    def test_commits_written_in_batches(self, db: DatabaseManager) -> None:
+        """Commits are buffered across repositories up to the batch size."""
+        parser = MagicMock()
+        parser.read_ref_tips.side_effect = lambda path: {"HEAD": path.name}
+        parser.iter_new_commits.side_effect = lambda path, _tips, _known, _limit: (
+            _commit(f"{path.name}-{i}") for i in range(3)
+        )
+        manager = GitHubSyncManager(db, parser, batch_size=5)
+
+        with patch.object(
+            db, "record_github_commits_bulk", wraps=db.record_github_commits_bulk
+        ) as write:
+            summary = manager.sync_repos([Path(f"/r/{i}") for i in range(4)], max_workers=1)
+
+        assert [len(call[0][0]) for call in write.call_args_list] == [6, 6]
+        assert summary.total_commits == 12
+
+    def test_scan_errors_reported(self, db: DatabaseManager, repos: list[Path]) -> None:
+        """A repository that cannot be read is reported and the rest still sync."""
+        not_a_repo = repos[0].parent / "plain"
+        not_a_repo.mkdir()
+
+        summary = GitHubSyncManager(db).sync_repos([not_a_repo, *repos])
+
+        assert summary.total_commits == 6
+        assert len(summary.errors) == 1
+        assert summary.errors[0].startswith("plain: Not a git repository")
+
+    def test_unexpected_worker_error_raised(self, db: DatabaseManager, repos: list[Path]) -> None:
+        """An unexpected error in a worker is raised instead of hanging the sync."""
+        parser = MagicMock()
+        parser.read_ref_tips.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            GitHubSyncManager(parser=parser, db=db).sync_repos(repos, max_workers=2)
+
+    def test_failed_write_keeps_state(self, db: DatabaseManager, repos: list[Path]) -> None:
+        """If commits cannot be written the ref tips are not saved, so they are retried."""
+        manager = GitHubSyncManager(db)
+
+        with patch.object(
+            db, "record_github_commits_bulk", side_effect=sqlite3.OperationalError("x")
+        ):
+            summary = manager.sync_repos(repos)
+
+        assert summary.total_commits == 0
+        assert len(summary.errors) == 3
+        assert db.get_github_sync_states() == {}
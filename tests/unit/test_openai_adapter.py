@@ -276,7 +276,8 @@ def test_restore(adapter_with_temp_dir: OpenAIAdapter, tmp_path: Path) -> None:
     adapter_with_temp_dir.set_config("api_key", "modified-key")
 
     # Restore
-    adapter_with_temp_dir.restore(backup_file)
+    with pytest.deprecated_call():
+        adapter_with_temp_dir.restore(backup_file)
 
     # Verify restored
     config = adapter_with_temp_dir._load_config()
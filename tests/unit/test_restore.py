@@ -3,17 +3,21 @@
 import tarfile
 from datetime import UTC, datetime
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
 from ai_asst_mgr.adapters.base import VendorInfo
+from ai_asst_mgr.adapters.claude import ClaudeAdapter
 from ai_asst_mgr.operations.backup import BackupManager
+from ai_asst_mgr.operations.backup_catalog import BackupMetadata
 from ai_asst_mgr.operations.restore import (
     RestoreManager,
     RestorePreview,
     RestoreResult,
 )
+from ai_asst_mgr.operations.snapshot import SnapshotRepository
+from ai_asst_mgr.utils.compression import CompressionSettings, detect_codec
 
 
 @pytest.fixture
@@ -187,16 +191,39 @@ class TestRestoreVendor:
     def test_restore_vendor_success(
         self, restore_manager: RestoreManager, mock_adapter: Mock, sample_backup: Path
     ) -> None:
-        """Test successful vendor restore."""
-        mock_adapter.restore = Mock()
+        """Test successful vendor restore replaces the config dir with the backup."""
+        config_dir = mock_adapter.info.config_dir
+        (config_dir / "stale.json").write_text("{}")
 
         result = restore_manager.restore_vendor(
             sample_backup, mock_adapter, create_pre_restore_backup=False
         )
 
         assert result.success is True
-        assert result.restored_files > 0
-        mock_adapter.restore.assert_called_once_with(sample_backup)
+        assert result.restored_files == 3
+        assert (config_dir / "skills" / "test_skill.md").read_text() == "# Test Skill"
+        assert not (config_dir / "stale.json").exists()
+        assert not any(".restore-" in p.name for p in config_dir.parent.iterdir())
+
+    def test_restore_vendor_keeps_symlinked_config_dir(
+        self, restore_manager: RestoreManager, mock_adapter: Mock, sample_backup: Path
+    ) -> None:
+        """Test a symlinked config dir stays a link to the restored directory."""
+        link = mock_adapter.info.config_dir
+        target = link.parent / "dotfiles" / "claude"
+        target.parent.mkdir()
+        link.rename(target)
+        link.symlink_to(target)
+
+        result = restore_manager.restore_vendor(
+            sample_backup, mock_adapter, create_pre_restore_backup=False
+        )
+
+        assert result.success is True
+        assert link.is_symlink()
+        assert link.resolve() == target
+        assert (target / "skills" / "test_skill.md").read_text() == "# Test Skill"
+        assert not any(".restore-" in p.name for p in target.parent.iterdir())
 
     def test_restore_vendor_invalid_backup(
         self, restore_manager: RestoreManager, mock_adapter: Mock, tmp_path: Path
@@ -261,15 +288,112 @@ class TestRestoreVendor:
     def test_restore_vendor_handles_restore_error(
         self, restore_manager: RestoreManager, mock_adapter: Mock, sample_backup: Path
     ) -> None:
-        """Test restore handles adapter errors gracefully."""
-        mock_adapter.restore = Mock(side_effect=OSError("Restore failed"))
+        """Test a failed swap leaves the current configuration in place."""
+        config_dir = mock_adapter.info.config_dir
+        original_rename = Path.rename
+
+        def failing_rename(self: Path, target: Path) -> Path:
+            # Fail only the rename of the extracted backup into place
+            if Path(target) == config_dir and self.parent.name == "extracted":
+                raise OSError("Restore failed")
+            return original_rename(self, target)
+
+        with patch.object(Path, "rename", failing_rename):
+            result = restore_manager.restore_vendor(
+                sample_backup, mock_adapter, create_pre_restore_backup=False
+            )
+
+        assert result.success is False
+        assert "Restore failed" in result.error
+        assert (config_dir / "settings.json").read_text() == '{"test": "value"}'
+        assert not (config_dir / "skills").exists()
+
+    def test_restore_vendor_removes_stale_staging(
+        self, restore_manager: RestoreManager, mock_adapter: Mock, sample_backup: Path
+    ) -> None:
+        """Test staging dirs left by an interrupted restore are cleaned up."""
+        stale = mock_adapter.info.config_dir.parent / "..claude.restore-killed"
+        (stale / "extracted").mkdir(parents=True)
 
         result = restore_manager.restore_vendor(
             sample_backup, mock_adapter, create_pre_restore_backup=False
         )
 
+        assert result.success is True
+        assert not stale.exists()
+
+    def test_restore_vendor_recovers_interrupted_swap(
+        self, restore_manager: RestoreManager, mock_adapter: Mock, sample_backup: Path
+    ) -> None:
+        """Test a config dir left in staging by a killed restore is renamed back first."""
+        config_dir = mock_adapter.info.config_dir
+        stale = config_dir.parent / f".{config_dir.name}.restore-killed"
+        stale.mkdir()
+        config_dir.rename(stale / "previous")
+        (stale / "previous" / "projects").mkdir()
+        (stale / "previous" / "projects" / "session.jsonl").write_text("transcript")
+
+        with patch(
+            "ai_asst_mgr.operations.restore.RestoreManager._extract_backup",
+            return_value=(None, "Archive is empty"),
+        ):
+            result = restore_manager.restore_vendor(
+                sample_backup, mock_adapter, create_pre_restore_backup=False
+            )
+
         assert result.success is False
-        assert "Restore failed" in result.error
+        assert (config_dir / "projects" / "session.jsonl").read_text() == "transcript"
+        assert not stale.exists()
+
+    def test_restore_vendor_keeps_stale_previous(
+        self, restore_manager: RestoreManager, mock_adapter: Mock, sample_backup: Path
+    ) -> None:
+        """Test staging dirs holding a previous config are left alone when the config exists."""
+        config_dir = mock_adapter.info.config_dir
+        stale = config_dir.parent / f".{config_dir.name}.restore-killed"
+        (stale / "previous").mkdir(parents=True)
+        (stale / "previous" / "only-copy.json").write_text("{}")
+        messages: list[str] = []
+
+        result = restore_manager.restore_vendor(
+            sample_backup,
+            mock_adapter,
+            create_pre_restore_backup=False,
+            progress_callback=messages.append,
+        )
+
+        assert result.success is True
+        assert (stale / "previous" / "only-copy.json").exists()
+        assert any(str(stale) in msg for msg in messages)
+
+    def test_restore_vendor_checksum_mismatch(
+        self,
+        restore_manager: RestoreManager,
+        backup_manager: BackupManager,
+        mock_adapter: Mock,
+        sample_backup: Path,
+    ) -> None:
+        """Test an archive that no longer matches the catalog is not restored."""
+        backup_manager.catalog.add(
+            BackupMetadata(
+                vendor_id="claude",
+                timestamp=datetime.now(tz=UTC),
+                backup_path=sample_backup,
+                size_bytes=sample_backup.stat().st_size,
+                checksum="0" * 64,
+                file_count=3,
+                config_dir=str(mock_adapter.info.config_dir),
+            )
+        )
+
+        result = restore_manager.restore_vendor(
+            sample_backup, mock_adapter, create_pre_restore_backup=True
+        )
+
+        assert result.success is False
+        assert "Checksum mismatch" in result.error
+        assert result.pre_restore_backup is None
+        assert not (mock_adapter.info.config_dir / "skills").exists()
 
 
 class TestRestoreSelective:
@@ -349,14 +473,14 @@ class TestRollback:
         self, restore_manager: RestoreManager, mock_adapter: Mock, sample_backup: Path
     ) -> None:
         """Test successful rollback."""
-        mock_adapter.restore = Mock()
+        mock_adapter.backup = Mock()
 
         result = restore_manager.rollback(sample_backup, mock_adapter)
 
         assert result.success is True
         # Rollback should not create pre-restore backup
         assert result.pre_restore_backup is None
-        mock_adapter.restore.assert_called_once()
+        mock_adapter.backup.assert_not_called()
 
     def test_rollback_with_progress(
         self, restore_manager: RestoreManager, mock_adapter: Mock, sample_backup: Path
@@ -407,6 +531,279 @@ class TestGetRestorableDirectories:
         assert directories == []
 
 
+class TestSnapshotRestore:
+    """Tests for restoring deduplicated snapshot backups."""
+
+    @pytest.fixture
+    def snapshot_path(self, temp_backup_dir: Path, mock_adapter: Mock) -> Path:
+        """Create a snapshot backup of the mock adapter's config."""
+        manager = BackupManager(temp_backup_dir, incremental=True)
+        result = manager.backup_vendor(mock_adapter)
+        assert result.metadata is not None
+        return result.metadata.backup_path
+
+    def test_preview_and_directories_from_manifest(
+        self, restore_manager: RestoreManager, mock_adapter: Mock, snapshot_path: Path
+    ) -> None:
+        """Test preview and directory listing read the snapshot manifest."""
+        preview = restore_manager.preview_restore(snapshot_path, mock_adapter)
+
+        assert preview is not None
+        assert sorted(preview.files_to_restore) == [
+            "claude/agents/test_agent.md",
+            "claude/settings.json",
+        ]
+        assert restore_manager.get_restorable_directories(snapshot_path) == ["agents"]
+
+    def test_restore_vendor_from_snapshot(
+        self, restore_manager: RestoreManager, mock_adapter: Mock, snapshot_path: Path
+    ) -> None:
+        """Test restore reassembles the snapshot into the config dir."""
+        config_dir = mock_adapter.info.config_dir
+        (config_dir / "settings.json").write_text("changed")
+
+        result = restore_manager.restore_vendor(
+            snapshot_path, mock_adapter, create_pre_restore_backup=False
+        )
+
+        assert result.success is True
+        assert result.restored_files == 2
+        assert (config_dir / "settings.json").read_text() == '{"test": "value"}'
+
+    def test_restore_exports_snapshot_uncompressed(
+        self, restore_manager: RestoreManager, mock_adapter: Mock, snapshot_path: Path
+    ) -> None:
+        """Test snapshots are not gzipped on their way to being extracted."""
+        original_export = SnapshotRepository.export_archive
+        codecs: list[str | None] = []
+
+        def export(self: SnapshotRepository, manifest: Path, archive: Path, **kwargs: bool) -> int:
+            count = original_export(self, manifest, archive, **kwargs)
+            codecs.append(detect_codec(archive))
+            return count
+
+        with patch.object(SnapshotRepository, "export_archive", export):
+            result = restore_manager.restore_vendor(
+                snapshot_path, mock_adapter, create_pre_restore_backup=False
+            )
+
+        assert result.success is True
+        assert codecs == [None]
+
+    def test_restore_selective_from_snapshot(
+        self, restore_manager: RestoreManager, mock_adapter: Mock, snapshot_path: Path
+    ) -> None:
+        """Test selective restore works on snapshots."""
+        agent = mock_adapter.info.config_dir / "agents" / "test_agent.md"
+        agent.write_text("changed")
+
+        result = restore_manager.restore_selective(snapshot_path, mock_adapter, ["agents"])
+
+        assert result.success is True
+        assert agent.read_text() == "# Test Agent"
+
+
+class TestExcludedPathsSurviveRestore:
+    """Tests that restoring never deletes data the backup deliberately skipped."""
+
+    @pytest.fixture
+    def adapter(self, mock_adapter: Mock) -> ClaudeAdapter:
+        """Create a real Claude adapter over the mock adapter's config dir."""
+        config_dir = mock_adapter.info.config_dir
+        (config_dir / "projects").mkdir()
+        (config_dir / "projects" / "session.jsonl").write_text("transcript")
+        (config_dir / "statsig").mkdir()
+        (config_dir / "statsig" / "cache").write_text("flags")
+        adapter = ClaudeAdapter()
+        adapter._config_dir = config_dir
+        adapter._settings_file = config_dir / "settings.json"
+        return adapter
+
+    @pytest.mark.parametrize("incremental", [False, True])
+    def test_restore_vendor_keeps_excluded(
+        self, temp_backup_dir: Path, adapter: ClaudeAdapter, incremental: bool
+    ) -> None:
+        """Test full restores bring back the backup and keep excluded paths."""
+        manager = BackupManager(temp_backup_dir, incremental=incremental, exclude=["projects/"])
+        backup = manager.backup_vendor(adapter)
+        assert backup.metadata is not None
+        config_dir = adapter.info.config_dir
+        (config_dir / "settings.json").write_text('{"changed": true}')
+        (config_dir / "projects" / "session.jsonl").write_text("newer transcript")
+
+        result = RestoreManager(manager).restore_vendor(
+            backup.metadata.backup_path, adapter, create_pre_restore_backup=False
+        )
+
+        assert result.success is True
+        assert result.restored_files == 2
+        assert (config_dir / "settings.json").read_text() == '{"test": "value"}'
+        assert (config_dir / "projects" / "session.jsonl").read_text() == "newer transcript"
+        assert (config_dir / "statsig" / "cache").read_text() == "flags"
+
+    def test_failed_swap_keeps_excluded(
+        self, temp_backup_dir: Path, adapter: ClaudeAdapter
+    ) -> None:
+        """Test excluded paths survive when the restored tree cannot be moved into place."""
+        manager = BackupManager(temp_backup_dir, exclude=["projects/"])
+        backup = manager.backup_vendor(adapter)
+        assert backup.metadata is not None
+        config_dir = adapter.info.config_dir
+        (config_dir / "projects" / "session.jsonl").write_text("newer transcript")
+        original_rename = Path.rename
+
+        def failing_rename(self: Path, target: Path) -> Path:
+            if Path(target) == config_dir and self.parent.name == "extracted":
+                raise OSError("Restore failed")
+            return original_rename(self, target)
+
+        with patch.object(Path, "rename", failing_rename):
+            result = RestoreManager(manager).restore_vendor(
+                backup.metadata.backup_path, adapter, create_pre_restore_backup=False
+            )
+
+        assert result.success is False
+        assert (config_dir / "projects" / "session.jsonl").read_text() == "newer transcript"
+        assert (config_dir / "statsig" / "cache").read_text() == "flags"
+
+    def test_failed_carry_over_keeps_previous(
+        self, temp_backup_dir: Path, adapter: ClaudeAdapter
+    ) -> None:
+        """Test the previous configuration is kept if excluded paths cannot be moved back."""
+        manager = BackupManager(temp_backup_dir, exclude=["projects/"])
+        backup = manager.backup_vendor(adapter)
+        assert backup.metadata is not None
+        config_dir = adapter.info.config_dir
+
+        with patch(
+            "ai_asst_mgr.operations.restore.carry_over_excluded",
+            side_effect=OSError("disk full"),
+        ):
+            result = RestoreManager(manager).restore_vendor(
+                backup.metadata.backup_path, adapter, create_pre_restore_backup=False
+            )
+
+        assert result.success is False
+        assert result.error is not None
+        assert "disk full" in result.error
+        kept = config_dir.parent.glob(f".{config_dir.name}.restore-*/previous/projects/*")
+        assert [path.read_text() for path in kept] == ["transcript"]
+
+    def test_restore_selective_keeps_excluded(
+        self, temp_backup_dir: Path, adapter: ClaudeAdapter
+    ) -> None:
+        """Test selective restores keep excluded files inside the restored directory."""
+        manager = BackupManager(temp_backup_dir, exclude=["agents/*.log"])
+        agents = adapter.info.config_dir / "agents"
+        backup = manager.backup_vendor(adapter)
+        assert backup.metadata is not None
+        (agents / "debug.log").write_text("log")
+
+        result = RestoreManager(manager).restore_selective(
+            backup.metadata.backup_path, adapter, ["agents"]
+        )
+
+        assert result.success is True
+        assert (agents / "test_agent.md").exists()
+        assert (agents / "debug.log").read_text() == "log"
+
+    def test_failed_selective_swap_keeps_excluded(
+        self, temp_backup_dir: Path, adapter: ClaudeAdapter
+    ) -> None:
+        """Test excluded files survive when a restored directory cannot be moved into place."""
+        manager = BackupManager(temp_backup_dir, exclude=["agents/*.log"])
+        agents = adapter.info.config_dir / "agents"
+        backup = manager.backup_vendor(adapter)
+        assert backup.metadata is not None
+        (agents / "debug.log").write_text("log")
+        original_rename = Path.rename
+
+        def failing_rename(self: Path, target: Path) -> Path:
+            if Path(target) == agents and self.name == "agents":
+                raise OSError("Restore failed")
+            return original_rename(self, target)
+
+        with patch.object(Path, "rename", failing_rename):
+            result = RestoreManager(manager).restore_selective(
+                backup.metadata.backup_path, adapter, ["agents"]
+            )
+
+        assert result.success is False
+        assert (agents / "debug.log").read_text() == "log"
+        assert (agents / "test_agent.md").exists()
+        assert not list(adapter.info.config_dir.parent.glob("temp_restore_*"))
+
+
+class TestIndexedRestore:
+    """Tests for listing and selective restore through an archive's member index."""
+
+    @pytest.fixture
+    def manager(self, temp_backup_dir: Path) -> BackupManager:
+        """Create a BackupManager writing small compression blocks."""
+        return BackupManager(temp_backup_dir, compression=CompressionSettings(block_size=16_384))
+
+    @pytest.fixture
+    def backup_path(self, manager: BackupManager, mock_adapter: Mock) -> Path:
+        """Back up a config with large transcripts through a real adapter."""
+        config_dir = mock_adapter.info.config_dir
+        (config_dir / "projects").mkdir()
+        for i in range(4):
+            (config_dir / "projects" / f"session{i}.jsonl").write_bytes(bytes(range(256)) * 400)
+        adapter = ClaudeAdapter()
+        adapter._config_dir = config_dir
+        adapter._settings_file = config_dir / "settings.json"
+        result = manager.backup_vendor(adapter)
+        assert result.metadata is not None
+        return result.metadata.backup_path
+
+    def test_listing_does_not_read_archive(
+        self, manager: BackupManager, mock_adapter: Mock, backup_path: Path
+    ) -> None:
+        """Test preview and directory listing are answered from the index."""
+        restore_manager = RestoreManager(manager)
+
+        with patch("tarfile.TarFile.getmembers") as mock_getmembers:
+            preview = restore_manager.preview_restore(backup_path, mock_adapter)
+            directories = restore_manager.get_restorable_directories(backup_path)
+
+        mock_getmembers.assert_not_called()
+        assert preview is not None
+        assert len(preview.files_to_restore) == 6
+        assert directories == ["agents", "projects"]
+
+    def test_selective_restore_reads_only_needed_blocks(
+        self, manager: BackupManager, mock_adapter: Mock, backup_path: Path
+    ) -> None:
+        """Test damage outside the requested directory does not affect its restore."""
+        index = manager.load_archive_index(backup_path)
+        assert index is not None
+        transcript = next(m for m in index.members if m.name.endswith("session2.jsonl"))
+        block = next(b for b in index.blocks if b.offset > transcript.start)
+        data = bytearray(backup_path.read_bytes())
+        data[block.compressed_offset + 10] ^= 0xFF
+        backup_path.write_bytes(bytes(data))
+        agent = mock_adapter.info.config_dir / "agents" / "test_agent.md"
+        agent.write_text("changed")
+        restore_manager = RestoreManager(manager)
+
+        agents = restore_manager.restore_selective(backup_path, mock_adapter, ["agents"])
+        projects = restore_manager.restore_selective(backup_path, mock_adapter, ["projects"])
+
+        assert agents.success is True
+        assert agents.restored_files == 1
+        assert agent.read_text() == "# Test Agent"
+        assert projects.success is False
+        assert "corrupt" in (projects.error or "")
+
+    def test_stale_index_ignored(self, manager: BackupManager, backup_path: Path) -> None:
+        """Test an index whose checksum disagrees with the catalog is not used."""
+        backup = manager.list_backups("claude")[0]
+        backup.checksum = "0" * 64
+        manager.catalog.add(backup)
+
+        assert manager.load_archive_index(backup_path) is None
+
+
 class TestBackupTimestamp:
     """Tests for _get_backup_timestamp method."""
 
@@ -448,30 +845,6 @@ class TestBackupTimestamp:
         assert isinstance(timestamp, datetime)
 
 
-class TestCountFilesInArchive:
-    """Tests for _count_files_in_archive method."""
-
-    def test_count_files_in_archive(
-        self, restore_manager: RestoreManager, sample_backup: Path
-    ) -> None:
-        """Test counting files in archive."""
-        count = restore_manager._count_files_in_archive(sample_backup)
-
-        # sample_backup has settings.json, agents/test_agent.md, skills/test_skill.md
-        assert count == 3
-
-    def test_count_files_invalid_archive(
-        self, restore_manager: RestoreManager, tmp_path: Path
-    ) -> None:
-        """Test returns 0 for invalid archive."""
-        invalid_path = tmp_path / "invalid.tar.gz"
-        invalid_path.write_text("not a tar file")
-
-        count = restore_manager._count_files_in_archive(invalid_path)
-
-        assert count == 0
-
-
 class TestRestoreEdgeCases:
     """Additional edge case tests for RestoreManager."""
 
@@ -658,14 +1031,3 @@ class TestRestoreEdgeCases:
         directories = restore_manager.get_restorable_directories(corrupt_archive)
 
         assert directories == []
-
-    def test_count_files_invalid_archive_tar_error(
-        self, restore_manager: RestoreManager, tmp_path: Path
-    ) -> None:
-        """Test _count_files_in_archive handles TarError gracefully."""
-        corrupt_archive = tmp_path / "corrupt.tar.gz"
-        corrupt_archive.write_bytes(b"not a valid tar")
-
-        count = restore_manager._count_files_in_archive(corrupt_archive)
-
-        assert count == 0
@@ -0,0 +1,205 @@
+"""Unit tests for content-addressed snapshot backups."""
+
+import tarfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ai_asst_mgr.operations.snapshot import (
+    ChunkStore,
+    SnapshotRepository,
+    is_snapshot,
+)
+from ai_asst_mgr.utils.compression import detect_codec
+
+
+@pytest.fixture
+def source_dir(tmp_path: Path) -> Path:
+    """Create a configuration directory to snapshot."""
+    source = tmp_path / ".claude"
+    (source / "agents").mkdir(parents=True)
+    (source / "settings.json").write_text('{"test": "value"}')
+    (source / "agents" / "one.md").write_text("# One")
+    (source / "history.jsonl").write_text("line\n" * 1000)
+    (source / "link.md").symlink_to("agents/one.md")
+    return source
+
+
+@pytest.fixture
+def repository(tmp_path: Path) -> SnapshotRepository:
+    """Create an empty snapshot repository."""
+    return SnapshotRepository(tmp_path / "backups" / ".store")
+
+
+@pytest.fixture
+def manifest_dir(tmp_path: Path) -> Path:
+    """Directory holding snapshot manifests."""
+    directory = tmp_path / "backups"
+    directory.mkdir(exist_ok=True)
+    return directory
+
+
+class TestChunkStore:
+    """Tests for ChunkStore."""
+
+    def test_put_is_idempotent(self, tmp_path: Path) -> None:
+        """Storing identical data twice writes it once."""
+        store = ChunkStore(tmp_path / "store")
+
+        digest, written = store.put(b"hello" * 100)
+        again, written_again = store.put(b"hello" * 100)
+
+        assert digest == again
+        assert written > 0
+        assert written_again == 0
+        assert store.get(digest) == b"hello" * 100
+        assert list(store.digests()) == [digest]
+
+    def test_get_detects_corruption(self, tmp_path: Path) -> None:
+        """A chunk whose contents changed on disk is rejected."""
+        store = ChunkStore(tmp_path / "store")
+        digest, _ = store.put(b"data")
+        store.object_path(digest).write_bytes(b"garbage")
+
+        with pytest.raises(ValueError, match="Corrupt chunk"):
+            store.get(digest)
+
+
+class TestCreateSnapshot:
+    """Tests for SnapshotRepository.create_snapshot."""
+
+    def test_first_snapshot_stores_everything(
+        self, repository: SnapshotRepository, source_dir: Path, manifest_dir: Path
+    ) -> None:
+        """The first snapshot stores every file and records all entries."""
+        stats = repository.create_snapshot(source_dir, manifest_dir / "a.snapshot.json", "claude")
+
+        assert stats.file_count == 3
+        assert stats.new_chunks == 3
+        assert stats.unchanged_files == 0
+        assert stats.stored_bytes > 0
+        kinds = {e.path: e.kind for e in repository.load_entries(stats.path)}
+        assert kinds["claude"] == "dir"
+        assert kinds["claude/agents"] == "dir"
+        assert kinds["claude/link.md"] == "symlink"
+        assert kinds["claude/history.jsonl"] == "file"
+
+    def test_unchanged_files_are_not_read_or_stored(
+        self, repository: SnapshotRepository, source_dir: Path, manifest_dir: Path
+    ) -> None:
+        """A second snapshot reuses unchanged files and stores only changes."""
+        first = repository.create_snapshot(source_dir, manifest_dir / "a.snapshot.json", "claude")
+        (source_dir / "settings.json").write_text('{"test": "changed"}')
+
+        with patch.object(
+            SnapshotRepository,
+            "_store_file",
+            autospec=True,
+            side_effect=SnapshotRepository._store_file,
+        ) as store_file:
+            second = repository.create_snapshot(
+                source_dir, manifest_dir / "b.snapshot.json", "claude", previous=first.path
+            )
+
+        assert [call.args[1].name for call in store_file.call_args_list] == ["settings.json"]
+        assert second.unchanged_files == 2
+        assert second.new_chunks == 1
+
+    def test_identical_content_is_deduplicated(
+        self, repository: SnapshotRepository, source_dir: Path, manifest_dir: Path
+    ) -> None:
+        """Files with identical content share chunks even without a previous snapshot."""
+        (source_dir / "copy.jsonl").write_text("line\n" * 1000)
+
+        stats = repository.create_snapshot(source_dir, manifest_dir / "a.snapshot.json", "claude")
+
+        assert stats.file_count == 4
+        assert stats.new_chunks == 3
+
+    def test_large_files_are_chunked(
+        self, repository: SnapshotRepository, source_dir: Path, manifest_dir: Path
+    ) -> None:
+        """Appending to a multi-chunk file only stores the changed tail chunk."""
+        with patch("ai_asst_mgr.operations.snapshot.CHUNK_SIZE", 1024):
+            first = repository.create_snapshot(
+                source_dir, manifest_dir / "a.snapshot.json", "claude"
+            )
+            with (source_dir / "history.jsonl").open("a") as f:
+                f.write("more\n")
+            second = repository.create_snapshot(
+                source_dir, manifest_dir / "b.snapshot.json", "claude", previous=first.path
+            )
+
+        entries = {e.path: e for e in repository.load_entries(second.path)}
+        assert len(entries["claude/history.jsonl"].chunks) == 5
+        assert second.new_chunks == 1
+
+
+class TestVerifyExportAndGc:
+    """Tests for verification, export and garbage collection."""
+
+    def test_export_round_trips(
+        self, repository: SnapshotRepository, source_dir: Path, manifest_dir: Path, tmp_path: Path
+    ) -> None:
+        """Exported archives contain the original files under the archive root."""
+        stats = repository.create_snapshot(source_dir, manifest_dir / "a.snapshot.json", "claude")
+        archive = tmp_path / "export.tar.gz"
+
+        assert repository.export_archive(stats.path, archive) == 3
+
+        with tarfile.open(archive, "r:gz") as tar:
+            history = tar.extractfile("claude/history.jsonl")
+            assert history is not None
+            assert history.read() == (source_dir / "history.jsonl").read_bytes()
+            assert tar.getmember("claude/link.md").issym()
+
+    def test_export_uncompressed(
+        self, repository: SnapshotRepository, source_dir: Path, manifest_dir: Path, tmp_path: Path
+    ) -> None:
+        """Exports without compression are plain tar archives."""
+        stats = repository.create_snapshot(source_dir, manifest_dir / "a.snapshot.json", "claude")
+        archive = tmp_path / "export.tar"
+
+        assert repository.export_archive(stats.path, archive, compress=False) == 3
+
+        assert detect_codec(archive) is None
+        with tarfile.open(archive, "r:") as tar:
+            history = tar.extractfile("claude/history.jsonl")
+            assert history is not None
+            assert history.read() == (source_dir / "history.jsonl").read_bytes()
+
+    def test_verify_reports_missing_chunk(
+        self, repository: SnapshotRepository, source_dir: Path, manifest_dir: Path
+    ) -> None:
+        """Verification fails when a referenced chunk has been removed."""
+        stats = repository.create_snapshot(source_dir, manifest_dir / "a.snapshot.json", "claude")
+        assert repository.verify_snapshot(stats.path)[0] is True
+
+        digest = next(repository.store.digests())
+        repository.store.object_path(digest).unlink()
+
+        is_valid, message = repository.verify_snapshot(stats.path)
+        assert is_valid is False
+        assert "Missing chunk" in message
+
+    def test_collect_garbage_keeps_live_chunks(
+        self, repository: SnapshotRepository, source_dir: Path, manifest_dir: Path
+    ) -> None:
+        """Only chunks unreferenced by live snapshots are removed."""
+        first = repository.create_snapshot(source_dir, manifest_dir / "a.snapshot.json", "claude")
+        (source_dir / "settings.json").write_text('{"test": "changed"}')
+        second = repository.create_snapshot(
+            source_dir, manifest_dir / "b.snapshot.json", "claude", previous=first.path
+        )
+
+        gc = repository.collect_garbage([second.path])
+
+        assert gc.removed_chunks == 1
+        assert gc.freed_bytes > 0
+        assert repository.verify_snapshot(second.path)[0] is True
+
+    def test_is_snapshot(self) -> None:
+        """Snapshot manifests are recognised by their suffix."""
+        assert is_snapshot(Path("claude_snapshot_1.snapshot.json"))
+        assert not is_snapshot(Path("claude_backup_1.tar.gz"))
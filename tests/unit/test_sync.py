@@ -16,6 +16,7 @@ from ai_asst_mgr.operations.sync import (
     SyncPreview,
     SyncResult,
 )
+from ai_asst_mgr.utils.tree_index import file_digest
 
 
 @pytest.fixture
@@ -231,7 +232,9 @@ class TestPreviewSync:
     ) -> None:
         """Test successful sync preview."""
 
-        def mock_clone(_url: str, dest_dir: Path, _branch: str) -> bool:
+        def mock_clone(
+            _url: str, dest_dir: Path, _branch: str, _paths: list[str] | None = None
+        ) -> bool:
             # Copy mock repo content to dest_dir
             if dest_dir.exists():
                 shutil.rmtree(dest_dir)
@@ -248,6 +251,36 @@ class TestPreviewSync:
         # skills/new_skill.md doesn't exist locally
         assert any("skills" in f for f in preview.files_to_add)
 
+    def test_preview_sync_reuses_local_hashes(
+        self, backup_manager: BackupManager, mock_adapter: Mock, tmp_path: Path
+    ) -> None:
+        """Test a second preview does not re-read unchanged local files."""
+        repo_dir = tmp_path / "repo"
+        (repo_dir / "agents").mkdir(parents=True)
+        (repo_dir / "agents" / "local_agent.md").write_text("# Other Agent")
+        (repo_dir / "settings.json").write_text('{"existing": "config"}')
+        manager = SyncManager(backup_manager, hash_cache_dir=tmp_path / "hashes")
+
+        def mock_clone(
+            _url: str, dest_dir: Path, _branch: str, _paths: list[str] | None = None
+        ) -> bool:
+            shutil.copytree(repo_dir, dest_dir)
+            return True
+
+        with patch.object(manager, "_clone_repo", side_effect=mock_clone):
+            first = manager.preview_sync("https://github.com/test/config.git", mock_adapter)
+            with patch("ai_asst_mgr.utils.tree_index.file_digest", wraps=file_digest) as digest:
+                second = manager.preview_sync("https://github.com/test/config.git", mock_adapter)
+
+        assert first == second
+        assert second is not None
+        assert second.files_to_modify == ["agents/local_agent.md"]
+        assert second.files_to_add == []
+        # Only the remote copies are hashed; local hashes come from the cache
+        hashed = [call.args[0] for call in digest.call_args_list]
+        assert len(hashed) == 2
+        assert all("temp_sync_preview_claude" in path.parts for path in hashed)
+
 
 class TestSyncVendor:
     """Tests for sync_vendor method."""
@@ -267,7 +300,9 @@ class TestSyncVendor:
     ) -> None:
         """Test successful sync with KEEP_REMOTE strategy."""
 
-        def mock_clone(_url: str, dest_dir: Path, _branch: str) -> bool:
+        def mock_clone(
+            _url: str, dest_dir: Path, _branch: str, _paths: list[str] | None = None
+        ) -> bool:
             if dest_dir.exists():
                 shutil.rmtree(dest_dir)
             shutil.copytree(mock_repo_dir, dest_dir)
@@ -293,7 +328,9 @@ class TestSyncVendor:
         def callback(msg: str) -> None:
             progress_messages.append(msg)
 
-        def mock_clone(_url: str, dest_dir: Path, _branch: str) -> bool:
+        def mock_clone(
+            _url: str, dest_dir: Path, _branch: str, _paths: list[str] | None = None
+        ) -> bool:
             if dest_dir.exists():
                 shutil.rmtree(dest_dir)
             shutil.copytree(mock_repo_dir, dest_dir)
@@ -325,7 +362,9 @@ class TestSyncVendor:
 
         mock_adapter.backup = Mock(side_effect=mock_backup_method)
 
-        def mock_clone(_url: str, dest_dir: Path, _branch: str) -> bool:
+        def mock_clone(
+            _url: str, dest_dir: Path, _branch: str, _paths: list[str] | None = None
+        ) -> bool:
             if dest_dir.exists():
                 shutil.rmtree(dest_dir)
             shutil.copytree(mock_repo_dir, dest_dir)
@@ -350,7 +389,9 @@ class TestSyncAllVendors:
     ) -> None:
         """Test sync all vendors."""
 
-        def mock_clone(_url: str, dest_dir: Path, _branch: str) -> bool:
+        def mock_clone(
+            _url: str, dest_dir: Path, _branch: str, _paths: list[str] | None = None
+        ) -> bool:
             if dest_dir.exists():
                 shutil.rmtree(dest_dir)
             shutil.copytree(mock_repo_dir, dest_dir)
@@ -412,6 +453,35 @@ class TestCloneRepo:
 
         assert result is False
 
+    def test_clone_repo_restricted_to_sync_paths(
+        self, sync_manager: SyncManager, mock_adapter: Mock
+    ) -> None:
+        """Test sync clones only the vendor's sync directories and files."""
+        with patch.object(sync_manager, "_clone_repo", return_value=False) as mock_clone:
+            sync_manager.sync_vendor("https://github.com/test/repo.git", mock_adapter)
+
+        paths = mock_clone.call_args.args[3]
+        assert paths == [
+            *SyncManager.VENDOR_SYNC_DIRS["claude"],
+            *SyncManager.VENDOR_SYNC_FILES["claude"],
+        ]
+
+    def test_clone_repo_uses_cache(self, backup_manager: BackupManager, tmp_path: Path) -> None:
+        """Test a configured clone cache is used instead of cloning."""
+        clone_cache = Mock()
+        clone_cache.checkout.return_value = True
+        manager = SyncManager(backup_manager, clone_cache)
+        dest_dir = tmp_path / "cloned"
+
+        with patch("ai_asst_mgr.operations.sync.git_clone") as mock_git_clone:
+            result = manager._clone_repo("https://github.com/test/repo.git", dest_dir, "dev")
+
+        assert result is True
+        clone_cache.checkout.assert_called_once_with(
+            "https://github.com/test/repo.git", dest_dir, "dev", None
+        )
+        mock_git_clone.assert_not_called()
+
 
 class TestFilesDiffer:
     """Tests for _files_differ method."""
@@ -510,6 +580,73 @@ class TestSyncDirectory:
         assert modified == 0
         assert (local_dir / "file.txt").read_text() == "local content"
 
+    def test_sync_directory_keep_local_adds_missing(
+        self, sync_manager: SyncManager, tmp_path: Path
+    ) -> None:
+        """KEEP_LOCAL still adds files that only exist remotely."""
+        remote_dir = tmp_path / "remote"
+        remote_dir.mkdir()
+        (remote_dir / "file.txt").write_text("remote content")
+        (remote_dir / "new.txt").write_text("new")
+
+        local_dir = tmp_path / "local"
+        local_dir.mkdir()
+        (local_dir / "file.txt").write_text("local content")
+
+        added, modified, deleted = sync_manager._sync_directory(
+            remote_dir, local_dir, MergeStrategy.KEEP_LOCAL
+        )
+
+        assert (added, modified, deleted) == (1, 0, 0)
+        assert (local_dir / "new.txt").read_text() == "new"
+        assert (local_dir / "file.txt").read_text() == "local content"
+
+    def test_sync_directory_replace_writes_only_changes(
+        self, sync_manager: SyncManager, tmp_path: Path
+    ) -> None:
+        """REPLACE rewrites one changed file and leaves identical files' inodes alone."""
+        remote_dir = tmp_path / "remote"
+        local_dir = tmp_path / "local"
+        for root in (remote_dir, local_dir):
+            (root / "nested").mkdir(parents=True)
+            for i in range(5):
+                (root / "nested" / f"same{i}.md").write_text(f"same {i}")
+        (remote_dir / "changed.md").write_text("new")
+        (local_dir / "changed.md").write_text("old")
+        (local_dir / "gone" / "deep").mkdir(parents=True)
+        (local_dir / "gone" / "deep" / "stale.md").write_text("stale")
+        inodes = {p: p.stat().st_ino for p in (local_dir / "nested").iterdir()}
+
+        added, modified, deleted = sync_manager._sync_directory(
+            remote_dir, local_dir, MergeStrategy.REPLACE
+        )
+
+        assert (added, modified, deleted) == (0, 1, 1)
+        assert (local_dir / "changed.md").read_text() == "new"
+        assert not (local_dir / "gone").exists()
+        assert {p: p.stat().st_ino for p in (local_dir / "nested").iterdir()} == inodes
+
+    def test_sync_directory_merge_writes_remote_versions(
+        self, sync_manager: SyncManager, tmp_path: Path
+    ) -> None:
+        """MERGE adds new files and writes .remote copies of conflicting ones."""
+        remote_dir = tmp_path / "remote"
+        remote_dir.mkdir()
+        (remote_dir / "file.txt").write_text("remote content")
+        (remote_dir / "new.txt").write_text("new")
+
+        local_dir = tmp_path / "local"
+        local_dir.mkdir()
+        (local_dir / "file.txt").write_text("local content")
+
+        added, modified, deleted = sync_manager._sync_directory(
+            remote_dir, local_dir, MergeStrategy.MERGE
+        )
+
+        assert (added, modified, deleted) == (1, 1, 0)
+        assert (local_dir / "file.txt").read_text() == "local content"
+        assert (local_dir / "file.txt.remote").read_text() == "remote content"
+
 
 class TestSyncFile:
     """Tests for _sync_file method."""
@@ -604,7 +741,9 @@ class TestSyncEdgeCases:
     ) -> None:
         """Test sync_vendor handles exceptions gracefully."""
 
-        def mock_clone_then_fail(_url: str, dest_dir: Path, _branch: str) -> bool:
+        def mock_clone_then_fail(
+            _url: str, dest_dir: Path, _branch: str, _paths: list[str] | None = None
+        ) -> bool:
             if dest_dir.exists():
                 shutil.rmtree(dest_dir)
             shutil.copytree(mock_repo_dir, dest_dir)
@@ -676,7 +815,9 @@ class TestSyncEdgeCases:
         def callback(msg: str) -> None:
             progress_messages.append(msg)
 
-        def mock_clone(_url: str, dest_dir: Path, _branch: str) -> bool:
+        def mock_clone(
+            _url: str, dest_dir: Path, _branch: str, _paths: list[str] | None = None
+        ) -> bool:
             if dest_dir.exists():
                 shutil.rmtree(dest_dir)
             shutil.copytree(mock_repo_dir, dest_dir)
@@ -699,7 +840,9 @@ class TestSyncEdgeCases:
         mock_repo_dir.mkdir()
         # No agents or skills directories
 
-        def mock_clone(_url: str, dest_dir: Path, _branch: str) -> bool:
+        def mock_clone(
+            _url: str, dest_dir: Path, _branch: str, _paths: list[str] | None = None
+        ) -> bool:
             if dest_dir.exists():
                 shutil.rmtree(dest_dir)
             shutil.copytree(mock_repo_dir, dest_dir)
@@ -727,7 +870,9 @@ class TestSyncEdgeCases:
         adapter = Mock()
         adapter.info = info
 
-        def mock_clone(_url: str, dest_dir: Path, _branch: str) -> bool:
+        def mock_clone(
+            _url: str, dest_dir: Path, _branch: str, _paths: list[str] | None = None
+        ) -> bool:
             if dest_dir.exists():
                 shutil.rmtree(dest_dir)
             shutil.copytree(mock_repo_dir, dest_dir)
@@ -748,7 +893,9 @@ class TestSyncEdgeCases:
         mock_repo_dir.mkdir()
         # No settings.json in remote
 
-        def mock_clone(_url: str, dest_dir: Path, _branch: str) -> bool:
+        def mock_clone(
+            _url: str, dest_dir: Path, _branch: str, _paths: list[str] | None = None
+        ) -> bool:
             if dest_dir.exists():
                 shutil.rmtree(dest_dir)
             shutil.copytree(mock_repo_dir, dest_dir)
@@ -766,7 +913,9 @@ class TestSyncEdgeCases:
     ) -> None:
         """Test sync_vendor without backup manager."""
 
-        def mock_clone(_url: str, dest_dir: Path, _branch: str) -> bool:
+        def mock_clone(
+            _url: str, dest_dir: Path, _branch: str, _paths: list[str] | None = None
+        ) -> bool:
             if dest_dir.exists():
                 shutil.rmtree(dest_dir)
             shutil.copytree(mock_repo_dir, dest_dir)
@@ -789,7 +938,9 @@ class TestSyncEdgeCases:
         """Test sync_vendor when adapter not installed (skips backup)."""
         mock_adapter.is_installed.return_value = False
 
-        def mock_clone(_url: str, dest_dir: Path, _branch: str) -> bool:
+        def mock_clone(
+            _url: str, dest_dir: Path, _branch: str, _paths: list[str] | None = None
+        ) -> bool:
             if dest_dir.exists():
                 shutil.rmtree(dest_dir)
             shutil.copytree(mock_repo_dir, dest_dir)
@@ -814,7 +965,9 @@ class TestSyncEdgeCases:
         mock_repo_dir.mkdir()
         # No settings.json
 
-        def mock_clone(_url: str, dest_dir: Path, _branch: str) -> bool:
+        def mock_clone(
+            _url: str, dest_dir: Path, _branch: str, _paths: list[str] | None = None
+        ) -> bool:
             if dest_dir.exists():
                 shutil.rmtree(dest_dir)
             shutil.copytree(mock_repo_dir, dest_dir)
@@ -843,9 +996,9 @@ class TestSyncEdgeCases:
             remote_file, local_file, MergeStrategy.KEEP_REMOTE
         )
 
-        # Files are same, so should still copy but count as modified
+        # Identical files are left alone
         assert added == 0
-        assert modified == 1
+        assert modified == 0
 
     def test_sync_directory_replace_with_empty_local(
         self, sync_manager: SyncManager, tmp_path: Path
@@ -917,4 +1070,6 @@ class TestSyncEdgeCases:
 
         assert result is True
         # Destination directory should have been removed before cloning
-        mock_git.assert_called_once_with("https://github.com/test/repo.git", dest_dir, "main")
+        mock_git.assert_called_once_with(
+            "https://github.com/test/repo.git", dest_dir, "main", sparse_paths=None
+        )
@@ -2,17 +2,29 @@
 
 from __future__ import annotations
 
+import sqlite3
 import tempfile
+import threading
+import time
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
+from ai_asst_mgr.database.manager import DatabaseManager, EventRecord
+from ai_asst_mgr.tracking.buffered_writer import BufferedEventWriter
 from ai_asst_mgr.tracking.session_tracker import (
     CREDENTIAL_PATTERNS,
     VendorSessionTracker,
 )
 
 
+def _event_count(db_path: Path) -> int:
+    """Count rows in the events table."""
+    with sqlite3.connect(db_path) as conn:
+        return int(conn.execute("SELECT COUNT(*) FROM events").fetchone()[0])
+
+
 class TestVendorSessionTracker:
     """Tests for VendorSessionTracker class."""
 
@@ -251,6 +263,214 @@ class TestVendorSessionTracker:
         assert stats is not None
 
 
+class TestBufferedTracking:
+    """Tests for VendorSessionTracker with a background writer."""
+
+    def test_unbuffered_by_default(self, tmp_path: Path) -> None:
+        """Verify trackers write synchronously unless buffering is requested."""
+        tracker = VendorSessionTracker(tmp_path / "test.db")
+        assert tracker.writer is None
+        assert tracker.flush() is True
+
+    def test_end_session_flushes_events(self, tmp_path: Path) -> None:
+        """Verify end_session writes all buffered events before returning."""
+        db_path = tmp_path / "test.db"
+        with VendorSessionTracker(db_path, buffered=True) as tracker:
+            session_id = tracker.start_session()
+            tracker.log_tool_call(session_id, "Read")
+            tracker.log_message(session_id, "user")
+            tracker.log_error(session_id, "timeout")
+
+            summary = tracker.end_session(session_id)
+
+            assert _event_count(db_path) == 3
+            assert summary["tool_calls"] == 1
+
+    def test_close_flushes_and_stops_writer(self, tmp_path: Path) -> None:
+        """Verify close writes pending events and stops the writer thread."""
+        db_path = tmp_path / "test.db"
+        tracker = VendorSessionTracker(db_path, buffered=True)
+        tracker.log_tool_call("sess-1", "Read")
+
+        tracker.close()
+
+        assert tracker.writer is not None
+        assert tracker.writer.closed
+        assert _event_count(db_path) == 1
+
+    def test_buffered_events_keep_submit_order(self, tmp_path: Path) -> None:
+        """Verify buffered events are stored in the order they were logged."""
+        db_path = tmp_path / "test.db"
+        with VendorSessionTracker(db_path, buffered=True) as tracker:
+            for index in range(20):
+                tracker.log_tool_call("sess-1", f"Tool{index}")
+            tracker.flush()
+
+        with sqlite3.connect(db_path) as conn:
+            names = [row[0] for row in conn.execute("SELECT event_name FROM events ORDER BY id")]
+        assert names == [f"Tool{index}" for index in range(20)]
+
+
+class TestBufferedEventWriter:
+    """Tests for BufferedEventWriter."""
+
+    @pytest.fixture
+    def db(self, tmp_path: Path) -> DatabaseManager:
+        """Create an initialized database."""
+        manager = DatabaseManager(tmp_path / "test.db")
+        manager.initialize()
+        return manager
+
+    def test_group_commit_by_batch_size(self, db: DatabaseManager) -> None:
+        """Verify full batches commit together without waiting for the interval."""
+        writer = BufferedEventWriter(db, batch_size=5, flush_interval_ms=60_000)
+        try:
+            for _ in range(10):
+                writer.submit(EventRecord("sess-1", "claude", "tool_call", "Read"))
+            writer.flush(timeout=5)
+            stats = writer.stats()
+        finally:
+            writer.close()
+
+        assert stats.written == 10
+        assert stats.batches == 2
+        assert _event_count(db.db_path) == 10
+
+    def test_group_commit_by_interval(self, db: DatabaseManager) -> None:
+        """Verify a partial batch commits once the flush interval elapses."""
+        writer = BufferedEventWriter(db, batch_size=1000, flush_interval_ms=10)
+        try:
+            writer.submit(EventRecord("sess-1", "claude", "message", "user"))
+            for _ in range(200):
+                if writer.stats().written:
+                    break
+                threading.Event().wait(0.01)
+            assert writer.stats().written == 1
+        finally:
+            writer.close()
+
+    def test_submit_stamps_timestamp(self, db: DatabaseManager) -> None:
+        """Verify events are timestamped at submission time."""
+        writer = BufferedEventWriter(db)
+        event = EventRecord("sess-1", "claude", "message", "user")
+        try:
+            writer.submit(event)
+        finally:
+            writer.close()
+
+        assert event.timestamp is not None
+        with sqlite3.connect(db.db_path) as conn:
+            assert conn.execute("SELECT timestamp FROM events").fetchone()[0] == event.timestamp
+
+    def test_full_queue_drops_when_not_blocking(self) -> None:
+        """Verify a full queue drops events and records backpressure."""
+        release = threading.Event()
+        db = MagicMock()
+        db.record_events.side_effect = lambda _events: release.wait(5)
+        writer = BufferedEventWriter(db, max_queue_size=1, batch_size=1, block=False)
+        try:
+            results = [writer.submit(EventRecord("s", "claude", "message")) for _ in range(5)]
+            stats = writer.stats()
+        finally:
+            release.set()
+            writer.close()
+
+        assert not all(results)
+        assert stats.queue_full >= 1
+        assert stats.dropped == results.count(False)
+
+    def test_full_queue_blocks_until_space(self) -> None:
+        """Verify blocking submits wait for space instead of dropping."""
+        db = MagicMock()
+        db.record_events.side_effect = lambda _events: threading.Event().wait(0.01)
+        writer = BufferedEventWriter(db, max_queue_size=1, batch_size=1, put_timeout=5)
+        try:
+            results = [writer.submit(EventRecord("s", "claude", "message")) for _ in range(5)]
+            writer.flush(timeout=5)
+            stats = writer.stats()
+        finally:
+            writer.close()
+
+        assert all(results)
+        assert stats.dropped == 0
+        assert stats.written == 5
+
+    def test_write_error_counts_dropped_events(self) -> None:
+        """Verify failed commits are logged and counted, and the writer keeps running."""
+        db = MagicMock()
+        db.record_events.side_effect = [sqlite3.OperationalError("locked"), 1]
+        writer = BufferedEventWriter(db, batch_size=1)
+        try:
+            writer.submit(EventRecord("s", "claude", "message"))
+            writer.flush(timeout=5)
+            writer.submit(EventRecord("s", "claude", "message"))
+            writer.flush(timeout=5)
+            stats = writer.stats()
+        finally:
+            writer.close()
+
+        assert stats.write_errors == 1
+        assert stats.dropped == 1
+        assert stats.written == 1
+
+    def test_flush_times_out_on_full_queue(self) -> None:
+        """Verify flush() gives up within its timeout when the queue stays full."""
+        release = threading.Event()
+        db = MagicMock()
+        db.record_events.side_effect = lambda _events: release.wait(5)
+        writer = BufferedEventWriter(db, max_queue_size=1, batch_size=1, block=False)
+        try:
+            writer.submit(EventRecord("s", "claude", "message"))
+            while not writer.submit(EventRecord("s", "claude", "message")):
+                threading.Event().wait(0.01)
+            started = time.monotonic()
+            flushed = writer.flush(timeout=0.1)
+            elapsed = time.monotonic() - started
+        finally:
+            release.set()
+            writer.close()
+
+        assert flushed is False
+        assert elapsed < 1
+
+    def test_close_waits_for_submits_in_progress(self) -> None:
+        """Verify an event accepted while close() runs is still written."""
+        release = threading.Event()
+        db = MagicMock()
+        db.record_events.side_effect = lambda events: release.wait(5) and len(events)
+        writer = BufferedEventWriter(db, max_queue_size=1, batch_size=1, put_timeout=5)
+        writer.submit(EventRecord("s", "claude", "message"))
+        writer.submit(EventRecord("s", "claude", "message"))
+        results: list[bool] = []
+        submitter = threading.Thread(
+            target=lambda: results.append(writer.submit(EventRecord("s", "claude", "message")))
+        )
+        submitter.start()
+        while not writer.stats().queue_full:
+            threading.Event().wait(0.01)
+
+        closer = threading.Thread(target=writer.close)
+        closer.start()
+        threading.Event().wait(0.05)
+        release.set()
+        submitter.join(5)
+        closer.join(5)
+
+        assert results == [True]
+        assert writer.stats().written == 3
+        with pytest.raises(RuntimeError, match="closed"):
+            writer.submit(EventRecord("s", "claude", "message"))
+
+    def test_submit_after_close_raises(self, db: DatabaseManager) -> None:
+        """Verify a closed writer rejects new events."""
+        writer = BufferedEventWriter(db)
+        writer.close()
+
+        assert writer.flush() is True
+        with pytest.raises(RuntimeError, match="closed"):
+            writer.submit(EventRecord("s", "claude", "message"))
+
+
 class TestCredentialRedaction:
     """Tests for credential redaction functionality."""
 
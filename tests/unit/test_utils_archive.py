@@ -0,0 +1,117 @@
+"""Unit tests for single-pass archive utilities."""
+
+import hashlib
+import tarfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ai_asst_mgr.utils.archive import extract_tar_archive, scan_tar_archive, write_tar_archive
+
+
+@pytest.fixture
+def source_dir(tmp_path: Path) -> Path:
+    """Create a small configuration tree to archive."""
+    source = tmp_path / ".claude"
+    (source / "agents").mkdir(parents=True)
+    (source / "settings.json").write_text('{"test": "value"}')
+    (source / "agents" / "one.md").write_text("# One")
+    (source / "agents" / "two.md").write_text("# Two" * 1000)
+    return source
+
+
+class TestWriteTarArchive:
+    """Tests for write_tar_archive."""
+
+    def test_stats_match_finished_archive(self, source_dir: Path, tmp_path: Path) -> None:
+        """Checksum, size and counts equal what a separate read would report."""
+        archive = tmp_path / "backup.tar.gz"
+
+        stats = write_tar_archive(source_dir, archive, "claude")
+
+        assert stats.path == archive
+        assert stats.checksum == hashlib.sha256(archive.read_bytes()).hexdigest()
+        assert stats.size_bytes == archive.stat().st_size
+        with tarfile.open(archive, "r:gz") as tar:
+            members = tar.getmembers()
+        assert stats.member_count == len(members)
+        assert stats.file_count == sum(1 for m in members if m.isfile()) == 3
+        assert all(m.name.startswith("claude") for m in members)
+
+    def test_failure_leaves_no_partial_archive(self, source_dir: Path, tmp_path: Path) -> None:
+        """A failed write removes the temporary file and never creates the archive."""
+        archive = tmp_path / "backup.tar.gz"
+
+        with (
+            patch("tarfile.TarFile.add", side_effect=OSError("disk full")),
+            pytest.raises(OSError, match="disk full"),
+        ):
+            write_tar_archive(source_dir, archive, "claude")
+
+        assert list(tmp_path.glob("backup.tar.gz*")) == []
+
+
+class TestScanTarArchive:
+    """Tests for scan_tar_archive."""
+
+    @pytest.mark.parametrize("mode", ["w:gz", "w:bz2", "w"])
+    def test_scan_matches_separate_reads(self, source_dir: Path, tmp_path: Path, mode: str) -> None:
+        """Scanning hashes the whole file and counts members in one read."""
+        archive = tmp_path / "backup.tar"
+        with tarfile.open(archive, mode) as tar:  # type: ignore[call-overload]
+            tar.add(source_dir, arcname="claude")
+
+        stats = scan_tar_archive(archive)
+
+        assert stats.checksum == hashlib.sha256(archive.read_bytes()).hexdigest()
+        assert stats.size_bytes == archive.stat().st_size
+        assert stats.file_count == 3
+        assert stats.member_count == 5
+
+    def test_scan_matches_write_stats(self, source_dir: Path, tmp_path: Path) -> None:
+        """An archive written by write_tar_archive scans to the same stats."""
+        archive = tmp_path / "backup.tar.gz"
+        written = write_tar_archive(source_dir, archive, "claude")
+
+        assert scan_tar_archive(archive) == written
+
+    def test_scan_invalid_archive(self, tmp_path: Path) -> None:
+        """Non-tar input raises TarError."""
+        archive = tmp_path / "bad.tar.gz"
+        archive.write_bytes(b"not a tar file at all")
+
+        with pytest.raises(tarfile.TarError):
+            scan_tar_archive(archive)
+
+
+class TestExtractTarArchive:
+    """Tests for extract_tar_archive."""
+
+    def test_extract_matches_write_stats(self, source_dir: Path, tmp_path: Path) -> None:
+        """Extraction reproduces the tree and reports the archive's checksum and counts."""
+        archive = tmp_path / "backup.tar.gz"
+        written = write_tar_archive(source_dir, archive, "claude")
+        dest = tmp_path / "restored"
+
+        extracted = extract_tar_archive(archive, dest)
+
+        assert extracted.stats == written
+        assert extracted.root_name == "claude"
+        assert (dest / "claude" / "agents" / "two.md").read_text() == "# Two" * 1000
+
+    def test_extract_skips_unsafe_members(self, tmp_path: Path) -> None:
+        """Members escaping the destination are neither written nor counted."""
+        archive = tmp_path / "evil.tar"
+        payload = tmp_path / "payload.txt"
+        payload.write_text("x")
+        with tarfile.open(archive, "w") as tar:
+            tar.add(payload, arcname="claude/ok.txt")
+            tar.add(payload, arcname="../escaped.txt")
+        dest = tmp_path / "out"
+
+        extracted = extract_tar_archive(archive, dest)
+
+        assert extracted.stats.file_count == 1
+        assert (dest / "claude" / "ok.txt").exists()
+        assert not (tmp_path / "escaped.txt").exists()
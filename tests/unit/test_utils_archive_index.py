@@ -0,0 +1,141 @@
+"""Unit tests for the random-access archive member index."""
+
+import os
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from ai_asst_mgr.utils.archive import write_tar_archive
+from ai_asst_mgr.utils.archive_index import ArchiveIndex, index_path_for
+from ai_asst_mgr.utils.compression import CODECS, CompressionSettings, available_codecs
+
+CODEC_PARAMS = [
+    pytest.param(
+        name,
+        marks=pytest.mark.skipif(
+            name not in available_codecs(), reason=f"{name} not available in this Python"
+        ),
+    )
+    for name in CODECS
+]
+
+LONG_NAME = "a" * 150 + ".md"
+
+
+@pytest.fixture
+def source_dir(tmp_path: Path) -> Path:
+    """Create a tree with small config files and large incompressible transcripts."""
+    source = tmp_path / ".claude"
+    (source / "agents").mkdir(parents=True)
+    (source / "projects" / "repo").mkdir(parents=True)
+    (source / "settings.json").write_text('{"test": "value"}')
+    (source / "agents" / "reviewer.md").write_text("# Reviewer")
+    (source / "agents" / LONG_NAME).write_text("# Long name")
+    for i in range(8):
+        (source / "projects" / "repo" / f"session{i}.jsonl").write_bytes(os.urandom(40_000))
+    return source
+
+
+def _write(source_dir: Path, tmp_path: Path, codec: str = "gz") -> ArchiveIndex:
+    """Archive the tree in small blocks and load its index."""
+    settings = CompressionSettings(codec, threads=2, block_size=32 * 1024)
+    archive = tmp_path / f"backup{settings.extension}"
+    write_tar_archive(source_dir, archive, "claude", settings)
+    index = ArchiveIndex.load(archive)
+    assert index is not None
+    return index
+
+
+class TestIndexWriting:
+    """Tests for the sidecar written by write_tar_archive."""
+
+    def test_members_match_archive(self, source_dir: Path, tmp_path: Path) -> None:
+        """The index lists the same members as a full read of the archive."""
+        index = _write(source_dir, tmp_path)
+
+        with tarfile.open(index.archive_path, "r:*") as tar:
+            expected = [(m.name, m.type, m.size) for m in tar.getmembers()]
+        assert [(m.name, m.type, m.size) for m in index.tarinfos()] == expected
+        assert index_path_for(index.archive_path).exists()
+
+    def test_blocks_tile_archive(self, source_dir: Path, tmp_path: Path) -> None:
+        """Blocks are contiguous in both streams and cover the whole file."""
+        index = _write(source_dir, tmp_path)
+
+        assert len(index.blocks) > 1
+        for previous, block in zip(index.blocks, index.blocks[1:], strict=False):
+            assert block.offset == previous.offset + previous.size
+            assert block.compressed_offset == previous.compressed_offset + previous.compressed_size
+        last = index.blocks[-1]
+        assert last.compressed_offset + last.compressed_size == index.archive_path.stat().st_size
+
+
+class TestOpenMembers:
+    """Tests for random-access extraction through the index."""
+
+    @pytest.mark.parametrize("codec", CODEC_PARAMS)
+    def test_subset_round_trip(self, source_dir: Path, tmp_path: Path, codec: str) -> None:
+        """Selected members, including PAX long names, read back byte for byte."""
+        index = _write(source_dir, tmp_path, codec)
+        wanted = [m for m in index.members if m.name.startswith(("claude/agents", "claude/proj"))]
+        wanted = [m for m in wanted if not m.name.endswith(("session1.jsonl", "session2.jsonl"))]
+
+        with index.open_members(wanted) as tar:
+            names = tar.getnames()
+            for member in tar.getmembers():
+                if member.isfile():
+                    data = tar.extractfile(member)
+                    assert data is not None
+                    relative = Path(*Path(member.name).parts[1:])
+                    assert data.read() == (source_dir / relative).read_bytes()
+
+        assert names == [m.name for m in wanted]
+        assert f"claude/agents/{LONG_NAME}" in names
+
+    def test_empty_selection(self, source_dir: Path, tmp_path: Path) -> None:
+        """Selecting nothing yields a valid, empty tar stream."""
+        index = _write(source_dir, tmp_path)
+
+        with index.open_members([]) as tar:
+            assert tar.getmembers() == []
+
+    def test_corrupt_block_detected(self, source_dir: Path, tmp_path: Path) -> None:
+        """Damage inside a block that is read raises tarfile.ReadError."""
+        index = _write(source_dir, tmp_path)
+        block = index.blocks[-1]
+        data = bytearray(index.archive_path.read_bytes())
+        data[block.compressed_offset + block.compressed_size // 2] ^= 0xFF
+        index.archive_path.write_bytes(bytes(data))
+
+        with (
+            pytest.raises(tarfile.ReadError, match="corrupt"),
+            index.open_members(index.members[-1:]),
+        ):
+            pass
+
+
+class TestLoad:
+    """Tests for ArchiveIndex.load."""
+
+    def test_missing_index(self, tmp_path: Path) -> None:
+        """Archives without a sidecar have no index."""
+        archive = tmp_path / "backup.tar.gz"
+        archive.write_bytes(b"")
+
+        assert ArchiveIndex.load(archive) is None
+
+    def test_size_mismatch_ignored(self, source_dir: Path, tmp_path: Path) -> None:
+        """An index for a different version of the archive is not used."""
+        index = _write(source_dir, tmp_path)
+        with index.archive_path.open("ab") as f:
+            f.write(b"\0")
+
+        assert ArchiveIndex.load(index.archive_path) is None
+
+    def test_garbage_ignored(self, source_dir: Path, tmp_path: Path) -> None:
+        """An unreadable sidecar is treated as missing."""
+        index = _write(source_dir, tmp_path)
+        index_path_for(index.archive_path).write_bytes(b"not gzip")
+
+        assert ArchiveIndex.load(index.archive_path) is None
@@ -0,0 +1,151 @@
+"""Unit tests for the persistent clone cache."""
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import git
+import pytest
+
+from ai_asst_mgr.operations.sync import MergeStrategy, SyncManager
+from ai_asst_mgr.utils.clone_cache import CloneCache
+from ai_asst_mgr.utils.git import GitValidationError
+
+_ACTOR = git.Actor("Test", "test@example.com")
+
+
+def _commit(repo: git.Repo, files: dict[str, str], message: str) -> str:
+    """Write files into a working repository and commit them."""
+    work_dir = Path(repo.working_dir)
+    for name, content in files.items():
+        path = work_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    repo.index.add(list(files))
+    return repo.index.commit(message, author=_ACTOR, committer=_ACTOR).hexsha
+
+
+@pytest.fixture
+def source_repo(tmp_path: Path) -> git.Repo:
+    """Create a repository with vendor configuration on main."""
+    repo = git.Repo.init(tmp_path / "dotfiles", initial_branch="main")
+    with repo.config_writer() as config:
+        config.set_value("uploadpack", "allowFilter", "true")
+        config.set_value("uploadpack", "allowAnySHA1InWant", "true")
+    _commit(
+        repo,
+        {
+            "settings.json": '{"theme": "dark"}',
+            "agents/reviewer.md": "# Reviewer",
+            "photos/holiday.jpg": "x" * 10_000,
+        },
+        "Initial config",
+    )
+    return repo
+
+
+def _url(repo: git.Repo) -> str:
+    return f"file://{repo.working_dir}"
+
+
+class TestCloneCache:
+    """Tests for CloneCache."""
+
+    def test_checkout_writes_branch(self, source_repo: git.Repo, tmp_path: Path) -> None:
+        """The branch's files are written and a bare repository is cached."""
+        cache = CloneCache(tmp_path / "cache")
+        dest = tmp_path / "checkout"
+
+        assert cache.checkout(_url(source_repo), dest)
+
+        assert (dest / "settings.json").read_text() == '{"theme": "dark"}'
+        assert (dest / "agents" / "reviewer.md").read_text() == "# Reviewer"
+        assert not (dest / ".git").exists()
+        assert git.Repo(cache.repo_path(_url(source_repo))).bare
+
+    def test_later_instances_fetch_new_commits(self, source_repo: git.Repo, tmp_path: Path) -> None:
+        """A new cache instance on the same directory picks up new commits."""
+        url = _url(source_repo)
+        assert CloneCache(tmp_path / "cache").checkout(url, tmp_path / "first")
+        head = _commit(source_repo, {"settings.json": '{"theme": "light"}'}, "Switch theme")
+
+        cache = CloneCache(tmp_path / "cache")
+
+        assert cache.fetch(url) == head
+        assert cache.checkout(url, tmp_path / "second")
+        assert (tmp_path / "second" / "settings.json").read_text() == '{"theme": "light"}'
+
+    def test_checkout_paths_fetches_only_their_contents(
+        self, source_repo: git.Repo, tmp_path: Path
+    ) -> None:
+        """Only the requested paths are written or downloaded; absent paths are skipped."""
+        cache = CloneCache(tmp_path / "cache")
+        dest = tmp_path / "checkout"
+
+        assert cache.checkout(_url(source_repo), dest, paths=["agents", "skills", "settings.json"])
+
+        assert sorted(str(p.relative_to(dest)) for p in dest.rglob("*")) == [
+            "agents",
+            "agents/reviewer.md",
+            "settings.json",
+        ]
+        cached = git.Repo(cache.repo_path(_url(source_repo)))
+        objects = cached.git.rev_list("--objects", "--missing=print", "main").splitlines()
+        missing = [line for line in objects if line.startswith("?")]
+        photo = source_repo.head.commit.tree / "photos/holiday.jpg"
+        assert missing == [f"?{photo.hexsha}"]
+
+    def test_fetches_once_per_instance(self, source_repo: git.Repo, tmp_path: Path) -> None:
+        """Repeated checkouts of one branch share a single fetch."""
+        cache = CloneCache(tmp_path / "cache")
+
+        with patch.object(cache, "_fetch", wraps=cache._fetch) as fetch:
+            for name in ("preview", "claude", "gemini"):
+                assert cache.checkout(_url(source_repo), tmp_path / name)
+
+        fetch.assert_called_once()
+
+    def test_missing_branch_fails(self, source_repo: git.Repo, tmp_path: Path) -> None:
+        """Fetching a branch the remote does not have fails without raising."""
+        cache = CloneCache(tmp_path / "cache")
+
+        assert not cache.checkout(_url(source_repo), tmp_path / "out", "nope")
+
+    def test_damaged_cache_is_recreated(self, source_repo: git.Repo, tmp_path: Path) -> None:
+        """A cache entry that is not a repository any more is rebuilt."""
+        cache = CloneCache(tmp_path / "cache")
+        repo_path = cache.repo_path(_url(source_repo))
+        repo_path.mkdir(parents=True)
+        (repo_path / "junk").write_text("not a repository")
+
+        assert cache.checkout(_url(source_repo), tmp_path / "out")
+        assert (tmp_path / "out" / "settings.json").exists()
+
+    def test_invalid_url_rejected(self, tmp_path: Path) -> None:
+        """URLs are validated before any Git command runs."""
+        cache = CloneCache(tmp_path / "cache")
+
+        with pytest.raises(GitValidationError):
+            cache.checkout("https://example.com/repo;rm -rf", tmp_path / "out")
+        assert not cache.cache_dir.exists()
+
+    def test_sync_manager_shares_fetch(self, source_repo: git.Repo, tmp_path: Path) -> None:
+        """Syncing several vendors from one repository fetches it once."""
+        adapters = {}
+        for vendor_id in ("claude", "gemini"):
+            adapter = Mock()
+            adapter.info.vendor_id = vendor_id
+            adapter.info.name = vendor_id
+            adapter.info.config_dir = tmp_path / f".{vendor_id}"
+            adapters[vendor_id] = adapter
+        cache = CloneCache(tmp_path / "cache")
+        manager = SyncManager(None, cache)
+
+        with patch.object(cache, "_fetch", wraps=cache._fetch) as fetch:
+            results = manager.sync_all_vendors(
+                _url(source_repo), adapters, strategy=MergeStrategy.KEEP_REMOTE
+            )
+
+        assert all(result.success for result in results.values())
+        fetch.assert_called_once()
+        assert (tmp_path / ".claude" / "agents" / "reviewer.md").exists()
+        assert (tmp_path / ".gemini" / "settings.json").exists()
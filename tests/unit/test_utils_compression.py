@@ -0,0 +1,157 @@
+"""Unit tests for pluggable backup compression."""
+
+import io
+import os
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from ai_asst_mgr.utils.archive import scan_tar_archive, write_tar_archive
+from ai_asst_mgr.utils.compression import (
+    CODECS,
+    BlockCompressor,
+    CompressionSettings,
+    available_codecs,
+    detect_codec,
+)
+
+CODEC_PARAMS = [
+    pytest.param(
+        name,
+        marks=pytest.mark.skipif(
+            name not in available_codecs(), reason=f"{name} not available in this Python"
+        ),
+    )
+    for name in CODECS
+]
+
+
+@pytest.fixture
+def source_dir(tmp_path: Path) -> Path:
+    """Create a configuration tree with compressible and incompressible files."""
+    source = tmp_path / ".claude"
+    (source / "agents").mkdir(parents=True)
+    (source / "settings.json").write_text('{"test": "value"}')
+    (source / "agents" / "big.md").write_text("# Agent\n" * 20_000)
+    (source / "agents" / "random.bin").write_bytes(os.urandom(200_000))
+    return source
+
+
+class TestCompressionSettings:
+    """Tests for CompressionSettings validation."""
+
+    def test_defaults_to_gzip(self) -> None:
+        """Default settings produce gzip archives at level 6."""
+        settings = CompressionSettings()
+
+        assert settings.extension == ".tar.gz"
+        assert settings.effective_level == 6
+        assert settings.effective_threads >= 1
+
+    def test_unknown_codec_rejected(self) -> None:
+        """An unknown codec name raises ValueError listing the alternatives."""
+        with pytest.raises(ValueError, match="Unsupported compression 'rar'"):
+            CompressionSettings("rar")
+
+    @pytest.mark.parametrize(("codec", "level"), [("gz", 0), ("xz", 10), ("bz2", 12)])
+    def test_level_out_of_range_rejected(self, codec: str, level: int) -> None:
+        """Levels outside the codec's range raise ValueError."""
+        with pytest.raises(ValueError, match="must be between"):
+            CompressionSettings(codec, level)
+
+
+class TestBlockCompressor:
+    """Tests for BlockCompressor."""
+
+    @pytest.mark.parametrize("threads", [1, 4])
+    @pytest.mark.parametrize("codec", CODEC_PARAMS)
+    def test_blocks_concatenate_to_valid_stream(self, codec: str, threads: int) -> None:
+        """Many small blocks decompress back to the original bytes, in order."""
+        data = b"".join(f"line {i}\n".encode() for i in range(50_000))
+        settings = CompressionSettings(codec, threads=threads, block_size=16 * 1024)
+        output = io.BytesIO()
+
+        with BlockCompressor(output, settings) as compressor:  # type: ignore[arg-type]
+            for start in range(0, len(data), 10_000):
+                compressor.write(data[start : start + 10_000])
+
+        assert _decompress(codec, output.getvalue()) == data
+
+    def test_close_is_idempotent(self) -> None:
+        """Closing twice writes the final block only once."""
+        output = io.BytesIO()
+        compressor = BlockCompressor(output, CompressionSettings(threads=2))  # type: ignore[arg-type]
+        compressor.write(b"payload")
+
+        compressor.close()
+        size = output.tell()
+        compressor.close()
+
+        assert output.tell() == size > 0
+
+
+class TestCompressedArchives:
+    """Round trips through write_tar_archive for every codec."""
+
+    @pytest.mark.parametrize("codec", CODEC_PARAMS)
+    def test_round_trip(self, source_dir: Path, tmp_path: Path, codec: str) -> None:
+        """Archives are readable with r:* and scan to the same stats."""
+        settings = CompressionSettings(codec, threads=4, block_size=64 * 1024)
+        archive = tmp_path / f"backup{settings.extension}"
+
+        stats = write_tar_archive(source_dir, archive, "claude", settings)
+
+        assert detect_codec(archive) == codec
+        assert scan_tar_archive(archive) == stats
+        with tarfile.open(archive, "r:*") as tar:
+            extracted = tar.extractfile("claude/agents/random.bin")
+            assert extracted is not None
+            assert extracted.read() == (source_dir / "agents" / "random.bin").read_bytes()
+        assert stats.file_count == 3
+
+    @pytest.mark.parametrize("codec", ["gz", "xz", "bz2"])
+    def test_truncated_archive_rejected(self, source_dir: Path, tmp_path: Path, codec: str) -> None:
+        """Truncated compressed data raises tarfile.ReadError when scanned."""
+        settings = CompressionSettings(codec, block_size=64 * 1024)
+        archive = tmp_path / f"backup{settings.extension}"
+        write_tar_archive(source_dir, archive, "claude", settings)
+        archive.write_bytes(archive.read_bytes()[: archive.stat().st_size // 2])
+
+        with pytest.raises(tarfile.ReadError):
+            scan_tar_archive(archive)
+
+    def test_detect_codec_uncompressed(self, tmp_path: Path) -> None:
+        """Plain tar files are reported as uncompressed."""
+        archive = tmp_path / "plain.tar"
+        archive.write_bytes(_tar_of(b"data"))
+
+        assert detect_codec(archive) is None
+
+
+def _tar_of(data: bytes) -> bytes:
+    """Build an uncompressed tar containing a single member named 'data'."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        info = tarfile.TarInfo("data")
+        info.size = len(data)
+        tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def _decompress(codec: str, payload: bytes) -> bytes:
+    """Decompress a (possibly multi-member) payload with the stdlib readers."""
+    import bz2
+    import gzip
+    import importlib
+    import lzma
+
+    if codec == "gz":
+        return gzip.decompress(payload)
+    if codec == "xz":
+        return lzma.decompress(payload)
+    if codec == "bz2":
+        return bz2.decompress(payload)
+    zstd = importlib.import_module("compression.zstd")
+    result: bytes = zstd.decompress(payload)
+    return result
@@ -0,0 +1,180 @@
+"""Unit tests for backup exclusion rules."""
+
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from ai_asst_mgr.utils.archive import write_tar_archive
+from ai_asst_mgr.utils.exclusions import (
+    ExclusionRule,
+    ExclusionRules,
+    carry_over_excluded,
+)
+
+
+@pytest.fixture
+def config_dir(tmp_path: Path) -> Path:
+    """Create a config tree with configuration, caches and transcripts."""
+    root = tmp_path / ".claude"
+    (root / "agents").mkdir(parents=True)
+    (root / "projects" / "repo").mkdir(parents=True)
+    (root / "statsig").mkdir()
+    (root / "settings.json").write_text("{}")
+    (root / "agents" / "reviewer.md").write_text("# Reviewer")
+    (root / "agents" / "debug.log").write_text("log" * 100)
+    (root / "projects" / "repo" / "session.jsonl").write_bytes(b"x" * 5000)
+    (root / "statsig" / "cache").write_bytes(b"c" * 300)
+    return root
+
+
+def _rules(*patterns: str, max_file_size: int | None = None) -> ExclusionRules:
+    return ExclusionRules([ExclusionRule(p, "test") for p in patterns], max_file_size)
+
+
+class TestExclusionRule:
+    """Tests for gitignore-style pattern matching."""
+
+    @pytest.mark.parametrize(
+        ("pattern", "path", "is_dir", "expected"),
+        [
+            ("*.log", "debug.log", False, True),
+            ("*.log", "agents/debug.log", False, True),
+            ("*.log", "agents/debug.md", False, False),
+            ("projects/", "projects", True, True),
+            ("projects/", "projects", False, False),
+            ("/settings.json", "settings.json", False, True),
+            ("/settings.json", "agents/settings.json", False, False),
+            ("agents/*.md", "agents/reviewer.md", False, True),
+            ("agents/*.md", "agents/sub/reviewer.md", False, False),
+            ("agents/**/*.md", "agents/sub/reviewer.md", False, True),
+            ("**/cache", "statsig/cache", False, True),
+            ("file?.txt", "file1.txt", False, True),
+            ("file[!0-9].txt", "file1.txt", False, False),
+        ],
+    )
+    def test_matches(self, pattern: str, path: str, is_dir: bool, expected: bool) -> None:
+        """Patterns follow .gitignore anchoring, wildcard and directory rules."""
+        assert ExclusionRule(pattern, "test").matches(path, is_dir=is_dir) is expected
+
+    def test_empty_pattern_rejected(self) -> None:
+        """A pattern with nothing to match raises ValueError."""
+        with pytest.raises(ValueError, match="Empty exclusion pattern"):
+            ExclusionRule("!/", "test")
+
+
+class TestExclusionRules:
+    """Tests for rule sets."""
+
+    def test_last_matching_rule_wins(self) -> None:
+        """A later negation re-includes what an earlier rule excluded."""
+        rules = _rules("*.log", "!keep.log")
+
+        assert rules.match("debug.log", is_dir=False) == "*.log (test)"
+        assert rules.match("keep.log", is_dir=False) is None
+
+    def test_max_file_size(self) -> None:
+        """Files above the size limit are excluded; directories never are."""
+        rules = _rules(max_file_size=100)
+
+        assert rules.match("big.bin", is_dir=False, size=101) == rules.size_label
+        assert rules.match("small.bin", is_dir=False, size=100) is None
+        assert rules.match("dir", is_dir=True, size=10_000) is None
+
+    def test_for_directory_reads_backupignore(self, config_dir: Path) -> None:
+        """Defaults, .backupignore and user patterns combine in priority order."""
+        (config_dir / ".backupignore").write_text("# transcripts\n\nprojects/\n!statsig/\n")
+
+        rules = ExclusionRules.for_directory(config_dir, ["statsig/"], ["*.log"])
+
+        assert [(r.pattern, r.source) for r in rules.rules] == [
+            ("statsig/", "vendor default"),
+            ("projects/", ".backupignore"),
+            ("!statsig/", ".backupignore"),
+            ("*.log", "--exclude"),
+        ]
+        assert rules.match("statsig", is_dir=True) is None
+
+    def test_pax_header_round_trip(self) -> None:
+        """Rules survive serialization into an archive header."""
+        rules = _rules("projects/", "!keep.log", max_file_size=42)
+
+        restored = ExclusionRules.from_pax_headers(rules.to_pax_headers())
+
+        assert restored.rules == rules.rules
+        assert restored.max_file_size == 42
+        assert not ExclusionRules.from_pax_headers({})
+        assert not ExclusionRules.from_pax_headers({"AI_ASST_MGR.exclusions": "{bad"})
+
+    def test_explain(self, config_dir: Path) -> None:
+        """The report attributes every skipped byte to the rule that skipped it."""
+        rules = _rules("projects/", "*.log", "statsig/")
+
+        report = rules.explain(config_dir)
+
+        assert report.included_files == 2
+        assert report.included_bytes == len("{}") + len("# Reviewer")
+        assert report.excluded["projects/ (test)"].bytes == 5000
+        assert report.excluded["*.log (test)"].bytes == 300
+        assert report.excluded["statsig/ (test)"].files == 1
+        assert report.excluded_bytes == 5600
+
+    def test_walk_does_not_descend_into_excluded_dirs(self, config_dir: Path) -> None:
+        """Excluded directories are reported once and their contents are skipped."""
+        paths = [rel for _, rel, _ in _rules("projects/").walk(config_dir)]
+
+        assert "projects" in paths
+        assert not any(p.startswith("projects/") for p in paths)
+
+
+class TestArchiveExclusions:
+    """Tests for exclusions applied while writing archives."""
+
+    def test_excluded_paths_not_archived(self, config_dir: Path, tmp_path: Path) -> None:
+        """Excluded members are skipped and the rules are recorded in the archive."""
+        rules = _rules("projects/", "*.log")
+        archive = tmp_path / "backup.tar.gz"
+
+        stats = write_tar_archive(config_dir, archive, "claude", exclusions=rules)
+
+        with tarfile.open(archive, "r:*") as tar:
+            names = tar.getnames()
+            recorded = ExclusionRules.from_pax_headers(tar.pax_headers)
+        assert "claude/agents/reviewer.md" in names
+        assert not any("projects" in name or name.endswith(".log") for name in names)
+        assert stats.file_count == 3
+        assert recorded.rules == rules.rules
+
+
+class TestCarryOverExcluded:
+    """Tests for keeping excluded data across a restore."""
+
+    def test_moves_only_missing_excluded_paths(self, config_dir: Path, tmp_path: Path) -> None:
+        """Excluded paths move into the restored tree; backed-up paths are untouched."""
+        restored = tmp_path / "restored"
+        (restored / "agents").mkdir(parents=True)
+        (restored / "settings.json").write_text('{"restored": true}')
+
+        moved = carry_over_excluded(config_dir, restored, _rules("projects/", "*.log"))
+
+        assert moved == 2
+        assert (restored / "projects" / "repo" / "session.jsonl").exists()
+        assert (restored / "agents" / "debug.log").exists()
+        assert (restored / "settings.json").read_text() == '{"restored": true}'
+        assert not (restored / "statsig").exists()
+
+    def test_prefix_scopes_anchored_rules(self, config_dir: Path, tmp_path: Path) -> None:
+        """Rules are matched against paths relative to the config root."""
+        restored = tmp_path / "restored-agents"
+        restored.mkdir()
+
+        moved = carry_over_excluded(
+            config_dir / "agents", restored, _rules("agents/*.log"), prefix="agents"
+        )
+
+        assert moved == 1
+        assert (restored / "debug.log").exists()
+
+    def test_no_rules_is_a_no_op(self, config_dir: Path, tmp_path: Path) -> None:
+        """Without rules nothing is moved."""
+        assert carry_over_excluded(config_dir, tmp_path / "restored", ExclusionRules()) == 0
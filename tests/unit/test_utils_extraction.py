@@ -0,0 +1,140 @@
+"""Unit tests for parallel tar extraction."""
+
+import io
+import os
+import tarfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ai_asst_mgr.utils.extraction import ParallelExtractor
+
+
+def _add_file(tar: tarfile.TarFile, name: str, data: bytes, mode: int = 0o644) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mode = mode
+    info.mtime = 1_700_000_000
+    tar.addfile(info, io.BytesIO(data))
+
+
+def _extract(archive: Path, dest: Path, max_workers: int = 4) -> list[str]:
+    """Extract an archive in stream mode, returning the names that were extracted."""
+    extracted: list[str] = []
+    with (
+        tarfile.open(archive, "r|*") as tar,
+        ParallelExtractor(dest, max_workers) as extractor,
+    ):
+        for member in tar:
+            if extractor.extract(tar, member):
+                extracted.append(member.name)
+        extractor.finish()
+    return extracted
+
+
+@pytest.fixture
+def source_dir(tmp_path: Path) -> Path:
+    """Create a tree with many small files, nested directories and a symlink."""
+    source = tmp_path / "source"
+    for i in range(20):
+        sub = source / f"dir{i % 4}" / "nested"
+        sub.mkdir(parents=True, exist_ok=True)
+        (sub / f"file{i}.txt").write_bytes(os.urandom(100 + i * 50))
+    (source / "empty.txt").write_bytes(b"")
+    (source / "link").symlink_to("dir0/nested/file0.txt")
+    return source
+
+
+class TestParallelExtractor:
+    """Tests for ParallelExtractor."""
+
+    def test_round_trip(self, source_dir: Path, tmp_path: Path) -> None:
+        """Every file, directory and link matches the source tree."""
+        archive = tmp_path / "backup.tar.gz"
+        with tarfile.open(archive, "w:gz") as tar:
+            tar.add(source_dir, arcname="claude")
+        dest = tmp_path / "out"
+
+        _extract(archive, dest)
+
+        for path in source_dir.rglob("*"):
+            restored = dest / "claude" / path.relative_to(source_dir)
+            if path.is_symlink():
+                assert restored.readlink() == path.readlink()
+            elif path.is_file():
+                assert restored.read_bytes() == path.read_bytes()
+            else:
+                assert restored.is_dir()
+
+    def test_attributes_applied(self, tmp_path: Path) -> None:
+        """Files and directories get their archived mtime; unsafe mode bits are dropped."""
+        archive = tmp_path / "backup.tar"
+        with tarfile.open(archive, "w") as tar:
+            info = tarfile.TarInfo("claude")
+            info.type = tarfile.DIRTYPE
+            info.mode = 0o755
+            info.mtime = 1_600_000_000
+            tar.addfile(info)
+            _add_file(tar, "claude/script.sh", b"#!/bin/sh\n", mode=0o4777)
+        dest = tmp_path / "out"
+
+        _extract(archive, dest)
+
+        script = dest / "claude" / "script.sh"
+        assert script.stat().st_mode & 0o7777 == 0o755
+        assert script.stat().st_mtime == 1_700_000_000
+        assert (dest / "claude").stat().st_mtime == 1_600_000_000
+
+    def test_duplicate_members_keep_archive_order(self, tmp_path: Path) -> None:
+        """A later member with the same name wins, as with sequential extraction."""
+        archive = tmp_path / "backup.tar"
+        with tarfile.open(archive, "w") as tar:
+            _add_file(tar, "claude/settings.json", b"old" * 10_000)
+            _add_file(tar, "claude/settings.json", b"new")
+
+        _extract(archive, tmp_path / "out")
+
+        assert (tmp_path / "out" / "claude" / "settings.json").read_bytes() == b"new"
+
+    def test_large_files_streamed(self, tmp_path: Path) -> None:
+        """Files above the pooling threshold are written from the stream directly."""
+        data = os.urandom(50_000)
+        archive = tmp_path / "backup.tar.gz"
+        with tarfile.open(archive, "w:gz") as tar:
+            _add_file(tar, "claude/big.bin", data)
+            _add_file(tar, "claude/small.bin", b"small")
+
+        with patch("ai_asst_mgr.utils.extraction._POOLED_FILE_MAX_SIZE", 1024):
+            _extract(archive, tmp_path / "out")
+
+        assert (tmp_path / "out" / "claude" / "big.bin").read_bytes() == data
+        assert (tmp_path / "out" / "claude" / "small.bin").read_bytes() == b"small"
+
+    def test_unsafe_members_skipped(self, tmp_path: Path) -> None:
+        """Members escaping the destination are rejected without being written."""
+        archive = tmp_path / "evil.tar"
+        with tarfile.open(archive, "w") as tar:
+            _add_file(tar, "claude/ok.txt", b"ok")
+            _add_file(tar, "../escaped.txt", b"bad")
+            link = tarfile.TarInfo("claude/passwd")
+            link.type = tarfile.SYMTYPE
+            link.linkname = "/etc/passwd"
+            tar.addfile(link)
+        dest = tmp_path / "out"
+
+        assert _extract(archive, dest) == ["claude/ok.txt"]
+        assert not (tmp_path / "escaped.txt").exists()
+        assert not (dest / "claude" / "passwd").is_symlink()
+
+    def test_write_errors_propagate(self, tmp_path: Path) -> None:
+        """A failed write on the pool is raised by finish()."""
+        archive = tmp_path / "backup.tar"
+        with tarfile.open(archive, "w") as tar:
+            _add_file(tar, "claude/a.txt", b"a")
+
+        with (
+            patch("ai_asst_mgr.utils.extraction._write_bytes", side_effect=OSError("disk full")),
+            pytest.raises(OSError, match="disk full"),
+        ):
+            _extract(archive, tmp_path / "out")
@@ -3,6 +3,7 @@
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import git
 import pytest
 from git.exc import GitCommandError, InvalidGitRepositoryError
 
@@ -170,7 +171,7 @@ class TestGitClone:
     """Tests for git_clone function."""
 
     @patch("ai_asst_mgr.utils.git.is_git_installed")
-    @patch("ai_asst_mgr.utils.git.git.Repo.clone_from")
+    @patch("git.Repo.clone_from")
     def test_git_clone_success(
         self, mock_clone_from: Mock, mock_is_installed: Mock, tmp_path: Path
     ) -> None:
@@ -220,7 +221,7 @@ class TestGitClone:
             git_clone("https://github.com/user/repo.git", dest_dir)
 
     @patch("ai_asst_mgr.utils.git.is_git_installed")
-    @patch("ai_asst_mgr.utils.git.git.Repo.clone_from")
+    @patch("git.Repo.clone_from")
     def test_git_clone_command_error(
         self, mock_clone_from: Mock, mock_is_installed: Mock, tmp_path: Path
     ) -> None:
@@ -234,7 +235,7 @@ class TestGitClone:
         assert result is False
 
     @patch("ai_asst_mgr.utils.git.is_git_installed")
-    @patch("ai_asst_mgr.utils.git.git.Repo.clone_from")
+    @patch("git.Repo.clone_from")
     def test_git_clone_invalid_repo_error(
         self, mock_clone_from: Mock, mock_is_installed: Mock, tmp_path: Path
     ) -> None:
@@ -248,7 +249,7 @@ class TestGitClone:
         assert result is False
 
     @patch("ai_asst_mgr.utils.git.is_git_installed")
-    @patch("ai_asst_mgr.utils.git.git.Repo.clone_from")
+    @patch("git.Repo.clone_from")
     def test_git_clone_with_custom_depth(
         self, mock_clone_from: Mock, mock_is_installed: Mock, tmp_path: Path
     ) -> None:
@@ -268,7 +269,7 @@ class TestGitClone:
         )
 
     @patch("ai_asst_mgr.utils.git.is_git_installed")
-    @patch("ai_asst_mgr.utils.git.git.Repo.clone_from")
+    @patch("git.Repo.clone_from")
     def test_git_clone_with_invalid_depth(
         self, mock_clone_from: Mock, mock_is_installed: Mock, tmp_path: Path
     ) -> None:
@@ -289,7 +290,7 @@ class TestGitClone:
         )
 
     @patch("ai_asst_mgr.utils.git.is_git_installed")
-    @patch("ai_asst_mgr.utils.git.git.Repo.clone_from")
+    @patch("git.Repo.clone_from")
     def test_git_clone_with_custom_branch(
         self, mock_clone_from: Mock, mock_is_installed: Mock, tmp_path: Path
     ) -> None:
@@ -404,7 +405,7 @@ class TestGitEdgeCases:
         assert validate_git_branch("feature$123") is False
 
     @patch("ai_asst_mgr.utils.git.is_git_installed")
-    @patch("ai_asst_mgr.utils.git.git.Repo.clone_from")
+    @patch("git.Repo.clone_from")
     def test_git_clone_with_zero_depth(
         self, mock_clone_from: Mock, mock_is_installed: Mock, tmp_path: Path
     ) -> None:
@@ -424,7 +425,7 @@ class TestGitEdgeCases:
         )
 
     @patch("ai_asst_mgr.utils.git.is_git_installed")
-    @patch("ai_asst_mgr.utils.git.git.Repo.clone_from")
+    @patch("git.Repo.clone_from")
     def test_git_clone_with_string_depth(
         self, mock_clone_from: Mock, mock_is_installed: Mock, tmp_path: Path
     ) -> None:
@@ -447,3 +448,69 @@ class TestGitEdgeCases:
             branch="main",
             depth=1,
         )
+
+
+class TestSparseClone:
+    """Tests for git_clone with sparse_paths."""
+
+    @pytest.fixture
+    def source_repo(self, tmp_path: Path) -> Path:
+        """Create a repository with vendor config next to unrelated large files."""
+        repo = git.Repo.init(tmp_path / "dotfiles", initial_branch="main")
+        with repo.config_writer() as config:
+            config.set_value("uploadpack", "allowFilter", "true")
+        work_dir = tmp_path / "dotfiles"
+        (work_dir / "agents").mkdir()
+        (work_dir / "agents" / "reviewer.md").write_text("# Reviewer")
+        (work_dir / "settings.json").write_text("{}")
+        (work_dir / "photos").mkdir()
+        (work_dir / "photos" / "holiday.jpg").write_bytes(b"x" * 10_000)
+        repo.index.add(["agents/reviewer.md", "settings.json", "photos/holiday.jpg"])
+        actor = git.Actor("Test", "test@example.com")
+        repo.index.commit("Initial config", author=actor, committer=actor)
+        return work_dir
+
+    def test_checks_out_sparse_paths_only(self, source_repo: Path, tmp_path: Path) -> None:
+        """Only the requested paths are checked out."""
+        dest_dir = tmp_path / "clone"
+
+        result = git_clone(
+            f"file://{source_repo}", dest_dir, sparse_paths=["agents", "settings.json"]
+        )
+
+        assert result is True
+        assert (dest_dir / "agents" / "reviewer.md").read_text() == "# Reviewer"
+        assert (dest_dir / "settings.json").exists()
+        assert not (dest_dir / "photos").exists()
+
+    @patch("ai_asst_mgr.utils.git.is_git_installed")
+    @patch("ai_asst_mgr.utils.git._sparse_clone")
+    @patch("git.Repo.clone_from")
+    def test_falls_back_to_full_clone(
+        self,
+        mock_clone_from: Mock,
+        mock_sparse_clone: Mock,
+        mock_is_installed: Mock,
+        tmp_path: Path,
+    ) -> None:
+        """A failed partial or sparse clone is retried as a regular clone."""
+        mock_is_installed.return_value = True
+        mock_sparse_clone.side_effect = GitCommandError("clone", "filter not supported")
+        dest_dir = tmp_path / "repo"
+
+        result = git_clone("https://github.com/user/repo.git", dest_dir, sparse_paths=["agents"])
+
+        assert result is True
+        mock_clone_from.assert_called_once_with(
+            "https://github.com/user/repo.git",
+            str(dest_dir),
+            branch="main",
+            depth=1,
+        )
+
+    def test_rejects_unsafe_paths(self, tmp_path: Path) -> None:
+        """Sparse paths that could be read as options or escape the repository are rejected."""
+        with pytest.raises(GitValidationError, match="Invalid repository path"):
+            git_clone("https://github.com/user/repo.git", tmp_path, sparse_paths=["--force"])
+        with pytest.raises(GitValidationError, match="Invalid repository path"):
+            git_clone("https://github.com/user/repo.git", tmp_path, sparse_paths=["../etc"])
@@ -0,0 +1,130 @@
+"""Unit tests for in-process metrics utilities."""
+
+import pytest
+
+from ai_asst_mgr.utils.metrics import Counter, Gauge, Histogram, MetricsRegistry
+
+
+class TestCounter:
+    """Tests for Counter metric."""
+
+    def test_inc_accumulates_per_label_set(self) -> None:
+        """Test that increments are tracked per label set."""
+        counter = Counter("requests_total", "Requests.", ("route",))
+        counter.inc(route="/a")
+        counter.inc(2, route="/a")
+        counter.inc(route="/b")
+
+        assert counter.value(route="/a") == 3
+        assert counter.value(route="/b") == 1
+        assert counter.value(route="/c") == 0
+
+    def test_inc_rejects_negative_amount(self) -> None:
+        """Test that counters cannot decrease."""
+        counter = Counter("requests_total", "Requests.")
+        with pytest.raises(ValueError, match="non-negative"):
+            counter.inc(-1)
+
+    def test_inc_rejects_wrong_labels(self) -> None:
+        """Test that label names must match the definition."""
+        counter = Counter("requests_total", "Requests.", ("route",))
+        with pytest.raises(ValueError, match="expects labels"):
+            counter.inc(path="/a")
+
+    def test_render_escapes_label_values(self) -> None:
+        """Test that quotes and backslashes in labels are escaped."""
+        counter = Counter("requests_total", "Requests.", ("route",))
+        counter.inc(route='a"b\\c')
+
+        lines = counter.render()
+
+        assert lines[0] == "# HELP requests_total Requests."
+        assert lines[1] == "# TYPE requests_total counter"
+        assert lines[2] == 'requests_total{route="a\\"b\\\\c"} 1'
+
+
+class TestGauge:
+    """Tests for Gauge metric."""
+
+    def test_set_inc_dec(self) -> None:
+        """Test that gauges move in both directions."""
+        gauge = Gauge("open_connections", "Open connections.")
+        gauge.set(5)
+        gauge.inc()
+        gauge.dec(3)
+
+        assert gauge.value() == 3
+        assert gauge.render()[-1] == "open_connections 3"
+
+
+class TestHistogram:
+    """Tests for Histogram metric."""
+
+    def test_observe_renders_cumulative_buckets(self) -> None:
+        """Test bucket, sum, and count lines."""
+        histogram = Histogram("latency_seconds", "Latency.", ("method",), buckets=(0.1, 1.0))
+        histogram.observe(0.05, method="get")
+        histogram.observe(0.5, method="get")
+        histogram.observe(5.0, method="get")
+
+        lines = histogram.render()
+
+        assert 'latency_seconds_bucket{method="get",le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{method="get",le="1"} 2' in lines
+        assert 'latency_seconds_bucket{method="get",le="+Inf"} 3' in lines
+        assert 'latency_seconds_sum{method="get"} 5.55' in lines
+        assert 'latency_seconds_count{method="get"} 3' in lines
+        assert histogram.count(method="get") == 3
+
+    def test_time_context_manager_observes_duration(self) -> None:
+        """Test that the time() helper records one observation."""
+        histogram = Histogram("latency_seconds", "Latency.")
+        with histogram.time():
+            pass
+
+        assert histogram.count() == 1
+        assert histogram.total() >= 0
+
+    def test_time_records_on_exception(self) -> None:
+        """Test that durations are recorded even when the block raises."""
+        histogram = Histogram("latency_seconds", "Latency.")
+        with pytest.raises(RuntimeError), histogram.time():
+            raise RuntimeError
+
+        assert histogram.count() == 1
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry."""
+
+    def test_get_or_create_returns_same_metric(self) -> None:
+        """Test that re-registering a name returns the existing metric."""
+        registry = MetricsRegistry()
+        first = registry.counter("events_total", "Events.")
+        second = registry.counter("events_total", "Events.")
+
+        assert first is second
+
+    def test_conflicting_definition_raises(self) -> None:
+        """Test that a name cannot be reused for another metric type."""
+        registry = MetricsRegistry()
+        registry.counter("events_total", "Events.")
+
+        with pytest.raises(ValueError, match="different definition"):
+            registry.gauge("events_total", "Events.")
+
+    def test_render_and_reset(self) -> None:
+        """Test rendering all metrics and clearing samples."""
+        registry = MetricsRegistry()
+        registry.counter("b_total", "B.").inc()
+        registry.gauge("a_value", "A.").set(2)
+
+        text = registry.render()
+
+        assert text.endswith("\n")
+        assert text.index("a_value") < text.index("b_total")
+        assert "b_total 1" in text
+
+        registry.reset()
+
+        assert "b_total 1" not in registry.render()
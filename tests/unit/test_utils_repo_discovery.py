@@ -0,0 +1,150 @@
+"""Unit tests for cached, parallel git repository discovery."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ai_asst_mgr.utils.repo_discovery import DEFAULT_PRUNE_DIRS, RepoDiscovery
+
+
+def _make_repos(root: Path, *names: str) -> None:
+    for name in names:
+        (root / name / ".git").mkdir(parents=True)
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    """Create a directory of projects with dependency trees inside."""
+    base = tmp_path / "Developer"
+    _make_repos(base, "alpha", "group/beta", "group/gamma")
+    _make_repos(base, "web/node_modules/left-pad", "tool/venv/lib/pkg")
+    (base / "notes" / "drafts").mkdir(parents=True)
+    return base
+
+
+class TestRepoDiscovery:
+    """Tests for RepoDiscovery."""
+
+    def test_finds_sorted_repos(self, workspace: Path) -> None:
+        """Repositories are returned sorted, without pruned directories."""
+        repos = RepoDiscovery().find(workspace)
+
+        assert repos == [
+            workspace / "alpha",
+            workspace / "group" / "beta",
+            workspace / "group" / "gamma",
+        ]
+
+    def test_custom_prune(self, workspace: Path) -> None:
+        """Directories in a custom prune list are not entered."""
+        repos = RepoDiscovery(prune=DEFAULT_PRUNE_DIRS | {"group"}).find(workspace)
+
+        assert repos == [workspace / "alpha"]
+
+    def test_empty_prune_enters_everything(self, workspace: Path) -> None:
+        """Without a prune list, dependency trees are searched too."""
+        repos = RepoDiscovery(prune=()).find(workspace, max_depth=4)
+
+        assert workspace / "web" / "node_modules" / "left-pad" in repos
+        assert workspace / "tool" / "venv" / "lib" / "pkg" in repos
+
+    def test_symlink_loop(self, workspace: Path) -> None:
+        """A symlink back up the tree does not cause repeated visits."""
+        (workspace / "group" / "loop").symlink_to(workspace)
+
+        repos = RepoDiscovery().find(workspace, max_depth=10)
+
+        assert len(repos) == 3
+
+    def test_symlinked_repo_found(self, workspace: Path, tmp_path: Path) -> None:
+        """Repositories reached through a symlink are found once."""
+        _make_repos(tmp_path, "elsewhere/delta")
+        (workspace / "linked").symlink_to(tmp_path / "elsewhere")
+
+        repos = RepoDiscovery().find(workspace)
+
+        assert workspace / "linked" / "delta" in repos
+
+    def test_unreadable_directory_skipped(self, workspace: Path) -> None:
+        """Directories that cannot be listed are skipped."""
+        original_scandir = os.scandir
+        blocked = str(workspace / "group")
+
+        def fake_scandir(path: str) -> object:
+            if path == blocked:
+                raise PermissionError(path)
+            return original_scandir(path)
+
+        with patch("ai_asst_mgr.utils.repo_discovery.os.scandir", fake_scandir):
+            repos = RepoDiscovery().find(workspace)
+
+        assert repos == [workspace / "alpha"]
+
+
+class TestRepoDiscoveryCache:
+    """Tests for the persisted listing cache."""
+
+    def test_unchanged_tree_not_listed(self, workspace: Path, tmp_path: Path) -> None:
+        """A second search reuses every listing from the cache file."""
+        cache = tmp_path / "repos.json"
+        first = RepoDiscovery(cache_path=cache)
+        repos = first.find(workspace)
+        first.save()
+
+        second = RepoDiscovery(cache_path=cache)
+        with patch("ai_asst_mgr.utils.repo_discovery.os.scandir") as mock_scandir:
+            assert second.find(workspace) == repos
+        mock_scandir.assert_not_called()
+        assert (second.hits, second.misses) == (first.misses, 0)
+
+    def test_new_repo_found(self, workspace: Path, tmp_path: Path) -> None:
+        """Only directories whose mtime changed are listed again."""
+        cache = tmp_path / "repos.json"
+        first = RepoDiscovery(cache_path=cache)
+        first.find(workspace)
+        first.save()
+        _make_repos(workspace, "notes/drafts")
+
+        second = RepoDiscovery(cache_path=cache)
+        repos = second.find(workspace)
+
+        assert workspace / "notes" / "drafts" in repos
+        assert second.misses == 1
+
+    def test_removed_directories_forgotten(self, workspace: Path, tmp_path: Path) -> None:
+        """Listings for directories that no longer exist are dropped."""
+        cache = tmp_path / "repos.json"
+        discovery = RepoDiscovery(cache_path=cache)
+        discovery.find(workspace)
+        (workspace / "notes" / "drafts").rmdir()
+        discovery.find(workspace)
+        discovery.save()
+
+        saved = json.loads(cache.read_text())["dirs"]
+        assert str(workspace / "notes" / "drafts") not in saved
+        assert str(workspace / "alpha") in saved
+
+    def test_cache_discarded_when_prune_changes(self, workspace: Path, tmp_path: Path) -> None:
+        """Listings saved with another prune list are not reused."""
+        cache = tmp_path / "repos.json"
+        first = RepoDiscovery(cache_path=cache)
+        first.find(workspace)
+        first.save()
+
+        second = RepoDiscovery(prune=(), cache_path=cache)
+        repos = second.find(workspace, max_depth=4)
+
+        assert second.hits == 0
+        assert workspace / "web" / "node_modules" / "left-pad" in repos
+
+    def test_corrupt_cache_ignored(self, workspace: Path, tmp_path: Path) -> None:
+        """An unreadable cache file is treated as empty."""
+        cache = tmp_path / "repos.json"
+        cache.write_text("{not json")
+
+        repos = RepoDiscovery(cache_path=cache).find(workspace)
+
+        assert len(repos) == 3
@@ -0,0 +1,104 @@
+"""Unit tests for applying tree diffs."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ai_asst_mgr.utils.tree_apply import apply_tree_diff, install_file
+from ai_asst_mgr.utils.tree_index import TreeDiff
+
+
+def _write(root: Path, files: dict[str, str]) -> None:
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+@pytest.fixture
+def trees(tmp_path: Path) -> tuple[Path, Path, TreeDiff]:
+    """Create a source and destination tree and the diff between them."""
+    source = tmp_path / "source"
+    dest = tmp_path / "dest"
+    _write(source, {"same.md": "same", "changed.md": "new", "deep/added.md": "added"})
+    _write(dest, {"same.md": "same", "changed.md": "old", "old/deeper/gone.md": "gone"})
+    diff = TreeDiff(
+        added=["deep/added.md"],
+        modified=["changed.md"],
+        deleted=["old/deeper/gone.md"],
+        unchanged=["same.md"],
+    )
+    return source, dest, diff
+
+
+class TestInstallFile:
+    """Tests for install_file."""
+
+    def test_replaces_with_new_inode_and_metadata(self, tmp_path: Path) -> None:
+        """The file is renamed into place with the source's mode and mtime."""
+        source = tmp_path / "source.sh"
+        source.write_text("#!/bin/sh\n")
+        source.chmod(0o755)
+        os.utime(source, ns=(1_700_000_000_000_000_000, 1_700_000_000_000_000_000))
+        dest = tmp_path / "out" / "dest.sh"
+        dest.parent.mkdir()
+        dest.write_text("old")
+        old_inode = dest.stat().st_ino
+
+        install_file(source, dest)
+
+        assert dest.read_text() == "#!/bin/sh\n"
+        assert dest.stat().st_mode & 0o777 == 0o755
+        assert dest.stat().st_mtime_ns == source.stat().st_mtime_ns
+        assert dest.stat().st_ino != old_inode
+        assert [p.name for p in dest.parent.iterdir()] == ["dest.sh"]
+
+    def test_failed_copy_leaves_destination(self, tmp_path: Path) -> None:
+        """A failed write removes the temporary file and keeps the old contents."""
+        source = tmp_path / "source.md"
+        source.write_text("new")
+        dest = tmp_path / "dest.md"
+        dest.write_text("old")
+
+        with (
+            patch("ai_asst_mgr.utils.tree_apply.shutil.copyfileobj", side_effect=OSError("full")),
+            pytest.raises(OSError, match="full"),
+        ):
+            install_file(source, dest)
+
+        assert dest.read_text() == "old"
+        assert {p.name for p in tmp_path.iterdir()} == {"source.md", "dest.md"}
+
+
+class TestApplyTreeDiff:
+    """Tests for apply_tree_diff."""
+
+    def test_mirror(self, trees: tuple[Path, Path, TreeDiff]) -> None:
+        """With deletion, the destination ends up matching the source exactly."""
+        source, dest, diff = trees
+        same_inode = (dest / "same.md").stat().st_ino
+
+        result = apply_tree_diff(source, dest, diff, delete=True)
+
+        assert (result.added, result.modified, result.deleted, result.unchanged) == (1, 1, 1, 1)
+        assert sorted(str(p.relative_to(dest)) for p in dest.rglob("*")) == [
+            "changed.md",
+            "deep",
+            "deep/added.md",
+            "same.md",
+        ]
+        assert (dest / "changed.md").read_text() == "new"
+        assert (dest / "same.md").stat().st_ino == same_inode
+
+    def test_keep_modified_and_deleted(self, trees: tuple[Path, Path, TreeDiff]) -> None:
+        """Without overwriting or deletion, only additions are written."""
+        source, dest, diff = trees
+
+        result = apply_tree_diff(source, dest, diff, update_modified=False)
+
+        assert (result.added, result.modified, result.deleted, result.unchanged) == (1, 0, 0, 3)
+        assert (dest / "changed.md").read_text() == "old"
+        assert (dest / "old" / "deeper" / "gone.md").exists()
+        assert (dest / "deep" / "added.md").read_text() == "added"
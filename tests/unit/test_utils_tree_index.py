@@ -0,0 +1,186 @@
+"""Unit tests for tree snapshots and hash-indexed diffing."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ai_asst_mgr.utils.tree_index import (
+    HashCache,
+    TreeSnapshot,
+    diff_trees,
+    file_digest,
+)
+
+
+def _write(root: Path, files: dict[str, str]) -> None:
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+@pytest.fixture
+def trees(tmp_path: Path) -> tuple[Path, Path]:
+    """Create a local config tree and a remote checkout that differ."""
+    local = tmp_path / "local"
+    remote = tmp_path / "remote"
+    _write(
+        local,
+        {
+            "settings.json": "{}",
+            "agents/same.md": "same",
+            "agents/changed.md": "old",
+            "agents/resized.md": "short",
+            "agents/gone.md": "bye",
+            "notes/private.md": "not synced",
+        },
+    )
+    _write(
+        remote,
+        {
+            "settings.json": "{}",
+            "agents/same.md": "same",
+            "agents/changed.md": "new",
+            "agents/resized.md": "much longer",
+            "agents/deep/new.md": "hello",
+        },
+    )
+    return local, remote
+
+
+class TestTreeSnapshot:
+    """Tests for TreeSnapshot.scan."""
+
+    def test_scan_whole_tree(self, trees: tuple[Path, Path]) -> None:
+        """Every file is recorded with its size, keyed by POSIX path."""
+        local, _ = trees
+
+        snapshot = TreeSnapshot.scan(local)
+
+        assert len(snapshot) == 6
+        assert snapshot.files["agents/changed.md"].size == 3
+        assert "notes/private.md" in snapshot
+        assert "agents" not in snapshot
+
+    def test_scan_limited_paths(self, trees: tuple[Path, Path]) -> None:
+        """Only the given paths are walked and missing ones are skipped."""
+        local, _ = trees
+
+        snapshot = TreeSnapshot.scan(local, ["agents", "settings.json", "skills"])
+
+        assert sorted(snapshot.files) == [
+            "agents/changed.md",
+            "agents/gone.md",
+            "agents/resized.md",
+            "agents/same.md",
+            "settings.json",
+        ]
+
+    def test_symlinked_directories_not_followed(self, tmp_path: Path) -> None:
+        """A symlink loop does not make the walk recurse forever."""
+        _write(tmp_path / "root", {"agents/a.md": "a"})
+        (tmp_path / "root" / "agents" / "loop").symlink_to(tmp_path / "root")
+
+        snapshot = TreeSnapshot.scan(tmp_path / "root")
+
+        assert list(snapshot.files) == ["agents/a.md"]
+
+    def test_under(self, trees: tuple[Path, Path]) -> None:
+        """Files below a directory are listed in sorted order, without prefix collisions."""
+        _, remote = trees
+        _write(remote, {"agents-old/x.md": "x"})
+        snapshot = TreeSnapshot.scan(remote)
+
+        assert list(snapshot.under("agents")) == [
+            "agents/changed.md",
+            "agents/deep/new.md",
+            "agents/resized.md",
+            "agents/same.md",
+        ]
+
+
+class TestDiffTrees:
+    """Tests for diff_trees."""
+
+    def test_classifies_changes(self, trees: tuple[Path, Path]) -> None:
+        """Additions, modifications, deletions and unchanged files are separated."""
+        local, remote = trees
+        paths = ["agents", "settings.json"]
+
+        diff = diff_trees(TreeSnapshot.scan(local, paths), TreeSnapshot.scan(remote, paths))
+
+        assert diff.added == ["agents/deep/new.md"]
+        assert diff.modified == ["agents/changed.md", "agents/resized.md"]
+        assert diff.deleted == ["agents/gone.md"]
+        assert diff.unchanged == ["agents/same.md", "settings.json"]
+
+    def test_size_mismatch_not_hashed(self, trees: tuple[Path, Path]) -> None:
+        """Files whose sizes differ are reported without reading them."""
+        local, remote = trees
+        old = TreeSnapshot.scan(local, ["agents/resized.md"])
+        new = TreeSnapshot.scan(remote, ["agents/resized.md"])
+
+        with patch("ai_asst_mgr.utils.tree_index.file_digest") as digest:
+            diff = diff_trees(old, new)
+
+        assert diff.modified == ["agents/resized.md"]
+        digest.assert_not_called()
+
+
+class TestHashCache:
+    """Tests for HashCache."""
+
+    def test_reuses_hashes_across_runs(self, trees: tuple[Path, Path], tmp_path: Path) -> None:
+        """A saved cache avoids rehashing unchanged files and notices changed ones."""
+        local, remote = trees
+        cache_path = tmp_path / "hashes.json"
+        first = HashCache(cache_path)
+        diff_trees(TreeSnapshot.scan(local), TreeSnapshot.scan(remote), first)
+        first.save()
+
+        changed = local / "agents" / "same.md"
+        changed.write_text("SAME")
+        os.utime(changed, ns=(1, 1))
+        second = HashCache(cache_path)
+        diff = diff_trees(TreeSnapshot.scan(local), TreeSnapshot.scan(remote), second)
+
+        assert first.misses == 3
+        assert second.hits == 2
+        assert second.misses == 1
+        assert "agents/same.md" in diff.modified
+
+    def test_digest_matches_contents(self, trees: tuple[Path, Path]) -> None:
+        """Cached digests are the SHA256 of the file contents."""
+        local, _ = trees
+        snapshot = TreeSnapshot.scan(local)
+
+        assert HashCache().digest(snapshot, "settings.json") == file_digest(local / "settings.json")
+
+    def test_retain_drops_stale_entries(self, trees: tuple[Path, Path], tmp_path: Path) -> None:
+        """Entries for files that disappeared are not saved."""
+        local, _ = trees
+        cache = HashCache(tmp_path / "hashes.json")
+        snapshot = TreeSnapshot.scan(local)
+        cache.digest(snapshot, "settings.json")
+        cache.digest(snapshot, "agents/gone.md")
+
+        cache.retain(TreeSnapshot.scan(local, ["settings.json"]))
+        cache.save()
+
+        reloaded = HashCache(tmp_path / "hashes.json")
+        reloaded.digest(snapshot, "settings.json")
+        reloaded.digest(snapshot, "agents/gone.md")
+        assert reloaded.hits == 1
+
+    def test_corrupt_cache_ignored(self, trees: tuple[Path, Path], tmp_path: Path) -> None:
+        """An unreadable cache file starts an empty cache."""
+        local, _ = trees
+        cache_path = tmp_path / "hashes.json"
+        cache_path.write_text("{not json")
+
+        cache = HashCache(cache_path)
+
+        assert cache.digest(TreeSnapshot.scan(local), "settings.json")
+        assert cache.misses == 1
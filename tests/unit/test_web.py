@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -445,6 +446,47 @@ class TestErrorHandling:
         assert b"Internal server error" in response.content
 
 
+class TestMetricsEndpoint:
+    """Tests for the Prometheus /metrics endpoint."""
+
+    @pytest.fixture
+    def client(self) -> TestClient:
+        """Create a test client."""
+        app = create_app()
+        return TestClient(app)
+
+    def test_metrics_returns_prometheus_text(self, client: TestClient) -> None:
+        """Test that /metrics serves the text exposition format."""
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE ai_asst_mgr_http_request_duration_seconds histogram" in response.text
+
+    def test_requests_are_timed_by_route_template(self, client: TestClient) -> None:
+        """Test that request timings use the route template as label."""
+        client.get("/api/does-not-exist")
+        client.get("/metrics")
+
+        text = client.get("/metrics").text
+        assert 'ai_asst_mgr_http_requests_total{method="GET",route="/metrics",status="200"}' in text
+        assert 'route="unmatched",status="404"' in text
+
+    def test_database_metrics_are_exported(self, tmp_path: Path) -> None:
+        """Test that DatabaseManager instrumentation appears in /metrics."""
+        from ai_asst_mgr.database import DatabaseManager
+
+        db = DatabaseManager(tmp_path / "metrics.db")
+        db.initialize()
+        db.record_session("sess-1", "claude")
+        db.get_vendor_stats_summary()
+
+        client = TestClient(create_app())
+        text = client.get("/metrics").text
+        assert 'ai_asst_mgr_db_operation_duration_seconds_count{method="record_session"}' in text
+        assert 'ai_asst_mgr_db_rows_returned_total{method="get_vendor_stats_summary"}' in text
+        assert "ai_asst_mgr_db_connections_open 0" in text
+
+
 class TestCLIServeCommand:
     """Tests for the serve CLI command."""
 